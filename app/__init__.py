@@ -2,7 +2,8 @@
 from flask import Flask
 import os
 from app.extensions import db, api
-from app.common.config import config_by_name # <--- Importa o dicionário de configurações
+from app.common.config import config_by_name, validate_jwt_secret # <--- Importa o dicionário de configurações
+import app.infrastructure.database.sqlite_pragmas  # noqa: F401  (liga as FKs no SQLite)
 
 def create_app(config_name=None):
     
@@ -20,9 +21,15 @@ def create_app(config_name=None):
     # 1. CARREGA TODA A CONFIGURAÇÃO A PARTIR DO OBJETO CORRETO
     app.config.from_object(config_by_name[config_name])
     print(f"*** URL DO BANCO: {app.config['SQLALCHEMY_DATABASE_URI']} ***")
+    # Tokens assinados com uma chave ausente ou pública poderiam ser forjados
+    validate_jwt_secret(config_name, app.config)
+
     # 2. INICIALIZA AS EXTENSÕES COM O APP JÁ CONFIGURADO
     db.init_app(app)
     api.init_app(app)
+    # Respostas JSON com orjson (quando instalado) no lugar do json da stdlib
+    from app.presentation.json_representation import output_json
+    api.representation('application/json')(output_json)
 
     # 3. VERIFICA A CONEXÃO COM O BANCO (seu código de verificação)
     # Este bloco continua útil, especialmente para debugar o startup em produção
@@ -32,10 +39,58 @@ def create_app(config_name=None):
             print("INFO: Verificação de conexão com DB ativada.")
             pass # Mantenha sua lógica aqui
 
+        # 4. AQUECE O CACHE DE CATEGORIAS (categorias quase nunca mudam)
+        if app.config.get('WARM_CATEGORY_CACHE_ON_STARTUP', False):
+            from app.infrastructure.persistence.category_repository import CategoryRepository
+            try:
+                cached = CategoryRepository().warm_cache()
+                print(f"INFO: Cache de categorias aquecido com {cached} categorias.")
+            except Exception as e:
+                # Sem o cache aquecido as categorias são carregadas sob demanda
+                print(f"WARNING: Não foi possível aquecer o cache de categorias: {e}")
+
+    # 5. CARREGA O ÍNDICE DE BUSCA EM MEMÓRIA (PRODUCT_SEARCH_BACKEND='memory')
+    if app.config.get('PRODUCT_SEARCH_BACKEND') == 'memory':
+        start_product_search_index(app)
+
+    # 6. POOLS DAS TAREFAS DE CPU (MINIATURAS, HASH DE SENHAS) E ARQUIVOS ENVIADOS
+    from app.infrastructure.images.image_variants import image_processing_pool
+    image_processing_pool.configure(max_workers=app.config['IMAGE_PROCESSING_WORKERS'],
+                                    max_pending=app.config['IMAGE_PROCESSING_QUEUE_LIMIT'])
+    from app.presentation.media import register_media_route
+    register_media_route(app)
+    from app.infrastructure.security.bcrypt_password_hasher import password_hashing_pool
+    password_hashing_pool.configure(max_workers=app.config['PASSWORD_HASHING_WORKERS'],
+                                    max_pending=app.config['PASSWORD_HASHING_QUEUE_LIMIT'])
+
+    # 7. CACHE DOS ACCESS TOKENS JÁ VERIFICADOS (guard das rotas autenticadas)
+    from app.infrastructure.cache.verified_token_cache import verified_token_cache
+    verified_token_cache.configure(max_size=app.config['VERIFIED_TOKEN_CACHE_SIZE'],
+                                   max_age=app.config['VERIFIED_TOKEN_CACHE_MAX_AGE'])
+
+    # 8. CARRINHOS COM GRAVAÇÃO EM LOTE (CART_STORAGE='write_behind')
+    if app.config.get('CART_STORAGE') == 'write_behind':
+        start_cart_flusher(app)
+
+    # 9. CACHE DAS RESPOSTAS JÁ GUARDADAS PARA AS IDEMPOTENCY-KEYS (checkout)
+    from app.infrastructure.cache.idempotency_cache import idempotency_response_cache
+    idempotency_response_cache.configure(max_size=app.config['IDEMPOTENCY_CACHE_SIZE'])
+
     from app.presentation.controllers.auth_controller import auth_ns
     from app.presentation.controllers.artisan_controller import artisan_ns 
+    from app.presentation.controllers.product_controller import product_ns
+    from app.presentation.controllers.cart_controller import cart_ns
+    from app.presentation.controllers.order_controller import order_ns
     api.add_namespace(auth_ns) 
     api.add_namespace(artisan_ns)
+    api.add_namespace(product_ns)
+    api.add_namespace(cart_ns)
+    api.add_namespace(order_ns)
+
+    from app.cli import dataset_cli, idempotency_cli, stock_cli
+    app.cli.add_command(stock_cli)
+    app.cli.add_command(dataset_cli)
+    app.cli.add_command(idempotency_cli)
 
     # Adicionar middleware de segurança para todas as respostas
     @app.after_request
@@ -56,4 +111,64 @@ def create_app(config_name=None):
         
         return response
 
-    return app
\ No newline at end of file
+    return app
+
+
+def start_product_search_index(app):
+    """
+    Enables the in-memory product search index and loads it from the database,
+    in a background thread unless PRODUCT_SEARCH_INDEX_BACKGROUND_BUILD is False.
+    """
+    import threading
+    from app.infrastructure.search.inverted_index import product_search_index
+    from app.infrastructure.search.in_memory_product_search_repository import InMemoryProductSearchRepository
+
+    # Habilita antes da carga para não perder produtos criados durante ela
+    product_search_index.enabled = True
+
+    def build():
+        with app.app_context():
+            try:
+                indexed = InMemoryProductSearchRepository().rebuild()
+                print(f"INFO: Índice de busca carregado com {indexed} produtos: "
+                      f"{product_search_index.memory_footprint()}")
+            except Exception as e:
+                # Sem o índice a busca continua no banco
+                print(f"WARNING: Não foi possível carregar o índice de busca: {e}")
+
+    if app.config.get('PRODUCT_SEARCH_INDEX_BACKGROUND_BUILD', True):
+        threading.Thread(target=build, name='product-search-index', daemon=True).start()
+    else:
+        build()
+
+
+def start_cart_flusher(app):
+    """
+    Enables the cart change buffer and starts the thread that writes it to the
+    database every CART_FLUSH_INTERVAL_SECONDS (or as soon as it is full); what
+    is left is written when the process exits normally.
+    """
+    import atexit
+    import threading
+    from app.infrastructure.cache.cart_change_buffer import cart_change_buffer
+    from app.infrastructure.persistence.write_behind_cart_repository import WriteBehindCartRepository
+
+    cart_change_buffer.configure(enabled=True, max_pending_buyers=app.config['CART_FLUSH_MAX_PENDING_BUYERS'])
+    repository = WriteBehindCartRepository(buffer=cart_change_buffer)
+
+    def flush():
+        with app.app_context():
+            try:
+                repository.flush()
+            except Exception as e:
+                # As mudanças voltam para o buffer e vão na próxima gravação
+                print(f"WARNING: Não foi possível gravar os carrinhos: {e}")
+
+    def run():
+        while True:
+            cart_change_buffer.flush_requested.wait(app.config['CART_FLUSH_INTERVAL_SECONDS'])
+            cart_change_buffer.flush_requested.clear()
+            flush()
+
+    threading.Thread(target=run, name='cart-flusher', daemon=True).start()
+    atexit.register(flush)
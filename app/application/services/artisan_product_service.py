@@ -1,9 +1,16 @@
 from asyncio.log import logger
+import hashlib
 from app.domain.repositories.artisan_repository_interface import IArtisanRepository
 from app.domain.repositories.product_repository_interface import IProductRepository
 from app.domain.repositories.category_repository_interface import ICategoryRepository
 from app.domain.models.product import ProductEntity
-from app.presentation.dtos.product_dtos import RegisterProductRequest, ResponseRegisterProduct
+from app.presentation.dtos.product_dtos import RegisterProductRequest, ResponseRegisterProduct, product_listing_dict
+from app.common.utils import encode_keyset_cursor, decode_keyset_cursor
+from app.common.exceptions import CategoryNotFoundError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
 class ArtisanProductService:
     def __init__(self, product_repository: IProductRepository, category_repository: ICategoryRepository, artisan_repository: IArtisanRepository):
         self._artisan_repository = artisan_repository
@@ -11,10 +18,21 @@ class ArtisanProductService:
         self.category_repository = category_repository      
 
     def create_artisan_product(self, artisan_id: str, product_data: RegisterProductRequest) -> ResponseRegisterProduct:
-        artisan = self._artisan_repository.get_artisan_by_id(artisan_id)
-        #TODO: exceptionError
-        if not artisan:
-            raise ValueError("Artisan not found")
+        """
+        Creates a product for an artisan.
+
+        The common case costs one INSERT + COMMIT: the category comes from the
+        category cache, and the artisan and the name uniqueness are enforced by
+        the database constraints (no check-then-insert race between requests).
+
+        :raises ArtisanNotFoundError: If the artisan does not exist.
+        :raises CategoryNotFoundError: If the category does not exist.
+        :raises DuplicateProductError: If the artisan already has a product with this name.
+        :raises ValueError: If the product data is invalid.
+        """
+        # Validate price and name
+        if not product_data.name or product_data.price is None or product_data.price < 0 or (product_data.stock is not None and product_data.stock < 0):
+            raise ValueError("Invalid product data")
 
         new_product = ProductEntity(
             name=product_data.name,
@@ -26,18 +44,11 @@ class ArtisanProductService:
             category_id=product_data.category_id,
         )
         
-        #check category_id 
+        #check category_id (cache de categorias, normalmente sem ir ao banco)
         category = self.category_repository.get_by_id(new_product.category_id)
         if not category:
-            raise ValueError("Category does not exist")
-        print(f"category found: {category}")
-        # Validate price and name
-        if not product_data.name or product_data.price is None or product_data.price < 0 or product_data.stock < 0:
-            raise ValueError("Invalid product data")
+            raise CategoryNotFoundError()
 
-        #check pre-existence of product 
-        if self.product_repository.get_artisan_product_by_name(artisan_id, new_product.name):
-            raise ValueError("Product with this name already exists for this artisan")
         try:
             saved_product = self.product_repository.create(new_product)
             logger.info("Product saved successfully:")
@@ -52,18 +63,13 @@ class ArtisanProductService:
     
     def __get_categories_by_ids(self, category_ids: set[str]) -> list:
         """
-        Helper method to fetch categories by their IDs.
+        Helper method to fetch categories by their IDs with a single repository call.
         """
-        categories = []
-        for cat_id in category_ids:
-            try:
-                category = self.category_repository.get_by_id(cat_id)
-            except Exception as e:
-                logger.error(f"Error fetching category {cat_id}: {e}")
-                category = None
-                pass                         
-            categories.append(category)
-        return categories
+        try:
+            return self.category_repository.get_many_by_ids(list(category_ids))
+        except Exception as e:
+            logger.error(f"Error fetching categories {category_ids}: {e}")
+            return []
     
     def get_all_products_by_artisan(self, artisan_id: str):
         try:
@@ -79,6 +85,72 @@ class ArtisanProductService:
             logger.info(f"No products found for artisan {artisan_id}")
             return []
         
+        return self.__build_product_responses(products)
+
+    def get_products_page_etag(self, artisan_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None) -> str:
+        """
+        Returns the ETag of a page of an artisan's products without loading them.
+
+        The ETag hashes the catalogue version (product count and latest updated_at)
+        together with the page parameters, so it changes whenever any product of
+        the artisan is created, updated or deleted. It must be computed before the
+        page is loaded: a write in between then only costs one extra 200.
+
+        :param artisan_id: ID of the artisan.
+        :param limit: Maximum number of products in the page.
+        :param cursor: Cursor of the page, or None for the first page.
+        :return: ETag value (without quotes).
+        :raises ValueError: If limit or cursor are invalid.
+        """
+        self.__validate_page(limit, cursor)
+        count, last_updated_at = self.product_repository.get_artisan_catalogue_version(artisan_id)
+        version = f"{artisan_id}:{count}:{last_updated_at.isoformat() if last_updated_at else ''}:{limit}:{cursor or ''}"
+        return hashlib.sha1(version.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def __validate_page(limit, cursor):
+        if limit is None or limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        return decode_keyset_cursor(cursor) if cursor else None
+
+    def get_products_page_by_artisan(self, artisan_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None):
+        """
+        Returns one page of an artisan's products and the cursor of the next page.
+
+        Pages are ordered by (registration_date, product_id) and fetched by keyset,
+        so the cost of a page does not depend on how many products the store has.
+
+        :param artisan_id: ID of the artisan.
+        :param limit: Maximum number of products in the page.
+        :param cursor: Opaque cursor returned with the previous page, or None for the first page.
+        :return: Tuple (list of products as dicts shaped like ResponseRegisterProduct,
+                 next cursor or None if this is the last page).
+        """
+        after = self.__validate_page(limit, cursor)
+
+        artisan = self._artisan_repository.get_artisan_by_id(artisan_id)
+        if not artisan:
+            raise ValueError("Artisan not found")
+
+        # One extra row tells whether there is a next page without a COUNT query
+        rows = self.product_repository.find_with_categories_by_artisan_id(artisan_id, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_product, _ = rows[-1]
+            next_cursor = encode_keyset_cursor(last_product.registration_date, last_product.product_id)
+
+        # Dados vindos do banco: monta a resposta sem criar nem validar modelos pydantic
+        products = [product_listing_dict(product, category) for product, category in rows]
+        return products, next_cursor
+
+    def __build_product_responses(self, products) -> list:
+        """
+        Helper method to map products to response DTOs with their categories.
+        """
+        if not products:
+            return []
+
         # Fetch categories for the products
         category_ids = {product.category_id for product in products}
         categories = self.__get_categories_by_ids(category_ids)
@@ -91,4 +163,3 @@ class ArtisanProductService:
             ResponseRegisterProduct.from_domain_entities(product, category_map.get(product.category_id))
             for product in products
         ]
-        
\ No newline at end of file
@@ -0,0 +1,51 @@
+from app.common.exceptions import CartItemNotFoundError, ProductNotFoundError
+from app.domain.models.cart import CartEntity
+from app.domain.repositories.cart_repository_interface import ICartRepository
+from app.domain.repositories.product_repository_interface import IProductRepository
+from app.presentation.dtos.cart_dtos import AddCartItemRequest, CartResponse, UpdateCartItemRequest
+
+
+class CartService:
+    def __init__(self, cart_repository: ICartRepository, product_repository: IProductRepository):
+        self.cart_repository = cart_repository
+        self.product_repository = product_repository
+
+    def get_cart(self, buyer_id: str) -> CartResponse:
+        """
+        Returns the buyer's cart with its products and totals (empty if the buyer has none).
+        """
+        cart = self.cart_repository.get_by_buyer_id(buyer_id)
+        return CartResponse.from_domain_entity(cart or CartEntity(buyer_id=buyer_id))
+
+    def add_item(self, buyer_id: str, request: AddCartItemRequest) -> CartResponse:
+        """
+        Adds a product to the cart; adding a product already there sums the quantities.
+        The stock is only checked at checkout.
+
+        :raises ProductNotFoundError: If the product does not exist or is inactive.
+        """
+        product = self.product_repository.get_product_by_id(request.product_id)
+        if not product or product.status.lower() == 'inactive':
+            raise ProductNotFoundError()
+        self.cart_repository.add_item(buyer_id, request.product_id, request.quantity)
+        return self.get_cart(buyer_id)
+
+    def update_item(self, buyer_id: str, product_id: str, request: UpdateCartItemRequest) -> CartResponse:
+        """
+        Replaces the quantity of a product in the cart.
+
+        :raises CartItemNotFoundError: If the product is not in the cart.
+        """
+        if not self.cart_repository.set_item_quantity(buyer_id, product_id, request.quantity):
+            raise CartItemNotFoundError()
+        return self.get_cart(buyer_id)
+
+    def remove_item(self, buyer_id: str, product_id: str) -> CartResponse:
+        """
+        Removes a product from the cart.
+
+        :raises CartItemNotFoundError: If the product is not in the cart.
+        """
+        if not self.cart_repository.remove_item(buyer_id, product_id):
+            raise CartItemNotFoundError()
+        return self.get_cart(buyer_id)
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from app.application.services.stock_reservation_service import StockReservationService
+from app.common.exceptions import InsufficientStockError
+from app.domain.repositories.cart_repository_interface import ICartRepository
+from app.domain.repositories.order_repository_interface import IOrderRepository
+from app.presentation.dtos.order_dtos import CheckoutRequest, OrderResponse
+
+
+class CheckoutService:
+    def __init__(self, cart_repository: ICartRepository, order_repository: IOrderRepository,
+                 stock_reservation_service: Optional[StockReservationService] = None):
+        self.cart_repository = cart_repository
+        self.order_repository = order_repository
+        self.stock_reservation_service = stock_reservation_service
+
+    def checkout(self, buyer_id: str, request: CheckoutRequest) -> OrderResponse:
+        """
+        Turns the buyer's cart into a pending order: the prices are copied to the
+        order, the stock is taken and the cart is emptied, all or nothing.
+
+        :raises EmptyCartError: If the cart has no items.
+        :raises InsufficientStockError: If any product does not have enough stock.
+        :raises CartChangedError: If the cart kept changing during the checkout.
+        """
+        # Mudanças do carrinho ainda no buffer (CART_STORAGE='write_behind') precisam estar no banco
+        self.cart_repository.flush(buyer_id)
+        try:
+            order = self.order_repository.create_from_cart(buyer_id, request.payment_method)
+        except InsufficientStockError as e:
+            # Como na reserva: reservas expiradas podem estar segurando o estoque que falta
+            if not self.stock_reservation_service or not self.stock_reservation_service.release_expired(
+                    product_ids=e.product_ids):
+                raise
+            order = self.order_repository.create_from_cart(buyer_id, request.payment_method)
+        return OrderResponse.from_domain_entity(order)
@@ -0,0 +1,99 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from app.common.exceptions import IdempotencyKeyInProgressError, IdempotencyKeyReusedError
+from app.domain.models.idempotency_record import IdempotencyRecordEntity
+from app.domain.repositories.idempotency_key_repository_interface import IIdempotencyKeyRepository
+
+# Por quanto tempo a resposta guardada é devolvida às repetições da requisição
+DEFAULT_IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+# Chaves vencidas apagadas por transação na limpeza
+EXPIRED_KEY_DELETE_BATCH_SIZE = 500
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+# Tentativas de gravar a resposta depois que a ação já rodou (e, no checkout, já criou o pedido)
+COMPLETE_ATTEMPTS = 2
+
+
+class IdempotencyService:
+    def __init__(self, idempotency_key_repository: IIdempotencyKeyRepository,
+                 key_ttl: timedelta = DEFAULT_IDEMPOTENCY_KEY_TTL):
+        self.idempotency_key_repository = idempotency_key_repository
+        self.key_ttl = key_ttl
+
+    def execute(self, scope: str, idempotency_key: str, request_body: Any,
+                action: Callable[[], tuple[Any, int]]) -> tuple[IdempotencyRecordEntity, bool]:
+        """
+        Runs the action once per key: repetitions of the request get the stored
+        response back without running it again. A failed action stores nothing
+        (the key is released), so the client can retry it. A response that cannot
+        be stored is still returned and logged: the action already ran, and the
+        retries reaching this process get it from the repository cache.
+
+        :param scope: Operation and owner of the key, e.g. 'checkout:<buyer_id>'.
+        :param idempotency_key: Value of the Idempotency-Key header.
+        :param request_body: JSON body of the request; the key cannot be reused with another body.
+        :param action: Runs the request, returning its (JSON body, HTTP status).
+        :return: The record with the response, and whether it is a stored response being replayed.
+        :raises ValueError: If the key is empty, too long or not printable ASCII.
+        :raises IdempotencyKeyReusedError: If the key was used with a different body.
+        :raises IdempotencyKeyInProgressError: If the first request with the key is still running.
+        """
+        self.__validate_key(idempotency_key)
+        now = datetime.utcnow()
+        record = IdempotencyRecordEntity(scope, idempotency_key, self.request_hash(request_body),
+                                         expires_at=now + self.key_ttl)
+        existing = self.idempotency_key_repository.claim(record, now)
+        if existing is not None:
+            if existing.request_hash != record.request_hash:
+                raise IdempotencyKeyReusedError()
+            if existing.status != IdempotencyRecordEntity.COMPLETED:
+                raise IdempotencyKeyInProgressError()
+            return existing, True
+
+        try:
+            record.response_body, record.response_status = action()
+        except BaseException:
+            self.idempotency_key_repository.release(scope, idempotency_key)
+            raise
+        self.__complete(record)
+        return record, False
+
+    def __complete(self, record: IdempotencyRecordEntity) -> None:
+        error = None
+        for _ in range(COMPLETE_ATTEMPTS):
+            try:
+                self.idempotency_key_repository.complete(record)
+                return
+            except Exception as e:
+                error = e
+        # Não libera a chave: a ação já rodou e repeti-la (ex.: outro checkout) seria pior
+        print(f"Error storing the response of idempotency key {record.idempotency_key} ({record.scope}): "
+              f"{error}; response {record.response_status} {record.response_body}")
+
+    def purge_expired(self, batch_size: int = EXPIRED_KEY_DELETE_BATCH_SIZE) -> int:
+        """
+        Deletes the keys whose TTL has passed, batch_size per transaction.
+
+        :return: Number of deleted keys.
+        """
+        deleted = 0
+        now = datetime.utcnow()
+        while True:
+            batch = self.idempotency_key_repository.delete_expired(now, batch_size)
+            deleted += batch
+            if batch < batch_size:
+                return deleted
+
+    @staticmethod
+    def request_hash(request_body: Any) -> str:
+        """SHA-256 of the body in canonical JSON (sorted keys), so key order does not matter."""
+        canonical = json.dumps(request_body, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def __validate_key(idempotency_key: str) -> None:
+        if (not idempotency_key or len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH
+                or not idempotency_key.isascii() or not idempotency_key.isprintable()):
+            raise ValueError(f"Idempotency-Key must have 1 to {MAX_IDEMPOTENCY_KEY_LENGTH} printable ASCII characters")
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from app.common.utils import decode_keyset_cursor, encode_keyset_cursor
+from app.domain.repositories.order_repository_interface import IOrderRepository
+from app.presentation.dtos.order_dtos import OrderResponse
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class OrderHistoryService:
+    def __init__(self, order_repository: IOrderRepository):
+        self.order_repository = order_repository
+
+    def get_orders_page(self, buyer_id: str, limit: int = DEFAULT_PAGE_SIZE,
+                        cursor: Optional[str] = None) -> tuple[list[OrderResponse], Optional[str]]:
+        """
+        Returns one page of the buyer's orders, newest first, and the cursor of the next page.
+
+        Pages are fetched by keyset on (order_date, order_id), so the cost of a
+        page does not depend on how many orders the buyer has.
+
+        :param buyer_id: ID of the buyer.
+        :param limit: Maximum number of orders in the page.
+        :param cursor: Opaque cursor returned with the previous page, or None for the first page.
+        :return: Tuple (orders with their items, next cursor or None if this is the last page).
+        :raises ValueError: If limit or cursor are invalid.
+        """
+        if limit is None or limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        before = decode_keyset_cursor(cursor) if cursor else None
+
+        # Um pedido a mais diz se existe próxima página sem COUNT
+        orders = self.order_repository.find_page_by_buyer_id(buyer_id, limit=limit + 1, before=before)
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = encode_keyset_cursor(orders[-1].order_date, orders[-1].order_id)
+        return [OrderResponse.from_domain_entity(order) for order in orders], next_cursor
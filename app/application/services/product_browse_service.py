@@ -0,0 +1,97 @@
+from app.domain.models.product_filter import ProductFilter
+from app.domain.repositories.product_repository_interface import IProductRepository
+from app.domain.repositories.category_repository_interface import ICategoryRepository
+from app.presentation.dtos.product_dtos import (
+    ResponseRegisterProduct, ProductBrowseResponse, ProductBrowseFacets, CategoryFacet, PriceRangeFacet
+)
+
+DEFAULT_BROWSE_PAGE_SIZE = 20
+MAX_BROWSE_PAGE_SIZE = 50
+# Limites superiores (exclusivos) das faixas de preço das facetas
+PRICE_BUCKET_BOUNDS = (25.0, 50.0, 100.0, 200.0, 500.0)
+BROWSE_SORTS = ('newest', 'price_asc', 'price_desc')
+# Status que o catálogo público pode filtrar (inativos nunca aparecem)
+BROWSE_STATUSES = ('active', 'out_of_stock')
+
+
+class ProductBrowseService:
+    def __init__(self, product_repository: IProductRepository, category_repository: ICategoryRepository):
+        self.product_repository = product_repository
+        self.category_repository = category_repository
+
+    def browse_products(self, product_filter: ProductFilter, page: int = 1,
+                        page_size: int = DEFAULT_BROWSE_PAGE_SIZE, sort: str = 'newest') -> ProductBrowseResponse:
+        """
+        Lists the products matching the filters with facet counts per category
+        and per price range.
+
+        :param product_filter: Criteria the products must match.
+        :param page: 1-based page number.
+        :param page_size: Number of products per page.
+        :param sort: 'newest', 'price_asc' or 'price_desc'.
+        :return: ProductBrowseResponse with the page and the facets.
+        :raises ValueError: If the filters or the pagination parameters are invalid.
+        """
+        self._validate(product_filter, page, page_size, sort)
+
+        # As facetas também dão o total: não precisa de um COUNT separado
+        counts = self.product_repository.count_facets(product_filter, PRICE_BUCKET_BOUNDS)
+        total = sum(counts['categories'].values())
+        offset = (page - 1) * page_size
+
+        rows = []
+        if offset < total:
+            rows = self.product_repository.find_with_categories_by_filter(
+                product_filter, limit=page_size, offset=offset, sort=sort
+            )
+
+        return ProductBrowseResponse(
+            page=page,
+            page_size=page_size,
+            total=total,
+            has_next=offset + page_size < total,
+            items=[ResponseRegisterProduct.from_domain_entities(product, category) for product, category in rows],
+            facets=ProductBrowseFacets(
+                categories=self._category_facets(counts['categories']),
+                price_ranges=self._price_range_facets(counts['price_buckets']),
+            ),
+        )
+
+    @staticmethod
+    def _validate(product_filter, page, page_size, sort):
+        if page_size is None or page_size < 1 or page_size > MAX_BROWSE_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_BROWSE_PAGE_SIZE}")
+        if page is None or page < 1:
+            raise ValueError("page must be greater than zero")
+        if sort not in BROWSE_SORTS:
+            raise ValueError(f"sort must be one of: {', '.join(BROWSE_SORTS)}")
+        if product_filter.status and product_filter.status.lower() not in BROWSE_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(BROWSE_STATUSES)}")
+        for price in (product_filter.min_price, product_filter.max_price):
+            if price is not None and price < 0:
+                raise ValueError("Prices must not be negative")
+        if (product_filter.min_price is not None and product_filter.max_price is not None
+                and product_filter.min_price > product_filter.max_price):
+            raise ValueError("min_price must not be greater than max_price")
+
+    def _category_facets(self, category_counts: dict) -> list[CategoryFacet]:
+        # Nomes vêm do cache de categorias, sem JOIN na agregação
+        names = {
+            category.category_id: category.name
+            for category in self.category_repository.get_many_by_ids(list(category_counts))
+        } if category_counts else {}
+        facets = [
+            CategoryFacet(category_id=category_id, name=names.get(category_id), count=count)
+            for category_id, count in category_counts.items()
+        ]
+        facets.sort(key=lambda facet: (-facet.count, facet.name or ''))
+        return facets
+
+    @staticmethod
+    def _price_range_facets(bucket_counts: dict) -> list[PriceRangeFacet]:
+        lower_bounds = (0.0,) + PRICE_BUCKET_BOUNDS
+        upper_bounds = PRICE_BUCKET_BOUNDS + (None,)
+        return [
+            PriceRangeFacet(min_price=lower, max_price=upper, count=bucket_counts.get(index, 0))
+            for index, (lower, upper) in enumerate(zip(lower_bounds, upper_bounds))
+        ]
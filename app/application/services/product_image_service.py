@@ -0,0 +1,94 @@
+import uuid
+from typing import BinaryIO, Iterator, Optional
+
+from app.domain.repositories.file_storage_interface import IFileStorage
+from app.domain.repositories.product_repository_interface import IProductRepository
+from app.common.exceptions import WorkerPoolBusyError
+from app.presentation.dtos.product_dtos import ProductImageUploadResponse
+
+MAX_IMAGE_UPLOAD_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _chunks(head: bytes, stream: BinaryIO) -> Iterator[bytes]:
+    yield head
+    while True:
+        chunk = stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+class ProductImageService:
+    def __init__(self, product_repository: IProductRepository, file_storage: IFileStorage, image_processor):
+        """
+        :param image_processor: Renders the resized variants in the background
+                                (see infrastructure.images.ImageVariantProcessor).
+        """
+        self.product_repository = product_repository
+        self.file_storage = file_storage
+        self.image_processor = image_processor
+
+    def upload_product_image(self, artisan_id: str, product_id: str, stream: BinaryIO) -> ProductImageUploadResponse:
+        """
+        Streams the image to the storage and schedules its variants, returning
+        without waiting for them. The product shows the original until the
+        display variant is ready, then switches to it.
+
+        :raises ValueError: If the product does not belong to the artisan or the file is not a JPEG, PNG or WebP image.
+        :raises UploadTooLargeError: If the image is larger than MAX_IMAGE_UPLOAD_BYTES.
+        :raises WorkerPoolBusyError: If too many images are already being processed.
+        """
+        product = self.product_repository.get_product_by_id(product_id)
+        if not product or product.artisan_id != artisan_id:
+            raise ValueError("Product not found")
+
+        head = stream.read(self.image_processor.sniff_bytes)
+        extension = self.image_processor.detect_extension(head)
+        if extension is None:
+            raise ValueError("Unsupported image, send a JPEG, PNG or WebP file")
+        # Recusa antes de gravar: com o pool cheio o upload seria descartado de qualquer forma
+        if self.image_processor.is_busy:
+            raise WorkerPoolBusyError()
+
+        image_id = uuid.uuid4().hex
+        prefix = f"products/{product_id}/{image_id}"
+        original_key = f"{prefix}/original.{extension}"
+        variant_keys = {variant.name: f"{prefix}/{variant.name}.{variant.extension}"
+                        for variant in self.image_processor.variants}
+        self.file_storage.save(original_key, _chunks(head, stream), max_bytes=MAX_IMAGE_UPLOAD_BYTES)
+        original_url = self.file_storage.url(original_key)
+
+        # Antes do submit: o callback só troca a URL enquanto ela ainda for a do original
+        self.product_repository.update_image_url(product_id, original_url)
+        try:
+            self.image_processor.submit(
+                self.file_storage.read(original_key),
+                lambda variants, error: self._store_variants(product_id, original_url, variant_keys, variants, error),
+            )
+        except WorkerPoolBusyError:
+            # O pool encheu depois da checagem: o produto fica só com o original
+            return ProductImageUploadResponse(product_id=product_id, image_id=image_id,
+                                              original_url=original_url, variants={}, status='original_only')
+
+        return ProductImageUploadResponse(
+            product_id=product_id,
+            image_id=image_id,
+            original_url=original_url,
+            variants={name: self.file_storage.url(key) for name, key in variant_keys.items()},
+        )
+
+    def _store_variants(self, product_id: str, original_url: str, variant_keys: dict[str, str],
+                        variants: Optional[dict[str, bytes]], error: Optional[BaseException]) -> None:
+        """
+        Saves the rendered variants and points the product at the display variant,
+        unless another image was uploaded meanwhile.
+        """
+        if error is not None:
+            # O produto continua com a imagem original
+            print(f"WARNING: Could not render the variants of {original_url}: {error}")
+            return
+        for name, data in variants.items():
+            self.file_storage.save(variant_keys[name], [data])
+        display_url = self.file_storage.url(variant_keys[self.image_processor.display_variant])
+        self.product_repository.update_image_url(product_id, display_url, expected_image_url=original_url)
@@ -0,0 +1,169 @@
+from asyncio.log import logger
+from itertools import islice
+from typing import Iterable, Optional
+
+from pydantic import ValidationError
+
+from app.common.exceptions import ProductBatchRejectedError
+from app.common.utils import normalize_product_name
+from app.domain.models.product import ProductEntity
+from app.domain.repositories.artisan_repository_interface import IArtisanRepository
+from app.domain.repositories.category_repository_interface import ICategoryRepository
+from app.domain.repositories.product_repository_interface import IProductRepository
+from app.presentation.dtos.product_dtos import RegisterProductRequest, ProductImportResponse, ProductImportRowError
+
+# Linhas validadas, checadas e gravadas juntas
+IMPORT_BATCH_SIZE = 500
+MAX_IMPORT_ROWS = 20_000
+
+
+def _validation_messages(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" if detail['loc'] else detail['msg']
+        for detail in error.errors()
+    ]
+
+
+class ProductImportService:
+    def __init__(self, product_repository: IProductRepository, category_repository: ICategoryRepository,
+                 artisan_repository: IArtisanRepository):
+        self.product_repository = product_repository
+        self.category_repository = category_repository
+        self._artisan_repository = artisan_repository
+
+    def import_products(self, artisan_id: str, records: Iterable[tuple[int, Optional[dict], Optional[str]]],
+                        batch_size: int = IMPORT_BATCH_SIZE) -> ProductImportResponse:
+        """
+        Imports many products for an artisan.
+
+        Rows are handled in batches: each batch is validated with RegisterProductRequest,
+        its names are checked against the artisan's catalogue with a single query and
+        its valid rows are saved together. Invalid rows are skipped and reported;
+        they never prevent the valid ones from being imported. Names are compared by
+        normalize_product_name, ignoring case and accents like the unique constraint.
+
+        :param artisan_id: ID of the artisan.
+        :param records: (row number, record, read error) tuples, as produced by app.common.record_readers.
+        :param batch_size: Number of rows per batch.
+        :return: ProductImportResponse with the counts and the errors per row.
+        :raises ValueError: If the artisan does not exist.
+        """
+        if not self._artisan_repository.get_artisan_by_id(artisan_id):
+            raise ValueError("Artisan not found")
+
+        errors: list[ProductImportRowError] = []
+        # Nomes (normalize_product_name) já gravados por esta importação
+        seen_names: set[str] = set()
+        total_rows = created = 0
+        truncated = False
+        records = iter(records)
+
+        while not truncated:
+            remaining = MAX_IMPORT_ROWS - total_rows
+            # Lê uma linha a mais para saber se o arquivo passa do limite
+            batch = list(islice(records, min(batch_size, remaining + 1)))
+            if not batch:
+                break
+            if len(batch) > remaining:
+                batch, truncated = batch[:remaining], True
+            total_rows += len(batch)
+            created += self._import_batch(artisan_id, batch, seen_names, errors)
+
+        errors.sort(key=lambda error: error.row)
+        return ProductImportResponse(
+            total_rows=total_rows,
+            created=created,
+            failed=len(errors),
+            truncated=truncated,
+            errors=errors,
+        )
+
+    def _import_batch(self, artisan_id, batch, seen_names, errors) -> int:
+        valid = []
+        for row_number, record, read_error in batch:
+            if read_error:
+                errors.append(ProductImportRowError(row=row_number, errors=[read_error]))
+                continue
+            try:
+                product_data = RegisterProductRequest(**record)
+            except ValidationError as e:
+                errors.append(ProductImportRowError(row=row_number, errors=_validation_messages(e)))
+                continue
+            row_errors = []
+            if not product_data.name or not product_data.name.strip():
+                row_errors.append("name: must not be empty")
+            if product_data.price < 0:
+                row_errors.append("price: must not be negative")
+            if product_data.stock is not None and product_data.stock < 0:
+                row_errors.append("stock: must not be negative")
+            if row_errors:
+                errors.append(ProductImportRowError(row=row_number, errors=row_errors))
+                continue
+            valid.append((row_number, product_data))
+
+        if not valid:
+            return 0
+
+        # Uma consulta por lote para categorias (cache) e outra para nomes já cadastrados
+        category_ids = {product_data.category_id for _, product_data in valid}
+        known_categories = {category.category_id for category in self.category_repository.get_many_by_ids(list(category_ids))}
+        existing_names = {normalize_product_name(name) for name in self.product_repository.find_existing_names(
+            artisan_id, [product_data.name for _, product_data in valid]
+        )}
+
+        row_numbers, entities, batch_names = [], [], set()
+        for row_number, product_data in valid:
+            name = normalize_product_name(product_data.name)
+            if product_data.category_id not in known_categories:
+                errors.append(ProductImportRowError(row=row_number, errors=["Category does not exist"]))
+                continue
+            if name in existing_names:
+                errors.append(ProductImportRowError(row=row_number, errors=["Product with this name already exists for this artisan"]))
+                continue
+            if name in seen_names or name in batch_names:
+                errors.append(ProductImportRowError(row=row_number, errors=["Duplicated product name in the import"]))
+                continue
+            batch_names.add(name)
+            row_numbers.append(row_number)
+            entities.append(ProductEntity(
+                name=product_data.name,
+                description=product_data.description,
+                price=product_data.price,
+                stock=product_data.stock if product_data.stock is not None else 0,
+                artisan_id=artisan_id,
+                image_url=product_data.image_url if product_data.image_url else None,
+                category_id=product_data.category_id,
+            ))
+
+        if not entities:
+            return 0
+        try:
+            created = self.product_repository.bulk_create(entities)
+        except ProductBatchRejectedError:
+            # Alguma linha bateu numa constraint (ex.: nome gravado por outra requisição
+            # depois da consulta): grava linha a linha para perder só as que conflitam
+            return self._import_rows(artisan_id, row_numbers, entities, seen_names, errors)
+        except Exception as e:
+            logger.error(f"Error importing products for artisan {artisan_id}: {e}")
+            for row_number in row_numbers:
+                errors.append(ProductImportRowError(row=row_number, errors=["Could not save the product, try again"]))
+            return 0
+        seen_names.update(batch_names)
+        return created
+
+    def _import_rows(self, artisan_id, row_numbers, entities, seen_names, errors) -> int:
+        created = 0
+        for row_number, entity in zip(row_numbers, entities):
+            try:
+                self.product_repository.create(entity)
+            except ValueError as e:
+                # DuplicateProductError, CategoryNotFoundError...
+                errors.append(ProductImportRowError(row=row_number, errors=[str(e)]))
+                continue
+            except Exception as e:
+                logger.error(f"Error importing product of row {row_number} for artisan {artisan_id}: {e}")
+                errors.append(ProductImportRowError(row=row_number, errors=["Could not save the product, try again"]))
+                continue
+            seen_names.add(normalize_product_name(entity.name))
+            created += 1
+        return created
@@ -0,0 +1,67 @@
+import re
+
+from app.domain.repositories.product_search_repository_interface import IProductSearchRepository
+from app.presentation.dtos.product_dtos import ResponseRegisterProduct, ProductSearchResponse
+
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 50
+# Páginas muito profundas custam caro para qualquer índice ranqueado
+MAX_SEARCH_RESULTS = 1000
+MAX_QUERY_LENGTH = 100
+MAX_QUERY_TERMS = 10
+
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class ProductSearchService:
+    def __init__(self, search_repository: IProductSearchRepository):
+        self.search_repository = search_repository
+
+    @staticmethod
+    def extract_terms(query: str) -> list[str]:
+        """
+        Splits a free-text query into lowercase search terms, dropping
+        one-letter words and duplicates.
+        """
+        terms = []
+        for term in _TERM_PATTERN.findall(query.lower()):
+            if len(term) > 1 and term not in terms:
+                terms.append(term)
+        return terms[:MAX_QUERY_TERMS]
+
+    def search_products(self, query: str, page: int = 1, page_size: int = DEFAULT_SEARCH_PAGE_SIZE) -> ProductSearchResponse:
+        """
+        Searches products across all artisans, best matches first.
+
+        :param query: Free-text query matched against product name and description.
+        :param page: 1-based page number.
+        :param page_size: Number of products per page.
+        :return: ProductSearchResponse with the page of products.
+        :raises ValueError: If the query or the pagination parameters are invalid.
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query is required")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(f"Search query must have at most {MAX_QUERY_LENGTH} characters")
+        if page_size is None or page_size < 1 or page_size > MAX_SEARCH_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_SEARCH_PAGE_SIZE}")
+        if page is None or page < 1:
+            raise ValueError("page must be greater than zero")
+        offset = (page - 1) * page_size
+        if offset + page_size > MAX_SEARCH_RESULTS:
+            raise ValueError(f"Only the first {MAX_SEARCH_RESULTS} results can be paginated, please refine the search")
+
+        terms = self.extract_terms(query)
+        if not terms:
+            raise ValueError("Search query must contain at least one word")
+
+        # One extra row tells whether there is a next page without a COUNT query
+        rows = self.search_repository.search(terms, limit=page_size + 1, offset=offset)
+        has_next = len(rows) > page_size
+        return ProductSearchResponse(
+            query=query,
+            page=page,
+            page_size=page_size,
+            has_next=has_next,
+            items=[ResponseRegisterProduct.from_domain_entities(product, category) for product, category in rows[:page_size]],
+        )
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Union
+
+from app.common.exceptions import InsufficientStockError, ReservationNotFoundError
+from app.domain.models.stock_reservation import StockReservationEntity
+from app.domain.repositories.stock_reservation_repository_interface import IStockReservationRepository
+
+# Tempo que uma reserva pendente segura o estoque até ser confirmada
+DEFAULT_RESERVATION_TTL = timedelta(minutes=15)
+# Reservas expiradas liberadas por consulta na varredura
+EXPIRED_RELEASE_BATCH_SIZE = 100
+
+
+class StockReservationService:
+    def __init__(self, stock_reservation_repository: IStockReservationRepository,
+                 reservation_ttl: timedelta = DEFAULT_RESERVATION_TTL):
+        self.stock_reservation_repository = stock_reservation_repository
+        self.reservation_ttl = reservation_ttl
+
+    def reserve(self, items: Union[dict[str, int], Iterable[tuple[str, int]]]) -> StockReservationEntity:
+        """
+        Reserves the stock of every item at once (all or none), e.g. all the lines of a cart.
+
+        :param items: Quantity per product_id, as a dict or as (product_id, quantity) pairs;
+                      repeated products are added up.
+        :return: The pending reservation, which holds the stock until it expires.
+        :raises InsufficientStockError: If any product does not have enough stock.
+        :raises ValueError: If the items are invalid.
+        """
+        quantities = self.__merge_quantities(items)
+        reservation = StockReservationEntity(items=quantities, expires_at=datetime.utcnow() + self.reservation_ttl)
+        try:
+            return self.stock_reservation_repository.reserve(reservation)
+        except InsufficientStockError as e:
+            # Reservas abandonadas podem estar segurando o estoque que falta:
+            # libera as expiradas desses produtos e tenta mais uma vez
+            if not self.release_expired(product_ids=e.product_ids):
+                raise
+            return self.stock_reservation_repository.reserve(reservation)
+
+    def confirm(self, reservation_id: str) -> None:
+        """
+        Confirms a pending reservation; its stock is not given back anymore.
+
+        :raises ReservationNotFoundError: If the reservation is not pending or has expired.
+        """
+        if not self.stock_reservation_repository.confirm(reservation_id, datetime.utcnow()):
+            raise ReservationNotFoundError()
+
+    def release(self, reservation_id: str) -> None:
+        """
+        Cancels a pending reservation, giving its stock back.
+
+        :raises ReservationNotFoundError: If the reservation is not pending.
+        """
+        if not self.stock_reservation_repository.release(reservation_id):
+            raise ReservationNotFoundError()
+
+    def release_expired(self, product_ids: Optional[list[str]] = None,
+                        batch_size: int = EXPIRED_RELEASE_BATCH_SIZE) -> int:
+        """
+        Gives back the stock of the pending reservations that have expired.
+
+        :param product_ids: Only reservations holding one of these products (all if None).
+        :param batch_size: Reservations looked up per query.
+        :return: Number of released reservations.
+        """
+        released = 0
+        while True:
+            expired_ids = self.stock_reservation_repository.find_expired_ids(
+                datetime.utcnow(), batch_size, product_ids=product_ids
+            )
+            for reservation_id in expired_ids:
+                if self.stock_reservation_repository.release(reservation_id, status=StockReservationEntity.EXPIRED):
+                    released += 1
+            if len(expired_ids) < batch_size:
+                return released
+
+    @staticmethod
+    def __merge_quantities(items) -> dict[str, int]:
+        pairs = items.items() if isinstance(items, dict) else items
+        quantities: dict[str, int] = {}
+        for product_id, quantity in pairs:
+            if not product_id or isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+                raise ValueError("Each item needs a product_id and a positive integer quantity")
+            quantities[product_id] = quantities.get(product_id, 0) + quantity
+        if not quantities:
+            raise ValueError("A reservation needs at least one item")
+        return quantities
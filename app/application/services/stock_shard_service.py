@@ -0,0 +1,43 @@
+from typing import Optional
+
+from app.domain.repositories.stock_shard_repository_interface import IStockShardRepository
+
+# Limites do número de shards por produto: com 1 não há ganho e muitos shards
+# deixam lenta a reserva quando o estoque está acabando (os shards são tentados em sequência)
+MIN_STOCK_SHARDS = 2
+MAX_STOCK_SHARDS = 64
+
+
+class StockShardService:
+    def __init__(self, stock_shard_repository: IStockShardRepository):
+        self.stock_shard_repository = stock_shard_repository
+
+    def enable_sharding(self, product_id: str, shard_count: int) -> None:
+        """
+        Puts a hot product in sharded-inventory mode, so concurrent reservations
+        update different rows instead of queueing on the product row.
+
+        :raises ValueError: If the shard count is out of range, or the product does
+                            not exist or is already sharded.
+        """
+        if not MIN_STOCK_SHARDS <= shard_count <= MAX_STOCK_SHARDS:
+            raise ValueError(f"The number of shards must be between {MIN_STOCK_SHARDS} and {MAX_STOCK_SHARDS}")
+        if not self.stock_shard_repository.enable_sharding(product_id, shard_count):
+            raise ValueError("Product not found or already sharded")
+
+    def disable_sharding(self, product_id: str) -> None:
+        """
+        Moves the stock of a sharded product back to its row.
+
+        :raises ValueError: If the product is not sharded.
+        """
+        if not self.stock_shard_repository.disable_sharding(product_id):
+            raise ValueError("Product is not sharded")
+
+    def sync_totals(self, product_ids: Optional[list[str]] = None) -> int:
+        """
+        Refreshes the cached total (the products' stock column) of the sharded products.
+
+        :return: Number of products whose stock changed.
+        """
+        return self.stock_shard_repository.sync_totals(product_ids)
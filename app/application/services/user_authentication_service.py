@@ -0,0 +1,75 @@
+from typing import Optional
+
+from app.common.exceptions import InvalidCredentialsError, InvalidTokenError
+from app.domain.models.user import UserEntity
+from app.domain.repositories.artisan_repository_interface import IArtisanRepository
+from app.domain.repositories.user_repository_interface import IUserRepository
+from app.domain.services.password_hasher_interface import IPasswordHasher
+from app.domain.services.token_service_interface import REFRESH_TOKEN, ITokenService
+from app.presentation.dtos.user_dtos import LoginResponse
+
+ARTISAN_ROLE = 'artisan'
+BUYER_ROLE = 'buyer'
+
+
+def is_active(user: Optional[UserEntity]) -> bool:
+    return user is not None and (user.status or '').lower() == 'active'
+
+
+class UserAuthenticationService:
+
+    def __init__(self, user_repository: IUserRepository, artisan_repository: IArtisanRepository,
+                 password_hasher: IPasswordHasher, token_service: ITokenService):
+        self.user_repository = user_repository
+        self.artisan_repository = artisan_repository
+        self.password_hasher = password_hasher
+        self.token_service = token_service
+
+    def authenticate(self, email: str, password: str) -> UserEntity:
+        """
+        Checks the credentials of a user. When the stored hash was made with
+        another work factor (or is a legacy plain password), it is replaced by
+        a hash with the current one, now that the password is known.
+
+        :raises InvalidCredentialsError: If the email is unknown, the user is not active or the password is wrong.
+        :raises WorkerPoolBusyError: If too many passwords are being hashed at the moment.
+        """
+        user = self.user_repository.get_by_email(email)
+        if not is_active(user):
+            raise InvalidCredentialsError()
+        if not self.password_hasher.verify(password, user.password):
+            raise InvalidCredentialsError()
+
+        if self.password_hasher.needs_rehash(user.password):
+            new_hash = self.password_hasher.hash(password)
+            try:
+                if self.user_repository.update_password_hash(user.user_id, new_hash, user.password):
+                    user.password = new_hash
+            except Exception as e:
+                # O login não depende disso: tenta de novo no próximo
+                print(f"WARNING: Could not rehash the password of user {user.user_id}: {e}")
+        return user
+
+    def login(self, email: str, password: str) -> LoginResponse:
+        """
+        Authenticates the user and issues an access and a refresh token.
+
+        :raises InvalidCredentialsError: If the credentials are not valid.
+        :raises WorkerPoolBusyError: If too many passwords are being hashed at the moment.
+        """
+        user = self.authenticate(email, password)
+        role = ARTISAN_ROLE if self.artisan_repository.get_artisan_by_id(user.user_id) else BUYER_ROLE
+        return LoginResponse.from_domain_entity(user, role, self.token_service.issue_tokens(user.user_id, role))
+
+    def refresh(self, refresh_token: str) -> LoginResponse:
+        """
+        Issues new tokens from a refresh token, if its user is still active.
+
+        :raises InvalidTokenError: If the refresh token is not valid or the user is no longer active.
+        """
+        claims = self.token_service.decode(refresh_token, REFRESH_TOKEN)
+        user = self.user_repository.get_by_id(claims['sub'])
+        if not is_active(user):
+            raise InvalidTokenError()
+        return LoginResponse.from_domain_entity(user, claims['role'],
+                                                self.token_service.issue_tokens(user.user_id, claims['role']))
@@ -0,0 +1,98 @@
+"""
+Comandos de manutenção executados com o `flask` CLI (ex.: a partir de um cron).
+"""
+import time
+
+import click
+from flask.cli import AppGroup
+
+from app.application.services.idempotency_service import EXPIRED_KEY_DELETE_BATCH_SIZE, IdempotencyService
+from app.application.services.stock_reservation_service import EXPIRED_RELEASE_BATCH_SIZE, StockReservationService
+from app.application.services.stock_shard_service import StockShardService
+from app.infrastructure.database.dataset_seeder import DEFAULT_SEED, DEFAULT_SEED_BATCH_SIZE, DatasetSeeder
+from app.infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
+from app.infrastructure.persistence.idempotency_key_repository import IdempotencyKeyRepository
+from app.infrastructure.persistence.stock_reservation_repository import StockReservationRepository
+from app.infrastructure.persistence.stock_shard_repository import StockShardRepository
+
+stock_cli = AppGroup('stock', help='Stock reservation maintenance.')
+dataset_cli = AppGroup('dataset', help='Generated datasets for local benchmarks.')
+idempotency_cli = AppGroup('idempotency', help='Idempotency-Key store maintenance.')
+
+
+@stock_cli.command('release-expired')
+@click.option('--batch-size', default=EXPIRED_RELEASE_BATCH_SIZE, show_default=True,
+              help='Reservations looked up per query.')
+def release_expired_reservations(batch_size):
+    """Give back the stock held by expired reservations."""
+    released = StockReservationService(StockReservationRepository()).release_expired(batch_size=batch_size)
+    click.echo(f"{released} expired reservations released")
+
+
+@stock_cli.command('shard')
+@click.argument('product_id')
+@click.option('--shards', default=8, show_default=True, help='Number of stock shards.')
+def shard_product_stock(product_id, shards):
+    """Split the stock of a hot product across several rows."""
+    try:
+        StockShardService(StockShardRepository()).enable_sharding(product_id, shards)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Stock of product {product_id} split across {shards} shards")
+
+
+@stock_cli.command('unshard')
+@click.argument('product_id')
+def unshard_product_stock(product_id):
+    """Move the stock of a sharded product back to its row."""
+    try:
+        StockShardService(StockShardRepository()).disable_sharding(product_id)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Stock of product {product_id} is no longer sharded")
+
+
+@stock_cli.command('sync-shards')
+def sync_sharded_stock_totals():
+    """Copy the sum of the shards to the stock shown in listings."""
+    changed = StockShardService(StockShardRepository()).sync_totals()
+    click.echo(f"{changed} sharded products updated")
+
+
+@idempotency_cli.command('purge-expired')
+@click.option('--batch-size', default=EXPIRED_KEY_DELETE_BATCH_SIZE, show_default=True, type=click.IntRange(min=1),
+              help='Keys deleted per transaction.')
+def purge_expired_idempotency_keys(batch_size):
+    """Delete the Idempotency-Keys whose TTL has passed."""
+    deleted = IdempotencyService(IdempotencyKeyRepository()).purge_expired(batch_size=batch_size)
+    click.echo(f"{deleted} expired idempotency keys deleted")
+
+
+@dataset_cli.command('seed')
+@click.option('--artisans', default=1000, show_default=True, help='Artisans to create.')
+@click.option('--buyers', default=10000, show_default=True, help='Buyers to create.')
+@click.option('--products-per-artisan', default=20.0, show_default=True, help='Average products per artisan.')
+@click.option('--orders-per-buyer', default=3.0, show_default=True, help='Average orders per buyer.')
+@click.option('--reviews-per-buyer', default=1.0, show_default=True, help='Average reviews per buyer.')
+@click.option('--cart-ratio', default=0.3, show_default=True, type=click.FloatRange(0, 1),
+              help='Fraction of the buyers with an open cart.')
+@click.option('--seed', 'seed', default=DEFAULT_SEED, show_default=True,
+              help='Random seed; the same seed generates the same dataset.')
+@click.option('--batch-size', default=DEFAULT_SEED_BATCH_SIZE, show_default=True, type=click.IntRange(min=1),
+              help='Rows per INSERT and per commit.')
+@click.option('--password', default='Seed@12345', show_default=True, help='Password of every seeded user.')
+def seed_dataset(artisans, buyers, products_per_artisan, orders_per_buyer, reviews_per_buyer, cart_ratio,
+                 seed, batch_size, password):
+    """Fill the database with a large, realistic dataset (categories must already exist)."""
+    started = time.perf_counter()
+    seeder = DatasetSeeder(seed=seed, batch_size=batch_size,
+                           password_hash=BcryptPasswordHasher().hash(password))
+    try:
+        counts = seeder.seed(artisans, buyers, products_per_artisan=products_per_artisan,
+                             orders_per_buyer=orders_per_buyer, reviews_per_buyer=reviews_per_buyer,
+                             cart_ratio=cart_ratio)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    for table, rows in counts.items():
+        click.echo(f"{table}: {rows} rows")
+    click.echo(f"Dataset seeded in {time.perf_counter() - started:.1f}s")
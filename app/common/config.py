@@ -1,8 +1,18 @@
 import os
+import secrets
+import tempfile
+from datetime import timedelta
+
+# Valor público (está no repositório): só serve para desenvolvimento
+DEFAULT_SECRET_KEY = 'uma-chave-secreta-padrao-para-emergencias'
+# Ambientes em que a chave dos tokens pode faltar (ver Development/TestingConfig)
+JWT_SECRET_OPTIONAL_ENVIRONMENTS = ('development', 'testing', 'default')
+
+
 class Config:
     """Configuração base, com valores padrão."""
     # Chave secreta para segurança da sessão e outros recursos do Flask
-    SECRET_KEY = os.getenv('FLASK_SECRET_KEY', 'uma-chave-secreta-padrao-para-emergencias')
+    SECRET_KEY = os.getenv('FLASK_SECRET_KEY', DEFAULT_SECRET_KEY)
     
     # Configurações do SQLAlchemy
     SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -11,12 +21,59 @@ class Config:
     JSON_AS_ASCII = False
     DEBUG = False
     TESTING = False
+    # Sem sugestões de rotas ("did you mean ...") nas mensagens 404 da API
+    ERROR_404_HELP = False
+
+    # Carrega as categorias em memória no startup (ver CategoryCache)
+    WARM_CATEGORY_CACHE_ON_STARTUP = True
+
+    # Backend da busca de produtos: 'database' (índice full-text do banco) ou
+    # 'memory' (índice invertido no processo, carregado no startup)
+    PRODUCT_SEARCH_BACKEND = os.getenv('PRODUCT_SEARCH_BACKEND', 'database')
+    # Carrega o índice em memória numa thread, sem atrasar o startup;
+    # até terminar, a busca usa o banco
+    PRODUCT_SEARCH_INDEX_BACKGROUND_BUILD = True
+
+    # Arquivos enviados (imagens de produto) num diretório local, servidos em MEDIA_URL
+    MEDIA_ROOT = os.getenv('MEDIA_ROOT', os.path.join(os.getcwd(), 'media'))
+    MEDIA_URL = os.getenv('MEDIA_URL', '/media')
+    # Processos que geram as miniaturas e quantas imagens podem esperar por eles (além disso, 503)
+    IMAGE_PROCESSING_WORKERS = int(os.getenv('IMAGE_PROCESSING_WORKERS', 2))
+    IMAGE_PROCESSING_QUEUE_LIMIT = int(os.getenv('IMAGE_PROCESSING_QUEUE_LIMIT', 32))
+
+    # Custo do bcrypt (cada +1 dobra o tempo do hash); hashes com outro custo são refeitos no login
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+    # Threads que calculam os hashes e quantos podem esperar por elas (além disso, 503).
+    # O limite tem de ficar abaixo das threads do gunicorn (--threads 8 no dockerfile):
+    # cada requisição espera o próprio hash, então nunca há mais hashes pendentes que threads
+    PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', min(4, os.cpu_count() or 1)))
+    PASSWORD_HASHING_QUEUE_LIMIT = int(os.getenv('PASSWORD_HASHING_QUEUE_LIMIT', PASSWORD_HASHING_WORKERS + 2))
+
+    # Tokens JWT do login (HS256)
+    # Sem valor padrão: fora de desenvolvimento e testes o create_app não sobe sem ela (validate_jwt_secret)
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
+    JWT_ACCESS_TOKEN_TTL = timedelta(minutes=int(os.getenv('JWT_ACCESS_TOKEN_MINUTES', 15)))
+    JWT_REFRESH_TOKEN_TTL = timedelta(days=int(os.getenv('JWT_REFRESH_TOKEN_DAYS', 7)))
+    # Tokens já verificados mantidos em memória (LRU) e por quanto tempo, no máximo, antes de checar o usuário de novo
+    VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv('VERIFIED_TOKEN_CACHE_SIZE', 10000))
+    VERIFIED_TOKEN_CACHE_MAX_AGE = int(os.getenv('VERIFIED_TOKEN_CACHE_MAX_AGE', 300))
+
+    # Carrinhos: 'database' (cada mudança é um commit) ou 'write_behind' (mudanças num
+    # buffer em memória, gravadas em lote a cada intervalo e antes do checkout)
+    CART_STORAGE = os.getenv('CART_STORAGE', 'database')
+    CART_FLUSH_INTERVAL_SECONDS = float(os.getenv('CART_FLUSH_INTERVAL_SECONDS', 5))
+    # Com mais compradores que isso no buffer a gravação não espera o intervalo
+    CART_FLUSH_MAX_PENDING_BUYERS = int(os.getenv('CART_FLUSH_MAX_PENDING_BUYERS', 1000))
+    # Respostas de Idempotency-Key já concluídas mantidas em memória (LRU) na frente da tabela idempotency_keys
+    IDEMPOTENCY_CACHE_SIZE = int(os.getenv('IDEMPOTENCY_CACHE_SIZE', 10000))
 
 class DevelopmentConfig(Config):
     """Configuração para o ambiente de desenvolvimento local."""
     DEBUG = True
     # Lê a URL do banco de dados do seu arquivo .env local
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
+    # Sem JWT_SECRET_KEY, uma chave aleatória por processo: os tokens deixam de valer ao reiniciar
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY') or secrets.token_urlsafe(32)
     print("dev env")
     print(SQLALCHEMY_DATABASE_URI)
 
@@ -37,6 +94,15 @@ class TestingConfig(Config):
     print("teste env")
     print(SQLALCHEMY_DATABASE_URI)
     CHECK_DB_CONNECTION_ON_STARTUP = 'False' 
+    # As tabelas de teste só são criadas depois do create_app
+    WARM_CATEGORY_CACHE_ON_STARTUP = False
+    PRODUCT_SEARCH_BACKEND = 'database'
+    CART_STORAGE = 'database'
+    MEDIA_ROOT = os.path.join(tempfile.gettempdir(), 'artisan-platform-test-media')
+    IMAGE_PROCESSING_WORKERS = 1
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY') or 'testing-only-jwt-secret'
+    # Custo mínimo do bcrypt: os testes não medem o hash
+    BCRYPT_ROUNDS = 4
 
 class ProductionConfig(Config):
     """Configuração para o ambiente de produção (nuvem)."""
@@ -51,4 +117,21 @@ config_by_name = {
     'testing': TestingConfig,
     'production': ProductionConfig,
     'default': DevelopmentConfig  
-}
\ No newline at end of file
+}
+
+
+def validate_jwt_secret(config_name, config):
+    """
+    Refuses to start outside development and testing when the access tokens
+    would be signed with a missing or public key: anyone could then issue
+    tokens for any user and role.
+
+    :param config_name: Name of the environment (key of config_by_name).
+    :param config: The loaded app.config.
+    :raises RuntimeError: If JWT_SECRET_KEY is unset or equals the default SECRET_KEY.
+    """
+    if config_name in JWT_SECRET_OPTIONAL_ENVIRONMENTS:
+        return
+    secret = config.get('JWT_SECRET_KEY')
+    if not secret or secret == DEFAULT_SECRET_KEY:
+        raise RuntimeError(f"JWT_SECRET_KEY must be set to a private value in the '{config_name}' environment")
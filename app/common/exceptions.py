@@ -0,0 +1,128 @@
+"""
+Erros de domínio. Herdam de ValueError para que os controllers continuem
+respondendo 400 com a mensagem, como nas validações dos serviços.
+"""
+
+
+class ArtisanNotFoundError(ValueError):
+    """The artisan does not exist."""
+
+    def __init__(self, message: str = "Artisan not found"):
+        super().__init__(message)
+
+
+class CategoryNotFoundError(ValueError):
+    """The category does not exist."""
+
+    def __init__(self, message: str = "Category does not exist"):
+        super().__init__(message)
+
+
+class DuplicateProductError(ValueError):
+    """The artisan already has a product with the same name."""
+
+    def __init__(self, message: str = "Product with this name already exists for this artisan"):
+        super().__init__(message)
+
+
+class ProductBatchRejectedError(ValueError):
+    """A constraint rejected at least one product of a batch, so none of them was saved."""
+
+    def __init__(self, message: str = "A product of the batch was rejected by the database"):
+        super().__init__(message)
+
+
+class InsufficientStockError(ValueError):
+    """One or more products do not have enough stock for a reservation."""
+
+    def __init__(self, product_ids: list[str], message: str = "Insufficient stock"):
+        self.product_ids = list(product_ids)
+        super().__init__(f"{message} for products: {', '.join(self.product_ids)}" if self.product_ids else message)
+
+
+class ReservationNotFoundError(ValueError):
+    """The stock reservation does not exist or can no longer be changed."""
+
+    def __init__(self, message: str = "Reservation not found or no longer pending"):
+        super().__init__(message)
+
+
+class UploadTooLargeError(ValueError):
+    """The uploaded file is larger than allowed."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"File too large, the limit is {max_bytes // (1024 * 1024)} MB")
+
+
+class WorkerPoolBusyError(Exception):
+    """
+    A bounded worker pool already has as many pending tasks as it accepts.
+    Not a ValueError: the request was valid, the server is just busy (503).
+    """
+
+    def __init__(self, message: str = "Server busy, try again in a few seconds"):
+        super().__init__(message)
+
+
+class InvalidCredentialsError(ValueError):
+    """The email is not registered or the password does not match."""
+
+    def __init__(self, message: str = "Invalid email or password"):
+        super().__init__(message)
+
+
+class InvalidTokenError(ValueError):
+    """The token is malformed, has a bad signature, has expired or is of another type."""
+
+    def __init__(self, message: str = "Invalid or expired token"):
+        super().__init__(message)
+
+
+class EmailAlreadyRegisteredError(ValueError):
+    """Another user already has the same email (compared case-insensitively)."""
+
+    def __init__(self, message: str = "Email already registered."):
+        super().__init__(message)
+
+
+class ProductNotFoundError(ValueError):
+    """The product does not exist or is not for sale."""
+
+    def __init__(self, message: str = "Product not found"):
+        super().__init__(message)
+
+
+class CartItemNotFoundError(ValueError):
+    """The product is not in the buyer's cart."""
+
+    def __init__(self, message: str = "Product not in the cart"):
+        super().__init__(message)
+
+
+class EmptyCartError(ValueError):
+    """Checkout of a cart without items."""
+
+    def __init__(self, message: str = "The cart is empty"):
+        super().__init__(message)
+
+
+class CartChangedError(ValueError):
+    """The cart kept changing while the checkout was turning it into an order."""
+
+    def __init__(self, message: str = "The cart changed during checkout, try again"):
+        super().__init__(message)
+
+
+class IdempotencyKeyReusedError(ValueError):
+    """The Idempotency-Key was already used for a request with a different body."""
+
+    def __init__(self, message: str = "Idempotency-Key already used for a different request"):
+        super().__init__(message)
+
+
+class IdempotencyKeyInProgressError(ValueError):
+    """The first request with the Idempotency-Key has not finished yet."""
+
+    def __init__(self, message: str = "A request with this Idempotency-Key is still being processed"):
+        super().__init__(message)
@@ -0,0 +1,163 @@
+"""
+Leitores em streaming para importações em lote: JSON array, NDJSON e CSV.
+
+Cada leitor consome um stream binário aos poucos (sem carregar o corpo inteiro
+em memória) e gera tuplas (row_number, record, error): record é o dict lido e
+error a mensagem quando a linha não pôde ser lida. Bytes que não são UTF-8 também
+viram uma linha de erro, nunca uma exceção no meio da importação: as linhas
+anteriores já podem ter sido gravadas e o cliente precisa do relatório delas.
+"""
+import codecs
+import csv
+import io
+import json
+from typing import BinaryIO, Iterator, Optional
+
+CHUNK_SIZE = 64 * 1024
+
+Record = tuple[int, Optional[dict], Optional[str]]
+
+_WHITESPACE = ' \t\n\r'
+
+
+def _stop_at_invalid_utf8(records: Iterator[Record]) -> Iterator[Record]:
+    """
+    Passes the records through until the text stops being valid UTF-8; then
+    yields one last error row, as the position in the file is lost.
+    """
+    row_number = 0
+    try:
+        for record in records:
+            row_number = record[0]
+            yield record
+    except UnicodeDecodeError:
+        yield row_number + 1, None, "Invalid UTF-8 text; the rest of the file was not read"
+
+
+def _record_or_error(row_number: int, value) -> Record:
+    if not isinstance(value, dict):
+        return row_number, None, "Each row must be a JSON object"
+    return row_number, value, None
+
+
+def iter_json_array(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Record]:
+    """
+    Reads the items of a top-level JSON array one by one.
+    Malformed JSON or text cannot be resynchronised, so it yields one last error row and stops.
+    """
+    return _stop_at_invalid_utf8(_iter_json_array(stream, chunk_size))
+
+
+def _iter_json_array(stream: BinaryIO, chunk_size: int) -> Iterator[Record]:
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer, position, eof = '', 0, False
+    started, expect_item, row_number = False, True, 0
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position == len(buffer):
+            if eof:
+                if not started:
+                    return
+                yield row_number + 1, None, "Invalid JSON: the array is not closed"
+                return
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + text_decoder.decode(chunk, final=eof)
+            position = 0
+            continue
+
+        char = buffer[position]
+        if not started:
+            if char != '[':
+                yield 1, None, "Invalid JSON: expected an array of products"
+                return
+            started = True
+            position += 1
+            continue
+        if char == ']':
+            return
+        if not expect_item:
+            if char != ',':
+                yield row_number + 1, None, "Invalid JSON: expected ',' between items"
+                return
+            expect_item = True
+            position += 1
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as e:
+            if not eof:
+                # O item provavelmente continua no próximo bloco
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[position:] + text_decoder.decode(chunk, final=eof)
+                position = 0
+                continue
+            yield row_number + 1, None, f"Invalid JSON: {e.msg}; the rest of the file was not read"
+            return
+        if end == len(buffer) and not eof:
+            # Um valor que termina no fim do buffer pode estar truncado (ex.: um número)
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + text_decoder.decode(chunk, final=eof)
+            position = 0
+            continue
+
+        row_number += 1
+        expect_item = False
+        position = end
+        yield _record_or_error(row_number, value)
+
+
+def iter_ndjson(stream: BinaryIO) -> Iterator[Record]:
+    """
+    Reads one JSON object per line; blank lines are skipped and
+    an invalid line (JSON or UTF-8) only fails that row.
+    """
+    row_number = 0
+    # Cada linha é decodificada sozinha: bytes inválidos não contaminam as outras
+    for index, raw_line in enumerate(stream):
+        if index == 0 and raw_line.startswith(codecs.BOM_UTF8):
+            raw_line = raw_line[len(codecs.BOM_UTF8):]
+        if not raw_line.strip():
+            continue
+        row_number += 1
+        try:
+            value = json.loads(raw_line.decode('utf-8'))
+        except UnicodeDecodeError:
+            yield row_number, None, "Invalid UTF-8 text"
+            continue
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        yield _record_or_error(row_number, value)
+
+
+def iter_csv(stream: BinaryIO) -> Iterator[Record]:
+    """
+    Reads a CSV with a header row. Empty cells are read as None, so optional
+    fields can be left blank. Invalid UTF-8 yields one last error row and stops.
+    """
+    return _stop_at_invalid_utf8(_iter_csv(stream))
+
+
+def _iter_csv(stream: BinaryIO) -> Iterator[Record]:
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+    for row_number, row in enumerate(reader, start=1):
+        if None in row:
+            yield row_number, None, "Row has more cells than the header"
+            continue
+        yield row_number, {key: (value if value != '' else None) for key, value in row.items()}, None
+
+
+# Content types aceitos pela importação e o leitor de cada um
+READERS_BY_MIMETYPE = {
+    'application/json': iter_json_array,
+    'application/x-ndjson': iter_ndjson,
+    'application/jsonl': iter_ndjson,
+    'text/csv': iter_csv,
+}
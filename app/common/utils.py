@@ -0,0 +1,55 @@
+import base64
+import json
+import unicodedata
+from datetime import datetime
+
+
+def encode_keyset_cursor(sort_value: datetime, tiebreaker: str) -> str:
+    """
+    Encodes the (sort value, id) pair of the last row of a page into an opaque cursor.
+
+    :param sort_value: Datetime column the listing is ordered by.
+    :param tiebreaker: Unique ID that breaks ties between rows with the same sort value.
+    :return: URL-safe string to be sent back by the client to fetch the next page.
+    """
+    payload = json.dumps([sort_value.isoformat(), tiebreaker], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decodes a cursor created by encode_keyset_cursor.
+
+    :param cursor: Opaque cursor received from the client.
+    :return: Tuple (sort value, id) of the last row of the previous page.
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, tiebreaker = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(sort_value), str(tiebreaker)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+
+def normalize_email(email: str) -> str:
+    """
+    Canonical form of an email used for uniqueness and lookups: trimmed and lowercased.
+
+    :param email: Email as typed by the user.
+    :return: Normalized email.
+    """
+    return email.strip().lower()
+
+
+def normalize_product_name(name: str) -> str:
+    """
+    Key under which two product names of an artisan count as the same one, like in
+    the case- and accent-insensitive collation of uq_products_artisan_name:
+    trimmed, casefolded and without accents ("Café" and " cafe" share a key).
+
+    :param name: Product name as sent by the artisan.
+    :return: Normalized name.
+    """
+    decomposed = unicodedata.normalize('NFKD', name.strip().casefold())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
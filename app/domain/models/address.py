@@ -1,4 +1,29 @@
+import hashlib
+import re
+import unicodedata
 from typing import Optional
+
+# Campos que identificam um endereço (o complemento e o país ficam de fora, como em to_filter_dict)
+FINGERPRINT_FIELDS = ('street', 'number', 'neighborhood', 'city', 'state', 'zip_code')
+
+
+def _normalize_address_part(value: Optional[str]) -> str:
+    # Sem acentos, minúsculas e espaços simples: "Rua  São Jorge " == "rua sao jorge"
+    text = unicodedata.normalize('NFKD', value or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(text.casefold().split())
+
+
+def address_fingerprint(street, number, neighborhood, city, state, zip_code) -> str:
+    """
+    SHA-256 (hex) of the normalized identifying fields of an address. Two
+    addresses that differ only in case, accents, spacing or zip code
+    punctuation have the same fingerprint.
+    """
+    parts = [_normalize_address_part(part) for part in (street, number, neighborhood, city, state)]
+    parts.append(re.sub(r'\D', '', zip_code or ''))
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
 class AddressEntity:
     def __init__(self, street: str, city: str, state: str, zip_code: str, country: str, number: str, neighborhood: str, address_id: Optional[str] = None, complement: Optional[str] = None):
         self.address_id = address_id
@@ -46,6 +71,10 @@ class AddressEntity:
                 self.country == other.country
                 )
 
+    def fingerprint(self) -> str:
+        """Fingerprint used to find an existing identical address (see address_fingerprint)."""
+        return address_fingerprint(*(getattr(self, field) for field in FINGERPRINT_FIELDS))
+
     def to_filter_dict(self) -> dict:
         """
         Returns a normalized dictionary of the attributes that define uniqueness.
@@ -0,0 +1,77 @@
+from decimal import Decimal
+from typing import Optional
+from datetime import datetime
+
+from app.domain.models.category import CategoryEntity
+from app.domain.models.product import ProductEntity
+
+# Quantidade máxima de um produto numa linha do carrinho; somas além disso param nela
+MAX_CART_ITEM_QUANTITY = 99
+
+
+class CartItemEntity:
+    """
+    Representa uma linha do carrinho: um produto e a quantidade desejada.
+    """
+
+    def __init__(
+        self,
+        product_id: str,
+        quantity: int,
+        cart_item_id: Optional[str] = None,
+        product: Optional[ProductEntity] = None,
+        category: Optional[CategoryEntity] = None,
+        line_total: Optional[Decimal] = None,
+    ) -> None:
+        """
+        :param product_id: ID of the product in the cart.
+        :param quantity: Quantity of the product.
+        :param cart_item_id: Unique ID of the cart line.
+        :param product: The product, when the cart was loaded with its products.
+        :param category: The category of the product, loaded together with it.
+        :param line_total: Price times quantity, computed by the database.
+        """
+        self.cart_item_id = cart_item_id
+        self.product_id = product_id
+        self.quantity = quantity
+        self.product = product
+        self.category = category
+        self.line_total = line_total
+
+    def __repr__(self) -> str:
+        return (f"CartItemEntity(cart_item_id={self.cart_item_id!r}, product_id={self.product_id!r}, "
+                f"quantity={self.quantity!r}, line_total={self.line_total!r})")
+
+
+class CartEntity:
+    """
+    Representa o carrinho de compras de um comprador (um por comprador).
+    """
+
+    def __init__(
+        self,
+        buyer_id: str,
+        cart_id: Optional[str] = None,
+        items: Optional[list[CartItemEntity]] = None,
+        total_quantity: int = 0,
+        total_value: Decimal = Decimal('0.00'),
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        :param buyer_id: ID of the buyer who owns the cart.
+        :param cart_id: Unique ID of the cart.
+        :param items: Lines of the cart.
+        :param total_quantity: Sum of the quantities of the lines.
+        :param total_value: Sum of the line totals.
+        :param updated_at: Last change of the cart.
+        """
+        self.cart_id = cart_id
+        self.buyer_id = buyer_id
+        self.items = items if items is not None else []
+        self.total_quantity = total_quantity
+        self.total_value = total_value
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return (f"CartEntity(cart_id={self.cart_id!r}, buyer_id={self.buyer_id!r}, items={len(self.items)}, "
+                f"total_quantity={self.total_quantity!r}, total_value={self.total_value!r})")
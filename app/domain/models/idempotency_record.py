@@ -0,0 +1,43 @@
+from typing import Any, Optional
+from datetime import datetime
+
+
+class IdempotencyRecordEntity:
+    """
+    Representa o uso de uma Idempotency-Key: a requisição que a reservou e,
+    depois de concluída, a resposta devolvida às repetições dela.
+    """
+
+    IN_PROGRESS = 'in_progress'
+    COMPLETED = 'completed'
+
+    def __init__(
+        self,
+        scope: str,
+        idempotency_key: str,
+        request_hash: str,
+        expires_at: datetime,
+        status: str = IN_PROGRESS,
+        response_status: Optional[int] = None,
+        response_body: Optional[Any] = None,
+    ) -> None:
+        """
+        :param scope: Operation and owner the key belongs to (e.g. 'checkout:<buyer_id>').
+        :param idempotency_key: Key sent by the client in the Idempotency-Key header.
+        :param request_hash: SHA-256 of the request body that used the key.
+        :param expires_at: When the key can be used again for a new request.
+        :param status: 'in_progress' while the request runs, 'completed' once its response is stored.
+        :param response_status: HTTP status of the stored response.
+        :param response_body: JSON body of the stored response.
+        """
+        self.scope = scope
+        self.idempotency_key = idempotency_key
+        self.request_hash = request_hash
+        self.expires_at = expires_at
+        self.status = status
+        self.response_status = response_status
+        self.response_body = response_body
+
+    def __repr__(self) -> str:
+        return (f"IdempotencyRecordEntity(scope={self.scope!r}, idempotency_key={self.idempotency_key!r}, "
+                f"status={self.status!r}, response_status={self.response_status!r})")
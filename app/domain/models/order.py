@@ -0,0 +1,111 @@
+from decimal import Decimal
+from typing import Any, Optional
+from datetime import datetime
+
+
+class OrderItemEntity:
+    """
+    Representa uma linha do pedido, com o preço do produto no momento da compra.
+    """
+
+    def __init__(
+        self,
+        product_id: str,
+        quantity: int,
+        unit_price: Decimal,
+        order_item_id: Optional[str] = None,
+    ) -> None:
+        """
+        :param product_id: ID of the product bought.
+        :param quantity: Quantity bought.
+        :param unit_price: Price of the product at checkout (later price changes do not affect it).
+        :param order_item_id: Unique ID of the order line.
+        """
+        self.order_item_id = order_item_id
+        self.product_id = product_id
+        self.quantity = quantity
+        self.unit_price = unit_price
+
+    @classmethod
+    def from_db_model(cls, db_model: Any) -> 'OrderItemEntity':
+        """
+        Creates an OrderItemEntity instance from a database model.
+
+        :param db_model: The database model instance.
+        :return: An instance of OrderItemEntity.
+        """
+        return cls(
+            order_item_id=db_model.order_item_id,
+            product_id=db_model.product_id,
+            quantity=db_model.quantity,
+            unit_price=Decimal(db_model.unit_price).quantize(Decimal('0.01')),
+        )
+
+    @property
+    def line_total(self) -> Decimal:
+        return self.unit_price * self.quantity
+
+    def __repr__(self) -> str:
+        return (f"OrderItemEntity(order_item_id={self.order_item_id!r}, product_id={self.product_id!r}, "
+                f"quantity={self.quantity!r}, unit_price={self.unit_price!r})")
+
+
+class OrderEntity:
+    """
+    Representa um pedido de um comprador, criado a partir do carrinho no checkout.
+    """
+
+    PENDING = 'pending'
+
+    def __init__(
+        self,
+        buyer_id: str,
+        payment_method: str,
+        total_value: Decimal,
+        order_id: Optional[str] = None,
+        items: Optional[list[OrderItemEntity]] = None,
+        order_status: str = PENDING,
+        order_date: Optional[datetime] = None,
+        delivery_address_id: Optional[str] = None,
+    ) -> None:
+        """
+        :param buyer_id: ID of the buyer who placed the order.
+        :param payment_method: Payment method chosen at checkout.
+        :param total_value: Sum of the line totals.
+        :param order_id: Unique ID of the order.
+        :param items: Lines of the order.
+        :param order_status: 'pending', 'processing', 'shipped', 'delivered' or 'canceled'.
+        :param order_date: When the order was placed.
+        :param delivery_address_id: ID of the copy of the buyer's address the order is delivered to.
+        """
+        self.order_id = order_id
+        self.buyer_id = buyer_id
+        self.payment_method = payment_method
+        self.total_value = total_value
+        self.items = items if items is not None else []
+        self.order_status = order_status
+        self.order_date = order_date if order_date else datetime.utcnow()
+        self.delivery_address_id = delivery_address_id
+
+    @classmethod
+    def from_db_model(cls, db_model: Any) -> 'OrderEntity':
+        """
+        Creates an OrderEntity instance from a database model.
+
+        :param db_model: The database model instance, with its order_items loaded.
+        :return: An instance of OrderEntity.
+        """
+        return cls(
+            order_id=db_model.order_id,
+            buyer_id=db_model.buyer_id,
+            payment_method=db_model.payment_method,
+            total_value=Decimal(db_model.total_value).quantize(Decimal('0.01')),
+            items=[OrderItemEntity.from_db_model(item) for item in db_model.order_items],
+            order_status=db_model.order_status,
+            order_date=db_model.order_date,
+            delivery_address_id=db_model.delivery_address_id,
+        )
+
+    def __repr__(self) -> str:
+        return (f"OrderEntity(order_id={self.order_id!r}, buyer_id={self.buyer_id!r}, items={len(self.items)}, "
+                f"total_value={self.total_value!r}, order_status={self.order_status!r})")
@@ -0,0 +1,33 @@
+from typing import Optional
+
+
+class ProductFilter:
+    """
+    Critérios de filtragem do catálogo de produtos (browse).
+    Todos os critérios são opcionais e combinados com AND.
+    """
+
+    def __init__(
+        self,
+        category_id: Optional[str] = None,
+        artisan_id: Optional[str] = None,
+        status: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> None:
+        """
+        :param category_id: Only products of this category.
+        :param artisan_id: Only products of this artisan.
+        :param status: Only products with this status; when None, inactive products are excluded.
+        :param min_price: Minimum price (inclusive).
+        :param max_price: Maximum price (inclusive).
+        """
+        self.category_id = category_id
+        self.artisan_id = artisan_id
+        self.status = status
+        self.min_price = min_price
+        self.max_price = max_price
+
+    def __repr__(self) -> str:
+        return (f"ProductFilter(category_id={self.category_id!r}, artisan_id={self.artisan_id!r}, "
+                f"status={self.status!r}, min_price={self.min_price!r}, max_price={self.max_price!r})")
@@ -0,0 +1,55 @@
+from typing import Any, Optional
+from datetime import datetime
+
+
+class StockReservationEntity:
+    """
+    Representa uma reserva de estoque: as quantidades de cada produto já
+    descontadas do estoque até a reserva ser confirmada, liberada ou expirar.
+    """
+
+    PENDING = 'pending'
+    CONFIRMED = 'confirmed'
+    RELEASED = 'released'
+    EXPIRED = 'expired'
+
+    def __init__(
+        self,
+        items: dict[str, int],
+        expires_at: datetime,
+        reservation_id: Optional[str] = None,
+        status: str = PENDING,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        :param items: Reserved quantity per product_id.
+        :param expires_at: When a pending reservation stops holding the stock.
+        :param reservation_id: Unique ID of the reservation.
+        :param status: 'pending', 'confirmed', 'released' or 'expired'.
+        :param created_at: When the reservation was made.
+        """
+        self.reservation_id = reservation_id
+        self.items = items
+        self.expires_at = expires_at
+        self.status = status
+        self.created_at = created_at if created_at else datetime.utcnow()
+
+    @classmethod
+    def from_db_model(cls, db_model: Any) -> 'StockReservationEntity':
+        """
+        Creates a StockReservationEntity instance from a database model.
+
+        :param db_model: The database model instance, with its items loaded.
+        :return: An instance of StockReservationEntity.
+        """
+        return cls(
+            reservation_id=db_model.reservation_id,
+            items={item.product_id: item.quantity for item in db_model.items},
+            expires_at=db_model.expires_at,
+            status=db_model.status,
+            created_at=db_model.created_at,
+        )
+
+    def __repr__(self) -> str:
+        return (f"StockReservationEntity(reservation_id={self.reservation_id!r}, items={self.items!r}, "
+                f"expires_at={self.expires_at!r}, status={self.status!r}, created_at={self.created_at!r})")
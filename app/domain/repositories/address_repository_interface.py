@@ -10,7 +10,7 @@ class IAddressRepository(ABC):
     """
     @abstractmethod
     def create(self, address: AddressEntity) -> AddressEntity:
-        """Saves an Address entity to the persistent storage."""
+        """Stages an Address entity in the current unit of work; it is saved on IUnitOfWork.commit."""
         pass
 
     @abstractmethod
@@ -20,5 +20,5 @@ class IAddressRepository(ABC):
     
     @abstractmethod
     def get_by_attributes(self, address_entity: AddressEntity) -> Optional[AddressEntity]:
-        """Gets an Address entity by its zip code."""
+        """Gets an existing Address with the same normalized attributes (case, accents and spacing ignored)."""
         pass
@@ -6,6 +6,7 @@ class IArtisanRepository(ABC):
     
     @abstractmethod
     def create(self, artisan_entity: ArtisanEntity) -> ArtisanEntity: # Aceita e retorna a entidade pura
+        """Stages an Artisan entity in the current unit of work; it is saved on IUnitOfWork.commit."""
         pass
     
     @abstractmethod
@@ -6,4 +6,5 @@ class IBuyerRepository(ABC):
     
     @abstractmethod
     def create(self, buyer_entity: BuyerEntity) -> BuyerEntity: # Aceita e retorna a entidade pura
+        """Stages a Buyer entity in the current unit of work; it is saved on IUnitOfWork.commit."""
         pass
\ No newline at end of file
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.models.cart import CartEntity
+
+
+class ICartRepository(ABC):
+    """
+    Interface (Abstract Base Class) for shopping cart data access operations.
+    Each buyer has at most one cart; its lines are addressed by product_id.
+    """
+
+    @abstractmethod
+    def get_by_buyer_id(self, buyer_id: str) -> Optional[CartEntity]:
+        """
+        Retrieve the cart of a buyer with its items, their products and categories
+        and the totals, in a single query.
+
+        :param buyer_id: ID of the buyer.
+        :return: CartEntity instance if the buyer has a cart, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def add_item(self, buyer_id: str, product_id: str, quantity: int) -> None:
+        """
+        Add a quantity of a product to the buyer's cart, creating the cart or the
+        line when needed; a product already in the cart has its quantity increased.
+
+        :param buyer_id: ID of the buyer.
+        :param product_id: ID of the product.
+        :param quantity: Quantity to add.
+        """
+        pass
+
+    @abstractmethod
+    def set_item_quantity(self, buyer_id: str, product_id: str, quantity: int) -> bool:
+        """
+        Replace the quantity of a line of the buyer's cart.
+
+        :param buyer_id: ID of the buyer.
+        :param product_id: ID of the product of the line.
+        :param quantity: New quantity.
+        :return: True if the line exists, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def remove_item(self, buyer_id: str, product_id: str) -> bool:
+        """
+        Remove a line from the buyer's cart.
+
+        :param buyer_id: ID of the buyer.
+        :param product_id: ID of the product of the line.
+        :return: True if the line was removed, False if it did not exist.
+        """
+        pass
+
+    @abstractmethod
+    def flush(self, buyer_id: Optional[str] = None) -> None:
+        """
+        Write the cart changes that are still buffered to the database, e.g.
+        before a checkout reads the cart. Repositories that write at once do nothing.
+
+        :param buyer_id: Only the changes of this buyer (all if None).
+        """
+        pass
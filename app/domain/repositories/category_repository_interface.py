@@ -17,4 +17,9 @@ class ICategoryRepository(ABC):
     @abstractmethod
     def get_by_id(self, category_id: str) -> Optional[CategoryEntity]:
         """Gets a Category entity by its ID."""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_many_by_ids(self, category_ids: list[str]) -> list[CategoryEntity]:
+        """Gets the Category entities with the given IDs. Unknown IDs are ignored."""
+        pass
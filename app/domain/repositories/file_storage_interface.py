@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+
+class IFileStorage(ABC):
+    """
+    Interface (Abstract Base Class) for storing uploaded files (e.g. product images)
+    and building the public URLs they are served from.
+    """
+
+    @abstractmethod
+    def save(self, key: str, chunks: Iterable[bytes], max_bytes: Optional[int] = None) -> int:
+        """
+        Store a file, writing it chunk by chunk; the file only becomes visible when complete.
+
+        :param key: Path of the file inside the storage, e.g. 'products/<id>/<image>/original.jpg'.
+        :param chunks: Content of the file.
+        :param max_bytes: Maximum size; nothing is stored when the content goes past it.
+        :return: Number of bytes stored.
+        :raises UploadTooLargeError: If the content is larger than max_bytes.
+        """
+        pass
+
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """
+        Read a whole stored file.
+
+        :param key: Path of the file inside the storage.
+        :return: Content of the file.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Delete a stored file, if it exists.
+
+        :param key: Path of the file inside the storage.
+        """
+        pass
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """
+        Build the public URL of a stored file.
+
+        :param key: Path of the file inside the storage.
+        :return: URL the file is served from.
+        """
+        pass
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.domain.models.idempotency_record import IdempotencyRecordEntity
+
+
+class IIdempotencyKeyRepository(ABC):
+    """
+    Interface (Abstract Base Class) for the Idempotency-Key store.
+    """
+
+    @abstractmethod
+    def claim(self, record: IdempotencyRecordEntity, now: datetime) -> Optional[IdempotencyRecordEntity]:
+        """
+        Save the key as 'in_progress' unless another request already used it.
+        An expired record does not count: it is replaced.
+
+        :param record: The new record, with its scope, key, request hash and expiry.
+        :param now: Current time, to tell expired records apart.
+        :return: None if the key was claimed, otherwise the record that already holds it.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, record: IdempotencyRecordEntity) -> None:
+        """
+        Store the response of the request that claimed the key. The response is
+        kept in the process cache first, so it is replayed here even if the
+        database write fails.
+
+        :param record: The claimed record, with its response_status and JSON-serializable response_body.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, scope: str, idempotency_key: str) -> None:
+        """
+        Delete a key still 'in_progress', so the client can retry a request that failed.
+
+        :param scope: Scope of the key.
+        :param idempotency_key: The key.
+        """
+        pass
+
+    @abstractmethod
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        """
+        Delete records whose expiry has passed.
+
+        :param now: Current time.
+        :param limit: Maximum number of records to delete.
+        :return: Number of deleted records.
+        """
+        pass
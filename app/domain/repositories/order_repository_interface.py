@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.domain.models.order import OrderEntity
+
+
+class IOrderRepository(ABC):
+    """
+    Interface (Abstract Base Class) for order data access operations.
+    """
+
+    @abstractmethod
+    def create_from_cart(self, buyer_id: str, payment_method: str) -> OrderEntity:
+        """
+        Turn the buyer's cart into an order in one transaction: the prices of the
+        products are copied to the order lines, the stock is taken out of the
+        products and the cart is emptied. Nothing changes if any step fails.
+
+        :param buyer_id: ID of the buyer.
+        :param payment_method: Payment method of the order.
+        :return: The created OrderEntity, with its items.
+        :raises EmptyCartError: If the cart has no items.
+        :raises InsufficientStockError: If any product has less stock than the cart asks for.
+        :raises CartChangedError: If the cart kept changing while the order was being created.
+        """
+        pass
+
+    @abstractmethod
+    def find_page_by_buyer_id(self, buyer_id: str, limit: int,
+                              before: Optional[tuple[datetime, str]] = None) -> list[OrderEntity]:
+        """
+        Retrieve one page of a buyer's orders with their items, newest first,
+        ordered by (order_date, order_id).
+
+        :param buyer_id: ID of the buyer.
+        :param limit: Maximum number of orders.
+        :param before: (order_date, order_id) of the last order of the previous page, or None for the first page.
+        :return: List of OrderEntity instances with their items.
+        """
+        pass
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from app.domain.models.product import ProductEntity
+from app.domain.models.category import CategoryEntity
+from app.domain.models.product_filter import ProductFilter
 from typing import Optional
+from datetime import datetime
 
 class IProductRepository(ABC):
     """
@@ -40,11 +43,103 @@ class IProductRepository(ABC):
         pass
     
     @abstractmethod
-    def find_by_artisan_id(self, artisan_id: str) -> list[ProductEntity]:
+    def update_image_url(self, product_id: str, image_url: str, expected_image_url: Optional[str] = None) -> bool:
         """
-        Find all products associated with a specific artisan ID.
-        
+        Change the image URL of a product.
+
+        :param product_id: ID of the product.
+        :param image_url: New image URL.
+        :param expected_image_url: If given, the URL is only changed while it still has this value.
+        :return: True if the product was updated.
+        """
+        pass
+
+    @abstractmethod
+    def find_existing_names(self, artisan_id: str, names: list[str]) -> set[str]:
+        """
+        Find which of the given product names the artisan already uses.
+
+        :param artisan_id: ID of the artisan.
+        :param names: Product names to check.
+        :return: Set with the names that already exist for the artisan, as stored
+                 (they may differ in case or accents from the given ones).
+        """
+        pass
+
+    @abstractmethod
+    def bulk_create(self, product_entities: list[ProductEntity]) -> int:
+        """
+        Save many products at once, all or none of them.
+
+        :param product_entities: ProductEntity instances to be saved.
+        :return: Number of saved products.
+        :raises ProductBatchRejectedError: If a constraint rejects any of the products.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_artisan_id(self, artisan_id: str, limit: Optional[int] = None,
+                           after: Optional[tuple[datetime, str]] = None) -> list[ProductEntity]:
+        """
+        Find the products associated with a specific artisan ID, ordered by
+        (registration_date, product_id).
+
         :param artisan_id: ID of the artisan whose products are to be retrieved.
+        :param limit: Maximum number of products to return (all of them if None).
+        :param after: (registration_date, product_id) of the last product already seen;
+                      only products after it are returned.
         :return: List of ProductEntity instances associated with the artisan.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def find_with_categories_by_artisan_id(self, artisan_id: str, limit: Optional[int] = None,
+                                           after: Optional[tuple[datetime, str]] = None) -> list[tuple[ProductEntity, CategoryEntity]]:
+        """
+        Find the products of a specific artisan together with their categories,
+        ordered by (registration_date, product_id).
+
+        :param artisan_id: ID of the artisan whose products are to be retrieved.
+        :param limit: Maximum number of products to return (all of them if None).
+        :param after: (registration_date, product_id) of the last product already seen.
+        :return: List of (ProductEntity, CategoryEntity) pairs.
+        """
+        pass
+
+    @abstractmethod
+    def find_with_categories_by_filter(self, product_filter: ProductFilter, limit: int, offset: int = 0,
+                                       sort: str = 'newest') -> list[tuple[ProductEntity, CategoryEntity]]:
+        """
+        Find the products matching a filter together with their categories.
+
+        :param product_filter: Criteria the products must match.
+        :param limit: Maximum number of products to return.
+        :param offset: Number of matching products to skip.
+        :param sort: 'newest', 'price_asc' or 'price_desc'.
+        :return: List of (ProductEntity, CategoryEntity) pairs.
+        """
+        pass
+
+    @abstractmethod
+    def count_facets(self, product_filter: ProductFilter, price_bounds: tuple[float, ...]) -> dict:
+        """
+        Count the products matching a filter per category and per price bucket.
+
+        :param product_filter: Criteria the products must match.
+        :param price_bounds: Ascending upper bounds (exclusive) of the price buckets; bucket i holds
+                             prices in [price_bounds[i-1], price_bounds[i]) and the last bucket,
+                             len(price_bounds), holds every price from the last bound up.
+        :return: {'categories': {category_id: count}, 'price_buckets': {bucket_index: count}}.
+        """
+        pass
+
+    @abstractmethod
+    def get_artisan_catalogue_version(self, artisan_id: str) -> tuple[int, Optional[datetime]]:
+        """
+        Get a cheap version of an artisan's catalogue: it changes whenever one of
+        the artisan's products is created, updated or deleted.
+
+        :param artisan_id: ID of the artisan.
+        :return: Tuple (number of products, latest updated_at or None if there are no products).
+        """
+        pass
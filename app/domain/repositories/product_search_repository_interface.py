@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from app.domain.models.product import ProductEntity
+from app.domain.models.category import CategoryEntity
+
+class IProductSearchRepository(ABC):
+    """
+    Interface (Abstract Base Class) for full-text search over the product catalogue.
+    """
+
+    @abstractmethod
+    def search(self, terms: list[str], limit: int, offset: int = 0) -> list[tuple[ProductEntity, CategoryEntity]]:
+        """
+        Search products across all artisans, best matches first.
+
+        :param terms: Normalized search terms; a product matches if it contains any of them.
+        :param limit: Maximum number of products to return.
+        :param offset: Number of ranked products to skip.
+        :return: List of (ProductEntity, CategoryEntity) pairs ordered by relevance.
+        """
+        pass
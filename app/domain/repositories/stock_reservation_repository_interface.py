@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.domain.models.stock_reservation import StockReservationEntity
+
+
+class IStockReservationRepository(ABC):
+    """
+    Interface (Abstract Base Class) for stock reservation data access operations.
+    Defines the contract for reserving and giving back the 'products' stock.
+    """
+
+    @abstractmethod
+    def reserve(self, reservation: StockReservationEntity) -> StockReservationEntity:
+        """
+        Take the quantities of every item out of the products' stock and save the
+        reservation, all or none of them.
+
+        :param reservation: StockReservationEntity with the items to reserve.
+        :return: The saved StockReservationEntity instance.
+        :raises InsufficientStockError: If any product has less stock than requested.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_id(self, reservation_id: str) -> Optional[StockReservationEntity]:
+        """
+        Retrieve a reservation by its ID.
+
+        :param reservation_id: ID of the reservation to retrieve.
+        :return: StockReservationEntity instance if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def confirm(self, reservation_id: str, now: datetime) -> bool:
+        """
+        Mark a pending, not yet expired reservation as confirmed; its stock is kept.
+
+        :param reservation_id: ID of the reservation.
+        :param now: Current time, to reject expired reservations.
+        :return: True if the reservation was confirmed, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, reservation_id: str, status: str = StockReservationEntity.RELEASED) -> bool:
+        """
+        Give the stock of a pending reservation back to its products.
+
+        :param reservation_id: ID of the reservation.
+        :param status: Final status of the reservation, 'released' or 'expired'.
+        :return: True if the stock was given back, False if the reservation was not pending.
+        """
+        pass
+
+    @abstractmethod
+    def find_expired_ids(self, now: datetime, limit: int, product_ids: Optional[list[str]] = None) -> list[str]:
+        """
+        Find pending reservations whose expiry has passed.
+
+        :param now: Current time.
+        :param limit: Maximum number of IDs to return.
+        :param product_ids: Only reservations holding stock of one of these products (all if None).
+        :return: List of reservation IDs, oldest expiry first.
+        """
+        pass
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IStockShardRepository(ABC):
+    """
+    Interface (Abstract Base Class) for the sharded-inventory mode, where the stock
+    of a product is split across several rows that can be reserved concurrently.
+    """
+
+    @abstractmethod
+    def enable_sharding(self, product_id: str, shard_count: int) -> bool:
+        """
+        Split the current stock of a product evenly across shard_count shards.
+
+        :param product_id: ID of the product.
+        :param shard_count: Number of shards.
+        :return: True if sharding was enabled, False if the product does not exist or is already sharded.
+        """
+        pass
+
+    @abstractmethod
+    def disable_sharding(self, product_id: str) -> bool:
+        """
+        Move the stock of every shard back to the product and drop the shards.
+
+        :param product_id: ID of the product.
+        :return: True if sharding was disabled, False if the product was not sharded.
+        """
+        pass
+
+    @abstractmethod
+    def get_total_stock(self, product_ids: list[str]) -> dict[str, int]:
+        """
+        Sum the shards of sharded products, reading them now.
+
+        :param product_ids: IDs of the products.
+        :return: Total stock per sharded product; products that are not sharded are left out.
+        """
+        pass
+
+    @abstractmethod
+    def sync_totals(self, product_ids: Optional[list[str]] = None) -> int:
+        """
+        Copy the sum of the shards to the products' stock column and update their status,
+        so listings show the total without reading the shards.
+
+        :param product_ids: Only these products (every sharded product if None).
+        :return: Number of products whose stock changed.
+        """
+        pass
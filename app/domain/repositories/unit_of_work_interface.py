@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    """
+    Interface for a database transaction shared by several repositories.
+
+    Repositories taking part in a unit of work only stage their changes; the
+    service commits them together, so they are saved all at once or not at all:
+
+        with unit_of_work:
+            ...repository calls...
+            unit_of_work.commit()
+
+    Leaving the block without committing (e.g. because of an exception) rolls back.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.rollback()
+        return False
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Make every staged change durable in a single commit.
+        """
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """
+        Discard every staged change.
+        """
+        pass
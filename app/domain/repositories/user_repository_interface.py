@@ -11,19 +11,42 @@ class IUserRepository(ABC):
     @abstractmethod
     def create(self, user_entity: UserEntity) -> UserEntity:
         """
-        Save a user to the repository.
+        Stage a user in the current unit of work; it is saved on IUnitOfWork.commit.
         
         :param user: UserEntity instance to be saved.
         :return: The saved UserEntity instance.
+        :raises EmailAlreadyRegisteredError: If another user has the same email, ignoring case.
         """
         pass
 
     @abstractmethod
     def get_by_email(self, email: str) -> Optional[UserEntity]:
         """
-        Retrieve a user by email.
+        Retrieve a user by email, ignoring case.
         
         :param email: Email of the user to retrieve.
         :return: UserEntity instance if found, None otherwise.
         """
-        pass        
+        pass
+
+    @abstractmethod
+    def get_by_id(self, user_id: str) -> Optional[UserEntity]:
+        """
+        Retrieve a user by ID.
+        
+        :param user_id: ID of the user to retrieve.
+        :return: UserEntity instance if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def update_password_hash(self, user_id: str, password_hash: str, expected_password_hash: str) -> bool:
+        """
+        Replace the stored password hash, if it is still the expected one.
+
+        :param user_id: ID of the user.
+        :param password_hash: New hash.
+        :param expected_password_hash: Hash read before computing the new one.
+        :return: True if the hash was replaced.
+        """
+        pass
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+
+class IPasswordHasher(ABC):
+    """
+    Interface for hashing and checking user passwords.
+    """
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """
+        Hash a password with the current work factor.
+
+        :param password: Plain text password.
+        :return: Hash to be stored in the user record.
+        """
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Check a password against a stored hash.
+
+        :param password: Plain text password.
+        :param password_hash: Hash stored in the user record.
+        :return: True if the password matches.
+        """
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Whether a stored hash was made with other parameters than the current
+        ones and should be replaced on the next successful login.
+
+        :param password_hash: Hash stored in the user record.
+        """
+        pass
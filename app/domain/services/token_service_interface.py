@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+
+ACCESS_TOKEN = 'access'
+REFRESH_TOKEN = 'refresh'
+
+
+class ITokenService(ABC):
+    """
+    Interface for issuing and checking the signed tokens of authenticated users.
+    """
+
+    @abstractmethod
+    def issue_tokens(self, user_id: str, role: str) -> dict:
+        """
+        Issue an access token and a refresh token for a user.
+
+        :param user_id: ID of the user (token subject).
+        :param role: Role of the user ('artisan' or 'buyer').
+        :return: Dict with access_token, refresh_token and expires_in (seconds of the access token).
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, token: str, token_type: str = ACCESS_TOKEN) -> dict:
+        """
+        Check the signature, expiration and type of a token.
+
+        :param token: Encoded token.
+        :param token_type: ACCESS_TOKEN or REFRESH_TOKEN.
+        :return: Claims of the token (sub, role, type, iat, exp).
+        :raises InvalidTokenError: If the token is not valid.
+        """
+        pass
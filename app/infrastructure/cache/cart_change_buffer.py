@@ -0,0 +1,133 @@
+# app/infrastructure/cache/cart_change_buffer.py
+"""
+Buffer em memória das mudanças de carrinho ainda não gravadas (CART_STORAGE='write_behind').
+
+Cada (comprador, produto) guarda uma única mudança já combinada com as anteriores:
+somar 1 cinco vezes vira "somar 5", e qualquer quantidade definida depois apaga o
+histórico. A gravação periódica (WriteBehindCartRepository.flush) leva tudo ao
+banco em lote; as mudanças que ainda não chegaram lá se perdem se o processo morrer.
+"""
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from app.domain.models.cart import MAX_CART_ITEM_QUANTITY
+
+# replace=False: somar quantity à linha; replace=True: a linha passa a ter quantity (0 remove).
+# As somas param em MAX_CART_ITEM_QUANTITY, como no banco
+CartChange = namedtuple('CartChange', ['replace', 'quantity'])
+
+DEFAULT_MAX_PENDING_BUYERS = 1000
+
+
+def combine_changes(older: Optional[CartChange], newer: CartChange) -> CartChange:
+    """The single change equivalent to applying `older` and then `newer`."""
+    if older is None or newer.replace:
+        return newer
+    return CartChange(older.replace, min(older.quantity + newer.quantity, MAX_CART_ITEM_QUANTITY))
+
+
+def apply_change(quantity: Optional[int], change: CartChange) -> int:
+    """Quantity of a line (None if absent) after the change; 0 means no line."""
+    if change.replace:
+        return change.quantity
+    return min((quantity or 0) + change.quantity, MAX_CART_ITEM_QUANTITY)
+
+
+class CartChangeBuffer:
+    """
+    Pending cart changes per buyer, shared by the threads of the process.
+
+    A flush takes the changes out of the pending map but keeps them visible to
+    the readers until it finishes; if it fails they go back, under the changes
+    made meanwhile. Flushes run one at a time.
+    """
+
+    def __init__(self, max_pending_buyers: int = DEFAULT_MAX_PENDING_BUYERS):
+        self.enabled = False
+        self.max_pending_buyers = max_pending_buyers
+        # Acordado quando o buffer enche, para a gravação não esperar o intervalo
+        self.flush_requested = threading.Event()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[str, dict[str, CartChange]] = {}
+        self._in_flight: dict[str, dict[str, CartChange]] = {}
+
+    def configure(self, enabled: bool, max_pending_buyers: int = DEFAULT_MAX_PENDING_BUYERS) -> None:
+        self.enabled = enabled
+        self.max_pending_buyers = max_pending_buyers
+
+    def record(self, buyer_id: str, product_id: str, change: CartChange) -> None:
+        """Combines the change with the pending one of the same line."""
+        with self._lock:
+            lines = self._pending.setdefault(buyer_id, {})
+            lines[product_id] = combine_changes(lines.get(product_id), change)
+            if len(self._pending) >= self.max_pending_buyers:
+                self.flush_requested.set()
+
+    def changes_for(self, buyer_id: str) -> dict[str, CartChange]:
+        """Changes of the buyer not yet in the database, per product_id."""
+        with self._lock:
+            changes = dict(self._in_flight.get(buyer_id, {}))
+            for product_id, change in self._pending.get(buyer_id, {}).items():
+                changes[product_id] = combine_changes(changes.get(product_id), change)
+            return changes
+
+    @contextmanager
+    def reading(self, buyer_id: str) -> Iterator[dict[str, CartChange]]:
+        """
+        Yields the buyer's buffered changes, for a read of the cart made inside
+        the block. With changes, the block waits for a running flush and keeps
+        the next one from starting, so the database read never already includes
+        changes that are still counted as buffered.
+        """
+        with self._lock:
+            buffered = buyer_id in self._pending or buyer_id in self._in_flight
+        if not buffered:
+            yield {}
+            return
+        with self._flush_lock:
+            yield self.changes_for(buyer_id)
+
+    def pending_buyers(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    @contextmanager
+    def flushing(self, buyer_id: Optional[str] = None) -> Iterator[dict[str, dict[str, CartChange]]]:
+        """
+        Takes the pending changes (of one buyer, or all) to be written, as
+        {buyer_id: {product_id: CartChange}}. They are dropped when the block
+        succeeds; when it raises, those not passed to mark_flushed are put back.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if buyer_id is None:
+                    self._in_flight, self._pending = self._pending, {}
+                elif buyer_id in self._pending:
+                    self._in_flight = {buyer_id: self._pending.pop(buyer_id)}
+                taken = self._in_flight
+            try:
+                yield taken
+            except BaseException:
+                # Só volta o que não foi gravado (mark_flushed tira os compradores já gravados)
+                with self._lock:
+                    for restored_buyer_id, lines in taken.items():
+                        for product_id, change in self._pending.get(restored_buyer_id, {}).items():
+                            lines[product_id] = combine_changes(lines.get(product_id), change)
+                        self._pending[restored_buyer_id] = lines
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight = {}
+
+    def mark_flushed(self, buyer_ids) -> None:
+        """Drops the changes of buyers already written by the running flush."""
+        with self._lock:
+            for buyer_id in buyer_ids:
+                self._in_flight.pop(buyer_id, None)
+
+
+# Instância única do processo, habilitada em create_app (CART_STORAGE='write_behind')
+cart_change_buffer = CartChangeBuffer()
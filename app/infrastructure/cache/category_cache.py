@@ -0,0 +1,115 @@
+# app/infrastructure/cache/category_cache.py
+import threading
+from typing import Iterable, Optional
+
+from app.domain.models.category import CategoryEntity
+
+
+class CategoryCache:
+    """
+    Process-wide, in-memory cache of categories keyed by category_id.
+
+    Categories are seeded by migration and almost never change, so the cache is
+    warmed once on startup and kept in sync by CategoryRepository.create
+    (write-through). Every change to the cache bumps `version`; a reader that
+    missed and went to the database only stores what it read if the version is
+    still the one it saw before the query, so a concurrent warm/invalidate is
+    never overwritten by stale data.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._categories: dict[str, CategoryEntity] = {}
+        self._version = 0
+        self._warm = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warm
+
+    def warm(self, categories: Iterable[CategoryEntity]) -> None:
+        """Replaces the cache content with the given categories."""
+        categories_by_id = {category.category_id: category for category in categories}
+        with self._lock:
+            self._categories = categories_by_id
+            self._version += 1
+            self._warm = True
+
+    def get(self, category_id: str) -> Optional[CategoryEntity]:
+        """Returns the cached category or None, counting the lookup as a hit or a miss."""
+        with self._lock:
+            category = self._categories.get(category_id)
+            if category is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return category
+
+    def get_many(self, category_ids: Iterable[str]) -> tuple[list[CategoryEntity], list[str]]:
+        """
+        Looks up several categories at once.
+
+        :return: Tuple (cached categories, IDs that are not in the cache).
+        """
+        found, missing = [], []
+        with self._lock:
+            for category_id in category_ids:
+                category = self._categories.get(category_id)
+                if category is None:
+                    missing.append(category_id)
+                else:
+                    found.append(category)
+            self._hits += len(found)
+            self._misses += len(missing)
+        return found, missing
+
+    def put(self, category: CategoryEntity, expected_version: Optional[int] = None) -> bool:
+        """
+        Stores a category in the cache.
+
+        :param category: Category to store.
+        :param expected_version: If given, the category is only stored when the cache
+                                 version did not change since it was read.
+        :return: True if the category was stored.
+        """
+        return self.put_many([category], expected_version)
+
+    def put_many(self, categories: Iterable[CategoryEntity], expected_version: Optional[int] = None) -> bool:
+        """Stores several categories at once. See put."""
+        with self._lock:
+            if expected_version is not None and expected_version != self._version:
+                return False
+            for category in categories:
+                self._categories[category.category_id] = category
+            self._version += 1
+            return True
+
+    def invalidate(self) -> None:
+        """Drops every cached category."""
+        with self._lock:
+            self._categories = {}
+            self._version += 1
+            self._warm = False
+
+    def stats(self) -> dict:
+        """Returns the hit/miss counters and the current size and version of the cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': (self._hits / lookups) if lookups else 0.0,
+                'size': len(self._categories),
+                'version': self._version,
+                'warm': self._warm,
+            }
+
+
+# Instância única compartilhada por todos os repositórios do processo
+category_cache = CategoryCache()
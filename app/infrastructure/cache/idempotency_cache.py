@@ -0,0 +1,70 @@
+# app/infrastructure/cache/idempotency_cache.py
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Optional
+
+from app.domain.models.idempotency_record import IdempotencyRecordEntity
+
+DEFAULT_IDEMPOTENCY_CACHE_SIZE = 10_000
+
+
+class IdempotencyResponseCache:
+    """
+    Process-wide LRU cache of completed Idempotency-Key records, in front of
+    the idempotency_keys table: a client retrying against the same process
+    gets the stored response without a query.
+
+    Only completed records are kept (they never change); an entry is dropped
+    at the record expires_at, and past max_size entries the least recently
+    used one is evicted.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_IDEMPOTENCY_CACHE_SIZE,
+                 clock: Callable[[], datetime] = datetime.utcnow):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], IdempotencyRecordEntity] = OrderedDict()
+        self.max_size = max_size
+        self._clock = clock
+
+    def configure(self, max_size: Optional[int] = None) -> None:
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max_size
+            self._entries.clear()
+
+    def get(self, scope: str, idempotency_key: str) -> Optional[IdempotencyRecordEntity]:
+        """Returns the completed record of the key, or None if it is not cached or has expired."""
+        key = (scope, idempotency_key)
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None:
+                return None
+            if self._clock() >= record.expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return record
+
+    def put(self, record: IdempotencyRecordEntity) -> None:
+        """Caches a completed record."""
+        if self.max_size <= 0 or record.status != IdempotencyRecordEntity.COMPLETED:
+            return
+        key = (record.scope, record.idempotency_key)
+        with self._lock:
+            self._entries[key] = record
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Instância única do processo, configurada em create_app
+idempotency_response_cache = IdempotencyResponseCache()
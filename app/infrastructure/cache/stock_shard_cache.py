@@ -0,0 +1,49 @@
+# app/infrastructure/cache/stock_shard_cache.py
+import threading
+import time
+from typing import Callable, Optional
+
+# Tempo até o processo perceber um produto que outro processo colocou (ou tirou) do modo sharded
+SHARD_LAYOUT_TTL_SECONDS = 30.0
+
+
+class StockShardCache:
+    """
+    Process-wide, in-memory cache of the sharded-inventory layout: the number of
+    stock shards of each sharded product.
+
+    Reservations use it to route each item to the products row or to its shards
+    without an extra query. Changes made in this process invalidate it at once;
+    changes made by other processes are picked up when the TTL expires, or
+    earlier when a reservation fails because the layout it used is stale.
+    """
+
+    def __init__(self, ttl: float = SHARD_LAYOUT_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self._lock = threading.Lock()
+        self._ttl = ttl
+        self._clock = clock
+        self._layout: Optional[dict[str, int]] = None
+        self._loaded_at = 0.0
+
+    def get_layout(self, loader: Callable[[], dict[str, int]]) -> dict[str, int]:
+        """
+        Returns {product_id: shard_count} of the sharded products, calling the
+        loader when the cache is empty or expired.
+        """
+        with self._lock:
+            if self._layout is not None and self._clock() - self._loaded_at < self._ttl:
+                return self._layout
+        layout = loader()
+        with self._lock:
+            self._layout = layout
+            self._loaded_at = self._clock()
+        return layout
+
+    def invalidate(self) -> None:
+        """Drops the cached layout; the next lookup reloads it."""
+        with self._lock:
+            self._layout = None
+
+
+# Instância única compartilhada por todos os repositórios do processo
+stock_shard_cache = StockShardCache()
@@ -0,0 +1,80 @@
+# app/infrastructure/cache/verified_token_cache.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+DEFAULT_VERIFIED_TOKEN_CACHE_SIZE = 10_000
+# Um usuário desativado perde o acesso em no máximo esse tempo, mesmo com o token ainda válido
+DEFAULT_VERIFIED_TOKEN_MAX_AGE_SECONDS = 300.0
+
+
+class VerifiedTokenCache:
+    """
+    Process-wide LRU cache of access tokens whose signature and user were
+    already checked, so repeated requests with the same token skip both.
+
+    Keyed by the SHA-256 of the token (the tokens themselves are not kept in
+    memory). An entry is dropped at the token `exp`, or after max_age seconds
+    so that the user is checked again; past max_size entries the least
+    recently used one is evicted.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VERIFIED_TOKEN_CACHE_SIZE,
+                 max_age: float = DEFAULT_VERIFIED_TOKEN_MAX_AGE_SECONDS, clock: Callable[[], float] = time.time):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self.max_size = max_size
+        self.max_age = max_age
+        self._clock = clock
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def configure(self, max_size: Optional[int] = None, max_age: Optional[float] = None) -> None:
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if max_age is not None:
+                self.max_age = max_age
+            self._entries.clear()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Returns the claims of a verified token, or None if it is not cached or has expired."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, valid_until = entry
+            if self._clock() >= valid_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        """Caches the claims of a token that has just been verified."""
+        valid_until = min(float(claims['exp']), self._clock() + self.max_age)
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, valid_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Instância única compartilhada pelo guard de todas as requisições do processo
+verified_token_cache = VerifiedTokenCache()
@@ -26,6 +26,9 @@ from app.infrastructure.persistence.models_db.order_item_db_model import OrderIt
 from app.infrastructure.persistence.models_db.message_db_model import MessageDBModel
 from app.infrastructure.persistence.models_db.cart_db_model import CartDBModel
 from app.infrastructure.persistence.models_db.cart_item_db_model import CartItemDBModel
+from app.infrastructure.persistence.models_db.stock_reservation_db_model import StockReservationDBModel, StockReservationItemDBModel
+from app.infrastructure.persistence.models_db.product_stock_shard_db_model import ProductStockShardDBModel
+from app.infrastructure.persistence.models_db.idempotency_key_db_model import IdempotencyKeyDBModel
 
 load_dotenv() 
 
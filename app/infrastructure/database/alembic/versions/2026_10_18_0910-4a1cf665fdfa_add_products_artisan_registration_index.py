@@ -0,0 +1,36 @@
+"""add products artisan registration index
+
+Revision ID: 4a1cf665fdfa
+Revises: 6889f46a311e
+Create Date: 2026-10-18 09:10:12.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a1cf665fdfa'
+down_revision: Union[str, None] = '6889f46a311e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A paginação por keyset compara registration_date: linha sem data não teria
+    # posição na ordem (nem cursor), então as antigas recebem a data da migração
+    op.execute("UPDATE products SET registration_date = CURRENT_TIMESTAMP WHERE registration_date IS NULL")
+    # Índice usado pela paginação por keyset da listagem de produtos do artesão
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.alter_column('registration_date', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index('ix_products_artisan_registration', ['artisan_id', 'registration_date', 'product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index('ix_products_artisan_registration')
+        batch_op.alter_column('registration_date', existing_type=sa.DateTime(), nullable=True)
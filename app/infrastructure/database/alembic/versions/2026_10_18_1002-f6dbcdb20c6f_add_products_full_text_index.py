@@ -0,0 +1,54 @@
+"""add products full text index
+
+Revision ID: f6dbcdb20c6f
+Revises: 4a1cf665fdfa
+Create Date: 2026-10-18 10:02:41.118530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6dbcdb20c6f'
+down_revision: Union[str, None] = '4a1cf665fdfa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLite não tem FULLTEXT: usa uma tabela FTS5 mantida por triggers
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5("
+    "product_id UNINDEXED, name, description, tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, description ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+    "INSERT INTO products_fts (product_id, name, description) SELECT product_id, name, description FROM products",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.create_index('ix_products_name_description_fulltext', 'products', ['name', 'description'],
+                        unique=False, mysql_prefix='FULLTEXT')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.drop_index('ix_products_name_description_fulltext', table_name='products')
+    elif dialect == 'sqlite':
+        for trigger in ('products_fts_ai', 'products_fts_ad', 'products_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS products_fts")
@@ -0,0 +1,32 @@
+"""add products browse indexes
+
+Revision ID: e4623fa4439d
+Revises: f6dbcdb20c6f
+Create Date: 2026-10-18 11:04:12.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4623fa4439d'
+down_revision: Union[str, None] = 'f6dbcdb20c6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.create_index('ix_products_category_status_price', ['category_id', 'status', 'price'], unique=False)
+        batch_op.create_index('ix_products_status_price_category', ['status', 'price', 'category_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index('ix_products_status_price_category')
+        batch_op.drop_index('ix_products_category_status_price')
@@ -0,0 +1,60 @@
+"""add products updated_at
+
+Revision ID: 39998d79d3e3
+Revises: e4623fa4439d
+Create Date: 2026-10-18 11:31:47.206318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39998d79d3e3'
+down_revision: Union[str, None] = 'e4623fa4439d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# No SQLite o batch_alter_table recria a tabela products e com isso apaga os triggers
+# que mantêm o products_fts (f6dbcdb20c6f); são recriados depois da reconstrução
+SQLITE_FTS_TRIGGERS_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, description ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+]
+
+
+def _restore_sqlite_fts_triggers() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_TRIGGERS_DDL:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    updated_at_type = sa.DateTime().with_variant(mysql.DATETIME(fsp=6), 'mysql')
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('updated_at', updated_at_type, nullable=True))
+
+    # Produtos existentes: a última alteração conhecida é o cadastro
+    op.execute("UPDATE products SET updated_at = COALESCE(registration_date, CURRENT_TIMESTAMP)")
+
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.alter_column('updated_at', existing_type=updated_at_type, nullable=False)
+        batch_op.create_index('ix_products_artisan_updated_at', ['artisan_id', 'updated_at'], unique=False)
+    _restore_sqlite_fts_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index('ix_products_artisan_updated_at')
+        batch_op.drop_column('updated_at')
+    _restore_sqlite_fts_triggers()
@@ -0,0 +1,71 @@
+"""add products artisan name unique
+
+Revision ID: 952146f6b8b7
+Revises: 39998d79d3e3
+Create Date: 2026-10-18 12:08:55.613402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '952146f6b8b7'
+down_revision: Union[str, None] = '39998d79d3e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# No SQLite o batch_alter_table recria a tabela products e com isso apaga os triggers
+# que mantêm o products_fts (f6dbcdb20c6f); são recriados depois da reconstrução
+SQLITE_FTS_TRIGGERS_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, description ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+]
+
+
+def _restore_sqlite_fts_triggers() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_TRIGGERS_DDL:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicatas antigas (cadastradas antes da constraint) ganham o início do
+    # product_id no nome; o produto mais antigo de cada grupo mantém o nome original.
+    # registration_date aceita NULL (conta como a data mais antiga) e o product_id
+    # desempata: cada grupo tem uma ordem total e só o primeiro fica com o nome
+    connection = op.get_bind()
+    duplicates = connection.execute(sa.text(
+        "SELECT p.product_id, p.name FROM products p "
+        "WHERE EXISTS (SELECT 1 FROM products older "
+        "              WHERE older.artisan_id = p.artisan_id AND older.name = p.name "
+        "              AND (COALESCE(older.registration_date, '1970-01-01 00:00:00') "
+        "                       < COALESCE(p.registration_date, '1970-01-01 00:00:00') "
+        "                   OR (COALESCE(older.registration_date, '1970-01-01 00:00:00') "
+        "                           = COALESCE(p.registration_date, '1970-01-01 00:00:00') "
+        "                       AND older.product_id < p.product_id)))"
+    )).fetchall()
+    for product_id, name in duplicates:
+        connection.execute(
+            sa.text("UPDATE products SET name = :name WHERE product_id = :product_id"),
+            {"name": f"{name[:244]} ({product_id[:8]})", "product_id": product_id},
+        )
+
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_products_artisan_name', ['artisan_id', 'name'])
+    _restore_sqlite_fts_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_products_artisan_name', type_='unique')
+    _restore_sqlite_fts_triggers()
@@ -0,0 +1,54 @@
+"""add stock reservations
+
+Revision ID: 8f5b33139cf7
+Revises: 952146f6b8b7
+Create Date: 2026-10-18 12:47:21.384015
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f5b33139cf7'
+down_revision: Union[str, None] = '952146f6b8b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stock_reservations',
+    sa.Column('reservation_id', sa.String(length=36), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('reservation_id')
+    )
+    with op.batch_alter_table('stock_reservations', schema=None) as batch_op:
+        batch_op.create_index('ix_stock_reservations_status_expires_at', ['status', 'expires_at'], unique=False)
+
+    op.create_table('stock_reservation_items',
+    sa.Column('reservation_id', sa.String(length=36), nullable=False),
+    sa.Column('product_id', sa.String(length=36), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.product_id'], ),
+    sa.ForeignKeyConstraint(['reservation_id'], ['stock_reservations.reservation_id'], ),
+    sa.PrimaryKeyConstraint('reservation_id', 'product_id')
+    )
+    with op.batch_alter_table('stock_reservation_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_stock_reservation_items_product_id'), ['product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('stock_reservation_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_stock_reservation_items_product_id'))
+
+    op.drop_table('stock_reservation_items')
+    with op.batch_alter_table('stock_reservations', schema=None) as batch_op:
+        batch_op.drop_index('ix_stock_reservations_status_expires_at')
+
+    op.drop_table('stock_reservations')
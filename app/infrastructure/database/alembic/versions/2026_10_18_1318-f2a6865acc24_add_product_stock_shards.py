@@ -0,0 +1,64 @@
+"""add product stock shards
+
+Revision ID: f2a6865acc24
+Revises: 8f5b33139cf7
+Create Date: 2026-10-18 13:18:40.127553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6865acc24'
+down_revision: Union[str, None] = '8f5b33139cf7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# No SQLite o batch_alter_table recria a tabela products e com isso apaga os triggers
+# que mantêm o products_fts (f6dbcdb20c6f); são recriados depois da reconstrução
+SQLITE_FTS_TRIGGERS_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; END",
+    "CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, description ON products BEGIN "
+    "DELETE FROM products_fts WHERE product_id = old.product_id; "
+    "INSERT INTO products_fts (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+]
+
+
+def _restore_sqlite_fts_triggers() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_FTS_TRIGGERS_DDL:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('stock_sharded', sa.Boolean(), server_default=sa.false(), nullable=False))
+    _restore_sqlite_fts_triggers()
+
+    op.create_table('product_stock_shards',
+    sa.Column('product_id', sa.String(length=36), nullable=False),
+    sa.Column('shard_index', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('stock', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.product_id'], ),
+    sa.PrimaryKeyConstraint('product_id', 'shard_index')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Devolve o estoque dos shards aos produtos antes de apagá-los
+    op.execute(
+        "UPDATE products SET stock = (SELECT COALESCE(SUM(s.stock), 0) FROM product_stock_shards s "
+        "WHERE s.product_id = products.product_id) WHERE stock_sharded = 1"
+    )
+    op.drop_table('product_stock_shards')
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_column('stock_sharded')
+    _restore_sqlite_fts_triggers()
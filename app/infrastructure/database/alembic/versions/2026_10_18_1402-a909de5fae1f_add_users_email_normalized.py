@@ -0,0 +1,57 @@
+"""add users email normalized
+
+Revision ID: a909de5fae1f
+Revises: f2a6865acc24
+Create Date: 2026-10-18 14:02:17.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a909de5fae1f'
+down_revision: Union[str, None] = 'f2a6865acc24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('email_normalized', sa.String(length=120), nullable=True))
+
+    op.execute("UPDATE users SET email_normalized = LOWER(TRIM(email))")
+    # Emails que só diferem em maiúsculas (cadastrados antes do índice): o usuário mais
+    # antigo fica com o email normalizado; os outros recebem o início do user_id como
+    # prefixo e precisam ser resolvidos à mão (não conseguem mais entrar por esse email).
+    # registration_date aceita NULL (conta como a data mais antiga) e o user_id desempata
+    connection = op.get_bind()
+    duplicates = connection.execute(sa.text(
+        "SELECT u.user_id, u.email_normalized FROM users u "
+        "WHERE EXISTS (SELECT 1 FROM users older "
+        "              WHERE older.email_normalized = u.email_normalized "
+        "              AND (COALESCE(older.registration_date, '1970-01-01 00:00:00') "
+        "                       < COALESCE(u.registration_date, '1970-01-01 00:00:00') "
+        "                   OR (COALESCE(older.registration_date, '1970-01-01 00:00:00') "
+        "                           = COALESCE(u.registration_date, '1970-01-01 00:00:00') "
+        "                       AND older.user_id < u.user_id)))"
+    )).fetchall()
+    for user_id, email_normalized in duplicates:
+        connection.execute(
+            sa.text("UPDATE users SET email_normalized = :email WHERE user_id = :user_id"),
+            {"email": f"{user_id[:8]}:{email_normalized}"[:120], "user_id": user_id},
+        )
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.alter_column('email_normalized', existing_type=sa.String(length=120), nullable=False)
+        batch_op.create_index('ux_users_email_normalized', ['email_normalized'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ux_users_email_normalized')
+        batch_op.drop_column('email_normalized')
@@ -0,0 +1,55 @@
+"""add addresses fingerprint
+
+Revision ID: cb24e56a3267
+Revises: a909de5fae1f
+Create Date: 2026-10-18 14:31:06.882140
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.domain.models.address import address_fingerprint
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cb24e56a3267'
+down_revision: Union[str, None] = 'a909de5fae1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('addresses', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('fingerprint', sa.String(length=64), nullable=True))
+
+    # O hash é calculado em Python (mesma normalização da aplicação), em lotes pela PK
+    connection = op.get_bind()
+    last_id = ''
+    while True:
+        rows = connection.execute(sa.text(
+            "SELECT address_id, street, number, neighborhood, city, state, zip_code FROM addresses "
+            "WHERE address_id > :last_id ORDER BY address_id LIMIT :limit"
+        ), {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        connection.execute(
+            sa.text("UPDATE addresses SET fingerprint = :fingerprint WHERE address_id = :address_id"),
+            [{"fingerprint": address_fingerprint(*row[1:]), "address_id": row[0]} for row in rows],
+        )
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table('addresses', schema=None) as batch_op:
+        batch_op.alter_column('fingerprint', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_index(batch_op.f('ix_addresses_fingerprint'), ['fingerprint'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('addresses', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_addresses_fingerprint'))
+        batch_op.drop_column('fingerprint')
@@ -0,0 +1,37 @@
+"""add cart unique indexes
+
+Revision ID: 6540d31c1d9e
+Revises: cb24e56a3267
+Create Date: 2026-10-18 15:03:41.207365
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6540d31c1d9e'
+down_revision: Union[str, None] = 'cb24e56a3267'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Até aqui nenhuma rota gravava carrinhos, então não há duplicatas a resolver
+    with op.batch_alter_table('carts', schema=None) as batch_op:
+        batch_op.create_index('ux_carts_buyer_id', ['buyer_id'], unique=True)
+
+    with op.batch_alter_table('cart_items', schema=None) as batch_op:
+        batch_op.create_index('ux_cart_items_cart_product', ['cart_id', 'product_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('cart_items', schema=None) as batch_op:
+        batch_op.drop_index('ux_cart_items_cart_product')
+
+    with op.batch_alter_table('carts', schema=None) as batch_op:
+        batch_op.drop_index('ux_carts_buyer_id')
@@ -0,0 +1,30 @@
+"""add orders buyer_id order_date index
+
+Revision ID: 362392fdc560
+Revises: bb63cc06ed7c
+Create Date: 2026-10-18 16:48:30.172644
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '362392fdc560'
+down_revision: Union[str, None] = 'bb63cc06ed7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index('ix_orders_buyer_id_order_date', ['buyer_id', 'order_date', 'order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('ix_orders_buyer_id_order_date')
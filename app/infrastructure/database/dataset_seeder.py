@@ -0,0 +1,335 @@
+# app/infrastructure/database/dataset_seeder.py
+"""
+Geração de massas de dados realistas para reproduzir localmente (MySQL ou SQLite)
+os planos de consulta de produção.
+
+As linhas são montadas como dicionários e gravadas com INSERTs em lote do
+SQLAlchemy Core (executemany), um commit por lote: nada passa pela sessão do ORM.
+Chamar o Faker por linha seria o gargalo, então ele só preenche um conjunto de
+valores no início e as linhas combinam esses valores com um random.Random; com a
+mesma seed a massa gerada (incluindo os ids) é sempre a mesma.
+"""
+import datetime
+import random
+import unicodedata
+import uuid
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator, Optional
+
+from faker import Faker
+from sqlalchemy import insert, select
+
+from app import db
+from app.common.utils import normalize_email
+from app.domain.models.address import address_fingerprint
+from app.infrastructure.persistence.models_db import (
+    AddressDBModel, ArtisanDBModel, BuyerDBModel, CartDBModel, CartItemDBModel, CategoryDBModel,
+    OrderDBModel, OrderItemDBModel, ProductDBModel, ReviewDBModel, UserDBModel,
+)
+
+DEFAULT_SEED = 42
+DEFAULT_SEED_BATCH_SIZE = 5000
+# Valores distintos gerados pelo Faker para cada campo (nomes, ruas, cidades...)
+FAKER_POOL_SIZE = 1000
+
+# Status dos pedidos conforme a idade: pedidos antigos já foram entregues (ou cancelados)
+_RECENT_ORDER_STATUSES = (('pending', 3), ('processing', 3), ('shipped', 3), ('delivered', 1))
+_PAST_ORDER_STATUSES = (('delivered', 18), ('canceled', 2))
+_PAYMENT_METHODS = (('credit_card', 6), ('pix', 3), ('boleto', 1))
+# Avaliações concentradas em 4 e 5 estrelas, como nas lojas reais
+_RATINGS = ((5, 50), (4, 30), (3, 10), (2, 5), (1, 5))
+
+
+def _chunked(rows: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _weighted(choices):
+    values = [value for value, _ in choices]
+    weights = [weight for _, weight in choices]
+    return values, weights
+
+
+def _email_part(name: str) -> str:
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return ''.join(ascii_name.split()).lower()
+
+
+class DatasetSeeder:
+    """
+    Inserts artisans, buyers (both with their users and addresses), products
+    across the existing categories, carts, orders and reviews.
+
+    Product popularity is skewed: a few products get most of the cart items,
+    order items and reviews, like the hot products of production.
+    """
+
+    def __init__(self, seed: int = DEFAULT_SEED, batch_size: int = DEFAULT_SEED_BATCH_SIZE,
+                 password_hash: str = '', days: int = 730,
+                 on_batch: Optional[Callable[[str, int], None]] = None):
+        """
+        :param seed: Seed of the generated data; the same seed generates the same rows
+                     (dates are relative to the day of the run). Seeding the same
+                     database twice needs different seeds, or the ids collide.
+        :param batch_size: Rows per INSERT (and per commit).
+        :param password_hash: Stored for every seeded user (hashing per user would take hours).
+        :param days: Age of the oldest users, products and orders.
+        :param on_batch: Called with (table name, rows) after each inserted batch.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.password_hash = password_hash
+        self.days = days
+        self.on_batch = on_batch
+        self.seed_value = seed
+        self.random = random.Random(seed)
+        self.now = datetime.datetime.combine(datetime.date.today(), datetime.time())
+        self._fill_pools(seed)
+
+    def _fill_pools(self, seed: int) -> None:
+        fake = Faker('pt_BR')
+        fake.seed_instance(seed)
+        self.pools = {
+            'first_name': [fake.first_name() for _ in range(FAKER_POOL_SIZE)],
+            'last_name': [fake.last_name() for _ in range(FAKER_POOL_SIZE)],
+            'street': [fake.street_name() for _ in range(FAKER_POOL_SIZE)],
+            'neighborhood': [fake.bairro() for _ in range(FAKER_POOL_SIZE)],
+            'city': [fake.city() for _ in range(FAKER_POOL_SIZE)],
+            'state': [fake.estado_sigla() for _ in range(FAKER_POOL_SIZE)],
+            'phone': [fake.msisdn()[:11] for _ in range(FAKER_POOL_SIZE)],
+            'word': [fake.word() for _ in range(FAKER_POOL_SIZE)],
+            'sentence': [fake.sentence(nb_words=12) for _ in range(FAKER_POOL_SIZE)],
+            'company': [fake.company() for _ in range(FAKER_POOL_SIZE)],
+        }
+
+    # --- Valores -------------------------------------------------------------
+
+    def _pick(self, pool: str) -> str:
+        return self.random.choice(self.pools[pool])
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def _past_datetime(self) -> datetime.datetime:
+        return self.now - datetime.timedelta(seconds=self.random.randrange(self.days * 24 * 60 * 60))
+
+    def _count_around(self, average: float) -> int:
+        # Entre 0 e o dobro da média: uns compram muito, outros nada
+        return self.random.randint(0, round(2 * average)) if average > 0 else 0
+
+    def _popular_index(self, size: int) -> int:
+        # Distribuição concentrada nos primeiros índices (poucos produtos muito vendidos)
+        return int(size * self.random.random() ** 3)
+
+    def _popular_products(self, products: list[tuple[str, Decimal]], picks: int, with_price: bool = False) -> list:
+        # dict em vez de set: sem repetir o produto e na ordem sorteada (a massa não muda entre execuções)
+        picked = dict.fromkeys(products[self._popular_index(len(products))] for _ in range(picks))
+        return list(picked) if with_price else [product_id for product_id, _ in picked]
+
+    def _address_row(self, created_at: datetime.datetime) -> dict:
+        street = self._pick('street')
+        number = str(self.random.randint(1, 9999))
+        neighborhood = self._pick('neighborhood')
+        city = self._pick('city')
+        state = self._pick('state')
+        zip_code = f"{self.random.randint(10000, 99999)}-{self.random.randint(0, 999):03d}"
+        return {
+            'address_id': self._uuid(), 'street': street, 'number': number,
+            'complement': f"Apto {self.random.randint(1, 300)}" if self.random.random() < 0.3 else None,
+            'neighborhood': neighborhood, 'city': city, 'state': state, 'country': 'Brasil',
+            'zip_code': zip_code,
+            # O Core não passa pelo __init__ do modelo, que é quem calcula o fingerprint
+            'fingerprint': address_fingerprint(street, number, neighborhood, city, state, zip_code),
+            'created_at': created_at, 'updated_at': created_at,
+        }
+
+    # --- Gravação ------------------------------------------------------------
+
+    def _insert(self, model, rows: list[dict]) -> None:
+        if rows:
+            db.session.execute(insert(model.__table__), rows)
+
+    def _commit(self, counts: dict[str, int], inserted: dict[str, list]) -> None:
+        db.session.commit()
+        for table, rows in inserted.items():
+            counts[table] = counts.get(table, 0) + len(rows)
+            if self.on_batch and rows:
+                self.on_batch(table, len(rows))
+
+    # --- Entidades -----------------------------------------------------------
+
+    def _seed_users(self, count: int, role: str, counts: dict[str, int]) -> list[str]:
+        """Inserts `count` users of the role with their addresses, returning their ids."""
+        user_ids = []
+        for batch in _chunked(range(count), self.batch_size):
+            addresses, users, profiles = [], [], []
+            for index in batch:
+                registered_at = self._past_datetime()
+                address = self._address_row(registered_at)
+                user_id = self._uuid()
+                first_name, last_name = self._pick('first_name'), self._pick('last_name')
+                # O índice e a seed garantem emails únicos mesmo repetindo os nomes do pool
+                email = (f"{_email_part(first_name)}.{_email_part(last_name)}.{index}"
+                         f"@{role}{self.seed_value}.example.com")
+                addresses.append(address)
+                users.append({
+                    'user_id': user_id, 'email': email, 'email_normalized': normalize_email(email),
+                    # Chaves com o nome das colunas (users.password, orders.address_id), não dos atributos
+                    'password': self.password_hash, 'status': 'active',
+                    'registration_date': registered_at, 'address_id': address['address_id'],
+                })
+                if role == 'artisan':
+                    profiles.append({
+                        'artisan_id': user_id, 'store_name': f"{self._pick('company')} {self._pick('word').title()}",
+                        'bio': self._pick('sentence'), 'phone': self._pick('phone'), 'status': 'active',
+                    })
+                else:
+                    profiles.append({'buyer_id': user_id, 'full_name': f"{first_name} {last_name}",
+                                     'phone': self._pick('phone')})
+                user_ids.append(user_id)
+            profile_model = ArtisanDBModel if role == 'artisan' else BuyerDBModel
+            self._insert(AddressDBModel, addresses)
+            self._insert(UserDBModel, users)
+            self._insert(profile_model, profiles)
+            self._commit(counts, {'addresses': addresses, 'users': users, profile_model.__tablename__: profiles})
+        return user_ids
+
+    def _seed_products(self, artisan_ids: list[str], per_artisan: float, category_ids: list[str],
+                       counts: dict[str, int]) -> list[tuple[str, Decimal]]:
+        """Inserts the products of each artisan, returning (product_id, price) pairs."""
+        products = []
+
+        def rows():
+            for artisan_id in artisan_ids:
+                for index in range(self._count_around(per_artisan)):
+                    registered_at = self._past_datetime()
+                    price = Decimal(self.random.randint(500, 50000)) / 100
+                    stock = 0 if self.random.random() < 0.1 else self.random.randint(1, 200)
+                    product_id = self._uuid()
+                    products.append((product_id, price))
+                    yield {
+                        'product_id': product_id,
+                        # O índice evita violar uq_products_artisan_name
+                        'name': f"{self._pick('word').title()} {self._pick('word')} {index + 1}",
+                        'description': self._pick('sentence'),
+                        'price': price, 'stock': stock,
+                        'status': 'active' if stock else 'out_of_stock',
+                        'registration_date': registered_at, 'updated_at': registered_at,
+                        'artisan_id': artisan_id, 'category_id': self.random.choice(category_ids),
+                    }
+
+        for batch in _chunked(rows(), self.batch_size):
+            self._insert(ProductDBModel, batch)
+            self._commit(counts, {'products': batch})
+        # Embaralha para que a popularidade não acompanhe a ordem dos artesãos
+        self.random.shuffle(products)
+        return products
+
+    def _seed_carts(self, buyer_ids: list[str], products: list[tuple[str, Decimal]], cart_ratio: float,
+                    counts: dict[str, int]) -> None:
+        for batch in _chunked(buyer_ids, self.batch_size):
+            carts, items = [], []
+            for buyer_id in batch:
+                if self.random.random() >= cart_ratio:
+                    continue
+                cart_id = self._uuid()
+                carts.append({'cart_id': cart_id, 'buyer_id': buyer_id})
+                for product_id in self._popular_products(products, self.random.randint(1, 5)):
+                    items.append({'cart_item_id': self._uuid(), 'cart_id': cart_id, 'product_id': product_id,
+                                  'quantity': self.random.randint(1, 3)})
+            self._insert(CartDBModel, carts)
+            self._insert(CartItemDBModel, items)
+            self._commit(counts, {'carts': carts, 'cart_items': items})
+
+    def _seed_orders(self, buyer_ids: list[str], products: list[tuple[str, Decimal]], per_buyer: float,
+                     counts: dict[str, int]) -> None:
+        recent_statuses, recent_weights = _weighted(_RECENT_ORDER_STATUSES)
+        past_statuses, past_weights = _weighted(_PAST_ORDER_STATUSES)
+        methods, method_weights = _weighted(_PAYMENT_METHODS)
+        recent = self.now - datetime.timedelta(days=7)
+
+        def orders():
+            for buyer_id in buyer_ids:
+                for _ in range(self._count_around(per_buyer)):
+                    yield buyer_id
+
+        for batch in _chunked(orders(), self.batch_size):
+            addresses, rows, items = [], [], []
+            for buyer_id in batch:
+                ordered_at = self._past_datetime()
+                # orders.address_id é único: cada pedido tem o seu endereço de entrega
+                address = self._address_row(ordered_at)
+                order_id = self._uuid()
+                total = Decimal('0.00')
+                for product_id, price in self._popular_products(products, self.random.randint(1, 4), with_price=True):
+                    quantity = self.random.randint(1, 3)
+                    total += price * quantity
+                    items.append({'order_item_id': self._uuid(), 'order_id': order_id, 'product_id': product_id,
+                                  'quantity': quantity, 'unit_price': price})
+                if ordered_at >= recent:
+                    status = self.random.choices(recent_statuses, recent_weights)[0]
+                else:
+                    status = self.random.choices(past_statuses, past_weights)[0]
+                addresses.append(address)
+                rows.append({
+                    'order_id': order_id, 'order_date': ordered_at, 'order_status': status,
+                    'total_value': total, 'address_id': address['address_id'],
+                    'payment_method': self.random.choices(methods, method_weights)[0],
+                    'gateway_transaction_id': None if status == 'canceled' else self._uuid(),
+                    'buyer_id': buyer_id,
+                })
+            self._insert(AddressDBModel, addresses)
+            self._insert(OrderDBModel, rows)
+            self._insert(OrderItemDBModel, items)
+            self._commit(counts, {'addresses': addresses, 'orders': rows, 'order_items': items})
+
+    def _seed_reviews(self, buyer_ids: list[str], products: list[tuple[str, Decimal]], per_buyer: float,
+                      counts: dict[str, int]) -> None:
+        ratings, rating_weights = _weighted(_RATINGS)
+
+        def rows():
+            for buyer_id in buyer_ids:
+                for product_id in self._popular_products(products, self._count_around(per_buyer)):
+                    yield {
+                        'review_id': self._uuid(), 'buyer_id': buyer_id, 'product_id': product_id,
+                        'rating': self.random.choices(ratings, rating_weights)[0],
+                        'comment': self._pick('sentence') if self.random.random() < 0.6 else None,
+                        'review_date': self._past_datetime(),
+                    }
+
+        for batch in _chunked(rows(), self.batch_size):
+            self._insert(ReviewDBModel, batch)
+            self._commit(counts, {'reviews': batch})
+
+    def seed(self, artisans: int, buyers: int, products_per_artisan: float = 20, orders_per_buyer: float = 3,
+             reviews_per_buyer: float = 1, cart_ratio: float = 0.3) -> dict[str, int]:
+        """
+        Generates the dataset. Counts per artisan or buyer are averages: each one
+        gets between 0 and twice the average.
+
+        :param cart_ratio: Fraction of the buyers with an open cart.
+        :return: Rows inserted per table.
+        :raises ValueError: If there are no categories (run the migrations first).
+        """
+        category_ids = list(db.session.scalars(
+            select(CategoryDBModel.category_id).order_by(CategoryDBModel.category_id)))
+        if not category_ids:
+            raise ValueError("No categories found, run the migrations that seed them first")
+
+        counts: dict[str, int] = {}
+        artisan_ids = self._seed_users(artisans, 'artisan', counts)
+        buyer_ids = self._seed_users(buyers, 'buyer', counts)
+        products = self._seed_products(artisan_ids, products_per_artisan, category_ids, counts)
+        if products:
+            self._seed_carts(buyer_ids, products, cart_ratio, counts)
+            self._seed_orders(buyer_ids, products, orders_per_buyer, counts)
+            self._seed_reviews(buyer_ids, products, reviews_per_buyer, counts)
+        return counts
@@ -0,0 +1,18 @@
+# app/infrastructure/database/sqlite_pragmas.py
+"""
+O SQLite (config 'testing') só verifica chaves estrangeiras com
+PRAGMA foreign_keys=ON, que vale por conexão. Sem isso as violações de FK
+que o MySQL rejeita passariam nos testes.
+"""
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
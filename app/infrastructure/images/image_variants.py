@@ -0,0 +1,131 @@
+# app/infrastructure/images/image_variants.py
+"""
+Geração das variantes (miniaturas) das imagens de produto num pool de processos.
+
+O redimensionamento é CPU puro e segura o GIL, então roda em processos separados,
+fora da thread da requisição; o pool é limitado (BoundedExecutor) para que uma
+rajada de uploads receba 503 em vez de acumular uma fila sem fim.
+"""
+import io
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Optional
+
+from flask import current_app, has_app_context
+
+from app.infrastructure.workers.bounded_executor import BoundedExecutor
+
+ImageVariant = namedtuple('ImageVariant', ['name', 'max_side', 'format', 'extension'])
+
+# Variantes geradas para cada imagem; 'medium' é a exibida nas páginas do produto
+IMAGE_VARIANTS = (
+    ImageVariant('thumbnail', 320, 'WEBP', 'webp'),
+    ImageVariant('thumbnail_jpeg', 320, 'JPEG', 'jpg'),
+    ImageVariant('medium', 960, 'WEBP', 'webp'),
+)
+DISPLAY_VARIANT = 'medium'
+
+# Assinaturas (magic bytes) dos formatos aceitos: o content type enviado pelo cliente não é confiável
+SNIFF_BYTES = 12
+_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+)
+
+DEFAULT_IMAGE_WORKERS = 2
+DEFAULT_IMAGE_QUEUE_LIMIT = 32
+
+
+def detect_image_extension(head: bytes) -> Optional[str]:
+    """
+    Returns the file extension of a JPEG, PNG or WebP image from its first
+    SNIFF_BYTES bytes, or None for anything else.
+    """
+    for signature, extension in _SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def render_variants(data: bytes, variants=IMAGE_VARIANTS) -> dict[str, bytes]:
+    """
+    Decodes the image once and encodes every variant, never upscaling it.
+    Runs in a worker process.
+
+    :param data: Bytes of the original image.
+    :return: Encoded bytes per variant name.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as image:
+        # Respeita a orientação gravada pela câmera no EXIF
+        image = ImageOps.exif_transpose(image)
+        rendered = {}
+        for variant in variants:
+            resized = image.copy()
+            resized.thumbnail((variant.max_side, variant.max_side), Image.Resampling.LANCZOS)
+            if variant.format == 'JPEG' and resized.mode not in ('RGB', 'L'):
+                resized = resized.convert('RGB')
+            elif resized.mode not in ('RGB', 'RGBA', 'L'):
+                resized = resized.convert('RGBA')
+            output = io.BytesIO()
+            resized.save(output, format=variant.format, quality=80, optimize=variant.format == 'JPEG')
+            rendered[variant.name] = output.getvalue()
+        return rendered
+
+
+def _create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    # 'spawn': fazer fork de um worker do gunicorn com várias threads pode herdar locks travados
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+# Pool único do processo, configurado em create_app (IMAGE_PROCESSING_WORKERS / IMAGE_PROCESSING_QUEUE_LIMIT)
+image_processing_pool = BoundedExecutor(_create_process_pool, DEFAULT_IMAGE_WORKERS, DEFAULT_IMAGE_QUEUE_LIMIT)
+
+
+class ImageVariantProcessor:
+    """
+    Renders the IMAGE_VARIANTS of an image in the bounded process pool and hands
+    the result to a callback, inside the app context of the submitting request so
+    the callback can use the repositories.
+    """
+
+    sniff_bytes = SNIFF_BYTES
+    detect_extension = staticmethod(detect_image_extension)
+
+    def __init__(self, pool: BoundedExecutor = image_processing_pool, variants=IMAGE_VARIANTS,
+                 display_variant: str = DISPLAY_VARIANT):
+        self.pool = pool
+        self.variants = variants
+        self.display_variant = display_variant
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether a new image would be rejected because the pool queue is full."""
+        return self.pool.pending >= self.pool.max_pending
+
+    def submit(self, data: bytes,
+               on_done: Callable[[Optional[dict[str, bytes]], Optional[BaseException]], None]) -> Future:
+        """
+        :param data: Bytes of the original image.
+        :param on_done: Called with (variants, None) on success or (None, error) on failure.
+        :raises WorkerPoolBusyError: If the pool queue is full.
+        """
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def done(finished: Future) -> None:
+            error = finished.exception()
+            try:
+                if app is None:
+                    on_done(None if error else finished.result(), error)
+                else:
+                    with app.app_context():
+                        on_done(None if error else finished.result(), error)
+            except Exception as e:
+                # Exceções em callbacks de Future são engolidas; registra pelo menos
+                print(f"WARNING: Could not store the image variants: {e}")
+
+        return self.pool.submit(render_variants, data, self.variants, on_done=done)
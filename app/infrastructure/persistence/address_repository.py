@@ -11,7 +11,7 @@ class AddressRepository(IAddressRepository):
     Handles persistence operations for AddressDBModel.
     """
     def create(self, address_entity: Address) -> Address: # Aceita Address (entidade pura)
-        """Saves an Address entity to the database by converting it to AddressDBModel."""
+        """Stages an Address entity in the current unit of work (add + flush, no commit)."""
         # CONVERSÃO: Entidade de Domínio Pura -> Modelo ORM
         address_db_model = AddressDBModel(
             street=address_entity.street,
@@ -26,10 +26,9 @@ class AddressRepository(IAddressRepository):
         print("Address DB Model: ", address_db_model)
         try:
             db.session.add(address_db_model)
-            db.session.commit()
+            db.session.flush()
         except Exception as e:
             print(f"Error saving address: {e}")
-            db.session.rollback()
             raise
         
         address_entity.address_id = address_db_model.address_id  # Atualiza o ID da entidade pura com o ID gerado pelo banco
@@ -44,10 +43,11 @@ class AddressRepository(IAddressRepository):
         return None
     
     def get_by_attributes(self, address_entity: Address) -> Optional[Address]:
-        """Gets an Address entity by its attributes."""
-        filter_criteria = address_entity.to_filter_dict()
-        query = AddressDBModel.query.filter_by(**filter_criteria)
-        address_db_model = query.first()
+        """
+        Gets an Address entity with the same normalized attributes, with a single
+        lookup on the indexed fingerprint column.
+        """
+        address_db_model = AddressDBModel.query.filter_by(fingerprint=address_entity.fingerprint()).first()
         if address_db_model:
             return Address.from_db_model(address_db_model)
         return None
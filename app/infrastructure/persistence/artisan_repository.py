@@ -9,7 +9,7 @@ class ArtisanRepository(IArtisanRepository):
 
     def create(self, artisan_entity):
         """
-        Saves an Artisan entity to the database.
+        Stages an Artisan entity in the current unit of work (add + flush, no commit).
         Converts the pure domain entity to a database model before saving.
         """
         # CONVERSION: Pure Domain Entity -> ORM Model
@@ -23,10 +23,11 @@ class ArtisanRepository(IArtisanRepository):
         print("Artisan DB Model: ", artisan_db_model)
         try:
             db.session.add(artisan_db_model)
-            db.session.commit()
+            db.session.flush()
         except Exception as e:
+            # Propaga: o serviço desfaz o cadastro inteiro (unit of work)
             print(f"Error saving artisan: {e}")
-            db.session.rollback()
+            raise
         
         print("Artisan Entity after save: ", artisan_entity)
         return artisan_entity # Retorna a entidade pura que foi salva
@@ -9,7 +9,7 @@ class BuyerRepository(IBuyerRepository):
 
     def create(self, buyer_entity):
         """
-        Saves an Buyer entity to the database.
+        Stages a Buyer entity in the current unit of work (add + flush, no commit).
         Converts the pure domain entity to a database model before saving.
         """
         # CONVERSION: Pure Domain Entity -> ORM Model
@@ -22,10 +22,11 @@ class BuyerRepository(IBuyerRepository):
         print("Buyer DB Model: ", buyer_db_model)
         try:
             db.session.add(buyer_db_model)
-            db.session.commit()
+            db.session.flush()
         except Exception as e:
+            # Propaga: o serviço desfaz o cadastro inteiro (unit of work)
             print(f"Error saving buyer: {e}")
-            db.session.rollback()
+            raise
         
         print("Buyer Entity after save: ", buyer_entity)
         return buyer_entity # Retorna a entidade pura que foi salva
\ No newline at end of file
@@ -0,0 +1,250 @@
+import uuid
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import bindparam, case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.domain.models.cart import MAX_CART_ITEM_QUANTITY, CartEntity, CartItemEntity
+from app.domain.models.category import CategoryEntity
+from app.domain.models.product import ProductEntity
+from app.domain.repositories.cart_repository_interface import ICartRepository
+from app.infrastructure.cache.cart_change_buffer import CartChange, apply_change
+from app.infrastructure.persistence.models_db.cart_db_model import CartDBModel
+from app.infrastructure.persistence.models_db.cart_item_db_model import CartItemDBModel
+from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
+from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+from app.infrastructure.persistence.product_repository import LISTING_COLUMNS, listing_row_to_entities
+
+_carts = CartDBModel.__table__
+_cart_items = CartItemDBModel.__table__
+
+CENTS = Decimal('0.01')
+
+# Preço x quantidade calculado no banco; as somas do carrinho são funções de janela
+# sobre as mesmas linhas, então itens, produtos, categorias e totais vêm num único SELECT
+_line_total = CartItemDBModel.quantity * ProductDBModel.price
+
+
+def _money(value) -> Decimal:
+    # O SQLite devolve NUMERIC como float: arredonda para centavos
+    return Decimal(value if value is not None else 0).quantize(CENTS)
+
+
+def _capped_increment(amount):
+    """quantity + amount, stopping at MAX_CART_ITEM_QUANTITY (LEAST does not exist in SQLite)."""
+    total = _cart_items.c.quantity + amount
+    return case((total > MAX_CART_ITEM_QUANTITY, MAX_CART_ITEM_QUANTITY), else_=total)
+
+
+_by_line = (_cart_items.c.cart_id == bindparam('b_cart_id'), _cart_items.c.product_id == bindparam('b_product_id'))
+# Statements executemany da gravação em lote das mudanças (apply_changes)
+_INCREMENT_LINES = update(_cart_items).where(*_by_line).values(quantity=_capped_increment(bindparam('b_quantity')))
+_REPLACE_LINES = update(_cart_items).where(*_by_line).values(quantity=bindparam('b_quantity'))
+_DELETE_LINES = delete(_cart_items).where(*_by_line)
+_TOUCH_CARTS = update(_carts).where(_carts.c.cart_id == bindparam('b_cart_id')).values(updated_at=func.now())
+
+
+def _cart_id_of(buyer_id: str):
+    return select(_carts.c.cart_id).where(_carts.c.buyer_id == buyer_id).scalar_subquery()
+
+
+class CartRepository(ICartRepository):
+    def __init__(self):
+        super().__init__()
+
+    def get_by_buyer_id(self, buyer_id: str) -> Optional[CartEntity]:
+        """
+        Loads the cart, its items, their products and categories and the totals
+        in one SELECT (carts LEFT JOIN cart_items, products and categories),
+        mapping the rows straight to entities: no ORM instances, so no lazy load
+        of CartItemDBModel.product per item.
+        """
+        statement = (
+            select(
+                CartDBModel.cart_id,
+                CartDBModel.updated_at.label('cart_updated_at'),
+                CartItemDBModel.cart_item_id,
+                CartItemDBModel.quantity,
+                *LISTING_COLUMNS,
+                _line_total.label('line_total'),
+                func.sum(_line_total).over().label('total_value'),
+                func.sum(CartItemDBModel.quantity).over().label('total_quantity'),
+            )
+            .select_from(CartDBModel)
+            # O carrinho vazio ainda devolve uma linha, com as colunas dos itens nulas
+            .outerjoin(CartItemDBModel, CartItemDBModel.cart_id == CartDBModel.cart_id)
+            .outerjoin(ProductDBModel, ProductDBModel.product_id == CartItemDBModel.product_id)
+            .outerjoin(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(CartDBModel.buyer_id == buyer_id)
+            .order_by(ProductDBModel.name, ProductDBModel.product_id)
+        )
+        rows = db.session.execute(statement).all()
+        if not rows:
+            return None
+
+        items = []
+        for row in rows:
+            if row.cart_item_id is None:
+                continue
+            product, category = listing_row_to_entities(row)
+            items.append(CartItemEntity(
+                cart_item_id=row.cart_item_id,
+                product_id=row.product_id,
+                quantity=row.quantity,
+                product=product,
+                category=category,
+                line_total=_money(row.line_total),
+            ))
+        first = rows[0]
+        return CartEntity(
+            cart_id=first.cart_id,
+            buyer_id=buyer_id,
+            items=items,
+            total_quantity=first.total_quantity or 0,
+            total_value=_money(first.total_value),
+            updated_at=first.cart_updated_at,
+        )
+
+    def add_item(self, buyer_id: str, product_id: str, quantity: int) -> None:
+        """
+        Creates the cart and the line on demand and sums the quantity with an
+        UPDATE quantity = quantity + n, capped at MAX_CART_ITEM_QUANTITY, in one
+        transaction. The unique indexes on carts.buyer_id and
+        cart_items(cart_id, product_id) reject the duplicates of concurrent
+        requests; the loser rolls back and retries once, finding the rows.
+        """
+        for attempt in range(2):
+            try:
+                cart_id = db.session.scalar(select(_carts.c.cart_id).where(_carts.c.buyer_id == buyer_id))
+                if cart_id is None:
+                    cart_id = str(uuid.uuid4())
+                    db.session.execute(insert(_carts).values(cart_id=cart_id, buyer_id=buyer_id))
+                else:
+                    self._touch(buyer_id)
+                increment = (
+                    update(_cart_items)
+                    .where(_cart_items.c.cart_id == cart_id, _cart_items.c.product_id == product_id)
+                    .values(quantity=_capped_increment(quantity))
+                )
+                if db.session.execute(increment).rowcount == 0:
+                    db.session.execute(insert(_cart_items).values(
+                        cart_item_id=str(uuid.uuid4()), cart_id=cart_id, product_id=product_id,
+                        quantity=min(quantity, MAX_CART_ITEM_QUANTITY),
+                    ))
+                db.session.commit()
+                return
+            except IntegrityError:
+                db.session.rollback()
+                if attempt:
+                    raise
+
+    def set_item_quantity(self, buyer_id: str, product_id: str, quantity: int) -> bool:
+        """Replaces the quantity with one UPDATE, without loading the cart."""
+        statement = (
+            update(_cart_items)
+            .where(_cart_items.c.cart_id == _cart_id_of(buyer_id), _cart_items.c.product_id == product_id)
+            .values(quantity=quantity)
+        )
+        return self._write(buyer_id, statement)
+
+    def remove_item(self, buyer_id: str, product_id: str) -> bool:
+        """Removes the line with one DELETE, without loading the cart."""
+        statement = (
+            delete(_cart_items)
+            .where(_cart_items.c.cart_id == _cart_id_of(buyer_id), _cart_items.c.product_id == product_id)
+        )
+        return self._write(buyer_id, statement)
+
+    def _write(self, buyer_id: str, statement) -> bool:
+        changed = db.session.execute(statement).rowcount > 0
+        if changed:
+            self._touch(buyer_id)
+        db.session.commit()
+        return changed
+
+    @staticmethod
+    def _touch(buyer_id: str) -> None:
+        # Mudanças nos itens também contam como mudança do carrinho (carrinhos abandonados)
+        db.session.execute(update(_carts).where(_carts.c.buyer_id == buyer_id).values(updated_at=func.now()))
+
+    def flush(self, buyer_id: Optional[str] = None) -> None:
+        """Nothing to do: every change is committed when it is made."""
+
+    def has_item(self, buyer_id: str, product_id: str) -> bool:
+        """Whether the buyer's cart has a line of the product (one indexed lookup)."""
+        statement = (
+            select(_cart_items.c.cart_item_id)
+            .where(_cart_items.c.cart_id == _cart_id_of(buyer_id), _cart_items.c.product_id == product_id)
+        )
+        return db.session.scalar(statement) is not None
+
+    def find_products_with_categories(self, product_ids: list[str]) -> dict[str, tuple[ProductEntity, CategoryEntity]]:
+        """Loads products and their categories in one joined SELECT, by product_id."""
+        if not product_ids:
+            return {}
+        statement = (
+            select(*LISTING_COLUMNS)
+            .join(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(ProductDBModel.product_id.in_(product_ids))
+        )
+        return {row.product_id: listing_row_to_entities(row) for row in db.session.execute(statement)}
+
+    def apply_changes(self, changes: dict[str, dict[str, CartChange]]) -> None:
+        """
+        Writes coalesced cart changes ({buyer_id: {product_id: CartChange}}) in one
+        transaction: two SELECTs find the existing carts and lines, then each kind
+        of write (new carts, new lines, increments, replacements, removals) is a
+        single executemany. Like add_item, it retries once when a concurrent
+        request created the same cart or line.
+        """
+        if not changes:
+            return
+        for attempt in range(2):
+            try:
+                self._apply_changes(changes)
+                db.session.commit()
+                return
+            except IntegrityError:
+                db.session.rollback()
+                if attempt:
+                    raise
+
+    @staticmethod
+    def _apply_changes(changes: dict[str, dict[str, CartChange]]) -> None:
+        cart_ids = dict(db.session.execute(
+            select(_carts.c.buyer_id, _carts.c.cart_id).where(_carts.c.buyer_id.in_(list(changes)))
+        ).all())
+        new_carts = [{'cart_id': str(uuid.uuid4()), 'buyer_id': buyer_id}
+                     for buyer_id in changes if buyer_id not in cart_ids]
+        if new_carts:
+            db.session.execute(insert(_carts), new_carts)
+            cart_ids.update((cart['buyer_id'], cart['cart_id']) for cart in new_carts)
+        existing = {tuple(row) for row in db.session.execute(
+            select(_cart_items.c.cart_id, _cart_items.c.product_id)
+            .where(_cart_items.c.cart_id.in_(list(cart_ids.values())))
+        )}
+
+        inserts, increments, replacements, removals = [], [], [], []
+        for buyer_id, lines in changes.items():
+            cart_id = cart_ids[buyer_id]
+            for product_id, change in lines.items():
+                line = {'b_cart_id': cart_id, 'b_product_id': product_id}
+                if (cart_id, product_id) not in existing:
+                    quantity = apply_change(None, change)
+                    if quantity > 0:
+                        inserts.append({'cart_item_id': str(uuid.uuid4()), 'cart_id': cart_id,
+                                        'product_id': product_id, 'quantity': quantity})
+                elif not change.replace:
+                    increments.append({**line, 'b_quantity': change.quantity})
+                elif change.quantity > 0:
+                    replacements.append({**line, 'b_quantity': change.quantity})
+                else:
+                    removals.append(line)
+
+        for statement, rows in ((insert(_cart_items), inserts), (_INCREMENT_LINES, increments),
+                                (_REPLACE_LINES, replacements), (_DELETE_LINES, removals)):
+            if rows:
+                db.session.execute(statement, rows)
+        db.session.execute(_TOUCH_CARTS, [{'b_cart_id': cart_ids[buyer_id]} for buyer_id in changes])
@@ -1,6 +1,7 @@
 
 from app.domain.repositories.category_repository_interface import ICategoryRepository
 from app.domain.models.category import CategoryEntity
+from app.infrastructure.cache.category_cache import CategoryCache, category_cache
 from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
 from app import db
 from typing import Optional
@@ -9,13 +10,17 @@ class CategoryRepository(ICategoryRepository):
     """
     Concrete implementation of the ICategoryRepository interface.
     This class handles the persistence logic for CategoryEntity instances.
+    Reads are served by the process-wide CategoryCache and only reach the
+    database on a cache miss.
     """
-    def __init__(self):
+    def __init__(self, cache: Optional[CategoryCache] = None):
         super().__init__()
+        self._cache = cache if cache is not None else category_cache
 
     def create(self, category: CategoryEntity) -> CategoryEntity:
         """
         Creates a new Category in the database and converts it to a pure domain entity.
+        The saved category is written through to the cache.
         """
         category_db_model = CategoryDBModel.from_entity(category)
         try:
@@ -26,13 +31,50 @@ class CategoryRepository(ICategoryRepository):
             db.session.rollback()
             raise
 
-        return CategoryEntity.from_db_model(category_db_model)
-    
+        saved_category = CategoryEntity.from_db_model(category_db_model)
+        self._cache.put(saved_category)
+        return saved_category
+
     def get_by_id(self, category_id: str) -> Optional[CategoryEntity]:
         """
         Gets a Category by ID and converts it to a pure domain entity.
         """
+        version = self._cache.version
+        category = self._cache.get(category_id)
+        if category is not None:
+            return category
+
         category_db_model = CategoryDBModel.query.get(category_id)
         if category_db_model:
-            return CategoryEntity.from_db_model(category_db_model)
-        return None
\ No newline at end of file
+            category = CategoryEntity.from_db_model(category_db_model)
+            self._cache.put(category, expected_version=version)
+            return category
+        return None
+
+    def get_many_by_ids(self, category_ids) -> list[CategoryEntity]:
+        """
+        Gets the Categories with the given IDs. The IDs missing from the cache are
+        resolved in a single IN query and converted to pure domain entities.
+        """
+        category_ids = list(set(category_ids))
+        if not category_ids:
+            return []
+        version = self._cache.version
+        categories, missing_ids = self._cache.get_many(category_ids)
+        if not missing_ids:
+            return categories
+
+        category_db_models = CategoryDBModel.query.filter(CategoryDBModel.category_id.in_(missing_ids)).all()
+        loaded_categories = [CategoryEntity.from_db_model(category_db_model) for category_db_model in category_db_models]
+        self._cache.put_many(loaded_categories, expected_version=version)
+        return categories + loaded_categories
+
+    def warm_cache(self) -> int:
+        """
+        Loads every category into the cache.
+
+        :return: Number of cached categories.
+        """
+        categories = [CategoryEntity.from_db_model(category_db_model) for category_db_model in CategoryDBModel.query.all()]
+        self._cache.warm(categories)
+        return len(categories)
@@ -0,0 +1,122 @@
+import json
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.domain.models.idempotency_record import IdempotencyRecordEntity
+from app.domain.repositories.idempotency_key_repository_interface import IIdempotencyKeyRepository
+from app.infrastructure.cache.idempotency_cache import IdempotencyResponseCache, idempotency_response_cache
+from app.infrastructure.persistence.models_db.idempotency_key_db_model import IdempotencyKeyDBModel
+
+_keys = IdempotencyKeyDBModel.__table__
+
+# Tentativas de reservar a chave quando ela some ou vence entre o INSERT e a leitura
+CLAIM_ATTEMPTS = 3
+
+_DELETE_KEYS = delete(_keys).where(
+    _keys.c.scope == bindparam('b_scope'),
+    _keys.c.idempotency_key == bindparam('b_key'),
+)
+
+
+def _by_key(scope: str, idempotency_key: str):
+    return _keys.c.scope == scope, _keys.c.idempotency_key == idempotency_key
+
+
+class IdempotencyKeyRepository(IIdempotencyKeyRepository):
+    def __init__(self, cache: IdempotencyResponseCache = idempotency_response_cache):
+        super().__init__()
+        self.cache = cache
+
+    def claim(self, record: IdempotencyRecordEntity, now: datetime) -> Optional[IdempotencyRecordEntity]:
+        """
+        Checks the in-process cache first; otherwise the INSERT itself is the
+        check (the primary key rejects a used key), so a new key costs one
+        statement and a repeated one an extra SELECT.
+        """
+        cached = self.cache.get(record.scope, record.idempotency_key)
+        if cached is not None:
+            return cached
+        for _ in range(CLAIM_ATTEMPTS):
+            try:
+                db.session.execute(insert(_keys).values(
+                    scope=record.scope,
+                    idempotency_key=record.idempotency_key,
+                    request_hash=record.request_hash,
+                    status=IdempotencyRecordEntity.IN_PROGRESS,
+                    created_at=now,
+                    expires_at=record.expires_at,
+                ))
+                db.session.commit()
+                return None
+            except IntegrityError:
+                db.session.rollback()
+            existing = self._find(record.scope, record.idempotency_key)
+            if existing is None:
+                # A requisição dona da chave falhou e a liberou: tenta de novo
+                continue
+            if existing.expires_at > now:
+                self.cache.put(existing)
+                return existing
+            # Vencida: apaga (só se continuar vencida) e tenta de novo
+            db.session.execute(delete(_keys).where(*_by_key(record.scope, record.idempotency_key),
+                                                   _keys.c.expires_at <= now))
+            db.session.commit()
+        # Outras requisições com a mesma chave ganharam todas as tentativas: trata como em andamento
+        return IdempotencyRecordEntity(record.scope, record.idempotency_key, record.request_hash, record.expires_at)
+
+    @staticmethod
+    def _find(scope: str, idempotency_key: str) -> Optional[IdempotencyRecordEntity]:
+        row = db.session.execute(select(_keys).where(*_by_key(scope, idempotency_key))).first()
+        if row is None:
+            return None
+        return IdempotencyRecordEntity(
+            scope=row.scope,
+            idempotency_key=row.idempotency_key,
+            request_hash=row.request_hash,
+            expires_at=row.expires_at,
+            status=row.status,
+            response_status=row.response_status,
+            response_body=json.loads(row.response_body) if row.response_body is not None else None,
+        )
+
+    def complete(self, record: IdempotencyRecordEntity) -> None:
+        # Em cache antes do UPDATE: se ele falhar, as repetições neste processo ainda recebem a resposta
+        record.status = IdempotencyRecordEntity.COMPLETED
+        self.cache.put(record)
+        try:
+            db.session.execute(
+                update(_keys)
+                .where(*_by_key(record.scope, record.idempotency_key))
+                .values(status=IdempotencyRecordEntity.COMPLETED, response_status=record.response_status,
+                        response_body=json.dumps(record.response_body))
+            )
+            db.session.commit()
+        except Exception as e:
+            print(f"Error storing the response of idempotency key {record.idempotency_key}: {e}")
+            db.session.rollback()
+            raise
+
+    def release(self, scope: str, idempotency_key: str) -> None:
+        db.session.execute(delete(_keys).where(*_by_key(scope, idempotency_key),
+                                               _keys.c.status == IdempotencyRecordEntity.IN_PROGRESS))
+        db.session.commit()
+
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        """
+        Looks up a batch of expired keys through the expires_at index and deletes
+        them by primary key with one executemany (a DELETE ... LIMIT is not portable).
+        """
+        rows = db.session.execute(
+            select(_keys.c.scope, _keys.c.idempotency_key)
+            .where(_keys.c.expires_at <= now)
+            .order_by(_keys.c.expires_at)
+            .limit(limit)
+        ).all()
+        if rows:
+            db.session.execute(_DELETE_KEYS, [{'b_scope': row.scope, 'b_key': row.idempotency_key} for row in rows])
+            db.session.commit()
+        return len(rows)
@@ -9,4 +9,7 @@ from app.infrastructure.persistence.models_db.order_db_model import OrderDBModel
 from app.infrastructure.persistence.models_db.order_item_db_model import OrderItemDBModel
 from app.infrastructure.persistence.models_db.message_db_model import MessageDBModel
 from app.infrastructure.persistence.models_db.cart_db_model import CartDBModel
-from app.infrastructure.persistence.models_db.cart_item_db_model import CartItemDBModel
\ No newline at end of file
+from app.infrastructure.persistence.models_db.cart_item_db_model import CartItemDBModel
+from app.infrastructure.persistence.models_db.stock_reservation_db_model import StockReservationDBModel, StockReservationItemDBModel
+from app.infrastructure.persistence.models_db.product_stock_shard_db_model import ProductStockShardDBModel
+from app.infrastructure.persistence.models_db.idempotency_key_db_model import IdempotencyKeyDBModel
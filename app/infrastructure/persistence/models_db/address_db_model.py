@@ -3,6 +3,7 @@ from app import db
 import datetime
 from sqlalchemy.orm import relationship
 import uuid
+from app.domain.models.address import address_fingerprint
 class AddressDBModel(db.Model):
     """
     Database model for the Address entity.
@@ -19,6 +20,8 @@ class AddressDBModel(db.Model):
     state = db.Column(db.String(2), nullable=False, name='state') # State abbreviation (e.g., 'BA', 'SP')
     country = db.Column(db.String(100), nullable=False, default='Brasil', name='country') # Country
     zip_code = db.Column(db.String(10), nullable=False, name='zip_code') # Postal code (ZIP)
+    # Hash dos campos normalizados (ver address_fingerprint): a busca de um endereço igual é uma consulta no índice
+    fingerprint = db.Column(db.String(64), nullable=False, index=True, name='fingerprint')
 
     created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
@@ -39,6 +42,7 @@ class AddressDBModel(db.Model):
         self.state = state
         self.country = country
         self.zip_code = zip_code
+        self.fingerprint = address_fingerprint(street, number, neighborhood, city, state, zip_code)
 
     def __repr__(self):
         return f"<AddressDBModel(address_id='{self.address_id}', zip_code='{self.zip_code}', city='{self.city}')>"
@@ -9,6 +9,10 @@ class CartDBModel(db.Model):
     Representa o carrinho de compras de um usuário.
     """
     __tablename__ = 'carts'
+    __table_args__ = (
+        # Um carrinho por comprador, mesmo com duas requisições criando o carrinho ao mesmo tempo
+        db.Index('ux_carts_buyer_id', 'buyer_id', unique=True),
+    )
 
     # Colunas da tabela
     cart_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -6,6 +6,11 @@ from sqlalchemy.orm import relationship
 
 class CartItemDBModel(db.Model):
     __tablename__ = 'cart_items'
+    __table_args__ = (
+        # Uma linha por produto no carrinho (adicionar de novo soma a quantidade);
+        # também atende a busca das linhas de um carrinho
+        db.Index('ux_cart_items_cart_product', 'cart_id', 'product_id', unique=True),
+    )
 
     # Colunas da tabela
     cart_item_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -0,0 +1,31 @@
+# app/infrastructure/persistence/models_db/idempotency_key_db_model.py
+from app import db
+import datetime
+
+
+class IdempotencyKeyDBModel(db.Model):
+    """
+    Modelo ORM para a tabela 'idempotency_keys'.
+    Guarda a resposta de uma requisição com o header Idempotency-Key, devolvida
+    de novo quando o cliente repete a requisição com a mesma chave.
+    """
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        # Limpeza das chaves vencidas: WHERE expires_at <= ?
+        db.Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+
+    # A chave vem do cliente: o escopo (operação e comprador) separa as chaves iguais de clientes diferentes
+    scope = db.Column(db.String(100), primary_key=True)
+    idempotency_key = db.Column(db.String(255), primary_key=True)
+    # SHA-256 do corpo da requisição: a mesma chave com outro corpo é recusada
+    request_hash = db.Column(db.String(64), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='in_progress') # Ex: 'in_progress', 'completed'
+    response_status = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return (f"<IdempotencyKeyDBModel(scope='{self.scope}', key='{self.idempotency_key}', "
+                f"status='{self.status}')>")
@@ -6,6 +6,11 @@ from sqlalchemy.orm import relationship
 
 class OrderDBModel(db.Model):
     __tablename__ = 'orders'
+    __table_args__ = (
+        # Histórico do comprador: WHERE buyer_id = ? ORDER BY order_date DESC, order_id DESC,
+        # paginado por keyset sem ler nenhuma linha fora da página
+        db.Index('ix_orders_buyer_id_order_date', 'buyer_id', 'order_date', 'order_id'),
+    )
 
     order_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     order_date = db.Column(db.DateTime, default=datetime.datetime.utcnow)
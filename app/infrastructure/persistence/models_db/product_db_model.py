@@ -2,10 +2,26 @@
 from app import db
 import uuid
 import datetime
+from sqlalchemy import DDL, event, false as sa_false
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 
 class ProductDBModel(db.Model):
     __tablename__ = 'products'
+    __table_args__ = (
+        # Um artesão não pode ter dois produtos com o mesmo nome (também protege contra cadastros concorrentes)
+        db.UniqueConstraint('artisan_id', 'name', name='uq_products_artisan_name'),
+        # Keyset pagination of an artisan's catalogue: WHERE artisan_id = ? ORDER BY registration_date, product_id
+        db.Index('ix_products_artisan_registration', 'artisan_id', 'registration_date', 'product_id'),
+        # Browse por categoria: WHERE category_id = ? AND status IN (...) AND price BETWEEN ...
+        db.Index('ix_products_category_status_price', 'category_id', 'status', 'price'),
+        # Browse sem categoria: filtra por status/preço e cobre os GROUP BY das facetas (category_id, faixa de preço)
+        db.Index('ix_products_status_price_category', 'status', 'price', 'category_id'),
+        # Versão do catálogo do artesão (ETag da listagem): COUNT(*), MAX(updated_at) WHERE artisan_id = ?
+        db.Index('ix_products_artisan_updated_at', 'artisan_id', 'updated_at'),
+        # Full-text search over name/description (MySQL only, see PRODUCTS_FTS_SQLITE_DDL for SQLite)
+        db.Index('ix_products_name_description_fulltext', 'name', 'description', mysql_prefix='FULLTEXT').ddl_if(dialect='mysql'),
+    )
 
     product_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = db.Column(db.String(255), nullable=False)
@@ -13,8 +29,14 @@ class ProductDBModel(db.Model):
     price = db.Column(db.Numeric(10, 2), nullable=False)
     stock = db.Column(db.Integer, nullable=False, default=0)
     image_url = db.Column(db.String(255), nullable=True)
-    registration_date = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    registration_date = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
     status = db.Column(db.String(20), nullable=False, default='active') # Ex: 'active', 'inactive', 'out_of_stock'
+    # Estoque dividido em linhas de product_stock_shards (produtos muito disputados);
+    # nesse caso 'stock' guarda a soma dos shards, atualizada por sync_totals
+    stock_sharded = db.Column(db.Boolean, nullable=False, default=False, server_default=sa_false())
+    # Microssegundos no MySQL: duas alterações no mesmo segundo precisam gerar versões diferentes
+    updated_at = db.Column(db.DateTime().with_variant(mysql.DATETIME(fsp=6), 'mysql'), nullable=False,
+                           default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
 
     # Foreign Keys
     artisan_id = db.Column(db.String(36), db.ForeignKey('artisans.artisan_id'), nullable=False)
@@ -28,4 +50,25 @@ class ProductDBModel(db.Model):
     cart_items = relationship('CartItemDBModel', back_populates='product')
 
     def __repr__(self):
-        return f"<ProductDBModel(id='{self.product_id}', name='{self.name}')>"
\ No newline at end of file
+        return f"<ProductDBModel(id='{self.product_id}', name='{self.name}')>"
+
+
+# Equivalente do índice FULLTEXT para o SQLite (config 'testing'): uma tabela FTS5
+# com o product_id e o texto indexado, mantida em sincronia por triggers.
+PRODUCTS_FTS_TABLE = 'products_fts'
+PRODUCTS_FTS_SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCTS_FTS_TABLE} USING fts5("
+    "product_id UNINDEXED, name, description, tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+    f"INSERT INTO {PRODUCTS_FTS_TABLE} (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+    f"DELETE FROM {PRODUCTS_FTS_TABLE} WHERE product_id = old.product_id; END",
+    f"CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, description ON products BEGIN "
+    f"DELETE FROM {PRODUCTS_FTS_TABLE} WHERE product_id = old.product_id; "
+    f"INSERT INTO {PRODUCTS_FTS_TABLE} (product_id, name, description) VALUES (new.product_id, new.name, new.description); END",
+]
+
+for _statement in PRODUCTS_FTS_SQLITE_DDL:
+    event.listen(ProductDBModel.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(ProductDBModel.__table__, 'before_drop',
+             DDL(f"DROP TABLE IF EXISTS {PRODUCTS_FTS_TABLE}").execute_if(dialect='sqlite'))
@@ -0,0 +1,22 @@
+# app/infrastructure/persistence/models_db/product_stock_shard_db_model.py
+from app import db
+from sqlalchemy.orm import relationship
+
+
+class ProductStockShardDBModel(db.Model):
+    """
+    Modelo ORM para a tabela 'product_stock_shards'.
+    O estoque de um produto em modo sharded fica dividido em N linhas, para que
+    compras concorrentes atualizem linhas diferentes em vez de disputar a do produto.
+    """
+    __tablename__ = 'product_stock_shards'
+
+    product_id = db.Column(db.String(36), db.ForeignKey('products.product_id'), primary_key=True)
+    shard_index = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    stock = db.Column(db.Integer, nullable=False, default=0)
+
+    product = relationship('ProductDBModel')
+
+    def __repr__(self):
+        return (f"<ProductStockShardDBModel(product_id='{self.product_id}', "
+                f"shard_index={self.shard_index}, stock={self.stock})>")
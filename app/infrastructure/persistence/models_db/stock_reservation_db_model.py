@@ -0,0 +1,41 @@
+# app/infrastructure/persistence/models_db/stock_reservation_db_model.py
+from app import db
+import uuid
+import datetime
+from sqlalchemy.orm import relationship
+
+
+class StockReservationDBModel(db.Model):
+    """
+    Modelo ORM para a tabela 'stock_reservations'.
+    O estoque dos itens já foi descontado de 'products' enquanto a reserva está pendente.
+    """
+    __tablename__ = 'stock_reservations'
+    __table_args__ = (
+        # Varredura das reservas expiradas: WHERE status = 'pending' AND expires_at <= ?
+        db.Index('ix_stock_reservations_status_expires_at', 'status', 'expires_at'),
+    )
+
+    reservation_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    status = db.Column(db.String(20), nullable=False, default='pending') # Ex: 'pending', 'confirmed', 'released', 'expired'
+    expires_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.datetime.utcnow)
+
+    items = relationship('StockReservationItemDBModel', back_populates='reservation', cascade='all, delete-orphan')
+
+    def __repr__(self):
+        return f"<StockReservationDBModel(id='{self.reservation_id}', status='{self.status}')>"
+
+
+class StockReservationItemDBModel(db.Model):
+    __tablename__ = 'stock_reservation_items'
+
+    reservation_id = db.Column(db.String(36), db.ForeignKey('stock_reservations.reservation_id'), primary_key=True)
+    product_id = db.Column(db.String(36), db.ForeignKey('products.product_id'), primary_key=True, index=True)
+    quantity = db.Column(db.Integer, nullable=False)
+
+    reservation = relationship('StockReservationDBModel', back_populates='items')
+
+    def __repr__(self):
+        return (f"<StockReservationItemDBModel(reservation_id='{self.reservation_id}', "
+                f"product_id='{self.product_id}', quantity={self.quantity})>")
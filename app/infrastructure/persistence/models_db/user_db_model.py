@@ -3,6 +3,7 @@ from typing import Any
 from app import db
 import uuid
 from datetime import datetime, timezone
+from app.common.utils import normalize_email
 from sqlalchemy.orm import relationship # Import 'backref' for inverse relationships
 
 
@@ -12,9 +13,14 @@ class UserDBModel(db.Model):
     Maps to the 'users' table in MySQL as per the diagram.
     """
     __tablename__ = 'users' 
+    __table_args__ = (
+        db.Index('ux_users_email_normalized', 'email_normalized', unique=True),
+    )
 
     user_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()), name='user_id') # PK as per diagram
     email = db.Column(db.String(120), unique=True, nullable=False)
+    # Email em minúsculas e sem espaços: garante a unicidade sem diferenciar maiúsculas e serve as buscas por email
+    email_normalized = db.Column(db.String(120), nullable=False)
     password_hash = db.Column(db.String(128), nullable=False, name='password') # Stores password hash, original name 'senha'
     registration_date = db.Column(db.DateTime, default=datetime.now(timezone.utc), name='registration_date') # Original name 'data_cadastro'
     status = db.Column(db.String(20), nullable=False, default='active') # E.g., 'active', 'inactive', 'pending'
@@ -49,6 +55,7 @@ class UserDBModel(db.Model):
         if user_id is not None:
             self.user_id = user_id
         self.email = email
+        self.email_normalized = normalize_email(email)
         self.password_hash = password_hash
         # self.role = role  # Remover esta linha, role não existe nos parâmetros
         self.status = status
@@ -0,0 +1,187 @@
+import datetime
+import uuid
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import and_, bindparam, delete, func, insert, literal, or_, select, update
+from sqlalchemy.orm import selectinload
+
+from app import db
+from app.common.exceptions import CartChangedError, EmptyCartError, InsufficientStockError
+from app.domain.models.order import OrderEntity, OrderItemEntity
+from app.domain.repositories.order_repository_interface import IOrderRepository
+from app.infrastructure.persistence.cart_repository import _money
+from app.infrastructure.persistence.models_db.address_db_model import AddressDBModel
+from app.infrastructure.persistence.models_db.cart_db_model import CartDBModel
+from app.infrastructure.persistence.models_db.cart_item_db_model import CartItemDBModel
+from app.infrastructure.persistence.models_db.order_db_model import OrderDBModel
+from app.infrastructure.persistence.models_db.order_item_db_model import OrderItemDBModel
+from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+from app.infrastructure.persistence.models_db.user_db_model import UserDBModel
+from app.infrastructure.persistence.stock_reservation_repository import (
+    decrement_stock, find_short_product_ids, shard_layout_is_stale,
+)
+
+_addresses = AddressDBModel.__table__
+_carts = CartDBModel.__table__
+_cart_items = CartItemDBModel.__table__
+_orders = OrderDBModel.__table__
+_order_items = OrderItemDBModel.__table__
+_products = ProductDBModel.__table__
+_users = UserDBModel.__table__
+
+# Tentativas do checkout quando o carrinho muda entre a leitura e a gravação
+CHECKOUT_ATTEMPTS = 3
+
+# Só apaga a linha se a quantidade ainda é a que foi lida (e precificada); a soma
+# dos rowcounts do executemany diz se o carrinho mudou ou se outro checkout o levou
+_TAKE_CART_LINES = delete(_cart_items).where(
+    _cart_items.c.cart_item_id == bindparam('b_cart_item_id'),
+    _cart_items.c.quantity == bindparam('b_quantity'),
+)
+
+# Colunas do endereço copiadas para o endereço de entrega do pedido
+_ADDRESS_COLUMNS = [column for column in _addresses.c if column.name not in ('address_id', 'created_at', 'updated_at')]
+
+
+def _before_keyset(before):
+    """
+    Builds the WHERE clause that skips every order up to the given
+    (order_date, order_id) pair of the newest-first keyset ordering.
+    """
+    last_order_date, last_order_id = before
+    return or_(
+        OrderDBModel.order_date < last_order_date,
+        and_(OrderDBModel.order_date == last_order_date, OrderDBModel.order_id < last_order_id),
+    )
+
+
+class OrderRepository(IOrderRepository):
+    def __init__(self):
+        super().__init__()
+
+    def create_from_cart(self, buyer_id: str, payment_method: str) -> OrderEntity:
+        """
+        Checkout in one transaction with a fixed number of statements, whatever
+        the number of cart lines: one SELECT reads the lines with the prices of
+        their products, then one executemany DELETE empties the cart, one
+        batched conditional UPDATE (decrement_stock) takes the stock, and the
+        delivery address, the order and all its items are one INSERT each.
+        """
+        try:
+            for attempt in range(CHECKOUT_ATTEMPTS):
+                now = datetime.datetime.utcnow()
+                lines = self._cart_lines(buyer_id)
+                if not lines:
+                    raise EmptyCartError()
+                quantities = {line.product_id: line.quantity for line in lines}
+                if not self._take_cart_lines(lines):
+                    # Outra requisição mudou o carrinho depois da leitura: lê de novo
+                    db.session.rollback()
+                    continue
+                if not decrement_stock(quantities, now):
+                    db.session.rollback()
+                    if attempt + 1 < CHECKOUT_ATTEMPTS and shard_layout_is_stale(quantities):
+                        continue
+                    raise InsufficientStockError(find_short_product_ids(quantities))
+                order = self._insert_order(buyer_id, payment_method, lines, now)
+                db.session.execute(update(_carts).where(_carts.c.cart_id == lines[0].cart_id)
+                                   .values(updated_at=func.now()))
+                db.session.commit()
+                return order
+            raise CartChangedError()
+        except (EmptyCartError, InsufficientStockError, CartChangedError):
+            db.session.rollback()
+            raise
+        except Exception as e:
+            print(f"Error creating the order of buyer {buyer_id}: {e}")
+            db.session.rollback()
+            raise
+
+    @staticmethod
+    def _cart_lines(buyer_id: str) -> list:
+        # O preço lido aqui é o que fica no pedido (unit_price)
+        return db.session.execute(
+            select(_cart_items.c.cart_item_id, _cart_items.c.cart_id, _cart_items.c.product_id,
+                   _cart_items.c.quantity, _products.c.price)
+            .join(_carts, _carts.c.cart_id == _cart_items.c.cart_id)
+            .join(_products, _products.c.product_id == _cart_items.c.product_id)
+            .where(_carts.c.buyer_id == buyer_id)
+            .order_by(_cart_items.c.product_id)
+        ).all()
+
+    @staticmethod
+    def _take_cart_lines(lines: list) -> bool:
+        parameters = [{'b_cart_item_id': line.cart_item_id, 'b_quantity': line.quantity} for line in lines]
+        return db.session.execute(_TAKE_CART_LINES, parameters).rowcount == len(parameters)
+
+    @staticmethod
+    def _copy_delivery_address(buyer_id: str, now: datetime.datetime) -> Optional[str]:
+        """
+        Copies the buyer's address for the order with one INSERT ... SELECT:
+        orders.address_id is unique, and a later change of the buyer's address
+        must not move an order already placed.
+        """
+        address_id = str(uuid.uuid4())
+        copied = db.session.execute(
+            insert(_addresses).from_select(
+                ['address_id', *(column.name for column in _ADDRESS_COLUMNS), 'created_at', 'updated_at'],
+                select(literal(address_id), *_ADDRESS_COLUMNS, literal(now), literal(now))
+                .select_from(_addresses.join(_users, _users.c.address_id == _addresses.c.address_id))
+                .where(_users.c.user_id == buyer_id)
+            )
+        ).rowcount
+        return address_id if copied else None
+
+    def _insert_order(self, buyer_id: str, payment_method: str, lines: list, now: datetime.datetime) -> OrderEntity:
+        order_id = str(uuid.uuid4())
+        items = [
+            OrderItemEntity(order_item_id=str(uuid.uuid4()), product_id=line.product_id,
+                            quantity=line.quantity, unit_price=_money(line.price))
+            for line in lines
+        ]
+        order = OrderEntity(
+            order_id=order_id,
+            buyer_id=buyer_id,
+            payment_method=payment_method,
+            total_value=_money(sum((item.line_total for item in items), Decimal('0'))),
+            items=items,
+            order_date=now,
+            delivery_address_id=self._copy_delivery_address(buyer_id, now),
+        )
+        # Chaves com o nome das colunas (orders.address_id), não dos atributos do modelo
+        db.session.execute(insert(_orders).values(
+            order_id=order_id,
+            order_date=now,
+            order_status=order.order_status,
+            total_value=order.total_value,
+            address_id=order.delivery_address_id,
+            payment_method=payment_method,
+            buyer_id=buyer_id,
+        ))
+        db.session.execute(insert(_order_items), [
+            {'order_item_id': item.order_item_id, 'order_id': order_id, 'product_id': item.product_id,
+             'quantity': item.quantity, 'unit_price': item.unit_price}
+            for item in items
+        ])
+        return order
+
+    def find_page_by_buyer_id(self, buyer_id: str, limit: int,
+                              before: Optional[tuple[datetime.datetime, str]] = None) -> list[OrderEntity]:
+        """
+        One page of orders read through ix_orders_buyer_id_order_date (filter,
+        order and keyset all come from the index), plus one SELECT ... IN for
+        the items of the whole page (selectinload): two queries per page,
+        however many orders the buyer has.
+        """
+        statement = (
+            select(OrderDBModel)
+            .options(selectinload(OrderDBModel.order_items))
+            .where(OrderDBModel.buyer_id == buyer_id)
+            .order_by(OrderDBModel.order_date.desc(), OrderDBModel.order_id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            statement = statement.where(_before_keyset(before))
+        order_db_models = db.session.execute(statement).scalars().all()
+        return [OrderEntity.from_db_model(order) for order in order_db_models]
@@ -1,7 +1,113 @@
+import datetime
 from app.domain.repositories.product_repository_interface import IProductRepository
 from app import db
+import uuid
+from sqlalchemy import String, and_, case, cast, exists, func, insert, literal, or_, select, union_all, update
+from sqlalchemy.exc import IntegrityError
+from app.common.exceptions import (
+    ArtisanNotFoundError, CategoryNotFoundError, DuplicateProductError, ProductBatchRejectedError,
+)
 from app.domain.models.product import ProductEntity
+from app.domain.models.category import CategoryEntity
 from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
+from app.infrastructure.persistence.models_db.artisan_db_model import ArtisanDBModel
+from app.infrastructure.persistence.category_repository import CategoryRepository
+from app.infrastructure.search.inverted_index import product_search_index
+
+
+def _after_keyset(after):
+    """
+    Builds the WHERE clause that skips every product up to the given
+    (registration_date, product_id) pair of the keyset ordering.
+    """
+    last_registration_date, last_product_id = after
+    return or_(
+        ProductDBModel.registration_date > last_registration_date,
+        and_(ProductDBModel.registration_date == last_registration_date,
+             ProductDBModel.product_id > last_product_id)
+    )
+
+def _status_values(status):
+    """
+    The status is stored both in lower case (column default) and in upper case
+    (ProductEntity default); comparing with IN keeps the status indexes usable.
+    """
+    return (status.lower(), status.upper())
+
+
+def _filter_conditions(product_filter):
+    """
+    Builds the WHERE conditions of a ProductFilter. Without a status filter
+    inactive products are left out.
+    """
+    conditions = []
+    if product_filter.category_id:
+        conditions.append(ProductDBModel.category_id == product_filter.category_id)
+    if product_filter.artisan_id:
+        conditions.append(ProductDBModel.artisan_id == product_filter.artisan_id)
+    if product_filter.status:
+        conditions.append(ProductDBModel.status.in_(_status_values(product_filter.status)))
+    else:
+        conditions.append(ProductDBModel.status.notin_(_status_values('inactive')))
+    if product_filter.min_price is not None:
+        conditions.append(ProductDBModel.price >= product_filter.min_price)
+    if product_filter.max_price is not None:
+        conditions.append(ProductDBModel.price <= product_filter.max_price)
+    return conditions
+
+
+_BROWSE_ORDERING = {
+    'newest': (ProductDBModel.registration_date.desc(), ProductDBModel.product_id),
+    'price_asc': (ProductDBModel.price, ProductDBModel.product_id),
+    'price_desc': (ProductDBModel.price.desc(), ProductDBModel.product_id),
+}
+
+# Columns needed to build a product listing (ResponseRegisterProduct) with its category
+LISTING_COLUMNS = (
+    ProductDBModel.product_id,
+    ProductDBModel.name,
+    ProductDBModel.description,
+    ProductDBModel.price,
+    ProductDBModel.stock,
+    ProductDBModel.image_url,
+    ProductDBModel.registration_date,
+    ProductDBModel.status,
+    ProductDBModel.artisan_id,
+    ProductDBModel.category_id,
+    CategoryDBModel.name.label('category_name'),
+    CategoryDBModel.description.label('category_description'),
+)
+
+
+def listing_row_to_entities(row):
+    """
+    Maps a row selected with LISTING_COLUMNS to a (ProductEntity, CategoryEntity) pair.
+    """
+    return (
+        ProductEntity(
+            product_id=row.product_id,
+            name=row.name,
+            description=row.description,
+            price=row.price,
+            stock=row.stock,
+            image_url=row.image_url if row.image_url else None,
+            registration_date=row.registration_date,
+            status=row.status,
+            artisan_id=row.artisan_id,
+            category_id=row.category_id,
+        ),
+        CategoryEntity(
+            category_id=row.category_id,
+            name=row.category_name,
+            description=row.category_description if row.category_description else None,
+        ),
+    )
+
+
+# Linhas por INSERT executemany no bulk_create
+BULK_INSERT_CHUNK_SIZE = 1000
+
 
 class ProductRepository(IProductRepository):
     def __init__(self):
@@ -9,13 +115,21 @@ class ProductRepository(IProductRepository):
 
     def create(self, product_entity):
         """
-        Saves a Product entity to the database.
+        Saves a Product entity to the database in a single INSERT + COMMIT.
         Converts the pure domain entity to a database model before saving.
+
+        The artisan, the category and the name uniqueness are enforced by the
+        foreign keys and the (artisan_id, name) unique constraint; when the
+        INSERT is rejected the cause is found with one validation query.
+
+        :raises ArtisanNotFoundError: If the artisan does not exist.
+        :raises CategoryNotFoundError: If the category does not exist.
+        :raises DuplicateProductError: If the artisan already has a product with this name.
         """
         
         # CONVERSION: Pure Domain Entity -> ORM Model
         product_db_model = ProductDBModel(
-            product_id=product_entity.product_id,
+            product_id=product_entity.product_id or str(uuid.uuid4()),
             name=product_entity.name,
             description=product_entity.description,
             price=product_entity.price,
@@ -24,19 +138,71 @@ class ProductRepository(IProductRepository):
             status=product_entity.status,
             image_url=product_entity.image_url,
             category_id=product_entity.category_id,
+            registration_date=product_entity.registration_date,
         )
         
         print("Product DB Model: ", product_db_model)
+        # Monta a entidade antes do commit: depois dele ler os atributos faria um SELECT de refresh
+        saved_product_entity = ProductEntity.from_db_model(product_db_model)
         try:
             db.session.add(product_db_model)
             db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            cause = self._integrity_error_cause(product_entity)
+            if cause is None:
+                print(f"Error saving product: {e}")
+                raise
+            raise cause from e
         except Exception as e:
             print(f"Error saving product: {e}")
             db.session.rollback()
-        product_entity =  ProductEntity.from_db_model(product_db_model)
-        print("Product Entity after save: ", product_entity)
-        return product_entity  
-    
+            raise
+        self._index_product(saved_product_entity)
+        print("Product Entity after save: ", saved_product_entity)
+        return saved_product_entity
+
+    @staticmethod
+    def _integrity_error_cause(product_entity):
+        """
+        Finds out which constraint rejected the product with a single query that checks
+        the artisan, the category and the name at once. Returns the matching domain
+        error, or None when none of them explains it.
+        """
+        statement = select(
+            exists().where(ArtisanDBModel.artisan_id == product_entity.artisan_id),
+            exists().where(CategoryDBModel.category_id == product_entity.category_id),
+            exists().where(and_(ProductDBModel.artisan_id == product_entity.artisan_id,
+                                ProductDBModel.name == product_entity.name)),
+        )
+        artisan_exists, category_exists, name_taken = db.session.execute(statement).one()
+        if not artisan_exists:
+            return ArtisanNotFoundError()
+        if not category_exists:
+            return CategoryNotFoundError()
+        if name_taken:
+            return DuplicateProductError()
+        return None
+
+    @staticmethod
+    def _index_product(product_entity):
+        """
+        Adds a newly saved product to the in-memory search index, when it is enabled.
+        A failure here never undoes the save: the product is picked up on the next rebuild.
+        """
+        if not product_search_index.enabled or (product_entity.status or '').lower() == 'inactive':
+            return
+        try:
+            category = CategoryRepository().get_by_id(product_entity.category_id)
+            product_search_index.add(
+                product_entity.product_id,
+                product_entity.name,
+                product_entity.description,
+                category.name if category else None,
+            )
+        except Exception as e:
+            print(f"WARNING: Could not index product {product_entity.product_id}: {e}")
+
     def get_product_by_id(self, product_id):
         """
         Retrieves a Product entity by its ID.
@@ -60,13 +226,98 @@ class ProductRepository(IProductRepository):
             return ProductEntity.from_db_model(product_db_model)
         return None
     
-    def find_by_artisan_id(self, artisan_id: str):
+    def update_image_url(self, product_id, image_url, expected_image_url=None):
+        """
+        Changes the image URL with one UPDATE; with expected_image_url it is a
+        compare-and-set, so a late update never overwrites a newer image.
         """
-        Finds all products associated with a specific artisan ID.
+        statement = (
+            update(ProductDBModel.__table__)
+            .where(ProductDBModel.product_id == product_id)
+            .values(image_url=image_url, updated_at=datetime.datetime.utcnow())
+        )
+        if expected_image_url is not None:
+            statement = statement.where(ProductDBModel.image_url == expected_image_url)
+        try:
+            result = db.session.execute(statement)
+            db.session.commit()
+        except Exception as e:
+            print(f"Error updating the image of product {product_id}: {e}")
+            db.session.rollback()
+            raise
+        return result.rowcount == 1
+
+    def find_existing_names(self, artisan_id: str, names):
+        """
+        Checks many names at once with a single IN query. The IN compares with the
+        collation of the column, the same one of uq_products_artisan_name, and the
+        stored names are returned as they are (e.g. 'vaso' when 'Vaso' was asked).
+        """
+        if not names:
+            return set()
+        statement = (
+            select(ProductDBModel.name)
+            .where(ProductDBModel.artisan_id == artisan_id)
+            .where(ProductDBModel.name.in_(set(names)))
+        )
+        return set(db.session.execute(statement).scalars())
+
+    def bulk_create(self, product_entities):
+        """
+        Inserts the products with Core executemany INSERTs of BULK_INSERT_CHUNK_SIZE
+        rows and one commit, without building ORM instances.
+
+        :raises ProductBatchRejectedError: If a constraint rejects any of the rows; none is saved.
+        """
+        if not product_entities:
+            return 0
+        now = datetime.datetime.utcnow()
+        rows = []
+        for product_entity in product_entities:
+            if not product_entity.product_id:
+                product_entity.product_id = str(uuid.uuid4())
+            rows.append({
+                'product_id': product_entity.product_id,
+                'name': product_entity.name,
+                'description': product_entity.description,
+                'price': product_entity.price,
+                'stock': product_entity.stock,
+                'image_url': product_entity.image_url,
+                'registration_date': product_entity.registration_date,
+                'updated_at': now,
+                'status': product_entity.status,
+                'artisan_id': product_entity.artisan_id,
+                'category_id': product_entity.category_id,
+            })
+        try:
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                db.session.execute(insert(ProductDBModel.__table__), rows[start:start + BULK_INSERT_CHUNK_SIZE])
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            raise ProductBatchRejectedError() from e
+        except Exception as e:
+            print(f"Error saving products in bulk: {e}")
+            db.session.rollback()
+            raise
+        for product_entity in product_entities:
+            self._index_product(product_entity)
+        return len(rows)
+
+    def find_by_artisan_id(self, artisan_id: str, limit=None, after=None):
+        """
+        Finds the products associated with a specific artisan ID, ordered by
+        (registration_date, product_id) so the listing can be paginated by keyset.
         Converts ORM models to pure domain entities.
         """
+        query = ProductDBModel.query.filter(ProductDBModel.artisan_id == artisan_id)
+        if after is not None:
+            query = query.filter(_after_keyset(after))
+        query = query.order_by(ProductDBModel.registration_date, ProductDBModel.product_id)
+        if limit is not None:
+            query = query.limit(limit)
         try:
-            product_db_models = ProductDBModel.query.filter_by(artisan_id=artisan_id).all()
+            product_db_models = query.all()
         except Exception as e:
             print(f"Error retrieving products for artisan {artisan_id}: {e}")
             return []
@@ -74,4 +325,88 @@ class ProductRepository(IProductRepository):
         if product_db_models:
             return [ProductEntity.from_db_model(product) for product in product_db_models]
         return []
-        
\ No newline at end of file
+
+    def find_with_categories_by_artisan_id(self, artisan_id: str, limit=None, after=None):
+        """
+        Finds the products of an artisan together with their categories in a single
+        joined SELECT, ordered by (registration_date, product_id).
+        Only the columns needed by the listing are loaded and the rows are mapped
+        straight to domain entities, without ORM instances, identity map or
+        lazy relationships.
+        """
+        statement = (
+            select(*LISTING_COLUMNS)
+            .join(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(ProductDBModel.artisan_id == artisan_id)
+            .order_by(ProductDBModel.registration_date, ProductDBModel.product_id)
+        )
+        if after is not None:
+            statement = statement.where(_after_keyset(after))
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        rows = db.session.execute(statement).all()
+        return [listing_row_to_entities(row) for row in rows]
+
+    def find_with_categories_by_filter(self, product_filter, limit, offset=0, sort='newest'):
+        """
+        Finds one page of the products matching the filter, with their categories,
+        in a single joined SELECT.
+        """
+        statement = (
+            select(*LISTING_COLUMNS)
+            .join(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(*_filter_conditions(product_filter))
+            .order_by(*_BROWSE_ORDERING[sort])
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = db.session.execute(statement).all()
+        return [listing_row_to_entities(row) for row in rows]
+
+    def get_artisan_catalogue_version(self, artisan_id: str):
+        """
+        Probes COUNT(*) and MAX(updated_at) of the artisan's products, answered
+        from the (artisan_id, updated_at) index without reading the rows.
+        """
+        statement = (
+            select(func.count(), func.max(ProductDBModel.updated_at))
+            .where(ProductDBModel.artisan_id == artisan_id)
+        )
+        count, last_updated_at = db.session.execute(statement).one()
+        return count, last_updated_at
+
+    def count_facets(self, product_filter, price_bounds):
+        """
+        Counts the filtered products per category and per price bucket in one
+        round trip: the filtered set is a CTE and each facet is one GROUP BY over it,
+        combined with UNION ALL.
+        """
+        price_bucket = case(
+            *[(ProductDBModel.price < bound, index) for index, bound in enumerate(price_bounds)],
+            else_=len(price_bounds),
+        )
+        filtered = (
+            select(ProductDBModel.category_id, price_bucket.label('price_bucket'))
+            .where(*_filter_conditions(product_filter))
+            .cte('filtered_products')
+        )
+        category_facet = (
+            select(literal('category').label('facet'),
+                   filtered.c.category_id.label('value'),
+                   func.count().label('total'))
+            .group_by(filtered.c.category_id)
+        )
+        price_facet = (
+            select(literal('price').label('facet'),
+                   cast(filtered.c.price_bucket, String).label('value'),
+                   func.count().label('total'))
+            .group_by(filtered.c.price_bucket)
+        )
+        facets = {'categories': {}, 'price_buckets': {}}
+        for row in db.session.execute(union_all(category_facet, price_facet)):
+            if row.facet == 'category':
+                facets['categories'][row.value] = row.total
+            else:
+                facets['price_buckets'][int(row.value)] = row.total
+        return facets
@@ -0,0 +1,81 @@
+from sqlalchemy import func, or_, select, table, column, literal_column
+from sqlalchemy.dialects.mysql import match
+
+from app import db
+from app.domain.repositories.product_search_repository_interface import IProductSearchRepository
+from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
+from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel, PRODUCTS_FTS_TABLE
+from app.infrastructure.persistence.product_repository import LISTING_COLUMNS, listing_row_to_entities
+
+products_fts = table(PRODUCTS_FTS_TABLE, column('product_id'))
+
+
+class ProductSearchRepository(IProductSearchRepository):
+    """
+    Full-text product search backed by the database index:
+    the FULLTEXT index on products(name, description) on MySQL and the
+    products_fts FTS5 table on SQLite. Other dialects fall back to a LIKE scan.
+    """
+
+    def search(self, terms, limit, offset=0):
+        """
+        Searches products by name/description and returns the best matches first.
+        Inactive products are never returned.
+        """
+        if not terms:
+            return []
+        dialect = db.engine.dialect.name
+        if dialect == 'mysql':
+            statement = self._mysql_statement(terms)
+        elif dialect == 'sqlite':
+            statement = self._sqlite_statement(terms)
+        else:
+            statement = self._like_statement(terms)
+
+        statement = (
+            statement
+            .join(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(func.lower(ProductDBModel.status) != 'inactive')
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = db.session.execute(statement).all()
+        return [listing_row_to_entities(row) for row in rows]
+
+    @staticmethod
+    def _mysql_statement(terms):
+        # NATURAL LANGUAGE MODE ranks by relevance and matches any of the terms
+        relevance = match(ProductDBModel.name, ProductDBModel.description,
+                          against=' '.join(terms)).in_natural_language_mode()
+        return (
+            select(*LISTING_COLUMNS)
+            .where(relevance > 0)
+            .order_by(relevance.desc(), ProductDBModel.product_id)
+        )
+
+    @staticmethod
+    def _sqlite_statement(terms):
+        # Cada termo entre aspas para não ser interpretado como sintaxe do FTS5
+        fts_query = ' OR '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        rank = literal_column(f'bm25({PRODUCTS_FTS_TABLE})')
+        return (
+            select(*LISTING_COLUMNS)
+            .select_from(products_fts)
+            .join(ProductDBModel, ProductDBModel.product_id == products_fts.c.product_id)
+            .where(literal_column(PRODUCTS_FTS_TABLE).op('MATCH')(fts_query))
+            # bm25 is lower for better matches
+            .order_by(rank, ProductDBModel.product_id)
+        )
+
+    @staticmethod
+    def _like_statement(terms):
+        conditions = []
+        for term in terms:
+            pattern = f'%{term}%'
+            conditions.append(ProductDBModel.name.ilike(pattern))
+            conditions.append(ProductDBModel.description.ilike(pattern))
+        return (
+            select(*LISTING_COLUMNS)
+            .where(or_(*conditions))
+            .order_by(ProductDBModel.name, ProductDBModel.product_id)
+        )
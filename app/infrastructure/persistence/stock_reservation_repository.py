@@ -0,0 +1,296 @@
+import datetime
+import uuid
+from sqlalchemy import and_, bindparam, case, insert, or_, select, update
+from sqlalchemy.orm import selectinload
+
+from app import db
+from app.common.exceptions import InsufficientStockError
+from app.domain.models.stock_reservation import StockReservationEntity
+from app.domain.repositories.stock_reservation_repository_interface import IStockReservationRepository
+from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+from app.infrastructure.persistence.models_db.stock_reservation_db_model import (
+    StockReservationDBModel, StockReservationItemDBModel,
+)
+from app.infrastructure.cache.stock_shard_cache import stock_shard_cache
+from app.infrastructure.persistence.product_repository import _status_values
+from app.infrastructure.persistence.stock_shard_repository import (
+    _shard_totals, decrement_sharded_stock, restore_sharded_stock, sharded_product_layout,
+)
+
+_products = ProductDBModel.__table__
+_quantity = bindparam('b_quantity')
+
+
+def _status_is(status):
+    # OR em vez de IN: parâmetros "expanding" do IN não podem ser usados com executemany
+    return or_(*(_products.c.status == value for value in _status_values(status)))
+
+
+# Desconta o estoque só se ainda houver o suficiente: a checagem e a escrita são
+# um único UPDATE atômico, sem SELECT ... FOR UPDATE segurando a linha do produto.
+# O status vem antes do stock no SET porque o MySQL avalia as atribuições em ordem
+# (as seguintes já enxergam o valor novo); assim todos os bancos usam o stock antigo.
+_DECREMENT_STOCK = (
+    update(_products)
+    .where(
+        _products.c.product_id == bindparam('b_product_id'),
+        _products.c.stock >= _quantity,
+        ~_status_is('inactive'),
+        # Produtos em modo sharded têm o estoque nos shards (ver stock_shard_repository)
+        _products.c.stock_sharded.is_(False),
+    )
+    .ordered_values(
+        (_products.c.status, case(
+            (and_(_products.c.stock == _quantity, _status_is('active')), 'out_of_stock'),
+            else_=_products.c.status,
+        )),
+        (_products.c.stock, _products.c.stock - _quantity),
+        (_products.c.updated_at, bindparam('b_updated_at')),
+    )
+)
+
+_RESTORE_STOCK = (
+    update(_products)
+    .where(_products.c.product_id == bindparam('b_product_id'), _products.c.stock_sharded.is_(False))
+    .ordered_values(
+        (_products.c.status, case(
+            (_status_is('out_of_stock'), 'active'),
+            else_=_products.c.status,
+        )),
+        (_products.c.stock, _products.c.stock + _quantity),
+        (_products.c.updated_at, bindparam('b_updated_at')),
+    )
+)
+
+
+def _stock_parameters(quantities, now):
+    # Ordem fixa de product_id: transações concorrentes travam as linhas na mesma ordem (sem deadlock)
+    return [
+        {'b_product_id': product_id, 'b_quantity': quantity, 'b_updated_at': now}
+        for product_id, quantity in sorted(quantities.items())
+    ]
+
+
+def decrement_stock(quantities, now=None):
+    """
+    Takes the quantities out of the products' stock with one batched conditional
+    UPDATE, in the current transaction (nothing is committed). A product whose
+    stock reaches zero goes 'out_of_stock'. Products in sharded-inventory mode
+    are taken from one of their shards instead.
+
+    :param quantities: Quantity per product_id.
+    :return: True if every product had enough stock; False otherwise, and then
+             the transaction must be rolled back.
+    """
+    layout = sharded_product_layout()
+    single_row = {product_id: quantity for product_id, quantity in quantities.items() if product_id not in layout}
+    if single_row:
+        parameters = _stock_parameters(single_row, now or datetime.datetime.utcnow())
+        if db.session.execute(_DECREMENT_STOCK, parameters).rowcount != len(parameters):
+            return False
+    for product_id in sorted(set(quantities) & layout.keys()):
+        if not decrement_sharded_stock(product_id, quantities[product_id], layout[product_id]):
+            return False
+    return True
+
+
+def restore_stock(quantities, now=None):
+    """
+    Gives the quantities back to the products' stock in the current transaction;
+    'out_of_stock' products become 'active' again.
+
+    :param quantities: Quantity per product_id.
+    """
+    now = now or datetime.datetime.utcnow()
+    layout = sharded_product_layout()
+    single_row = {product_id: quantity for product_id, quantity in quantities.items() if product_id not in layout}
+    restored = 0
+    if single_row:
+        restored = db.session.execute(_RESTORE_STOCK, _stock_parameters(single_row, now)).rowcount
+    missed = [product_id for product_id in sorted(set(quantities) & layout.keys())
+              if not restore_sharded_stock(product_id, quantities[product_id], layout[product_id])]
+    if restored == len(single_row) and not missed:
+        return
+
+    # O modo sharded de algum produto mudou em outro processo: devolve com o layout atual
+    stock_shard_cache.invalidate()
+    layout = sharded_product_layout()
+    retry = missed + [product_id for product_id in single_row if product_id in layout]
+    for product_id in retry:
+        if product_id in layout:
+            restore_sharded_stock(product_id, quantities[product_id], layout[product_id])
+        else:
+            db.session.execute(_RESTORE_STOCK, _stock_parameters({product_id: quantities[product_id]}, now))
+
+
+def stock_availability(quantities):
+    """
+    Reads the stock each product can sell right now: 0 when missing or inactive,
+    the sum of the shards when sharded.
+
+    :return: {product_id: (available stock, whether it is sharded)}.
+    """
+    rows = db.session.execute(
+        select(ProductDBModel.product_id, ProductDBModel.stock, ProductDBModel.status, ProductDBModel.stock_sharded)
+        .where(ProductDBModel.product_id.in_(list(quantities)))
+    ).all()
+    shard_totals = _shard_totals([row.product_id for row in rows if row.stock_sharded])
+    availability = {product_id: (0, False) for product_id in quantities}
+    for row in rows:
+        available = shard_totals.get(row.product_id, 0) if row.stock_sharded else row.stock
+        if (row.status or '').lower() == 'inactive':
+            available = 0
+        availability[row.product_id] = (available, bool(row.stock_sharded))
+    return availability
+
+
+def find_short_product_ids(quantities):
+    """
+    Finds which products cannot cover the requested quantities: missing,
+    inactive or with less stock. Used to report a failed decrement_stock.
+    """
+    availability = stock_availability(quantities)
+    return sorted(product_id for product_id, quantity in quantities.items()
+                  if availability[product_id][0] < quantity)
+
+
+def shard_layout_is_stale(quantities):
+    """
+    Checks whether another process turned the sharded mode of one of the products
+    on or off after this process cached the layout; if so the cache is reloaded.
+    Used to tell a failed decrement_stock worth retrying from a real shortage.
+    """
+    layout = sharded_product_layout()
+    stale = any(sharded != (product_id in layout)
+                for product_id, (_, sharded) in stock_availability(quantities).items())
+    if stale:
+        stock_shard_cache.invalidate()
+    return stale
+
+
+class StockReservationRepository(IStockReservationRepository):
+    def __init__(self):
+        super().__init__()
+
+    def reserve(self, reservation):
+        """
+        Decrements the stock of every item and saves the reservation in one transaction:
+        one batched UPDATE, two INSERTs and the COMMIT, whatever the number of items.
+        """
+        now = datetime.datetime.utcnow()
+        reservation_id = reservation.reservation_id or str(uuid.uuid4())
+        try:
+            if not decrement_stock(reservation.items, now):
+                db.session.rollback()
+                if not shard_layout_is_stale(reservation.items) or not decrement_stock(reservation.items, now):
+                    db.session.rollback()
+                    raise InsufficientStockError(find_short_product_ids(reservation.items))
+            db.session.execute(insert(StockReservationDBModel.__table__).values(
+                reservation_id=reservation_id,
+                status=StockReservationEntity.PENDING,
+                expires_at=reservation.expires_at,
+                created_at=reservation.created_at,
+            ))
+            db.session.execute(insert(StockReservationItemDBModel.__table__), [
+                {'reservation_id': reservation_id, 'product_id': product_id, 'quantity': quantity}
+                for product_id, quantity in reservation.items.items()
+            ])
+            db.session.commit()
+        except InsufficientStockError:
+            raise
+        except Exception as e:
+            print(f"Error reserving stock: {e}")
+            db.session.rollback()
+            raise
+        return StockReservationEntity(
+            reservation_id=reservation_id,
+            items=dict(reservation.items),
+            expires_at=reservation.expires_at,
+            status=StockReservationEntity.PENDING,
+            created_at=reservation.created_at,
+        )
+
+    def get_by_id(self, reservation_id):
+        """
+        Retrieves a reservation with its items (loaded in a second, batched query).
+        """
+        reservation_db_model = db.session.execute(
+            select(StockReservationDBModel)
+            .options(selectinload(StockReservationDBModel.items))
+            .where(StockReservationDBModel.reservation_id == reservation_id)
+        ).scalar_one_or_none()
+        if reservation_db_model:
+            return StockReservationEntity.from_db_model(reservation_db_model)
+        return None
+
+    def confirm(self, reservation_id, now):
+        """
+        Confirms the reservation with a conditional UPDATE, so an expired or
+        already released reservation is never confirmed.
+        """
+        try:
+            result = db.session.execute(
+                update(StockReservationDBModel.__table__)
+                .where(
+                    StockReservationDBModel.reservation_id == reservation_id,
+                    StockReservationDBModel.status == StockReservationEntity.PENDING,
+                    StockReservationDBModel.expires_at > now,
+                )
+                .values(status=StockReservationEntity.CONFIRMED)
+            )
+            db.session.commit()
+        except Exception as e:
+            print(f"Error confirming reservation {reservation_id}: {e}")
+            db.session.rollback()
+            raise
+        return result.rowcount == 1
+
+    def release(self, reservation_id, status=StockReservationEntity.RELEASED):
+        """
+        Gives the stock back. The status changes first, conditionally on 'pending':
+        when two releases race, only the one that changed it returns the stock.
+        """
+        try:
+            result = db.session.execute(
+                update(StockReservationDBModel.__table__)
+                .where(
+                    StockReservationDBModel.reservation_id == reservation_id,
+                    StockReservationDBModel.status == StockReservationEntity.PENDING,
+                )
+                .values(status=status)
+            )
+            if result.rowcount != 1:
+                db.session.rollback()
+                return False
+            items = db.session.execute(
+                select(StockReservationItemDBModel.product_id, StockReservationItemDBModel.quantity)
+                .where(StockReservationItemDBModel.reservation_id == reservation_id)
+            ).all()
+            if items:
+                restore_stock({item.product_id: item.quantity for item in items})
+            db.session.commit()
+        except Exception as e:
+            print(f"Error releasing reservation {reservation_id}: {e}")
+            db.session.rollback()
+            raise
+        return True
+
+    def find_expired_ids(self, now, limit, product_ids=None):
+        """
+        Lists pending reservations past their expiry using the (status, expires_at) index.
+        """
+        statement = (
+            select(StockReservationDBModel.reservation_id)
+            .where(
+                StockReservationDBModel.status == StockReservationEntity.PENDING,
+                StockReservationDBModel.expires_at <= now,
+            )
+            .order_by(StockReservationDBModel.expires_at)
+            .limit(limit)
+        )
+        if product_ids:
+            statement = statement.where(StockReservationDBModel.reservation_id.in_(
+                select(StockReservationItemDBModel.reservation_id)
+                .where(StockReservationItemDBModel.product_id.in_(list(product_ids)))
+            ))
+        return list(db.session.execute(statement).scalars())
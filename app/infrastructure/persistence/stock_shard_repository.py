@@ -0,0 +1,201 @@
+import datetime
+import random
+from sqlalchemy import and_, case, delete, func, insert, select, update
+
+from app import db
+from app.domain.repositories.stock_shard_repository_interface import IStockShardRepository
+from app.infrastructure.cache.stock_shard_cache import stock_shard_cache
+from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+from app.infrastructure.persistence.models_db.product_stock_shard_db_model import ProductStockShardDBModel
+from app.infrastructure.persistence.product_repository import _status_values
+
+_shards = ProductStockShardDBModel.__table__
+
+
+def _load_shard_layout():
+    rows = db.session.execute(
+        select(ProductStockShardDBModel.product_id, func.count())
+        .group_by(ProductStockShardDBModel.product_id)
+    ).all()
+    return {product_id: shard_count for product_id, shard_count in rows}
+
+
+def sharded_product_layout():
+    """
+    Returns {product_id: shard_count} of the sharded products, from the process cache.
+    """
+    return stock_shard_cache.get_layout(_load_shard_layout)
+
+
+def _take_from_shard(product_id, shard_index, quantity):
+    result = db.session.execute(
+        update(_shards)
+        .where(_shards.c.product_id == product_id,
+               _shards.c.shard_index == shard_index,
+               _shards.c.stock >= quantity)
+        .values(stock=_shards.c.stock - quantity)
+    )
+    return result.rowcount == 1
+
+
+def decrement_sharded_stock(product_id, quantity, shard_count):
+    """
+    Takes the quantity out of one shard of the product, in the current transaction.
+    Shards are tried from a random one on, so concurrent buyers update different rows;
+    when no single shard has enough, the quantity is taken from several of them.
+
+    :return: True if the shards had enough stock; False otherwise, and then the
+             transaction must be rolled back.
+    """
+    start = random.randrange(shard_count)
+    for offset in range(shard_count):
+        if _take_from_shard(product_id, (start + offset) % shard_count, quantity):
+            return True
+
+    rows = db.session.execute(
+        select(_shards.c.shard_index, _shards.c.stock)
+        .where(_shards.c.product_id == product_id, _shards.c.stock > 0)
+        .order_by(_shards.c.stock.desc())
+    ).all()
+    if sum(row.stock for row in rows) < quantity:
+        return False
+    remaining = quantity
+    for row in rows:
+        taken = min(row.stock, remaining)
+        if not _take_from_shard(product_id, row.shard_index, taken):
+            return False
+        remaining -= taken
+        if remaining == 0:
+            return True
+    return False
+
+
+def restore_sharded_stock(product_id, quantity, shard_count):
+    """
+    Gives the quantity back to a random shard of the product, in the current transaction.
+
+    :return: False if the product has no shards anymore.
+    """
+    result = db.session.execute(
+        update(_shards)
+        .where(_shards.c.product_id == product_id,
+               _shards.c.shard_index == random.randrange(shard_count))
+        .values(stock=_shards.c.stock + quantity)
+    )
+    return result.rowcount == 1
+
+
+def _shard_totals(product_ids=None):
+    statement = select(_shards.c.product_id, func.sum(_shards.c.stock)).group_by(_shards.c.product_id)
+    if product_ids is not None:
+        statement = statement.where(_shards.c.product_id.in_(list(product_ids)))
+    return {product_id: int(total or 0) for product_id, total in db.session.execute(statement).all()}
+
+
+class StockShardRepository(IStockShardRepository):
+    def __init__(self):
+        super().__init__()
+
+    def enable_sharding(self, product_id, shard_count):
+        """
+        Creates the shards and flags the product in one transaction. The stock column
+        keeps the total, which is what listings show.
+        """
+        try:
+            product = db.session.execute(
+                select(ProductDBModel.stock, ProductDBModel.stock_sharded)
+                .where(ProductDBModel.product_id == product_id)
+                .with_for_update()
+            ).one_or_none()
+            if product is None or product.stock_sharded:
+                db.session.rollback()
+                return False
+            share, remainder = divmod(product.stock, shard_count)
+            db.session.execute(insert(_shards), [
+                {'product_id': product_id, 'shard_index': index, 'stock': share + (1 if index < remainder else 0)}
+                for index in range(shard_count)
+            ])
+            db.session.execute(
+                update(ProductDBModel.__table__)
+                .where(ProductDBModel.product_id == product_id)
+                .values(stock_sharded=True)
+            )
+            db.session.commit()
+        except Exception as e:
+            print(f"Error enabling stock shards for product {product_id}: {e}")
+            db.session.rollback()
+            raise
+        finally:
+            stock_shard_cache.invalidate()
+        return True
+
+    def disable_sharding(self, product_id):
+        """
+        Collapses the shards into the stock column and drops them in one transaction.
+        """
+        try:
+            if product_id not in _shard_totals([product_id]):
+                db.session.rollback()
+                return False
+            result = db.session.execute(
+                update(ProductDBModel.__table__)
+                .where(ProductDBModel.product_id == product_id, ProductDBModel.stock_sharded.is_(True))
+                .values(
+                    stock=select(func.coalesce(func.sum(_shards.c.stock), 0))
+                    .where(_shards.c.product_id == product_id)
+                    .scalar_subquery(),
+                    stock_sharded=False,
+                    updated_at=datetime.datetime.utcnow(),
+                )
+            )
+            db.session.execute(delete(_shards).where(_shards.c.product_id == product_id))
+            db.session.commit()
+        except Exception as e:
+            print(f"Error disabling stock shards for product {product_id}: {e}")
+            db.session.rollback()
+            raise
+        finally:
+            stock_shard_cache.invalidate()
+        return result.rowcount == 1
+
+    def get_total_stock(self, product_ids):
+        """
+        Sums the shards of the given products with one GROUP BY over the shard primary key.
+        """
+        return _shard_totals(product_ids)
+
+    def sync_totals(self, product_ids=None):
+        """
+        One UPDATE for every sharded product whose stock column differs from the sum
+        of its shards; the status goes 'out_of_stock' at zero and back to 'active'.
+        """
+        products = ProductDBModel.__table__
+        total = (
+            select(func.coalesce(func.sum(_shards.c.stock), 0))
+            .where(_shards.c.product_id == products.c.product_id)
+            .scalar_subquery()
+        )
+        statement = (
+            update(products)
+            .where(products.c.stock_sharded.is_(True), products.c.stock != total)
+            # O status vem antes do stock: o MySQL avalia as atribuições do SET em ordem
+            .ordered_values(
+                (products.c.status, case(
+                    (and_(total == 0, products.c.status.in_(_status_values('active'))), 'out_of_stock'),
+                    (and_(total > 0, products.c.status.in_(_status_values('out_of_stock'))), 'active'),
+                    else_=products.c.status,
+                )),
+                (products.c.stock, total),
+                (products.c.updated_at, datetime.datetime.utcnow()),
+            )
+        )
+        if product_ids is not None:
+            statement = statement.where(products.c.product_id.in_(list(product_ids)))
+        try:
+            result = db.session.execute(statement)
+            db.session.commit()
+        except Exception as e:
+            print(f"Error syncing sharded stock totals: {e}")
+            db.session.rollback()
+            raise
+        return result.rowcount
@@ -0,0 +1,21 @@
+# app/infrastructure/persistence/unit_of_work.py
+from app import db
+from app.domain.repositories.unit_of_work_interface import IUnitOfWork
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """
+    Unit of work over the scoped db.session of the request: the repositories
+    add and flush to the same session, and commit sends them in one transaction.
+    """
+
+    def commit(self):
+        try:
+            db.session.commit()
+        except Exception as e:
+            print(f"Error committing the unit of work: {e}")
+            db.session.rollback()
+            raise
+
+    def rollback(self):
+        db.session.rollback()
@@ -3,13 +3,17 @@ from app.infrastructure.persistence.models_db.user_db_model import UserDBModel
 from app import db
 from app.domain.models.user import UserEntity
 from datetime import datetime, timezone
+from sqlalchemy import exists, select, update
+from sqlalchemy.exc import IntegrityError
+from app.common.exceptions import EmailAlreadyRegisteredError
+from app.common.utils import normalize_email
 
 class UserRepository(IUserRepository):
     def __init__(self):
         super().__init__()
 
     def create(self, user_entity) -> UserEntity:
-        """Saves a User entity to the database by converting it to UserDBModel."""
+        """Stages a User entity in the current unit of work (add + flush, no commit)."""
         # CONVERSION: Pure Domain Entity -> ORM Model
         user_db_model = UserDBModel(
             email=user_entity.email,
@@ -21,23 +25,59 @@ class UserRepository(IUserRepository):
         print("User DB Model: ", user_db_model)
         try:
             db.session.add(user_db_model)
-            db.session.commit()
+            db.session.flush()
+        except IntegrityError as e:
+            # Um flush que falhou invalida a transação: desfaz antes de consultar a causa
+            db.session.rollback()
+            # Só na falha: a unicidade do email é garantida pelo índice, sem SELECT antes do INSERT
+            if self._email_taken(user_db_model.email_normalized):
+                raise EmailAlreadyRegisteredError() from e
+            print(f"Error saving user: {e}")
+            raise
         except Exception as e:
             print(f"Error saving user: {e}")
-            db.session.rollback()
             raise
-        print("User DB Model after commit: ", user_db_model)
+        print("User DB Model after flush: ", user_db_model)
         user_entity.user_id = user_db_model.user_id  # Atualiza o ID da entidade pura com o ID gerado pelo banco
         user_entity.registration_date = user_db_model.registration_date
         print("User Entity after save: ", user_entity)
         return user_entity # Retorna a entidade pura que foi salva
     
+    @staticmethod
+    def _email_taken(email_normalized):
+        return db.session.execute(select(exists().where(UserDBModel.email_normalized == email_normalized))).scalar()
+
     def get_by_email(self, email: str) -> UserEntity:
-        """Retrieves a User entity by email."""
+        """Retrieves a User entity by email, ignoring case (unique index on email_normalized)."""
         #TODO: check also if the user is active
-        user_db_model = UserDBModel.query.filter_by(email=email).first()
+        user_db_model = UserDBModel.query.filter_by(email_normalized=normalize_email(email)).first()
         if user_db_model:
             user_entity = UserEntity.from_db_model(user_db_model)
             return user_entity
         
         return None
+
+    def get_by_id(self, user_id):
+        """Retrieves a User entity by its primary key."""
+        user_db_model = db.session.get(UserDBModel, user_id)
+        return UserEntity.from_db_model(user_db_model) if user_db_model else None
+
+    def update_password_hash(self, user_id, password_hash, expected_password_hash):
+        """
+        Compare-and-set in a single UPDATE, so a rehash on login never
+        overwrites a password changed meanwhile.
+        """
+        statement = (
+            update(UserDBModel.__table__)
+            .where(UserDBModel.user_id == user_id)
+            .where(UserDBModel.password_hash == expected_password_hash)
+            .values(password=password_hash)
+        )
+        try:
+            result = db.session.execute(statement)
+            db.session.commit()
+        except Exception as e:
+            print(f"Error updating the password of user {user_id}: {e}")
+            db.session.rollback()
+            raise
+        return result.rowcount == 1
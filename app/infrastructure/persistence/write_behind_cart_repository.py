@@ -0,0 +1,124 @@
+from decimal import Decimal
+from typing import Optional
+
+from app.domain.models.cart import CartEntity, CartItemEntity
+from app.domain.repositories.cart_repository_interface import ICartRepository
+from app.infrastructure.cache.cart_change_buffer import CartChange, CartChangeBuffer, apply_change, cart_change_buffer
+from app.infrastructure.persistence.cart_repository import CartRepository, _money
+
+# Compradores gravados por transação em cada flush
+CART_FLUSH_BATCH_SIZE = 500
+
+
+class WriteBehindCartRepository(ICartRepository):
+    """
+    Cart repository that keeps the changes in the in-process CartChangeBuffer and
+    writes them to carts/cart_items in batches (flush), instead of one commit per
+    change. Reads combine the cart in the database with the buffered changes.
+
+    While the buffer is disabled (CART_STORAGE='database') every call goes
+    straight to the database repository.
+    """
+
+    def __init__(self, repository: Optional[CartRepository] = None, buffer: CartChangeBuffer = cart_change_buffer,
+                 batch_size: int = CART_FLUSH_BATCH_SIZE):
+        self.repository = repository or CartRepository()
+        self.buffer = buffer
+        self.batch_size = batch_size
+
+    def get_by_buyer_id(self, buyer_id: str) -> Optional[CartEntity]:
+        """
+        Without buffered changes this is the single SELECT of CartRepository;
+        with them, the products added meanwhile are loaded in one more SELECT and
+        the totals of the cart are recomputed here.
+        """
+        if not self.buffer.enabled:
+            return self.repository.get_by_buyer_id(buyer_id)
+        with self.buffer.reading(buyer_id) as changes:
+            cart = self.repository.get_by_buyer_id(buyer_id)
+        if not changes:
+            return cart
+        return self._with_changes(cart or CartEntity(buyer_id=buyer_id), changes)
+
+    def add_item(self, buyer_id: str, product_id: str, quantity: int) -> None:
+        if not self.buffer.enabled:
+            return self.repository.add_item(buyer_id, product_id, quantity)
+        self.buffer.record(buyer_id, product_id, CartChange(replace=False, quantity=quantity))
+
+    def set_item_quantity(self, buyer_id: str, product_id: str, quantity: int) -> bool:
+        if not self.buffer.enabled:
+            return self.repository.set_item_quantity(buyer_id, product_id, quantity)
+        if not self._has_item(buyer_id, product_id):
+            return False
+        self.buffer.record(buyer_id, product_id, CartChange(replace=True, quantity=quantity))
+        return True
+
+    def remove_item(self, buyer_id: str, product_id: str) -> bool:
+        if not self.buffer.enabled:
+            return self.repository.remove_item(buyer_id, product_id)
+        if not self._has_item(buyer_id, product_id):
+            return False
+        self.buffer.record(buyer_id, product_id, CartChange(replace=True, quantity=0))
+        return True
+
+    def flush(self, buyer_id: Optional[str] = None) -> int:
+        """
+        Writes the buffered changes, CART_FLUSH_BATCH_SIZE buyers per transaction.
+
+        :return: Number of buyers whose changes were written.
+        """
+        flushed = 0
+        with self.buffer.flushing(buyer_id) as changes:
+            buyer_ids = list(changes)
+            for start in range(0, len(buyer_ids), self.batch_size):
+                batch = buyer_ids[start:start + self.batch_size]
+                self.repository.apply_changes({batch_buyer_id: changes[batch_buyer_id] for batch_buyer_id in batch})
+                self.buffer.mark_flushed(batch)
+                flushed += len(batch)
+        return flushed
+
+    def _has_item(self, buyer_id: str, product_id: str) -> bool:
+        change = self.buffer.changes_for(buyer_id).get(product_id)
+        if change is None:
+            return self.repository.has_item(buyer_id, product_id)
+        # Somar garante a linha; definir a quantidade só a mantém se não for 0
+        return not change.replace or change.quantity > 0
+
+    def _with_changes(self, cart: CartEntity, changes: dict[str, CartChange]) -> CartEntity:
+        lines = {item.product_id: item for item in cart.items}
+        added = [product_id for product_id, change in changes.items()
+                 if product_id not in lines and apply_change(None, change) > 0]
+        products = self.repository.find_products_with_categories(added)
+
+        items = []
+        for product_id in {**lines, **changes}:
+            line = lines.get(product_id)
+            quantity = line.quantity if line else None
+            if product_id in changes:
+                quantity = apply_change(quantity, changes[product_id])
+            if not quantity:
+                continue
+            if line:
+                product, category = line.product, line.category
+            elif product_id in products:
+                product, category = products[product_id]
+            else:
+                # O produto deixou de existir depois de entrar no buffer
+                continue
+            items.append(CartItemEntity(
+                cart_item_id=line.cart_item_id if line else None,
+                product_id=product_id,
+                quantity=quantity,
+                product=product,
+                category=category,
+                line_total=_money(Decimal(product.price) * quantity),
+            ))
+        items.sort(key=lambda item: (item.product.name, item.product_id))
+        return CartEntity(
+            cart_id=cart.cart_id,
+            buyer_id=cart.buyer_id,
+            items=items,
+            total_quantity=sum(item.quantity for item in items),
+            total_value=_money(sum((item.line_total for item in items), Decimal('0'))),
+            updated_at=cart.updated_at,
+        )
@@ -0,0 +1,89 @@
+# app/infrastructure/search/in_memory_product_search_repository.py
+from sqlalchemy import func, select
+
+from app import db
+from app.domain.repositories.product_search_repository_interface import IProductSearchRepository
+from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
+from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+from app.infrastructure.persistence.product_repository import LISTING_COLUMNS, listing_row_to_entities
+from app.infrastructure.search.inverted_index import InvertedIndex, product_search_index
+
+
+class InMemoryProductSearchRepository(IProductSearchRepository):
+    """
+    Product search answered by the in-process InvertedIndex. The index only ranks
+    product ids; the page is then loaded with a single IN query.
+    While the index is not ready (disabled or still loading) the search is
+    delegated to the fallback repository.
+    """
+
+    def __init__(self, index: InvertedIndex = None, fallback: IProductSearchRepository = None):
+        self.index = index if index is not None else product_search_index
+        self.fallback = fallback
+
+    def search(self, terms, limit, offset=0):
+        """
+        Ranks with the index and skips ids that are no longer live in the database
+        (deleted or inactive), fetching more of the ranking until offset + limit live
+        products are found, so pages stay full and offsets count only live products.
+        Ids found dead are dropped from the index.
+        """
+        if not terms:
+            return []
+        if not self.index.is_ready and self.fallback is not None:
+            return self.fallback.search(terms, limit, offset)
+
+        query = ' '.join(terms)
+        wanted = offset + limit
+        k = wanted
+        checked = 0
+        live, dead = [], []
+        while True:
+            ranked = self.index.search(query, k=k)
+            product_ids = [product_id for product_id, _ in ranked[checked:]]
+            checked = len(ranked)
+            rows_by_id = self._load_live_rows(product_ids)
+            for product_id in product_ids:
+                if product_id in rows_by_id:
+                    live.append(listing_row_to_entities(rows_by_id[product_id]))
+                else:
+                    dead.append(product_id)
+            # Para quando a página está cheia ou o índice não tem mais candidatos
+            if len(live) >= wanted or len(ranked) < k:
+                break
+            k *= 2
+        # Só remove depois da busca: remover antes mudaria as posições já verificadas
+        for product_id in dead:
+            self.index.remove(product_id)
+        return live[offset:wanted]
+
+    @staticmethod
+    def _load_live_rows(product_ids):
+        if not product_ids:
+            return {}
+        statement = (
+            select(*LISTING_COLUMNS)
+            .join(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(ProductDBModel.product_id.in_(product_ids))
+            .where(func.lower(ProductDBModel.status) != 'inactive')
+        )
+        return {row.product_id: row for row in db.session.execute(statement)}
+
+    def rebuild(self, batch_size: int = 10_000) -> int:
+        """
+        (Re)loads every active product into the index, streaming the rows in batches.
+        :return: Number of indexed products.
+        """
+        self.index.is_ready = False
+        self.index.clear()
+        statement = (
+            select(ProductDBModel.product_id, ProductDBModel.name, ProductDBModel.description,
+                   CategoryDBModel.name.label('category_name'))
+            .join(CategoryDBModel, CategoryDBModel.category_id == ProductDBModel.category_id)
+            .where(func.lower(ProductDBModel.status) != 'inactive')
+            .execution_options(yield_per=batch_size)
+        )
+        for row in db.session.execute(statement):
+            self.index.add(row.product_id, row.name, row.description, row.category_name)
+        self.index.is_ready = True
+        return len(self.index)
@@ -0,0 +1,242 @@
+# app/infrastructure/search/inverted_index.py
+"""
+Índice invertido em memória para a busca do catálogo.
+
+Cada produto recebe um ordinal sequencial e cada termo guarda duas listas
+compactas (array 'I' com os ordinais e array 'H' com a frequência ponderada),
+em vez de dicts/sets por termo. Como os ordinais só crescem, as listas ficam
+ordenadas e permitem busca binária.
+"""
+import heapq
+import math
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Optional
+
+from app.infrastructure.search.text_analyzer import analyze
+
+# Peso de cada campo na frequência do termo
+NAME_WEIGHT = 3
+CATEGORY_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+_MAX_TERM_FREQUENCY = 0xFFFF
+
+
+class InvertedIndex:
+    """
+    Thread-safe in-memory inverted index ranked with BM25.
+
+    Updating a document tombstones its previous ordinal and appends a new one;
+    the posting lists are compacted once tombstones pass `compaction_ratio`
+    of the documents.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75,
+                 max_scored_postings: int = 2_000, compaction_ratio: float = 0.25):
+        """
+        :param k1: BM25 term frequency saturation.
+        :param b: BM25 document length normalization.
+        :param max_scored_postings: Posting lists longer than this are not scanned in full:
+            they only rescore the candidates found by rarer terms (or, when every term is
+            that common, only their last `max_scored_postings` entries, the newest
+            products, are scored). This bounds the work of each query.
+        :param compaction_ratio: Fraction of tombstoned documents that triggers a compaction.
+        """
+        self.k1 = k1
+        self.b = b
+        self.max_scored_postings = max_scored_postings
+        self.compaction_ratio = compaction_ratio
+        # enabled: o índice recebe atualizações; is_ready: a carga inicial terminou
+        self.enabled = False
+        self.is_ready = False
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._doc_ids: list[Optional[str]] = []  # ordinal -> product_id (None = tombstone)
+        self._ordinals: dict[str, int] = {}
+        self._doc_lengths = array('I')
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._total_length = 0
+        self._tombstones = 0
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __contains__(self, product_id):
+        return product_id in self._ordinals
+
+    def clear(self):
+        """Removes every document from the index."""
+        with self._lock:
+            self._reset()
+
+    def add(self, product_id: str, name: str, description: Optional[str] = None,
+            category_name: Optional[str] = None):
+        """
+        Indexes a product, replacing the previous version if it was already indexed.
+        """
+        frequencies = Counter()
+        for term in analyze(name):
+            frequencies[term] += NAME_WEIGHT
+        for term in analyze(category_name):
+            frequencies[term] += CATEGORY_WEIGHT
+        for term in analyze(description):
+            frequencies[term] += DESCRIPTION_WEIGHT
+
+        with self._lock:
+            if product_id in self._ordinals:
+                self._remove_locked(product_id)
+            ordinal = len(self._doc_ids)
+            self._doc_ids.append(product_id)
+            self._ordinals[product_id] = ordinal
+            length = sum(frequencies.values())
+            self._doc_lengths.append(length)
+            self._total_length += length
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array('I'), array('H'))
+                postings[0].append(ordinal)
+                postings[1].append(min(frequency, _MAX_TERM_FREQUENCY))
+            self._maybe_compact()
+
+    def remove(self, product_id: str) -> bool:
+        """
+        Removes a product from the results.
+        :return: True if the product was indexed.
+        """
+        with self._lock:
+            if product_id not in self._ordinals:
+                return False
+            self._remove_locked(product_id)
+            self._maybe_compact()
+            return True
+
+    def _remove_locked(self, product_id):
+        ordinal = self._ordinals.pop(product_id)
+        self._doc_ids[ordinal] = None
+        self._total_length -= self._doc_lengths[ordinal]
+        self._tombstones += 1
+
+    def _maybe_compact(self):
+        if self._tombstones > 1000 and self._tombstones > len(self._doc_ids) * self.compaction_ratio:
+            self.compact()
+
+    def compact(self):
+        """
+        Drops tombstoned documents from the posting lists and renumbers the ordinals.
+        """
+        with self._lock:
+            if not self._tombstones:
+                return
+            remap = array('i', [-1]) * len(self._doc_ids)
+            doc_ids, doc_lengths = [], array('I')
+            for ordinal, product_id in enumerate(self._doc_ids):
+                if product_id is not None:
+                    remap[ordinal] = len(doc_ids)
+                    doc_ids.append(product_id)
+                    doc_lengths.append(self._doc_lengths[ordinal])
+
+            postings = {}
+            for term, (ordinals, frequencies) in self._postings.items():
+                new_ordinals, new_frequencies = array('I'), array('H')
+                for ordinal, frequency in zip(ordinals, frequencies):
+                    new_ordinal = remap[ordinal]
+                    if new_ordinal >= 0:
+                        new_ordinals.append(new_ordinal)
+                        new_frequencies.append(frequency)
+                if new_ordinals:
+                    postings[term] = (new_ordinals, new_frequencies)
+
+            self._doc_ids = doc_ids
+            self._doc_lengths = doc_lengths
+            self._ordinals = {product_id: ordinal for ordinal, product_id in enumerate(doc_ids)}
+            self._postings = postings
+            self._tombstones = 0
+
+    def search(self, query: str, k: int) -> list[tuple[str, float]]:
+        """
+        Returns the ids of the k best matching products with their scores, best first.
+        A product matches when it contains any of the query terms.
+        """
+        terms = set(analyze(query))
+        if not terms or k < 1:
+            return []
+
+        with self._lock:
+            live_documents = len(self._ordinals)
+            if not live_documents:
+                return []
+            average_length = self._total_length / live_documents or 1.0
+            doc_ids, doc_lengths = self._doc_ids, self._doc_lengths
+            k1, b = self.k1, self.b
+            length_factor = k1 * b / average_length
+            base_norm = k1 * (1 - b)
+
+            postings_by_term = [self._postings[term] for term in terms if term in self._postings]
+            # Termos raros primeiro: eles definem os candidatos, os comuns só reordenam
+            postings_by_term.sort(key=lambda postings: len(postings[0]))
+
+            scores: dict[int, float] = {}
+            for ordinals, frequencies in postings_by_term:
+                document_frequency = len(ordinals)
+                idf = math.log(1 + (live_documents - document_frequency + 0.5) / (document_frequency + 0.5))
+                if document_frequency > self.max_scored_postings and scores:
+                    for ordinal in list(scores):
+                        position = bisect_left(ordinals, ordinal)
+                        if position < document_frequency and ordinals[position] == ordinal:
+                            frequency = frequencies[position]
+                            norm = base_norm + length_factor * doc_lengths[ordinal]
+                            scores[ordinal] += idf * frequency * (k1 + 1) / (frequency + norm)
+                    continue
+
+                first = max(0, document_frequency - self.max_scored_postings)
+                for position in range(first, document_frequency):
+                    ordinal = ordinals[position]
+                    if doc_ids[ordinal] is None:
+                        continue
+                    frequency = frequencies[position]
+                    norm = base_norm + length_factor * doc_lengths[ordinal]
+                    scores[ordinal] = scores.get(ordinal, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+            # Empates ficam com o produto indexado primeiro
+            best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+            return [(doc_ids[ordinal], score) for ordinal, score in best]
+
+    def memory_footprint(self) -> dict:
+        """
+        Approximate memory used by the index, in bytes, with the document/term counts.
+        """
+        with self._lock:
+            postings_bytes = 0
+            vocabulary_bytes = sys.getsizeof(self._postings)
+            posting_count = 0
+            for term, (ordinals, frequencies) in self._postings.items():
+                posting_count += len(ordinals)
+                postings_bytes += sys.getsizeof(ordinals) + sys.getsizeof(frequencies)
+                vocabulary_bytes += sys.getsizeof(term) + sys.getsizeof((ordinals, frequencies))
+            documents_bytes = (
+                sys.getsizeof(self._doc_ids)
+                + sys.getsizeof(self._ordinals)
+                + sys.getsizeof(self._doc_lengths)
+                + sum(sys.getsizeof(product_id) for product_id in self._ordinals)
+            )
+            return {
+                'documents': len(self._ordinals),
+                'tombstones': self._tombstones,
+                'terms': len(self._postings),
+                'postings': posting_count,
+                'postings_bytes': postings_bytes,
+                'vocabulary_bytes': vocabulary_bytes,
+                'documents_bytes': documents_bytes,
+                'total_bytes': postings_bytes + vocabulary_bytes + documents_bytes,
+            }
+
+
+# Instância única do processo, alimentada no startup e pelo ProductRepository
+product_search_index = InvertedIndex()
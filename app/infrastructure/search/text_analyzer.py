@@ -0,0 +1,61 @@
+# app/infrastructure/search/text_analyzer.py
+"""
+Análise de texto em português para o índice de busca em memória:
+minúsculas, remoção de acentos, stopwords e um stemmer leve
+(plural, gênero, diminutivos e alguns sufixos comuns).
+"""
+import re
+import unicodedata
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = frozenset({
+    'a', 'o', 'as', 'os', 'e', 'de', 'da', 'do', 'das', 'dos', 'em', 'no', 'na', 'nos', 'nas',
+    'um', 'uma', 'uns', 'umas', 'com', 'sem', 'para', 'pra', 'por', 'pelo', 'pela', 'ao', 'aos',
+    'ou', 'que', 'se', 'sua', 'seu', 'the', 'and', 'of',
+})
+
+# (sufixo, substituição), testados em ordem; o primeiro que casar é aplicado
+_PLURAL_SUFFIXES = (
+    ('oes', 'ao'), ('aes', 'ao'), ('ais', 'al'), ('eis', 'el'), ('ois', 'ol'),
+    ('res', 'r'), ('zes', 'z'), ('ses', 's'), ('ns', 'm'), ('s', ''),
+)
+_DERIVATIONAL_SUFFIXES = (
+    'zinhos', 'zinhas', 'zinho', 'zinha', 'inhos', 'inhas', 'inho', 'inha',
+    'mente', 'issimo', 'issima',
+)
+_FINAL_VOWELS = ('a', 'o', 'e')
+
+
+def fold_accents(text: str) -> str:
+    """Lowercases the text and removes diacritics ("Cerâmica" -> "ceramica")."""
+    normalized = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(char for char in normalized if not unicodedata.combining(char))
+
+
+def stem(token: str) -> str:
+    """
+    Light Portuguese stemmer. It is not linguistically exact; it only has to map
+    the usual variations of a word (vaso, vasos, vasinho) to the same key, and
+    it is applied the same way to documents and queries.
+    """
+    if len(token) <= 3 or token.isdigit():
+        return token
+    for suffix, replacement in _PLURAL_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            token = token[:-len(suffix)] + replacement
+            break
+    for suffix in _DERIVATIONAL_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    if len(token) >= 4 and token.endswith(_FINAL_VOWELS):
+        token = token[:-1]
+    return token
+
+
+def analyze(text: str) -> list[str]:
+    """Splits a text into normalized terms, keeping repetitions (used for term frequency)."""
+    if not text:
+        return []
+    return [stem(token) for token in _TOKEN_PATTERN.findall(fold_accents(text)) if token not in STOPWORDS]
@@ -0,0 +1,91 @@
+# app/infrastructure/security/bcrypt_password_hasher.py
+"""
+Hash de senhas com bcrypt num pool de threads limitado.
+
+Cada hash custa ~250 ms de CPU com 12 rounds. O bcrypt libera o GIL, então
+threads bastam, mas sem limite uma rajada de cadastros ocuparia todos os
+núcleos e as threads do gunicorn; o pool limita os hashes simultâneos e,
+com a fila cheia, a requisição recebe 503 (WorkerPoolBusyError).
+"""
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+from flask import current_app, has_app_context
+
+from app.domain.services.password_hasher_interface import IPasswordHasher
+from app.infrastructure.workers.bounded_executor import BoundedExecutor
+
+DEFAULT_BCRYPT_ROUNDS = 12
+DEFAULT_HASHING_WORKERS = min(4, os.cpu_count() or 1)
+# Folga de espera além dos workers; somada a eles, menor que as threads do gunicorn
+DEFAULT_HASHING_QUEUE_LIMIT = DEFAULT_HASHING_WORKERS + 2
+# O bcrypt só usa os primeiros 72 bytes da senha (e o bcrypt 5 recusa senhas maiores)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+_BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+
+def _password_bytes(password: str) -> bytes:
+    return password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def _create_thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hashing')
+
+
+# Pool único do processo, configurado em create_app (PASSWORD_HASHING_WORKERS / PASSWORD_HASHING_QUEUE_LIMIT)
+password_hashing_pool = BoundedExecutor(_create_thread_pool, DEFAULT_HASHING_WORKERS, DEFAULT_HASHING_QUEUE_LIMIT)
+
+
+class BcryptPasswordHasher(IPasswordHasher):
+    """
+    bcrypt hasher running on the bounded password_hashing_pool.
+
+    Users registered before hashing was added have the plain password stored;
+    verify still accepts it and needs_rehash reports it, so it is replaced by a
+    hash on their next login.
+    """
+
+    def __init__(self, pool: BoundedExecutor = password_hashing_pool, rounds: Optional[int] = None):
+        """
+        :param pool: Pool where the hashes run.
+        :param rounds: bcrypt work factor (BCRYPT_ROUNDS of the current app if None).
+        """
+        self.pool = pool
+        self._rounds = rounds
+
+    @property
+    def rounds(self) -> int:
+        if self._rounds is not None:
+            return self._rounds
+        if has_app_context():
+            return current_app.config.get('BCRYPT_ROUNDS', DEFAULT_BCRYPT_ROUNDS)
+        return DEFAULT_BCRYPT_ROUNDS
+
+    def hash(self, password):
+        """:raises WorkerPoolBusyError: If the pool queue is full."""
+        rounds = self.rounds
+        hashed = self.pool.submit(lambda: bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds))).result()
+        return hashed.decode('ascii')
+
+    def verify(self, password, password_hash):
+        """:raises WorkerPoolBusyError: If the pool queue is full."""
+        if not password_hash:
+            return False
+        if not password_hash.startswith(_BCRYPT_PREFIXES):
+            # Senha legada gravada sem hash
+            return hmac.compare_digest(password.encode('utf-8'), password_hash.encode('utf-8'))
+        return self.pool.submit(
+            lambda: bcrypt.checkpw(_password_bytes(password), password_hash.encode('ascii'))
+        ).result()
+
+    def needs_rehash(self, password_hash):
+        if not password_hash or not password_hash.startswith(_BCRYPT_PREFIXES):
+            return True
+        # Formato: $2b$<rounds>$<salt + hash>
+        try:
+            return int(password_hash.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
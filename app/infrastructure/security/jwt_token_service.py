@@ -0,0 +1,79 @@
+# app/infrastructure/security/jwt_token_service.py
+import datetime
+import uuid
+from typing import Optional
+
+import jwt
+from flask import current_app, has_app_context
+
+from app.common.exceptions import InvalidTokenError
+from app.domain.services.token_service_interface import ACCESS_TOKEN, REFRESH_TOKEN, ITokenService
+
+DEFAULT_ACCESS_TOKEN_TTL = datetime.timedelta(minutes=15)
+DEFAULT_REFRESH_TOKEN_TTL = datetime.timedelta(days=7)
+JWT_ALGORITHM = 'HS256'
+
+
+class JwtTokenService(ITokenService):
+    """
+    HS256 JSON Web Tokens signed with JWT_SECRET_KEY. Tokens are stateless:
+    a refresh token stays valid until it expires.
+    """
+
+    def __init__(self, secret: Optional[str] = None,
+                 access_ttl: Optional[datetime.timedelta] = None, refresh_ttl: Optional[datetime.timedelta] = None):
+        """
+        :param secret: Signing key (JWT_SECRET_KEY of the current app if None).
+        :param access_ttl: Lifetime of access tokens (JWT_ACCESS_TOKEN_TTL of the current app if None).
+        :param refresh_ttl: Lifetime of refresh tokens (JWT_REFRESH_TOKEN_TTL of the current app if None).
+        """
+        self._secret = secret
+        self._access_ttl = access_ttl
+        self._refresh_ttl = refresh_ttl
+
+    @property
+    def secret(self) -> str:
+        return self._secret or current_app.config['JWT_SECRET_KEY']
+
+    @staticmethod
+    def _config(name, default):
+        return current_app.config.get(name, default) if has_app_context() else default
+
+    @property
+    def access_ttl(self) -> datetime.timedelta:
+        return self._access_ttl or self._config('JWT_ACCESS_TOKEN_TTL', DEFAULT_ACCESS_TOKEN_TTL)
+
+    @property
+    def refresh_ttl(self) -> datetime.timedelta:
+        return self._refresh_ttl or self._config('JWT_REFRESH_TOKEN_TTL', DEFAULT_REFRESH_TOKEN_TTL)
+
+    def _encode(self, user_id, role, token_type, ttl, now):
+        claims = {
+            'sub': user_id,
+            'role': role,
+            'type': token_type,
+            'iat': now,
+            'exp': now + ttl,
+            # Dois tokens emitidos no mesmo segundo nunca são iguais
+            'jti': uuid.uuid4().hex,
+        }
+        return jwt.encode(claims, self.secret, algorithm=JWT_ALGORITHM)
+
+    def issue_tokens(self, user_id, role):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        access_ttl = self.access_ttl
+        return {
+            'access_token': self._encode(user_id, role, ACCESS_TOKEN, access_ttl, now),
+            'refresh_token': self._encode(user_id, role, REFRESH_TOKEN, self.refresh_ttl, now),
+            'expires_in': int(access_ttl.total_seconds()),
+        }
+
+    def decode(self, token, token_type=ACCESS_TOKEN):
+        try:
+            claims = jwt.decode(token, self.secret, algorithms=[JWT_ALGORITHM],
+                                options={'require': ['sub', 'type', 'exp']})
+        except jwt.PyJWTError as e:
+            raise InvalidTokenError() from e
+        if claims['type'] != token_type:
+            raise InvalidTokenError()
+        return claims
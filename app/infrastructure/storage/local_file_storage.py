@@ -0,0 +1,75 @@
+# app/infrastructure/storage/local_file_storage.py
+import os
+import tempfile
+from typing import Optional
+
+from flask import current_app
+
+from app.common.exceptions import UploadTooLargeError
+from app.domain.repositories.file_storage_interface import IFileStorage
+
+
+class LocalFileStorage(IFileStorage):
+    """
+    Stores files in a local directory (MEDIA_ROOT), served by the app under MEDIA_URL.
+    Stand-in for an object storage in development and tests.
+    """
+
+    def __init__(self, root: Optional[str] = None, base_url: Optional[str] = None):
+        """
+        :param root: Directory of the files (MEDIA_ROOT of the current app if None).
+        :param base_url: URL prefix of the files (MEDIA_URL of the current app if None).
+        """
+        self._root = root
+        self._base_url = base_url
+
+    @property
+    def root(self) -> str:
+        return self._root or current_app.config['MEDIA_ROOT']
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url or current_app.config['MEDIA_URL']
+
+    def _path(self, key):
+        root = os.path.abspath(self.root)
+        path = os.path.abspath(os.path.join(root, key))
+        # A chave nunca pode sair do diretório (ex.: '../../etc/passwd')
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError("Invalid file key")
+        return path
+
+    def save(self, key, chunks, max_bytes=None):
+        """
+        Writes to a temporary file in the same directory and renames it at the
+        end, so readers never see a partial file.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.upload-')
+        size = 0
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise UploadTooLargeError(max_bytes)
+                    file.write(chunk)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        return size
+
+    def read(self, key):
+        with open(self._path(key), 'rb') as file:
+            return file.read()
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def url(self, key):
+        return f"{self.base_url.rstrip('/')}/{key}"
@@ -0,0 +1,92 @@
+# app/infrastructure/workers/bounded_executor.py
+import threading
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Callable, Optional
+
+from app.common.exceptions import WorkerPoolBusyError
+
+
+class BoundedExecutor:
+    """
+    A concurrent.futures executor with a limit of pending tasks (queued + running).
+
+    The executors of the stdlib queue without limit, so a burst of CPU-heavy
+    tasks would pile up for minutes while the requests that submitted them time
+    out. Past max_pending, submit fails fast with WorkerPoolBusyError and the
+    caller answers 503 instead.
+
+    The executor is created on the first submit, so module-level instances can
+    be configured from the app config in create_app before they are used.
+    """
+
+    def __init__(self, executor_factory: Callable[[int], Executor], max_workers: int, max_pending: int):
+        """
+        :param executor_factory: Creates the underlying executor for a number of workers.
+        :param max_workers: Number of workers of the executor.
+        :param max_pending: Maximum number of tasks queued or running at the same time.
+        """
+        self._executor_factory = executor_factory
+        self._lock = threading.Condition()
+        self._executor: Optional[Executor] = None
+        self._pending: set[Future] = set()
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+
+    def configure(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None) -> None:
+        """Changes the limits; an executor already created is replaced after its tasks finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            if max_workers is not None:
+                self.max_workers = max_workers
+            if max_pending is not None:
+                self.max_pending = max_pending
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, fn: Callable, *args, on_done: Optional[Callable[[Future], None]] = None, **kwargs) -> Future:
+        """
+        Schedules fn(*args, **kwargs) like Executor.submit.
+
+        :param on_done: Called with the finished future; the task only stops counting
+                        as pending after it returns.
+        :raises WorkerPoolBusyError: If max_pending tasks are already pending.
+        """
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                raise WorkerPoolBusyError()
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._pending.add(future)
+        future.add_done_callback(partial(self._finish, on_done))
+        return future
+
+    def _finish(self, on_done: Optional[Callable[[Future], None]], future: Future) -> None:
+        try:
+            if on_done is not None:
+                on_done(future)
+        finally:
+            with self._lock:
+                self._pending.discard(future)
+                self._lock.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until no task is pending (their on_done callbacks included).
+
+        :return: True if the pool became idle within the timeout.
+        """
+        with self._lock:
+            return self._lock.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
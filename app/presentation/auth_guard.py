@@ -0,0 +1,78 @@
+"""
+Propósito: exigir um access token (Authorization: Bearer <token>) nas rotas de um namespace.
+
+Os tokens já verificados ficam no VerifiedTokenCache: as requisições seguintes
+com o mesmo token não verificam a assinatura nem buscam o usuário de novo.
+"""
+from functools import wraps
+
+from flask import g, request
+from flask_restx import abort
+
+from app.application.services.user_authentication_service import ARTISAN_ROLE, BUYER_ROLE, is_active
+from app.common.exceptions import InvalidTokenError
+from app.infrastructure.cache.verified_token_cache import verified_token_cache
+from app.infrastructure.persistence.user_repository import UserRepository
+from app.infrastructure.security.jwt_token_service import JwtTokenService
+
+token_service = JwtTokenService()
+user_repository = UserRepository()
+
+# Documentação do esquema de autenticação no Swagger
+AUTHORIZATIONS = {
+    'Bearer': {'type': 'apiKey', 'in': 'header', 'name': 'Authorization',
+               'description': "Access token of /api/auth/login, as 'Bearer <token>'"},
+}
+
+
+def _bearer_token():
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    return token.strip() if scheme.lower() == 'bearer' and token.strip() else None
+
+
+def verify_access_token(token):
+    """
+    Returns the claims of a valid access token whose user is still active.
+
+    :raises InvalidTokenError: Otherwise.
+    """
+    claims = verified_token_cache.get(token)
+    if claims is not None:
+        return claims
+    claims = token_service.decode(token)
+    if not is_active(user_repository.get_by_id(claims['sub'])):
+        raise InvalidTokenError()
+    verified_token_cache.put(token, claims)
+    return claims
+
+
+def require_role(role):
+    """
+    Decorator for the views of a namespace (Namespace(decorators=[...])) or
+    for single methods of a resource: answers 401 without a valid access
+    token and 403 when the token is of another role or, for routes with an
+    artisan_id, of another artisan. The claims of the token are left in
+    flask.g.token_claims.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            token = _bearer_token()
+            if token is None:
+                abort(401, "Missing access token")
+            try:
+                claims = verify_access_token(token)
+            except InvalidTokenError as e:
+                abort(401, str(e))
+            if claims.get('role') != role:
+                abort(403, "Access denied")
+            if role == ARTISAN_ROLE and kwargs.get('artisan_id', claims['sub']) != claims['sub']:
+                abort(403, "Access denied")
+            g.token_claims = claims
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+require_artisan = require_role(ARTISAN_ROLE)
+require_buyer = require_role(BUYER_ROLE)
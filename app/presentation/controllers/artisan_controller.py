@@ -2,14 +2,23 @@
 Propósito: atuar como ponto de entrada para as requisições relacionadas a artesãos.
 """
 
+from flask import Response, request
 from pydantic import ValidationError
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, inputs
 
-from app.application.services.artisan_product_service import ArtisanProductService
+from app.application.services.artisan_product_service import ArtisanProductService, DEFAULT_PAGE_SIZE
+from app.application.services.product_import_service import ProductImportService
+from app.application.services.product_image_service import ProductImageService, MAX_IMAGE_UPLOAD_BYTES
+from app.common.exceptions import UploadTooLargeError, WorkerPoolBusyError
+from app.common.record_readers import READERS_BY_MIMETYPE
+from app.infrastructure.images.image_variants import ImageVariantProcessor
+from app.infrastructure.storage.local_file_storage import LocalFileStorage
+from app.presentation.auth_guard import AUTHORIZATIONS, require_artisan
 from app.infrastructure.persistence.artisan_repository import ArtisanRepository
 from app.infrastructure.persistence.category_repository import CategoryRepository
 from app.infrastructure.persistence.product_repository import ProductRepository
 from app.presentation.dtos.product_dtos import RegisterProductRequest
+from app.presentation.json_representation import RawJSON, dumps
 
 
 artisan_product_service_instance = ArtisanProductService(
@@ -18,8 +27,28 @@ artisan_product_service_instance = ArtisanProductService(
     artisan_repository=ArtisanRepository()
     )
 
-#TODO: adicionar autenticação e autorização
-artisan_ns = Namespace('artisan', description='Artisan management operations')
+product_import_service_instance = ProductImportService(
+    product_repository=ProductRepository(),
+    category_repository=CategoryRepository(),
+    artisan_repository=ArtisanRepository()
+)
+
+product_image_service_instance = ProductImageService(
+    product_repository=ProductRepository(),
+    file_storage=LocalFileStorage(),
+    image_processor=ImageVariantProcessor()
+)
+
+# As rotas de escrita (@require_artisan) exigem o access token do próprio artesão;
+# a listagem de produtos é a vitrine pública e não pede token
+artisan_ns = Namespace('artisan', description='Artisan management operations',
+                       authorizations=AUTHORIZATIONS)
+
+product_page_parser = artisan_ns.parser()
+product_page_parser.add_argument('limit', type=inputs.positive, default=DEFAULT_PAGE_SIZE, location='args',
+                                 help='Maximum number of products in the page')
+product_page_parser.add_argument('cursor', type=str, required=False, location='args',
+                                 help='Value of the X-Next-Cursor header returned with the previous page')
 
 @artisan_ns.route('/<string:artisan_id>/products')
 class ArtisanProductResource(Resource):
@@ -28,7 +57,7 @@ class ArtisanProductResource(Resource):
     """
     artisan_product_service = artisan_product_service_instance
 
-    @artisan_ns.doc('create_artisan_product')
+    @artisan_ns.doc('create_artisan_product', security='Bearer')
     @artisan_ns.expect(artisan_ns.model('Product', {
         'name': fields.String(required=True, description='Name of the product'),
         'description': fields.String(required=True, description='Description of the product'),
@@ -37,8 +66,8 @@ class ArtisanProductResource(Resource):
         'category_id': fields.String(required=True, description='Category ID of the product'),
         'image_url': fields.String(required=False, description='Image URL of the product')
     }))
+    @require_artisan
     def post(self, artisan_id):
-        #TODO: add authentication and authorization of artisan user!
         """
         Create a new product for an artisan.
         """
@@ -62,16 +91,102 @@ class ArtisanProductResource(Resource):
             artisan_ns.abort(500, "Internal server error")
             
     @artisan_ns.doc('get_artisan_products')
+    @artisan_ns.expect(product_page_parser)
     def get(self, artisan_id):
         """
-        Get all products for a specific artisan.
+        Get a page of products for a specific artisan.
+        The cursor of the next page, if any, is returned in the X-Next-Cursor header.
+        Send the ETag back in If-None-Match to get a 304 while the catalogue is unchanged.
         """
+        args = product_page_parser.parse_args()
         try:
-            products = artisan_product_service_instance.get_all_products_by_artisan(artisan_id)
-                        
-            return [product.model_dump() for product in products], 200  # Return the list of products with HTTP status 200
+            etag = artisan_product_service_instance.get_products_page_etag(
+                artisan_id, limit=args['limit'], cursor=args['cursor']
+            )
+            # Nada mudou: responde sem carregar nem serializar os produtos
+            if request.if_none_match.contains_weak(etag):
+                return Response(status=304, headers={'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'})
+
+            products, next_cursor = artisan_product_service_instance.get_products_page_by_artisan(
+                artisan_id, limit=args['limit'], cursor=args['cursor']
+            )
+            headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+            if next_cursor:
+                headers['X-Next-Cursor'] = next_cursor
+            # A lista inteira é codificada de uma vez
+            return RawJSON(dumps(products)), 200, headers
         except ValueError as e:
             artisan_ns.abort(400, str(e))
         except Exception as e:
             print(f"Error retrieving artisan products: {e}")
-            artisan_ns.abort(500, "Internal server error")
\ No newline at end of file
+            artisan_ns.abort(500, "Internal server error")
+
+
+@artisan_ns.route('/<string:artisan_id>/products/import')
+class ArtisanProductImportResource(Resource):
+    """
+    Resource for importing many products of an artisan at once.
+    """
+    product_import_service = product_import_service_instance
+
+    @artisan_ns.doc('import_artisan_products', security='Bearer', description=(
+        'Body: a JSON array of products (application/json), one product per line '
+        '(application/x-ndjson) or a CSV with a header row (text/csv), with the same '
+        'fields as the product creation. The body is read as a stream.'
+    ))
+    @require_artisan
+    def post(self, artisan_id):
+        """
+        Import products for an artisan, returning the errors of the rejected rows.
+        """
+        reader = READERS_BY_MIMETYPE.get(request.mimetype)
+        if reader is None:
+            artisan_ns.abort(415, f"Unsupported content type, use one of: {', '.join(READERS_BY_MIMETYPE)}")
+        try:
+            result = self.product_import_service.import_products(artisan_id, reader(request.stream))
+            return result.model_dump(), 200
+        except ValueError as e:
+            artisan_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error importing artisan products: {e}")
+            artisan_ns.abort(500, "Internal server error")
+
+
+@artisan_ns.route('/<string:artisan_id>/products/<string:product_id>/image')
+class ArtisanProductImageResource(Resource):
+    """
+    Resource for uploading the image of an artisan product.
+    """
+    product_image_service = product_image_service_instance
+
+    @artisan_ns.doc('upload_artisan_product_image', security='Bearer', description=(
+        'Body: the image itself (Content-Type image/jpeg, image/png or image/webp) or a '
+        'multipart form with an "image" file. Answers 202: the resized variants are '
+        'generated in the background and served from the returned URLs once ready.'
+    ))
+    @require_artisan
+    def post(self, artisan_id, product_id):
+        """
+        Upload the image of a product.
+        """
+        if request.content_length is not None and request.content_length > MAX_IMAGE_UPLOAD_BYTES:
+            artisan_ns.abort(413, str(UploadTooLargeError(MAX_IMAGE_UPLOAD_BYTES)))
+        if request.mimetype == 'multipart/form-data':
+            upload = request.files.get('image')
+            if upload is None:
+                artisan_ns.abort(400, "Send the image in the 'image' field")
+            stream = upload.stream
+        else:
+            stream = request.stream
+        try:
+            result = self.product_image_service.upload_product_image(artisan_id, product_id, stream)
+            return result.model_dump(), 202
+        except UploadTooLargeError as e:
+            artisan_ns.abort(413, str(e))
+        except WorkerPoolBusyError as e:
+            return {'message': str(e)}, 503, {'Retry-After': '5'}
+        except ValueError as e:
+            artisan_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error uploading product image: {e}")
+            artisan_ns.abort(500, "Internal server error")
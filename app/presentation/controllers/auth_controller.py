@@ -25,13 +25,19 @@ from flask_restx import Namespace, Resource, fields # Importa Namespace, Resourc
 
 # Import services and repository implementations for dependency injection
 from app.application.services.user_registration_service import UserRegistrationService
+from app.application.services.user_authentication_service import UserAuthenticationService
+from app.common.exceptions import InvalidCredentialsError, InvalidTokenError, WorkerPoolBusyError
+from app.infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
+from app.infrastructure.security.jwt_token_service import JwtTokenService
 from app.infrastructure.persistence.user_repository import UserRepository
 from app.infrastructure.persistence.artisan_repository import ArtisanRepository
 from app.infrastructure.persistence.buyer_repository import BuyerRepository # Placeholder, se você tiver um repositório de comprador
 from app.infrastructure.persistence.address_repository import AddressRepository
+from app.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 
 # Import DTOs for request and response formatting
 from app.presentation.dtos.user_dtos import RegisterArtisanRequest, ArtisanRegistrationResponse, RegisterBuyerRequest, BuyerRegistrationResponse
+from app.presentation.dtos.user_dtos import LoginRequest, RefreshTokenRequest
 
 # --- CRIAÇÃO DO NAMESPACE (Ele agrupa rotas e documentação) ---
 auth_ns = Namespace('auth', description='Authentication related operations') 
@@ -168,12 +174,21 @@ user_repository_instance = UserRepository()
 artisan_repository_instance = ArtisanRepository() 
 address_repository_instance = AddressRepository()
 buyer_repository_instance = BuyerRepository()
+password_hasher_instance = BcryptPasswordHasher()
 
 user_registration_service_instance = UserRegistrationService(
     user_repository=user_repository_instance,
     artisan_repository=artisan_repository_instance,
     address_repository=address_repository_instance,
-    buyer_repository=buyer_repository_instance 
+    buyer_repository=buyer_repository_instance,
+    password_hasher=password_hasher_instance,
+    unit_of_work=SqlAlchemyUnitOfWork()
+)
+user_authentication_service_instance = UserAuthenticationService(
+    user_repository=user_repository_instance,
+    artisan_repository=artisan_repository_instance,
+    password_hasher=password_hasher_instance,
+    token_service=JwtTokenService()
 )
 # -
 # --- CONTROLADOR COMO UM RECURSO FLASK-RESTX ---
@@ -207,6 +222,9 @@ class ArtisanRegistrationResource(Resource): # HERDA DE flask_restx.Resource
         
         except ValueError as e: # Captura erros de lógica de negócio do serviço
             auth_ns.abort(400, str(e)) 
+
+        except WorkerPoolBusyError as e: # Muitos hashes de senha na fila
+            auth_ns.abort(503, str(e))
         
         except Exception as e: # Captura outros erros inesperados
             print(f"Internal server error during artisan registration: {e}") 
@@ -300,7 +318,86 @@ class BuyerRegistrationResource(Resource):
         
         except ValueError as e:
             auth_ns.abort(400, str(e))
+
+        except WorkerPoolBusyError as e:
+            auth_ns.abort(503, str(e))
         
         except Exception as e:
             print(f"Internal server error during buyer registration: {e}")
             auth_ns.abort(500, "Internal server error")
+
+
+login_request_model = auth_ns.model('LoginRequest', {
+    'email': fields.String(required=True, description='User email', example='artisan@example.com'),
+    'password': fields.String(required=True, description='User password'),
+})
+
+refresh_token_request_model = auth_ns.model('RefreshTokenRequest', {
+    'refresh_token': fields.String(required=True, description='Refresh token returned by the login'),
+})
+
+login_response_model = auth_ns.model('LoginResponseOutput', {
+    'user_id': fields.String(required=True, description='Unique ID of the user'),
+    'email': fields.String(required=True, description='Login email of the user'),
+    'status': fields.String(required=True, description='Current status of the user account', example='active'),
+    'role': fields.String(required=True, description='User role in the system', example='artisan'),
+    'access_token': fields.String(required=True, description="Signed token for the 'Authorization: Bearer' header"),
+    'refresh_token': fields.String(required=True, description='Signed token for /api/auth/refresh'),
+    'token_type': fields.String(required=True, example='Bearer'),
+    'expires_in': fields.Integer(required=True, description='Seconds until the access token expires'),
+})
+
+
+@auth_ns.route('/login')
+class LoginResource(Resource):
+    """Resource for user login."""
+
+    user_authentication_service = user_authentication_service_instance
+
+    @auth_ns.expect(login_request_model, validate=True)
+    @auth_ns.marshal_with(login_response_model, code=200)
+    @auth_ns.doc(description='Check the credentials of a user and issue an access and a refresh token.')
+    def post(self):
+        """Logs a user in."""
+        try:
+            request_data = LoginRequest(**auth_ns.payload)
+            return self.user_authentication_service.login(request_data.email, request_data.password).model_dump(), 200
+
+        except ValidationError as e:
+            auth_ns.abort(400, "Invalid input data", details=e.errors())
+
+        except InvalidCredentialsError as e:
+            auth_ns.abort(401, str(e))
+
+        except WorkerPoolBusyError as e:
+            auth_ns.abort(503, str(e))
+
+        except Exception as e:
+            print(f"Internal server error during login: {e}")
+            auth_ns.abort(500, "Internal server error")
+
+
+@auth_ns.route('/refresh')
+class RefreshTokenResource(Resource):
+    """Resource for renewing the tokens of a user."""
+
+    user_authentication_service = user_authentication_service_instance
+
+    @auth_ns.expect(refresh_token_request_model, validate=True)
+    @auth_ns.marshal_with(login_response_model, code=200)
+    @auth_ns.doc(description='Issue new tokens from a valid refresh token.')
+    def post(self):
+        """Renews the tokens."""
+        try:
+            request_data = RefreshTokenRequest(**auth_ns.payload)
+            return self.user_authentication_service.refresh(request_data.refresh_token).model_dump(), 200
+
+        except ValidationError as e:
+            auth_ns.abort(400, "Invalid input data", details=e.errors())
+
+        except InvalidTokenError as e:
+            auth_ns.abort(401, str(e))
+
+        except Exception as e:
+            print(f"Internal server error during token refresh: {e}")
+            auth_ns.abort(500, "Internal server error")
@@ -0,0 +1,120 @@
+"""
+Propósito: atuar como ponto de entrada para o carrinho de compras do comprador autenticado.
+"""
+
+from flask import g
+from pydantic import ValidationError
+from flask_restx import Namespace, Resource, fields
+
+from app.application.services.cart_service import CartService
+from app.common.exceptions import CartItemNotFoundError, ProductNotFoundError
+from app.infrastructure.persistence.write_behind_cart_repository import WriteBehindCartRepository
+from app.infrastructure.persistence.product_repository import ProductRepository
+from app.presentation.auth_guard import AUTHORIZATIONS, require_buyer
+from app.presentation.dtos.cart_dtos import AddCartItemRequest, UpdateCartItemRequest
+
+
+cart_service_instance = CartService(
+    # Grava direto no banco, ou em lote quando CART_STORAGE='write_behind'
+    cart_repository=WriteBehindCartRepository(),
+    product_repository=ProductRepository()
+)
+
+# O carrinho é sempre o do dono do access token (claim 'sub')
+cart_ns = Namespace('cart', description="Shopping cart of the authenticated buyer",
+                    decorators=[require_buyer], authorizations=AUTHORIZATIONS, security='Bearer')
+
+
+def _buyer_id():
+    return g.token_claims['sub']
+
+
+@cart_ns.route('')
+class CartResource(Resource):
+    """
+    Resource for viewing the cart.
+    """
+    cart_service = cart_service_instance
+
+    @cart_ns.doc('get_cart')
+    def get(self):
+        """
+        Get the cart with its products and totals.
+        """
+        try:
+            return self.cart_service.get_cart(_buyer_id()).model_dump(mode='json'), 200
+        except Exception as e:
+            print(f"Error retrieving cart: {e}")
+            cart_ns.abort(500, "Internal server error")
+
+
+@cart_ns.route('/items')
+class CartItemsResource(Resource):
+    """
+    Resource for adding products to the cart.
+    """
+    cart_service = cart_service_instance
+
+    @cart_ns.doc('add_cart_item')
+    @cart_ns.expect(cart_ns.model('AddCartItem', {
+        'product_id': fields.String(required=True, description='ID of the product'),
+        'quantity': fields.Integer(required=False, default=1, description='Quantity to add'),
+    }))
+    def post(self):
+        """
+        Add a product to the cart, summing the quantity if it is already there.
+        """
+        try:
+            request_data = AddCartItemRequest(**(cart_ns.payload or {}))
+            return self.cart_service.add_item(_buyer_id(), request_data).model_dump(mode='json'), 200
+        except ValidationError as e:
+            cart_ns.abort(400, str(e))
+        except ProductNotFoundError as e:
+            cart_ns.abort(404, str(e))
+        except ValueError as e:
+            cart_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error adding cart item: {e}")
+            cart_ns.abort(500, "Internal server error")
+
+
+@cart_ns.route('/items/<string:product_id>')
+class CartItemResource(Resource):
+    """
+    Resource for changing or removing one product of the cart.
+    """
+    cart_service = cart_service_instance
+
+    @cart_ns.doc('update_cart_item')
+    @cart_ns.expect(cart_ns.model('UpdateCartItem', {
+        'quantity': fields.Integer(required=True, description='New quantity of the product'),
+    }))
+    def put(self, product_id):
+        """
+        Change the quantity of a product in the cart.
+        """
+        try:
+            request_data = UpdateCartItemRequest(**(cart_ns.payload or {}))
+            return self.cart_service.update_item(_buyer_id(), product_id, request_data).model_dump(mode='json'), 200
+        except ValidationError as e:
+            cart_ns.abort(400, str(e))
+        except CartItemNotFoundError as e:
+            cart_ns.abort(404, str(e))
+        except ValueError as e:
+            cart_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error updating cart item: {e}")
+            cart_ns.abort(500, "Internal server error")
+
+    @cart_ns.doc('remove_cart_item')
+    def delete(self, product_id):
+        """
+        Remove a product from the cart.
+        """
+        try:
+            return self.cart_service.remove_item(_buyer_id(), product_id).model_dump(mode='json'), 200
+        except CartItemNotFoundError as e:
+            cart_ns.abort(404, str(e))
+        except Exception as e:
+            print(f"Error removing cart item: {e}")
+            cart_ns.abort(500, "Internal server error")
@@ -0,0 +1,114 @@
+"""
+Propósito: atuar como ponto de entrada para os pedidos do comprador autenticado (checkout).
+"""
+
+from flask import g, request
+from pydantic import ValidationError
+from flask_restx import Namespace, Resource, fields, inputs
+
+from app.application.services.checkout_service import CheckoutService
+from app.application.services.idempotency_service import IdempotencyService
+from app.application.services.order_history_service import DEFAULT_PAGE_SIZE, OrderHistoryService
+from app.application.services.stock_reservation_service import StockReservationService
+from app.common.exceptions import (
+    CartChangedError, IdempotencyKeyInProgressError, IdempotencyKeyReusedError, InsufficientStockError,
+)
+from app.infrastructure.persistence.idempotency_key_repository import IdempotencyKeyRepository
+from app.infrastructure.persistence.order_repository import OrderRepository
+from app.infrastructure.persistence.stock_reservation_repository import StockReservationRepository
+from app.infrastructure.persistence.write_behind_cart_repository import WriteBehindCartRepository
+from app.presentation.auth_guard import AUTHORIZATIONS, require_buyer
+from app.presentation.dtos.order_dtos import CheckoutRequest
+
+
+checkout_service_instance = CheckoutService(
+    cart_repository=WriteBehindCartRepository(),
+    order_repository=OrderRepository(),
+    stock_reservation_service=StockReservationService(StockReservationRepository())
+)
+idempotency_service_instance = IdempotencyService(IdempotencyKeyRepository())
+order_history_service_instance = OrderHistoryService(OrderRepository())
+
+# Os pedidos são sempre os do dono do access token (claim 'sub')
+order_ns = Namespace('orders', description="Orders of the authenticated buyer",
+                     decorators=[require_buyer], authorizations=AUTHORIZATIONS, security='Bearer')
+
+
+order_page_parser = order_ns.parser()
+order_page_parser.add_argument('limit', type=inputs.positive, default=DEFAULT_PAGE_SIZE, location='args',
+                               help='Maximum number of orders in the page')
+order_page_parser.add_argument('cursor', type=str, required=False, location='args',
+                               help='Value of the X-Next-Cursor header returned with the previous page')
+
+
+def _buyer_id():
+    return g.token_claims['sub']
+
+
+@order_ns.route('')
+class OrdersResource(Resource):
+    """
+    Resource for placing orders and listing the order history.
+    """
+    checkout_service = checkout_service_instance
+    idempotency_service = idempotency_service_instance
+    order_history_service = order_history_service_instance
+
+    @order_ns.doc('get_orders')
+    @order_ns.expect(order_page_parser)
+    def get(self):
+        """
+        Get a page of the buyer's orders with their items, newest first.
+        The cursor of the next page, if any, is returned in the X-Next-Cursor header.
+        """
+        args = order_page_parser.parse_args()
+        try:
+            orders, next_cursor = self.order_history_service.get_orders_page(
+                _buyer_id(), limit=args['limit'], cursor=args['cursor']
+            )
+            headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+            return [order.model_dump(mode='json') for order in orders], 200, headers
+        except ValueError as e:
+            order_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error retrieving orders: {e}")
+            order_ns.abort(500, "Internal server error")
+
+    @order_ns.doc('checkout', params={'Idempotency-Key': {
+        'in': 'header', 'type': 'string',
+        'description': 'Unique key of this checkout; retries with the same key get the first response back',
+    }})
+    @order_ns.expect(order_ns.model('Checkout', {
+        'payment_method': fields.String(required=True, enum=['credit_card', 'pix', 'boleto'],
+                                        description='Payment method of the order'),
+    }))
+    def post(self):
+        """
+        Checkout: turn the cart into an order, taking the stock and emptying the cart.
+        """
+        buyer_id = _buyer_id()
+        payload = order_ns.payload or {}
+
+        def checkout():
+            request_data = CheckoutRequest(**payload)
+            return self.checkout_service.checkout(buyer_id, request_data).model_dump(mode='json'), 201
+
+        try:
+            idempotency_key = request.headers.get('Idempotency-Key')
+            if idempotency_key is None:
+                return checkout()
+            # Repetições da mesma chave (ex.: timeout no app) recebem o pedido já criado
+            record, replayed = self.idempotency_service.execute(
+                f"checkout:{buyer_id}", idempotency_key, payload, checkout)
+            return record.response_body, record.response_status, {'Idempotent-Replayed': str(replayed).lower()}
+        except ValidationError as e:
+            order_ns.abort(400, str(e))
+        except IdempotencyKeyReusedError as e:
+            order_ns.abort(422, str(e))
+        except (InsufficientStockError, CartChangedError, IdempotencyKeyInProgressError) as e:
+            order_ns.abort(409, str(e))
+        except ValueError as e:
+            order_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error during checkout: {e}")
+            order_ns.abort(500, "Internal server error")
@@ -0,0 +1,109 @@
+"""
+Propósito: atuar como ponto de entrada para as consultas públicas ao catálogo de produtos.
+"""
+
+from flask_restx import Namespace, Resource, inputs
+
+from app.application.services.product_search_service import ProductSearchService, DEFAULT_SEARCH_PAGE_SIZE
+from app.application.services.product_browse_service import (
+    ProductBrowseService, DEFAULT_BROWSE_PAGE_SIZE, BROWSE_SORTS, BROWSE_STATUSES
+)
+from app.domain.models.product_filter import ProductFilter
+from app.infrastructure.persistence.product_repository import ProductRepository
+from app.infrastructure.persistence.category_repository import CategoryRepository
+from app.infrastructure.persistence.product_search_repository import ProductSearchRepository
+from app.infrastructure.search.in_memory_product_search_repository import InMemoryProductSearchRepository
+
+
+product_search_service_instance = ProductSearchService(
+    # Usa o índice em memória quando habilitado e carregado, senão o full-text do banco
+    search_repository=InMemoryProductSearchRepository(fallback=ProductSearchRepository())
+)
+
+product_browse_service_instance = ProductBrowseService(
+    product_repository=ProductRepository(),
+    category_repository=CategoryRepository()
+)
+
+product_ns = Namespace('products', description='Public product catalogue operations')
+
+product_search_parser = product_ns.parser()
+product_search_parser.add_argument('q', type=str, required=True, location='args',
+                                   help='Words to search in the product name and description')
+product_search_parser.add_argument('page', type=inputs.positive, default=1, location='args',
+                                   help='1-based page number')
+product_search_parser.add_argument('page_size', type=inputs.positive, default=DEFAULT_SEARCH_PAGE_SIZE, location='args',
+                                   help='Number of products per page')
+
+product_browse_parser = product_ns.parser()
+product_browse_parser.add_argument('category_id', type=str, location='args', help='Only products of this category')
+product_browse_parser.add_argument('artisan_id', type=str, location='args', help='Only products of this artisan')
+product_browse_parser.add_argument('status', type=str, choices=BROWSE_STATUSES, location='args',
+                                   help='Only products with this status')
+product_browse_parser.add_argument('min_price', type=float, location='args', help='Minimum price (inclusive)')
+product_browse_parser.add_argument('max_price', type=float, location='args', help='Maximum price (inclusive)')
+product_browse_parser.add_argument('sort', type=str, choices=BROWSE_SORTS, default='newest', location='args',
+                                   help='Order of the products')
+product_browse_parser.add_argument('page', type=inputs.positive, default=1, location='args',
+                                   help='1-based page number')
+product_browse_parser.add_argument('page_size', type=inputs.positive, default=DEFAULT_BROWSE_PAGE_SIZE, location='args',
+                                   help='Number of products per page')
+
+
+@product_ns.route('/search')
+class ProductSearchResource(Resource):
+    """
+    Resource for searching products across all artisans.
+    """
+    product_search_service = product_search_service_instance
+
+    @product_ns.doc('search_products')
+    @product_ns.expect(product_search_parser)
+    def get(self):
+        """
+        Search products by name and description, best matches first.
+        """
+        args = product_search_parser.parse_args()
+        try:
+            result = self.product_search_service.search_products(
+                args['q'], page=args['page'], page_size=args['page_size']
+            )
+            return result.model_dump(), 200
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error searching products: {e}")
+            product_ns.abort(500, "Internal server error")
+
+
+@product_ns.route('/browse')
+class ProductBrowseResource(Resource):
+    """
+    Resource for browsing the catalogue with filters and facet counts.
+    """
+    product_browse_service = product_browse_service_instance
+
+    @product_ns.doc('browse_products')
+    @product_ns.expect(product_browse_parser)
+    def get(self):
+        """
+        List products filtered by category, artisan, status and price range, with facet counts.
+        """
+        args = product_browse_parser.parse_args()
+        product_filter = ProductFilter(
+            category_id=args['category_id'],
+            artisan_id=args['artisan_id'],
+            status=args['status'],
+            min_price=args['min_price'],
+            max_price=args['max_price'],
+        )
+        try:
+            result = self.product_browse_service.browse_products(
+                product_filter, page=args['page'], page_size=args['page_size'], sort=args['sort']
+            )
+            return result.model_dump(), 200
+        except ValueError as e:
+            product_ns.abort(400, str(e))
+        except Exception as e:
+            print(f"Error browsing products: {e}")
+            product_ns.abort(500, "Internal server error")
@@ -0,0 +1,89 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+from app.domain.models.cart import MAX_CART_ITEM_QUANTITY
+from app.presentation.dtos.product_dtos import CategoryDTO
+
+
+class AddCartItemRequest(BaseModel):
+    """
+    Request DTO for adding a product to the cart.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    product_id: str = Field(..., min_length=1, description="ID of the product")
+    quantity: int = Field(1, gt=0, le=MAX_CART_ITEM_QUANTITY, description="Quantity to add")
+
+
+class UpdateCartItemRequest(BaseModel):
+    """
+    Request DTO for changing the quantity of a cart line.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    quantity: int = Field(..., gt=0, le=MAX_CART_ITEM_QUANTITY, description="New quantity of the product")
+
+
+class CartItemResponse(BaseModel):
+    """
+    One line of the cart, with the current data of its product.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    product_id: str = Field(..., description="ID of the product")
+    name: str = Field(..., description="Name of the product")
+    image_url: Optional[str] = Field(None, description="Image URL of the product")
+    unit_price: float = Field(..., description="Current price of the product")
+    quantity: int = Field(..., description="Quantity in the cart")
+    line_total: float = Field(..., description="Unit price times quantity")
+    stock: int = Field(..., description="Stock of the product")
+    status: str = Field(..., description="Status of the product (e.g., active, out_of_stock)")
+    artisan_id: str = Field(..., description="ID of the artisan who sells the product")
+    category: CategoryDTO = Field(..., description="Category of the product")
+
+    @classmethod
+    def from_domain_entity(cls, item):
+        """
+        Create a CartItemResponse from a CartItemEntity loaded with its product and category.
+        """
+        return cls(
+            product_id=item.product_id,
+            name=item.product.name,
+            image_url=item.product.image_url,
+            unit_price=float(item.product.price),
+            quantity=item.quantity,
+            line_total=float(item.line_total),
+            stock=item.product.stock,
+            status=item.product.status,
+            artisan_id=item.product.artisan_id,
+            category=CategoryDTO.from_domain_entity(item.category),
+        )
+
+
+class CartResponse(BaseModel):
+    """
+    Response DTO for the buyer's cart, with the totals computed by the database.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    cart_id: Optional[str] = Field(None, description="ID of the cart, None while the buyer has never added a product")
+    buyer_id: str = Field(..., description="ID of the buyer")
+    items: list[CartItemResponse] = Field(default_factory=list, description="Lines of the cart")
+    total_quantity: int = Field(0, description="Sum of the quantities")
+    total_value: float = Field(0.0, description="Sum of the line totals")
+    updated_at: Optional[datetime] = Field(None, description="Last change of the cart")
+
+    @classmethod
+    def from_domain_entity(cls, cart):
+        """
+        Create a CartResponse from a CartEntity.
+        """
+        return cls(
+            cart_id=cart.cart_id,
+            buyer_id=cart.buyer_id,
+            items=[CartItemResponse.from_domain_entity(item) for item in cart.items],
+            total_quantity=cart.total_quantity,
+            total_value=float(cart.total_value),
+            updated_at=cart.updated_at,
+        )
@@ -0,0 +1,73 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Literal, Optional
+from datetime import datetime
+
+# Formas de pagamento aceitas no checkout
+PaymentMethod = Literal['credit_card', 'pix', 'boleto']
+
+
+class CheckoutRequest(BaseModel):
+    """
+    Request DTO for turning the buyer's cart into an order.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    payment_method: PaymentMethod = Field(..., description="Payment method: credit_card, pix or boleto")
+
+
+class OrderItemResponse(BaseModel):
+    """
+    One line of an order, with the price paid for the product.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    order_item_id: str = Field(..., description="ID of the order line")
+    product_id: str = Field(..., description="ID of the product")
+    quantity: int = Field(..., description="Quantity bought")
+    unit_price: float = Field(..., description="Price of the product at checkout")
+    line_total: float = Field(..., description="Unit price times quantity")
+
+    @classmethod
+    def from_domain_entity(cls, item):
+        """
+        Create an OrderItemResponse from an OrderItemEntity.
+        """
+        return cls(
+            order_item_id=item.order_item_id,
+            product_id=item.product_id,
+            quantity=item.quantity,
+            unit_price=float(item.unit_price),
+            line_total=float(item.line_total),
+        )
+
+
+class OrderResponse(BaseModel):
+    """
+    Response DTO for an order.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    order_id: str = Field(..., description="ID of the order")
+    buyer_id: str = Field(..., description="ID of the buyer")
+    order_date: datetime = Field(..., description="When the order was placed")
+    order_status: str = Field(..., description="Status of the order (e.g., pending, shipped)")
+    payment_method: str = Field(..., description="Payment method of the order")
+    total_value: float = Field(..., description="Sum of the line totals")
+    delivery_address_id: Optional[str] = Field(None, description="ID of the delivery address of the order")
+    items: list[OrderItemResponse] = Field(default_factory=list, description="Lines of the order")
+
+    @classmethod
+    def from_domain_entity(cls, order):
+        """
+        Create an OrderResponse from an OrderEntity.
+        """
+        return cls(
+            order_id=order.order_id,
+            buyer_id=order.buyer_id,
+            order_date=order.order_date,
+            order_status=order.order_status,
+            payment_method=order.payment_method,
+            total_value=float(order.total_value),
+            delivery_address_id=order.delivery_address_id,
+            items=[OrderItemResponse.from_domain_entity(item) for item in order.items],
+        )
@@ -106,4 +106,133 @@ class ResponseRegisterProduct(BaseModel):
         Esta função será chamada especificamente para o campo 'registration_date'
         durante a serialização, garantindo que ele seja convertido para uma string.
         """
-        return dt.isoformat()
\ No newline at end of file
+        return dt.isoformat()
+
+def product_listing_dict(product, category) -> dict:
+    """
+    Builds the same structure as ResponseRegisterProduct.from_domain_entities(...).model_dump()
+    straight from entities loaded from the database, without creating and validating
+    pydantic models. Only use it with trusted data: nothing is checked, the price
+    (Decimal from the NUMERIC column) is only converted to float.
+
+    :param product: The product entity.
+    :param category: The category entity.
+    :return: Dict ready to be JSON encoded.
+    """
+    return {
+        'product_id': product.product_id,
+        'name': product.name,
+        'description': product.description,
+        'price': float(product.price),
+        'stock': product.stock,
+        'artisan_id': product.artisan_id,
+        'image_url': product.image_url,
+        'registration_date': product.registration_date.isoformat(),
+        'status': product.status,
+        'category': {
+            'category_id': category.category_id,
+            'name': category.name,
+            'description': category.description,
+        },
+    }
+
+class ProductSearchResponse(BaseModel):
+    """
+    Response DTO for the product search.
+    Holds one page of products ordered by relevance.
+    """
+    model_config = ConfigDict(
+        extra='forbid',  # Forbid extra fields
+        protected_namespaces=()  # No protected namespaces
+    )
+
+    query: str = Field(..., description="Search query")
+    page: int = Field(..., description="1-based page number")
+    page_size: int = Field(..., description="Maximum number of products in the page")
+    has_next: bool = Field(..., description="Whether there is a next page")
+    items: list[ResponseRegisterProduct] = Field(default_factory=list, description="Products ordered by relevance")
+
+class CategoryFacet(BaseModel):
+    """
+    Number of filtered products in one category.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    category_id: str = Field(..., description="ID of the category")
+    name: Optional[str] = Field(None, description="Name of the category")
+    count: int = Field(..., description="Number of products in the category")
+
+class PriceRangeFacet(BaseModel):
+    """
+    Number of filtered products in one price range.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    min_price: float = Field(..., description="Lower bound of the range (inclusive)")
+    max_price: Optional[float] = Field(None, description="Upper bound of the range (exclusive), None for the last range")
+    count: int = Field(..., description="Number of products in the range")
+
+class ProductBrowseFacets(BaseModel):
+    """
+    Facet counts of a product browse.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    categories: list[CategoryFacet] = Field(default_factory=list, description="Product counts per category")
+    price_ranges: list[PriceRangeFacet] = Field(default_factory=list, description="Product counts per price range")
+
+class ProductBrowseResponse(BaseModel):
+    """
+    Response DTO for the product browse.
+    Holds one page of the filtered products and the facet counts of the whole filtered set.
+    """
+    model_config = ConfigDict(
+        extra='forbid',  # Forbid extra fields
+        protected_namespaces=()  # No protected namespaces
+    )
+
+    page: int = Field(..., description="1-based page number")
+    page_size: int = Field(..., description="Maximum number of products in the page")
+    total: int = Field(..., description="Number of products matching the filters")
+    has_next: bool = Field(..., description="Whether there is a next page")
+    items: list[ResponseRegisterProduct] = Field(default_factory=list, description="Products of the page")
+    facets: ProductBrowseFacets = Field(..., description="Facet counts of the filtered products")
+
+class ProductImportRowError(BaseModel):
+    """
+    Errors of one row of a bulk product import.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    row: int = Field(..., description="1-based row number (data rows only, without the CSV header)")
+    errors: list[str] = Field(..., description="Why the row was not imported")
+
+class ProductImportResponse(BaseModel):
+    """
+    Response DTO for the bulk product import: how many rows were read and
+    imported, and the errors of the rejected rows.
+    """
+    model_config = ConfigDict(
+        extra='forbid',  # Forbid extra fields
+        protected_namespaces=()  # No protected namespaces
+    )
+
+    total_rows: int = Field(..., description="Number of rows read")
+    created: int = Field(..., description="Number of products created")
+    failed: int = Field(..., description="Number of rejected rows")
+    truncated: bool = Field(False, description="Whether the import stopped at the row limit, leaving rows unread")
+    errors: list[ProductImportRowError] = Field(default_factory=list, description="Errors per rejected row")
+
+class ProductImageUploadResponse(BaseModel):
+    """
+    Response DTO for a product image upload. The variant URLs are final, but the
+    files only exist once the background processing finishes.
+    """
+    model_config = ConfigDict(extra='forbid', protected_namespaces=())
+
+    product_id: str = Field(..., description="ID of the product")
+    image_id: str = Field(..., description="ID of the uploaded image")
+    original_url: str = Field(..., description="URL of the image as uploaded")
+    variants: dict[str, str] = Field(..., description="URL of each resized variant (thumbnail, medium, ...)")
+    status: str = Field('processing', description="'processing' while the variants are being generated, "
+                                                 "'original_only' if they could not be scheduled")
@@ -163,4 +163,32 @@ class BuyerRegistrationResponse(BaseModel):
             status=user_entity.status,
             registration_date=user_entity.registration_date if user_entity.registration_date else None, # Adicionado o mapeamento da data de registro
             address=address_response_data
-        )
\ No newline at end of file
+        )
+
+# --- DTOs do Login ---
+class LoginRequest(BaseModel):
+    """DTO for the login request."""
+    email: str = Field(..., max_length=320)
+    password: str = Field(..., min_length=1, max_length=64)
+
+
+class RefreshTokenRequest(BaseModel):
+    """DTO for the token refresh request."""
+    refresh_token: str = Field(..., min_length=1)
+
+
+class LoginResponse(BaseModel):
+    """DTO for a successful login or token refresh."""
+    user_id: str
+    email: str
+    status: str
+    role: str
+    access_token: str
+    refresh_token: str
+    token_type: str = 'Bearer'
+    expires_in: int
+
+    @classmethod
+    def from_domain_entity(cls, user_entity: UserEntity, role: str, tokens: dict):
+        return cls(user_id=user_entity.user_id, email=user_entity.email, status=user_entity.status,
+                   role=role, **tokens)
@@ -0,0 +1,53 @@
+"""
+Propósito: codificar as respostas JSON da API. Usa o orjson quando instalado
+(bem mais rápido que o json da stdlib) e aceita corpos já codificados (RawJSON).
+"""
+import json
+from decimal import Decimal
+
+from flask import make_response, current_app
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa o json da stdlib
+    orjson = None
+
+
+class RawJSON(bytes):
+    """
+    Response body that is already JSON encoded (e.g. by pydantic's dump_json);
+    it is sent as is, without being decoded and encoded again.
+    """
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """
+    Encodes data to JSON bytes with orjson, or with the stdlib json module
+    (honouring the RESTX_JSON settings) when orjson is not installed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if current_app.debug:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+
+    settings = dict(current_app.config.get("RESTX_JSON", {}))
+    if current_app.debug:
+        settings.setdefault("indent", 4)
+    settings.setdefault("default", _default)
+    return json.dumps(data, **settings).encode('utf-8')
+
+
+def output_json(data, code, headers=None):
+    """Makes a Flask response with a JSON encoded body (flask-restx representation)."""
+    body = data if isinstance(data, RawJSON) else dumps(data)
+    # always end the json dumps with a new line, like flask-restx does
+    resp = make_response(body + b"\n", code)
+    resp.headers.extend(headers or {})
+    return resp
@@ -0,0 +1,19 @@
+"""
+Propósito: servir os arquivos enviados (LocalFileStorage) em desenvolvimento e testes.
+Em produção o MEDIA_URL deve apontar para um servidor de arquivos ou CDN na frente do MEDIA_ROOT.
+"""
+from flask import current_app, send_from_directory
+
+# Os nomes dos arquivos nunca mudam (cada upload gera um image_id novo), então podem ficar em cache
+MEDIA_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def serve_media(key):
+    return send_from_directory(current_app.config['MEDIA_ROOT'], key, max_age=MEDIA_MAX_AGE)
+
+
+def register_media_route(app):
+    """Serves MEDIA_ROOT under MEDIA_URL when MEDIA_URL is a local path."""
+    media_url = app.config['MEDIA_URL']
+    if media_url.startswith('/'):
+        app.add_url_rule(f"{media_url.rstrip('/')}/<path:key>", 'media', serve_media)
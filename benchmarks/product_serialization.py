@@ -0,0 +1,76 @@
+"""
+Micro-benchmark da serialização da listagem de produtos.
+
+Compara o caminho antigo (DTO validado por produto + model_dump + json da stdlib,
+como o flask-restx fazia) com o caminho rápido (dicts montados sem pydantic +
+um único dumps da lista inteira, com orjson quando instalado).
+
+Uso: python -m benchmarks.product_serialization [--repeat N]
+"""
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from app.domain.models.category import CategoryEntity
+from app.domain.models.product import ProductEntity
+from flask import Flask
+
+from app.presentation.dtos.product_dtos import ResponseRegisterProduct, product_listing_dict
+from app.presentation.json_representation import dumps, orjson
+
+SIZES = (1_000, 10_000)
+
+
+def build_rows(count):
+    categories = [CategoryEntity(str(uuid.uuid4()), f"Categoria {index}", "Descrição da categoria") for index in range(10)]
+    start = datetime(2025, 1, 1)
+    return [
+        (
+            ProductEntity(
+                product_id=str(uuid.uuid4()),
+                name=f"Produto artesanal {index}",
+                description="Peça feita à mão com materiais naturais",
+                price=Decimal("49.90"),
+                stock=index % 20,
+                category_id=categories[index % 10].category_id,
+                status='active',
+                registration_date=start + timedelta(minutes=index),
+                artisan_id=str(uuid.uuid4()),
+            ),
+            categories[index % 10],
+        )
+        for index in range(count)
+    ]
+
+
+def validated_path(rows):
+    products = [ResponseRegisterProduct.from_domain_entities(product, category) for product, category in rows]
+    return json.dumps([product.model_dump() for product in products]).encode('utf-8')
+
+
+def fast_path(rows):
+    return dumps([product_listing_dict(product, category) for product, category in rows])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (best one is reported)')
+    args = parser.parse_args()
+    # dumps lê as configurações do app atual
+    Flask(__name__).app_context().push()
+
+    print(f"JSON encoder: {'orjson' if orjson is not None else 'json (stdlib)'}")
+    print(f"{'products':>10} {'validated (ms)':>16} {'fast (ms)':>12} {'speed-up':>10}")
+    for size in SIZES:
+        rows = build_rows(size)
+        assert json.loads(validated_path(rows)) == json.loads(fast_path(rows))
+        validated = min(timeit.repeat(lambda: validated_path(rows), number=1, repeat=args.repeat)) * 1000
+        fast = min(timeit.repeat(lambda: fast_path(rows), number=1, repeat=args.repeat)) * 1000
+        print(f"{size:>10} {validated:>16.1f} {fast:>12.1f} {validated / fast:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark de concorrência das reservas de estoque de um produto disputado.
+
+Várias threads reservam 1 unidade do mesmo produto ao mesmo tempo até o estoque
+acabar, primeiro com o estoque numa única linha de 'products' e depois com o
+produto em modo sharded (estoque dividido em N linhas de 'product_stock_shards').
+
+O ganho do modo sharded vem dos locks por linha do InnoDB, então rode contra um
+MySQL descartável. No SQLite toda escrita trava o banco inteiro e os dois modos
+ficam parecidos: o padrão (um arquivo temporário) serve só para testar o script.
+
+Uso: python -m benchmarks.stock_sharding [--database-url URL] [--threads N]
+                                          [--reservations N] [--shards N]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import Flask
+
+from app import db
+from app.domain.models.stock_reservation import StockReservationEntity
+from app.infrastructure.persistence.models_db import (
+    AddressDBModel, ArtisanDBModel, CategoryDBModel, ProductDBModel, UserDBModel,
+)
+from app.infrastructure.persistence.stock_reservation_repository import StockReservationRepository
+from app.infrastructure.persistence.stock_shard_repository import StockShardRepository
+
+
+def build_app(database_url):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = (
+        {'connect_args': {'timeout': 60}} if database_url.startswith('sqlite') else {'pool_size': 64, 'max_overflow': 0}
+    )
+    db.init_app(app)
+    return app
+
+
+def create_product(stock):
+    """Creates an artisan with one product holding the given stock."""
+    marker = uuid.uuid4().hex[:8]
+    address = AddressDBModel(street="Rua do Benchmark", number="1", neighborhood="Centro", city="Salvador",
+                             state="BA", zip_code="40000-000")
+    db.session.add(address)
+    db.session.flush()
+    user = UserDBModel(email=f"bench-{marker}@example.com", password_hash="-", address_id=address.address_id)
+    db.session.add(user)
+    db.session.flush()
+    db.session.add(ArtisanDBModel(artisan_id=user.user_id, store_name=f"Loja {marker}"))
+    category = CategoryDBModel(name=f"Benchmark {marker}")
+    db.session.add(category)
+    db.session.flush()
+    product = ProductDBModel(name=f"Produto disputado {marker}", price=Decimal("10.00"), stock=stock,
+                             artisan_id=user.user_id, category_id=category.category_id)
+    db.session.add(product)
+    db.session.commit()
+    return product.product_id
+
+
+def run(app, product_id, reservations, threads):
+    """Reserves 1 unit per request from several threads until the stock runs out."""
+    latencies, failures = [], []
+    remaining = [reservations]
+    lock = threading.Lock()
+
+    def worker():
+        repository = StockReservationRepository()
+        with app.app_context():
+            while True:
+                with lock:
+                    if remaining[0] == 0:
+                        return
+                    remaining[0] -= 1
+                reservation = StockReservationEntity(items={product_id: 1},
+                                                     expires_at=datetime.utcnow() + timedelta(minutes=15))
+                started = time.perf_counter()
+                try:
+                    repository.reserve(reservation)
+                    latencies.append(time.perf_counter() - started)
+                except Exception as e:
+                    failures.append(type(e).__name__)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return elapsed, latencies, failures
+
+
+def report(label, elapsed, latencies, failures):
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p99 = latencies_ms[int(len(latencies_ms) * 0.99) - 1] if latencies_ms else 0.0
+    print(f"{label:>12} {len(latencies) / elapsed:>14.0f} {statistics.median(latencies_ms or [0]):>10.1f} "
+          f"{p99:>10.1f} {len(failures):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', help='Disposable database (default: a temporary SQLite file)')
+    parser.add_argument('--threads', type=int, default=16, help='Concurrent buyers')
+    parser.add_argument('--reservations', type=int, default=2_000, help='Reservations per mode (= initial stock)')
+    parser.add_argument('--shards', type=int, default=8, help='Stock shards of the sharded product')
+    args = parser.parse_args()
+
+    temporary = None
+    database_url = args.database_url
+    if database_url is None:
+        temporary = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        temporary.close()
+        database_url = f"sqlite:///{temporary.name}"
+
+    app = build_app(database_url)
+    try:
+        with app.app_context():
+            db.create_all()
+            single_row_id = create_product(args.reservations)
+            sharded_id = create_product(args.reservations)
+            StockShardRepository().enable_sharding(sharded_id, args.shards)
+
+        print(f"database: {database_url.split(':')[0]}, "
+              f"threads: {args.threads}, reservations: {args.reservations}, shards: {args.shards}")
+        print(f"{'mode':>12} {'reservations/s':>14} {'p50 (ms)':>10} {'p99 (ms)':>10} {'failures':>9}")
+        report('single row', *run(app, single_row_id, args.reservations, args.threads))
+        report(f'{args.shards} shards', *run(app, sharded_id, args.reservations, args.threads))
+    finally:
+        if temporary is not None:
+            os.unlink(temporary.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPICart:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture(autouse=True)
+    def authenticated(self, buyer_auth):
+        self.authenticated_tokens = buyer_auth
+
+    @pytest.fixture
+    def cart_products(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        marker = uuid.uuid4().hex[:8]
+        products = []
+        for index in range(51):
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=f"Peça {marker} {index:02d}",
+                description="Feita à mão",
+                price=Decimal("12.50") + index,
+                stock=10,
+                status='inactive' if index == 50 else 'active',
+                artisan_id=created_artisan.artisan_id,
+                category_id=created_category.category_id,
+            )
+            session.add(product)
+            products.append(product)
+        session.commit()
+        return products
+
+    def test_buyer_without_cart_gets_an_empty_cart(self, client, created_buyer):
+        response = client.get("/api/cart")
+
+        assert response.status_code == 200
+        assert response.json['cart_id'] is None
+        assert response.json['buyer_id'] == created_buyer.buyer_id
+        assert response.json['items'] == []
+        assert response.json['total_quantity'] == 0
+        assert response.json['total_value'] == 0
+
+    def test_adding_a_product_twice_sums_the_quantity(self, client, cart_products):
+        product = cart_products[0]
+        client.post("/api/cart/items", json={'product_id': product.product_id, 'quantity': 2})
+        response = client.post("/api/cart/items", json={'product_id': product.product_id})
+
+        assert response.status_code == 200
+        assert len(response.json['items']) == 1
+        item = response.json['items'][0]
+        assert item['quantity'] == 3
+        assert item['unit_price'] == 12.5
+        assert item['line_total'] == 37.5
+        assert item['category']['category_id'] == product.category_id
+        assert response.json['total_quantity'] == 3
+        assert response.json['total_value'] == 37.5
+
+    def test_summed_quantity_stops_at_the_maximum(self, client, cart_products):
+        product = cart_products[0]
+        client.post("/api/cart/items", json={'product_id': product.product_id, 'quantity': 99})
+        response = client.post("/api/cart/items", json={'product_id': product.product_id, 'quantity': 5})
+
+        assert response.status_code == 200
+        assert response.json['items'][0]['quantity'] == 99
+
+    def test_update_and_remove_items(self, client, cart_products):
+        first, second = cart_products[0], cart_products[1]
+        client.post("/api/cart/items", json={'product_id': first.product_id})
+        client.post("/api/cart/items", json={'product_id': second.product_id})
+
+        updated = client.put(f"/api/cart/items/{second.product_id}", json={'quantity': 4})
+        assert updated.status_code == 200
+        assert updated.json['total_quantity'] == 5
+        assert updated.json['total_value'] == 12.5 + 4 * 13.5
+
+        removed = client.delete(f"/api/cart/items/{first.product_id}")
+        assert removed.status_code == 200
+        assert [item['product_id'] for item in removed.json['items']] == [second.product_id]
+        assert removed.json['total_value'] == 54.0
+
+    def test_items_not_in_the_cart_are_not_found(self, client, cart_products):
+        product_id = cart_products[0].product_id
+
+        assert client.put(f"/api/cart/items/{product_id}", json={'quantity': 2}).status_code == 404
+        assert client.delete(f"/api/cart/items/{product_id}").status_code == 404
+
+    def test_unknown_and_inactive_products_cannot_be_added(self, client, cart_products):
+        unknown = client.post("/api/cart/items", json={'product_id': str(uuid.uuid4())})
+        inactive = client.post("/api/cart/items", json={'product_id': cart_products[50].product_id})
+
+        assert unknown.status_code == 404
+        assert inactive.status_code == 404
+        assert unknown.json['message'] == 'Product not found'
+
+    @pytest.mark.parametrize("quantity", [0, -1, 100])
+    def test_invalid_quantities_are_rejected(self, client, cart_products, quantity):
+        response = client.post("/api/cart/items",
+                               json={'product_id': cart_products[0].product_id, 'quantity': quantity})
+
+        assert response.status_code == 400
+
+    def test_cart_requires_a_buyer_token(self, client, artisan_auth):
+        # artisan_auth troca o token do comprador pelo de um artesão
+        assert client.get("/api/cart").status_code == 403
+        client.environ_base.pop('HTTP_AUTHORIZATION')
+        assert client.get("/api/cart").status_code == 401
+
+    def test_viewing_a_cart_of_50_items_is_a_single_query(self, app, client, created_buyer, cart_products):
+        from sqlalchemy import event
+        from app import db
+        from app.infrastructure.persistence.cart_repository import CartRepository
+        from app.presentation.auth_guard import verify_access_token
+        repository = CartRepository()
+        for product in cart_products[:50]:
+            repository.add_item(created_buyer.buyer_id, product.product_id, 2)
+        # Com o token já verificado sobra só a consulta do carrinho
+        verify_access_token(self.authenticated_tokens['access_token'])
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.get("/api/cart")
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert response.status_code == 200
+        assert len(response.json['items']) == 50
+        assert response.json['total_quantity'] == 100
+        expected_total = sum((product.price * 2 for product in cart_products[:50]), Decimal('0'))
+        assert Decimal(str(response.json['total_value'])) == expected_total
+        assert len(statements) == 1, statements
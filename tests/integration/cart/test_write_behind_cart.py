@@ -0,0 +1,208 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestWriteBehindCart:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture
+    def products(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        marker = uuid.uuid4().hex[:8]
+        products = []
+        for index in range(3):
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=f"Cesto {marker} {index}",
+                description="Palha trançada",
+                price=Decimal("10.00") * (index + 1),
+                stock=10,
+                artisan_id=created_artisan.artisan_id,
+                category_id=created_category.category_id,
+            )
+            session.add(product)
+            products.append(product)
+        session.commit()
+        return products
+
+    @pytest.fixture
+    def buffer(self):
+        from app.infrastructure.cache.cart_change_buffer import CartChangeBuffer
+        buffer = CartChangeBuffer()
+        buffer.configure(enabled=True)
+        return buffer
+
+    @pytest.fixture
+    def repository(self, buffer):
+        from app.infrastructure.persistence.write_behind_cart_repository import WriteBehindCartRepository
+        return WriteBehindCartRepository(buffer=buffer)
+
+    def cart_lines(self, buyer_id):
+        from app.infrastructure.persistence.models_db import CartDBModel, CartItemDBModel
+        cart = CartDBModel.query.filter_by(buyer_id=buyer_id).first()
+        if cart is None:
+            return None
+        return {item.product_id: item.quantity for item in CartItemDBModel.query.filter_by(cart_id=cart.cart_id)}
+
+    def record_statements(self, app, action):
+        from sqlalchemy import event
+        from app import db
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            action()
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        return statements
+
+    def test_changes_do_not_touch_the_database_until_the_flush(self, app, repository, created_buyer, products):
+        buyer_id = created_buyer.buyer_id
+        first_id, second_id = products[0].product_id, products[1].product_id
+
+        def churn():
+            for _ in range(10):
+                repository.add_item(buyer_id, first_id, 1)
+            repository.add_item(buyer_id, second_id, 2)
+            # a linha já está no buffer, então nem a existência dela é consultada
+            repository.set_item_quantity(buyer_id, first_id, 4)
+
+        assert self.record_statements(app, churn) == []
+        assert self.cart_lines(buyer_id) is None
+
+        statements = self.record_statements(app, repository.flush)
+        assert self.cart_lines(buyer_id) == {first_id: 4, second_id: 2}
+        writes = [statement for statement in statements if not statement.startswith('SELECT')]
+        # carrinho novo, linhas novas (um executemany) e o updated_at do carrinho
+        assert len(writes) == 3, writes
+
+    def test_flush_applies_increments_replacements_and_removals(self, repository, created_buyer, products):
+        from app.infrastructure.persistence.cart_repository import CartRepository
+        buyer_id = created_buyer.buyer_id
+        first, second, third = products
+        database = CartRepository()
+        database.add_item(buyer_id, first.product_id, 1)
+        database.add_item(buyer_id, second.product_id, 1)
+        database.add_item(buyer_id, third.product_id, 1)
+
+        repository.add_item(buyer_id, first.product_id, 2)
+        repository.set_item_quantity(buyer_id, second.product_id, 5)
+        repository.remove_item(buyer_id, third.product_id)
+        assert self.cart_lines(buyer_id) == {first.product_id: 1, second.product_id: 1, third.product_id: 1}
+
+        repository.flush(buyer_id)
+
+        assert self.cart_lines(buyer_id) == {first.product_id: 3, second.product_id: 5}
+
+    def test_flushed_increments_stop_at_the_maximum(self, repository, created_buyer, products):
+        from app.infrastructure.persistence.cart_repository import CartRepository
+        buyer_id = created_buyer.buyer_id
+        first, second, _ = products
+        CartRepository().add_item(buyer_id, first.product_id, 90)
+
+        for _ in range(3):
+            repository.add_item(buyer_id, first.product_id, 50)
+            repository.add_item(buyer_id, second.product_id, 50)
+        assert {item.product_id: item.quantity for item in repository.get_by_buyer_id(buyer_id).items} == {
+            first.product_id: 99, second.product_id: 99}
+
+        repository.flush(buyer_id)
+
+        assert self.cart_lines(buyer_id) == {first.product_id: 99, second.product_id: 99}
+
+    def test_reads_include_the_buffered_changes(self, repository, created_buyer, products):
+        from app.infrastructure.persistence.cart_repository import CartRepository
+        buyer_id = created_buyer.buyer_id
+        first, second, _ = products
+        CartRepository().add_item(buyer_id, first.product_id, 1)
+
+        repository.add_item(buyer_id, first.product_id, 1)
+        repository.add_item(buyer_id, second.product_id, 3)
+        cart = repository.get_by_buyer_id(buyer_id)
+
+        assert {item.product_id: item.quantity for item in cart.items} == {first.product_id: 2, second.product_id: 3}
+        assert cart.items[1].category.category_id == second.category_id
+        assert cart.total_quantity == 5
+        assert cart.total_value == Decimal("80.00")
+
+        repository.flush()
+        flushed = repository.get_by_buyer_id(buyer_id)
+        assert flushed.total_value == Decimal("80.00")
+        assert [item.product_id for item in flushed.items] == [item.product_id for item in cart.items]
+
+    def test_api_reads_its_own_buffered_writes(self, client, buyer_auth, created_buyer, products):
+        from app.infrastructure.cache.cart_change_buffer import cart_change_buffer
+        from app.presentation.controllers.cart_controller import cart_service_instance
+        cart_change_buffer.configure(enabled=True)
+        try:
+            for _ in range(3):
+                response = client.post("/api/cart/items", json={'product_id': products[0].product_id})
+            assert response.status_code == 200
+            assert response.json['items'][0]['quantity'] == 3
+            assert self.cart_lines(created_buyer.buyer_id) is None
+
+            cart_service_instance.cart_repository.flush(created_buyer.buyer_id)
+            assert self.cart_lines(created_buyer.buyer_id) == {products[0].product_id: 3}
+        finally:
+            cart_change_buffer.configure(enabled=False)
+            cart_service_instance.cart_repository.flush()
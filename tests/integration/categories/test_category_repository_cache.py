@@ -0,0 +1,47 @@
+import uuid
+from app.domain.models.category import CategoryEntity
+from app.infrastructure.cache.category_cache import CategoryCache
+from app.infrastructure.persistence.category_repository import CategoryRepository
+from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
+
+
+class TestCategoryRepositoryCache:
+
+    def test_create_writes_through_to_cache(self, session):
+        cache = CategoryCache()
+        repository = CategoryRepository(cache=cache)
+
+        created = repository.create(CategoryEntity(category_id=str(uuid.uuid4()), name=f"Cestaria {uuid.uuid4().hex[:6]}"))
+
+        assert repository.get_by_id(created.category_id).name == created.name
+        assert cache.stats()['hits'] == 1
+
+    def test_miss_loads_from_database_once(self, session):
+        category = CategoryDBModel(name=f"Couro {uuid.uuid4().hex[:6]}")
+        session.add(category)
+        session.commit()
+        cache = CategoryCache()
+        repository = CategoryRepository(cache=cache)
+
+        first = repository.get_by_id(category.category_id)
+        second = repository.get_by_id(category.category_id)
+
+        assert first.category_id == second.category_id == category.category_id
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+
+    def test_warm_cache_loads_all_categories(self, session):
+        category = CategoryDBModel(name=f"Vidro {uuid.uuid4().hex[:6]}")
+        session.add(category)
+        session.commit()
+        cache = CategoryCache()
+
+        loaded = CategoryRepository(cache=cache).warm_cache()
+
+        assert loaded >= 1
+        assert cache.is_warm
+        assert cache.get(category.category_id) is not None
+
+    def test_unknown_id_returns_none(self, session):
+        repository = CategoryRepository(cache=CategoryCache())
+        assert repository.get_by_id(str(uuid.uuid4())) is None
@@ -95,6 +95,46 @@ def created_artisan(session, created_user, valid_artisan_data):
     session.commit()
     return artisan
 
+@pytest.fixture
+def artisan_auth(client, created_artisan):
+    """Envia o access token do created_artisan em todas as requisições do client durante o teste."""
+    from app.infrastructure.security.jwt_token_service import JwtTokenService
+    tokens = JwtTokenService().issue_tokens(created_artisan.artisan_id, 'artisan')
+    client.environ_base['HTTP_AUTHORIZATION'] = f"Bearer {tokens['access_token']}"
+    yield tokens
+    client.environ_base.pop('HTTP_AUTHORIZATION', None)
+
+@pytest.fixture
+def created_buyer(session):
+    """Comprador com usuário e endereço próprios (independente do created_artisan)."""
+    from app.infrastructure.persistence.models_db import AddressDBModel, BuyerDBModel, UserDBModel
+    mock_address = mock_factory.address.create()
+    mock_user = mock_factory.user.create()
+    mock_buyer = mock_factory.buyer.create()
+    address = AddressDBModel(street=mock_address.street, number=mock_address.number,
+                             neighborhood=mock_address.neighborhood, city=mock_address.city,
+                             state=mock_address.state, zip_code=mock_address.zip_code,
+                             country=mock_address.country, address_id=str(uuid.uuid4()))
+    user = UserDBModel(email=f"{uuid.uuid4().hex[:8]}.{mock_user.email}", password_hash=mock_user.password,
+                       user_id=mock_buyer.buyer_id, address_id=address.address_id)
+    buyer = BuyerDBModel(buyer_id=mock_buyer.buyer_id, full_name=mock_buyer.full_name, phone=mock_buyer.phone[:20])
+    session.add(address)
+    session.flush()
+    session.add(user)
+    session.flush()
+    session.add(buyer)
+    session.commit()
+    return buyer
+
+@pytest.fixture
+def buyer_auth(client, created_buyer):
+    """Envia o access token do created_buyer em todas as requisições do client durante o teste."""
+    from app.infrastructure.security.jwt_token_service import JwtTokenService
+    tokens = JwtTokenService().issue_tokens(created_buyer.buyer_id, 'buyer')
+    client.environ_base['HTTP_AUTHORIZATION'] = f"Bearer {tokens['access_token']}"
+    yield tokens
+    client.environ_base.pop('HTTP_AUTHORIZATION', None)
+
 @pytest.fixture
 def created_category(session, valid_category_data):
     from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
@@ -0,0 +1,107 @@
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from sqlalchemy import func, select
+
+from app import db
+from app.cli import dataset_cli
+from app.common.utils import normalize_email
+from app.domain.models.address import address_fingerprint
+from app.infrastructure.database.dataset_seeder import DatasetSeeder
+from app.infrastructure.persistence.models_db import (
+    AddressDBModel, ArtisanDBModel, BuyerDBModel, CartDBModel, CartItemDBModel, CategoryDBModel,
+    OrderDBModel, OrderItemDBModel, ProductDBModel, ReviewDBModel, UserDBModel,
+)
+
+SEEDED_MODELS = (AddressDBModel, UserDBModel, ArtisanDBModel, BuyerDBModel, ProductDBModel, CartDBModel,
+                 CartItemDBModel, OrderDBModel, OrderItemDBModel, ReviewDBModel)
+
+
+class TestDatasetSeedCli:
+
+    @pytest.fixture
+    def seed_app(self, tmp_path):
+        # Banco próprio: a massa gerada é commitada e não pode vazar para os outros testes
+        seed_app = Flask(__name__)
+        seed_app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'dataset.db'}"
+        seed_app.config['BCRYPT_ROUNDS'] = 4
+        db.init_app(seed_app)
+        seed_app.cli.add_command(dataset_cli)
+        with seed_app.app_context():
+            db.create_all()
+        yield seed_app
+        with seed_app.app_context():
+            db.drop_all()
+            db.engine.dispose()
+
+    @pytest.fixture
+    def seeded_categories(self, seed_app):
+        with seed_app.app_context():
+            db.session.add_all([CategoryDBModel(name='Cerâmica'), CategoryDBModel(name='Madeira')])
+            db.session.commit()
+
+    def invoke_seed(self, seed_app, *args):
+        # O comando usa o app context ativo (o dos outros testes já está aberto)
+        with seed_app.app_context():
+            return seed_app.test_cli_runner().invoke(args=[
+                'dataset', 'seed', '--artisans', '5', '--buyers', '30', '--products-per-artisan', '4',
+                '--orders-per-buyer', '2', '--reviews-per-buyer', '2', '--batch-size', '7', *args,
+            ])
+
+    def table_counts(self):
+        return {model.__tablename__: db.session.scalar(select(func.count()).select_from(model))
+                for model in SEEDED_MODELS}
+
+    def test_seed_inserts_the_reported_rows(self, seed_app, seeded_categories):
+        result = self.invoke_seed(seed_app)
+
+        assert result.exit_code == 0, result.output
+        with seed_app.app_context():
+            counts = self.table_counts()
+        assert counts['artisans'] == 5
+        assert counts['buyers'] == 30
+        assert counts['users'] == 35
+        for table, rows in counts.items():
+            assert f"{table}: {rows} rows" in result.output or rows == 0
+
+    def test_seeded_rows_are_consistent(self, seed_app, seeded_categories):
+        assert self.invoke_seed(seed_app).exit_code == 0
+
+        with seed_app.app_context():
+            users = db.session.scalars(select(UserDBModel)).all()
+            assert all(user.email_normalized == normalize_email(user.email) for user in users)
+            addresses = db.session.scalars(select(AddressDBModel)).all()
+            assert all(address.fingerprint == address_fingerprint(
+                address.street, address.number, address.neighborhood, address.city, address.state,
+                address.zip_code) for address in addresses)
+            for order in db.session.scalars(select(OrderDBModel)):
+                assert order.order_items
+                assert order.total_value == sum((item.unit_price * item.quantity for item in order.order_items),
+                                                Decimal('0'))
+            category_ids = set(db.session.scalars(select(ProductDBModel.category_id)))
+            assert category_ids <= set(db.session.scalars(select(CategoryDBModel.category_id)))
+
+    def test_same_seed_generates_the_same_dataset(self, seed_app, seeded_categories):
+        assert self.invoke_seed(seed_app, '--seed', '7').exit_code == 0
+        with seed_app.app_context():
+            emails = sorted(db.session.scalars(select(UserDBModel.email)))
+            product_ids = sorted(db.session.scalars(select(ProductDBModel.product_id)))
+            for model in reversed(SEEDED_MODELS):
+                db.session.query(model).delete()
+            db.session.commit()
+
+        assert self.invoke_seed(seed_app, '--seed', '7').exit_code == 0
+        with seed_app.app_context():
+            assert sorted(db.session.scalars(select(UserDBModel.email))) == emails
+            assert sorted(db.session.scalars(select(ProductDBModel.product_id))) == product_ids
+
+    def test_seed_without_categories_fails(self, seed_app):
+        result = self.invoke_seed(seed_app)
+
+        assert result.exit_code == 1
+        assert "No categories found" in result.output
+
+    def test_batch_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            DatasetSeeder(batch_size=0)
@@ -0,0 +1,210 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPICheckout:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture(autouse=True)
+    def authenticated(self, buyer_auth):
+        self.authenticated_tokens = buyer_auth
+
+    @pytest.fixture
+    def products(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        marker = uuid.uuid4().hex[:8]
+        products = []
+        for index in range(40):
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=f"Tapete {marker} {index:02d}",
+                description="Tear manual",
+                price=Decimal("30.00") + index,
+                stock=5,
+                artisan_id=created_artisan.artisan_id,
+                category_id=created_category.category_id,
+            )
+            session.add(product)
+            products.append(product)
+        session.commit()
+        return products
+
+    def fill_cart(self, buyer_id, products, quantity=2):
+        from app.infrastructure.persistence.cart_repository import CartRepository
+        repository = CartRepository()
+        for product in products:
+            repository.add_item(buyer_id, product.product_id, quantity)
+
+    def cart_line_count(self, buyer_id):
+        from app.infrastructure.persistence.models_db import CartDBModel, CartItemDBModel
+        return CartItemDBModel.query.join(CartDBModel).filter(CartDBModel.buyer_id == buyer_id).count()
+
+    def product_rows(self, products):
+        from app import db
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        db.session.expire_all()
+        return {product.product_id: (product.stock, product.status)
+                for product in ProductDBModel.query.filter(
+                    ProductDBModel.product_id.in_([product.product_id for product in products]))}
+
+    def checkout_statements(self, app, client):
+        from sqlalchemy import event
+        from app import db
+        from app.infrastructure.persistence.stock_shard_repository import sharded_product_layout
+        from app.presentation.auth_guard import verify_access_token
+        # Token e layout dos shards já em cache: sobram só os statements do checkout
+        verify_access_token(self.authenticated_tokens['access_token'])
+        sharded_product_layout()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.post("/api/orders", json={'payment_method': 'pix'})
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        return response, statements
+
+    def test_checkout_turns_the_cart_into_an_order(self, client, created_buyer, products):
+        from app.infrastructure.persistence.models_db import AddressDBModel, OrderDBModel, OrderItemDBModel
+        first, second = products[0], products[1]
+        self.fill_cart(created_buyer.buyer_id, [first], quantity=5)
+        self.fill_cart(created_buyer.buyer_id, [second], quantity=1)
+
+        response = client.post("/api/orders", json={'payment_method': 'pix'})
+
+        assert response.status_code == 201
+        assert response.json['order_status'] == 'pending'
+        assert response.json['total_value'] == 5 * 30.0 + 31.0
+        assert {item['product_id']: item['quantity'] for item in response.json['items']} == {
+            first.product_id: 5, second.product_id: 1}
+        stock = self.product_rows([first, second])
+        assert stock[first.product_id] == (0, 'out_of_stock')
+        assert stock[second.product_id] == (4, 'active')
+
+        order = OrderDBModel.query.get(response.json['order_id'])
+        assert order.buyer_id == created_buyer.buyer_id
+        assert {item.product_id: Decimal(item.unit_price) for item in OrderItemDBModel.query.filter_by(
+            order_id=order.order_id)} == {first.product_id: Decimal("30.00"), second.product_id: Decimal("31.00")}
+        # O endereço de entrega é uma cópia do endereço do comprador
+        delivery = AddressDBModel.query.get(order.delivery_address_id)
+        assert delivery.address_id != created_buyer.user.address_id
+        assert delivery.fingerprint == created_buyer.user.address.fingerprint
+        assert self.cart_line_count(created_buyer.buyer_id) == 0
+
+    def test_unit_price_is_the_price_at_checkout(self, client, session, created_buyer, products):
+        self.fill_cart(created_buyer.buyer_id, products[:1])
+        response = client.post("/api/orders", json={'payment_method': 'boleto'})
+
+        products[0].price = Decimal("99.00")
+        session.commit()
+
+        assert response.json['items'][0]['unit_price'] == 30.0
+
+    def test_checkout_round_trips_do_not_grow_with_the_cart(self, app, client, created_buyer, products):
+        self.fill_cart(created_buyer.buyer_id, products[:2])
+        small, small_statements = self.checkout_statements(app, client)
+        self.fill_cart(created_buyer.buyer_id, products[2:])
+        large, large_statements = self.checkout_statements(app, client)
+
+        assert small.status_code == large.status_code == 201
+        assert len(large.json['items']) == 38
+        assert len(large_statements) == len(small_statements), large_statements
+
+    def test_insufficient_stock_changes_nothing(self, client, created_buyer, products):
+        from app.infrastructure.persistence.models_db import OrderDBModel
+        self.fill_cart(created_buyer.buyer_id, products[:1], quantity=2)
+        self.fill_cart(created_buyer.buyer_id, products[1:2], quantity=6)
+
+        response = client.post("/api/orders", json={'payment_method': 'credit_card'})
+
+        assert response.status_code == 409
+        assert products[1].product_id in response.json['message']
+        stock = self.product_rows(products[:2])
+        assert stock[products[0].product_id] == (5, 'active')
+        assert self.cart_line_count(created_buyer.buyer_id) == 2
+        assert OrderDBModel.query.filter_by(buyer_id=created_buyer.buyer_id).count() == 0
+
+    def test_checkout_of_an_empty_cart(self, client, created_buyer):
+        response = client.post("/api/orders", json={'payment_method': 'pix'})
+
+        assert response.status_code == 400
+        assert response.json['message'] == 'The cart is empty'
+
+    def test_unknown_payment_methods_are_rejected(self, client, created_buyer, products):
+        self.fill_cart(created_buyer.buyer_id, products[:1])
+
+        assert client.post("/api/orders", json={'payment_method': 'cash'}).status_code == 400
+        assert client.post("/api/orders", json={}).status_code == 400
+
+    def test_checkout_includes_buffered_cart_changes(self, client, created_buyer, products):
+        from app.infrastructure.cache.cart_change_buffer import cart_change_buffer
+        cart_change_buffer.configure(enabled=True)
+        try:
+            client.post("/api/cart/items", json={'product_id': products[0].product_id, 'quantity': 3})
+            response = client.post("/api/orders", json={'payment_method': 'pix'})
+        finally:
+            cart_change_buffer.configure(enabled=False)
+
+        assert response.status_code == 201
+        assert response.json['items'][0]['quantity'] == 3
+        assert cart_change_buffer.pending_buyers() == 0
@@ -0,0 +1,220 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIIdempotentCheckout:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture(autouse=True)
+    def authenticated(self, buyer_auth):
+        self.authenticated_tokens = buyer_auth
+
+    @pytest.fixture
+    def product(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        product = ProductDBModel(
+            product_id=str(uuid.uuid4()),
+            name=f"Bolsa {uuid.uuid4().hex[:8]}",
+            description="Couro curtido",
+            price=Decimal("80.00"),
+            stock=10,
+            artisan_id=created_artisan.artisan_id,
+            category_id=created_category.category_id,
+        )
+        session.add(product)
+        session.commit()
+        return product
+
+    def fill_cart(self, buyer_id, product, quantity=2):
+        from app.infrastructure.persistence.cart_repository import CartRepository
+        CartRepository().add_item(buyer_id, product.product_id, quantity)
+
+    def checkout(self, client, key, payment_method='pix'):
+        return client.post("/api/orders", json={'payment_method': payment_method},
+                           headers={'Idempotency-Key': key})
+
+    def order_count(self, buyer_id):
+        from app.infrastructure.persistence.models_db import OrderDBModel
+        return OrderDBModel.query.filter_by(buyer_id=buyer_id).count()
+
+    def test_retries_get_the_first_order_back(self, client, created_buyer, product):
+        from app.infrastructure.cache.idempotency_cache import idempotency_response_cache
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        self.fill_cart(created_buyer.buyer_id, product)
+        key = str(uuid.uuid4())
+
+        first = self.checkout(client, key)
+        # Sem o cache a repetição vem da tabela idempotency_keys
+        idempotency_response_cache.clear()
+        self.fill_cart(created_buyer.buyer_id, product)
+        retry = self.checkout(client, key)
+        cached_retry = self.checkout(client, key)
+
+        assert first.status_code == retry.status_code == cached_retry.status_code == 201
+        assert first.headers['Idempotent-Replayed'] == 'false'
+        assert retry.headers['Idempotent-Replayed'] == cached_retry.headers['Idempotent-Replayed'] == 'true'
+        assert retry.json == cached_retry.json == first.json
+        assert self.order_count(created_buyer.buyer_id) == 1
+        assert ProductDBModel.query.get(product.product_id).stock == 8
+
+    def test_cached_retry_does_not_touch_the_database(self, app, client, created_buyer, product):
+        from sqlalchemy import event
+        from app import db
+        self.fill_cart(created_buyer.buyer_id, product)
+        key = str(uuid.uuid4())
+        first = self.checkout(client, key)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            retry = self.checkout(client, key)
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert retry.json['order_id'] == first.json['order_id']
+        # Só o carrinho do checkout original foi esvaziado: a repetição nem chega a lê-lo
+        assert statements == []
+
+    def test_key_reused_with_another_body_is_rejected(self, client, created_buyer, product):
+        self.fill_cart(created_buyer.buyer_id, product)
+        key = str(uuid.uuid4())
+        self.checkout(client, key, payment_method='pix')
+
+        response = self.checkout(client, key, payment_method='boleto')
+
+        assert response.status_code == 422
+        assert self.order_count(created_buyer.buyer_id) == 1
+
+    def test_failed_checkout_releases_the_key(self, client, created_buyer, product):
+        key = str(uuid.uuid4())
+        empty = self.checkout(client, key)
+        self.fill_cart(created_buyer.buyer_id, product)
+        retry = self.checkout(client, key)
+
+        assert empty.status_code == 400
+        assert retry.status_code == 201
+        assert retry.headers['Idempotent-Replayed'] == 'false'
+
+    def test_response_that_cannot_be_stored_is_still_returned(self, client, created_buyer, product, monkeypatch):
+        import json as json_module
+        from types import SimpleNamespace
+        self.fill_cart(created_buyer.buyer_id, product)
+        key = str(uuid.uuid4())
+
+        def failing_dumps(value):
+            raise RuntimeError("database unavailable")
+
+        # O UPDATE da resposta falha depois que o pedido já foi criado
+        monkeypatch.setattr('app.infrastructure.persistence.idempotency_key_repository.json',
+                            SimpleNamespace(dumps=failing_dumps, loads=json_module.loads))
+        first = self.checkout(client, key)
+        retry = self.checkout(client, key)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.headers['Idempotent-Replayed'] == 'true'
+        assert retry.json == first.json
+        assert self.order_count(created_buyer.buyer_id) == 1
+
+    def test_request_still_running_is_not_repeated(self, client, created_buyer, product):
+        from app.application.services.idempotency_service import IdempotencyService
+        from app.domain.models.idempotency_record import IdempotencyRecordEntity
+        from app.infrastructure.persistence.idempotency_key_repository import IdempotencyKeyRepository
+        import datetime
+        self.fill_cart(created_buyer.buyer_id, product)
+        key = str(uuid.uuid4())
+        now = datetime.datetime.utcnow()
+        IdempotencyKeyRepository().claim(IdempotencyRecordEntity(
+            f"checkout:{created_buyer.buyer_id}", key, IdempotencyService.request_hash({'payment_method': 'pix'}),
+            expires_at=now + datetime.timedelta(hours=1)), now)
+
+        response = self.checkout(client, key)
+
+        assert response.status_code == 409
+        assert self.order_count(created_buyer.buyer_id) == 0
+
+    def test_invalid_keys_are_rejected(self, client, created_buyer, product):
+        self.fill_cart(created_buyer.buyer_id, product)
+
+        assert self.checkout(client, "k" * 256).status_code == 400
+        assert self.checkout(client, "").status_code == 400
+        assert self.order_count(created_buyer.buyer_id) == 0
+
+    def test_expired_keys_are_replaced_and_purged(self, session, created_buyer):
+        import datetime
+        from app.application.services.idempotency_service import IdempotencyService
+        from app.domain.models.idempotency_record import IdempotencyRecordEntity
+        from app.infrastructure.cache.idempotency_cache import IdempotencyResponseCache
+        from app.infrastructure.persistence.idempotency_key_repository import IdempotencyKeyRepository
+        from app.infrastructure.persistence.models_db import IdempotencyKeyDBModel
+        repository = IdempotencyKeyRepository(cache=IdempotencyResponseCache())
+        scope = f"checkout:{created_buyer.buyer_id}"
+        now = datetime.datetime.utcnow()
+        for index in range(5):
+            record = IdempotencyRecordEntity(scope, f"old-{index}", "hash", expires_at=now - datetime.timedelta(seconds=1))
+            assert repository.claim(record, now - datetime.timedelta(hours=1)) is None
+
+        renewed = IdempotencyRecordEntity(scope, "old-0", "other", expires_at=now + datetime.timedelta(hours=1))
+        assert repository.claim(renewed, now) is None
+
+        assert IdempotencyService(repository).purge_expired(batch_size=2) == 4
+        assert [row.idempotency_key for row in IdempotencyKeyDBModel.query.filter_by(scope=scope)] == ["old-0"]
@@ -0,0 +1,153 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIOrderHistory:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture(autouse=True)
+    def authenticated(self, buyer_auth):
+        self.authenticated_tokens = buyer_auth
+
+    @pytest.fixture
+    def orders(self, session, created_buyer, created_artisan, created_category):
+        """25 pedidos com 2 itens cada; os pedidos 10 e 11 têm a mesma order_date (desempate pelo order_id)."""
+        import datetime
+        from app.infrastructure.persistence.models_db import OrderDBModel, OrderItemDBModel, ProductDBModel
+        product = ProductDBModel(product_id=str(uuid.uuid4()), name=f"Caneca {uuid.uuid4().hex[:8]}",
+                                 description="Barro cozido", price=Decimal("10.00"), stock=100,
+                                 artisan_id=created_artisan.artisan_id, category_id=created_category.category_id)
+        session.add(product)
+        start = datetime.datetime(2026, 1, 1, 9, 0)
+        orders = []
+        for index in range(25):
+            order_date = start + datetime.timedelta(hours=min(index, 10) if index < 12 else index)
+            order = OrderDBModel(order_id=str(uuid.uuid4()), order_date=order_date, total_value=Decimal("20.00"),
+                                 payment_method='pix', buyer_id=created_buyer.buyer_id)
+            session.add(order)
+            for _ in range(2):
+                session.add(OrderItemDBModel(order_item_id=str(uuid.uuid4()), order_id=order.order_id,
+                                             product_id=product.product_id, quantity=1,
+                                             unit_price=Decimal("10.00")))
+            orders.append(order)
+        session.commit()
+        return sorted(orders, key=lambda order: (order.order_date, order.order_id), reverse=True)
+
+    def get_page(self, app, client, **params):
+        from sqlalchemy import event
+        from app import db
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.get("/api/orders", query_string=params)
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        return response, statements
+
+    def test_pages_walk_the_history_newest_first(self, app, client, orders):
+        from app.presentation.auth_guard import verify_access_token
+        verify_access_token(self.authenticated_tokens['access_token'])
+        seen, cursor, pages = [], None, 0
+        while True:
+            params = {'limit': 10, **({'cursor': cursor} if cursor else {})}
+            response, statements = self.get_page(app, client, **params)
+            assert response.status_code == 200
+            # Os pedidos da página e, num único SELECT ... IN, os itens de todos eles
+            assert len(statements) == 2, statements
+            assert all(len(order['items']) == 2 for order in response.json)
+            seen += [order['order_id'] for order in response.json]
+            pages += 1
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+
+        assert pages == 3
+        assert seen == [order.order_id for order in orders]
+
+    def test_only_the_buyers_own_orders_are_listed(self, client, session, orders):
+        from app.infrastructure.persistence.models_db import BuyerDBModel, OrderDBModel, UserDBModel
+        other_buyer_id = str(uuid.uuid4())
+        session.add(UserDBModel(email=f"{other_buyer_id[:8]}@example.com", password_hash="hash",
+                                user_id=other_buyer_id))
+        session.flush()
+        session.add(BuyerDBModel(buyer_id=other_buyer_id, full_name="Outra Compradora"))
+        session.flush()
+        session.add(OrderDBModel(order_id=str(uuid.uuid4()), total_value=Decimal("1.00"), payment_method='pix',
+                                 buyer_id=other_buyer_id))
+        session.commit()
+
+        response = client.get("/api/orders", query_string={'limit': 100})
+
+        assert [order['order_id'] for order in response.json] == [order.order_id for order in orders]
+
+    def test_buyer_without_orders_gets_an_empty_page(self, client, created_buyer):
+        response = client.get("/api/orders")
+
+        assert response.status_code == 200
+        assert response.json == []
+        assert 'X-Next-Cursor' not in response.headers
+
+    @pytest.mark.parametrize("params", [{'cursor': 'not-a-cursor'}, {'limit': 101}, {'limit': 0}])
+    def test_invalid_page_parameters(self, client, created_buyer, params):
+        assert client.get("/api/orders", query_string=params).status_code == 400
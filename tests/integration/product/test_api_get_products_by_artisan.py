@@ -1,4 +1,5 @@
 from collections import Counter
+from datetime import datetime, timedelta
 from decimal import Decimal
 import uuid
 import json
@@ -159,6 +160,117 @@ class TestAPIGetProductsByArtisan:
         assert counter_cats[product3.category_id] == 1, "Expected products to be from different categories"
         assert counter_cats[category_id] == 2, "Expected two products from the same category"
         
+    def test_get_products_by_artisan_paginated(self, client, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        base_date = datetime(2025, 1, 1, 12, 0, 0)
+        created_ids = []
+        for i in range(5):
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=f"Produto {i}",
+                description="Produto paginado",
+                price=Decimal("10.00"),
+                stock=1,
+                artisan_id=created_artisan.artisan_id,
+                category_id=created_category.category_id,
+                # dois produtos com a mesma data exercitam o desempate por product_id
+                registration_date=base_date + timedelta(minutes=min(i, 3)),
+            )
+            session.add(product)
+            created_ids.append(product.product_id)
+        session.commit()
+
+        seen_ids = []
+        cursor = None
+        pages = 0
+        while True:
+            url = f"/api/artisan/{created_artisan.artisan_id}/products?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = client.get(url)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert len(data) <= 2
+            seen_ids.extend(p['product_id'] for p in data)
+            pages += 1
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+
+        assert pages == 3
+        assert sorted(seen_ids) == sorted(created_ids), "Each product must be returned exactly once"
+
+    def test_get_products_by_artisan_loads_products_and_categories_in_one_query(self, app, client, created_multiple_products_same_category, created_product):
+        from sqlalchemy import event
+        from app import db
+        artisan_id = created_product.artisan_id
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.get(f"/api/artisan/{artisan_id}/products")
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert response.status_code == 200
+        assert len(json.loads(response.data)) == 3
+        # A consulta de versão do ETag (COUNT/MAX) não carrega produtos
+        product_selects = [s for s in statements if 'FROM products' in s and 'count(' not in s]
+        category_selects = [s for s in statements if 'FROM categories' in s]
+        assert len(product_selects) == 1, statements
+        assert 'JOIN categories' in product_selects[0]
+        assert category_selects == [], "Categories must come from the joined product query"
+
+    def test_get_products_by_artisan_not_modified(self, app, client, session, created_multiple_products_same_category, created_product):
+        from sqlalchemy import event
+        from app import db
+        artisan_id = created_product.artisan_id
+        first = client.get(f"/api/artisan/{artisan_id}/products")
+        etag = first.headers['ETag']
+        assert first.status_code == 200
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.get(f"/api/artisan/{artisan_id}/products", headers={'If-None-Match': etag})
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+        # Só a consulta de versão (COUNT/MAX), sem carregar produtos nem categorias
+        assert len(statements) == 1, statements
+        assert 'count(' in statements[0].lower() and 'JOIN' not in statements[0]
+
+    def test_get_products_by_artisan_etag_changes_on_write(self, client, session, created_multiple_products_same_category, created_product):
+        artisan_id = created_product.artisan_id
+        etag = client.get(f"/api/artisan/{artisan_id}/products").headers['ETag']
+
+        created_product.stock = created_product.stock + 1
+        session.commit()
+
+        response = client.get(f"/api/artisan/{artisan_id}/products", headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert len(json.loads(response.data)) == len(created_multiple_products_same_category) + 1
+
+    def test_get_products_by_artisan_invalid_cursor(self, client, created_artisan):
+        response = client.get(f"/api/artisan/{created_artisan.artisan_id}/products?cursor=invalid")
+        assert response.status_code == 400
+        assert json.loads(response.data)['message'] == "Invalid cursor"
+
     def test_get_products_by_different_categories(self, client, created_multiple_products_same_category, created_product):
         #TODO: Implement this test to check if products from different categories are returned correctly
         pass
\ No newline at end of file
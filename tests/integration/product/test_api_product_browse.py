@@ -0,0 +1,157 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIProductBrowse:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+
+    @pytest.fixture
+    def browsable_products(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.category_db_model import CategoryDBModel
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        other_category = CategoryDBModel(category_id=str(uuid.uuid4()), name=f"Outra {uuid.uuid4().hex[:6]}")
+        session.add(other_category)
+        data = [
+            (created_category.category_id, "10.00", 'active'),
+            (created_category.category_id, "30.00", 'ACTIVE'),
+            (created_category.category_id, "30.00", 'out_of_stock'),
+            (other_category.category_id, "150.00", 'active'),
+            (other_category.category_id, "900.00", 'inactive'),
+        ]
+        products = []
+        for category_id, price, status in data:
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=f"Produto {uuid.uuid4().hex[:6]}",
+                description="Feito à mão",
+                price=Decimal(price),
+                stock=1,
+                status=status,
+                artisan_id=created_artisan.artisan_id,
+                category_id=category_id,
+            )
+            session.add(product)
+            products.append(product)
+        session.commit()
+        return created_artisan.artisan_id, created_category, other_category, products
+
+    def test_browse_filters_and_counts_facets(self, client, browsable_products):
+        artisan_id, category, other_category, products = browsable_products
+        response = client.get(f"/api/products/browse?artisan_id={artisan_id}&sort=price_asc")
+        assert response.status_code == 200
+        data = json.loads(response.data)
+
+        # Inativos ficam de fora; status em maiúsculas também conta como ativo
+        assert data['total'] == 4
+        assert [item['product_id'] for item in data['items']][0] == products[0].product_id
+        assert [item['price'] for item in data['items']] == [10.0, 30.0, 30.0, 150.0]
+        assert [(facet['category_id'], facet['name'], facet['count']) for facet in data['facets']['categories']] == [
+            (category.category_id, category.name, 3), (other_category.category_id, other_category.name, 1)
+        ]
+        price_counts = {facet['min_price']: facet['count'] for facet in data['facets']['price_ranges']}
+        assert price_counts == {0.0: 1, 25.0: 2, 50.0: 0, 100.0: 1, 200.0: 0, 500.0: 0}
+
+    def test_browse_combined_filters(self, client, browsable_products):
+        artisan_id, category, _, products = browsable_products
+        response = client.get(
+            f"/api/products/browse?artisan_id={artisan_id}&category_id={category.category_id}"
+            f"&status=active&min_price=20&max_price=40"
+        )
+        data = json.loads(response.data)
+
+        assert data['total'] == 1
+        assert [item['product_id'] for item in data['items']] == [products[1].product_id]
+        assert data['has_next'] is False
+
+    def test_browse_paginates(self, client, browsable_products):
+        artisan_id, _, _, _ = browsable_products
+        first = json.loads(client.get(f"/api/products/browse?artisan_id={artisan_id}&page_size=3").data)
+        second = json.loads(client.get(f"/api/products/browse?artisan_id={artisan_id}&page_size=3&page=2").data)
+
+        assert first['has_next'] is True and second['has_next'] is False
+        assert len(first['items']) == 3 and len(second['items']) == 1
+        assert first['facets'] == second['facets']
+
+    def test_browse_computes_all_facets_in_one_query(self, app, client, browsable_products):
+        from sqlalchemy import event
+        from app import db
+        artisan_id, _, _, _ = browsable_products
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.get(f"/api/products/browse?artisan_id={artisan_id}")
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert response.status_code == 200
+        product_queries = [s for s in statements if 'products' in s]
+        # Uma consulta para as facetas (dois GROUP BY sobre a CTE) e uma para a página
+        assert len(product_queries) == 2, statements
+        assert product_queries[0].count('GROUP BY') == 2
+
+    @pytest.mark.parametrize("query", ["min_price=50&max_price=10", "min_price=-1", "status=inactive", "sort=name"])
+    def test_browse_invalid_filters(self, client, query):
+        response = client.get(f"/api/products/browse?{query}")
+        assert response.status_code == 400
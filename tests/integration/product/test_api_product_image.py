@@ -0,0 +1,145 @@
+import json
+import uuid
+import io
+import os
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIProductImage:
+
+    @pytest.fixture(autouse=True)
+    def authenticated(self, artisan_auth):
+        """As rotas do artesão exigem o access token dele."""
+        return artisan_auth
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+
+    @pytest.fixture
+    def valid_product_data(self, test_ids):
+        mock_product = mock_factory.product.create()
+        return {
+            "name": mock_product.name,
+            "description": mock_product.description,
+            "price": Decimal('25.00'),
+            "stock": 3,
+            "status": "active",
+        }
+
+    @staticmethod
+    def _png(size=(1600, 1200)):
+        from PIL import Image
+        output = io.BytesIO()
+        Image.new('RGB', size, (200, 120, 40)).save(output, format='PNG')
+        return output.getvalue()
+
+    def _image_url(self, session, product_id):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        session.expire_all()
+        return session.get(ProductDBModel, product_id).image_url
+
+    def test_upload_generates_variants_in_background(self, app, client, session, created_product):
+        from app.infrastructure.images.image_variants import image_processing_pool
+        artisan_id, product_id = created_product.artisan_id, created_product.product_id
+
+        response = client.post(f"/api/artisan/{artisan_id}/products/{product_id}/image",
+                               data=self._png(), content_type='image/png')
+        assert response.status_code == 202
+        data = json.loads(response.data)
+        assert data['status'] == 'processing'
+        assert data['original_url'].endswith('/original.png')
+        assert set(data['variants']) == {'thumbnail', 'thumbnail_jpeg', 'medium'}
+
+        assert image_processing_pool.wait(timeout=60)
+        for url in data['variants'].values():
+            path = os.path.join(app.config['MEDIA_ROOT'], url[len(app.config['MEDIA_URL']) + 1:])
+            assert os.path.getsize(path) > 0
+        assert self._image_url(session, product_id) == data['variants']['medium']
+
+        medium = client.get(data['variants']['medium'])
+        assert medium.status_code == 200
+        assert medium.data[8:12] == b'WEBP'
+        assert medium.cache_control.max_age > 0
+
+    def test_upload_multipart(self, client, session, created_product):
+        from app.infrastructure.images.image_variants import image_processing_pool
+        response = client.post(
+            f"/api/artisan/{created_product.artisan_id}/products/{created_product.product_id}/image",
+            data={'image': (io.BytesIO(self._png((400, 300))), 'vaso.png')}, content_type='multipart/form-data')
+
+        assert response.status_code == 202
+        assert image_processing_pool.wait(timeout=60)
+
+    def test_upload_rejects_non_images(self, client, session, created_product):
+        response = client.post(
+            f"/api/artisan/{created_product.artisan_id}/products/{created_product.product_id}/image",
+            data=b'<html>not an image</html>', content_type='image/png')
+
+        assert response.status_code == 400
+        assert self._image_url(session, created_product.product_id) is None
+
+    def test_upload_rejects_other_artisans_products(self, client, created_product):
+        response = client.post(f"/api/artisan/{uuid.uuid4()}/products/{created_product.product_id}/image",
+                               data=self._png((10, 10)), content_type='image/png')
+        assert response.status_code == 403
+
+    def test_upload_too_large(self, client, created_product, monkeypatch):
+        from app.application.services import product_image_service
+        monkeypatch.setattr(product_image_service, 'MAX_IMAGE_UPLOAD_BYTES', 1024)
+        response = client.post(
+            f"/api/artisan/{created_product.artisan_id}/products/{created_product.product_id}/image",
+            data=self._png(), content_type='image/png')
+        assert response.status_code == 413
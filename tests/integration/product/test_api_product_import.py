@@ -0,0 +1,167 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIProductImport:
+
+    @pytest.fixture(autouse=True)
+    def authenticated(self, artisan_auth):
+        """As rotas do artesão exigem o access token dele."""
+        return artisan_auth
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    def _products(self, category_id, count, prefix="Produto"):
+        return [
+            {"name": f"{prefix} {index}", "description": "Feito à mão", "price": 12.5,
+             "stock": index % 5, "category_id": category_id}
+            for index in range(count)
+        ]
+
+    def test_import_json_array(self, client, created_artisan, created_category):
+        products = self._products(created_category.category_id, 3)
+        products.append({"name": "Sem preço", "description": "x", "stock": 1, "category_id": created_category.category_id})
+
+        response = client.post(f"/api/artisan/{created_artisan.artisan_id}/products/import",
+                               data=json.dumps(products), content_type='application/json')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+
+        assert (data['total_rows'], data['created'], data['failed']) == (4, 3, 1)
+        assert data['errors'][0]['row'] == 4
+        listing = json.loads(client.get(f"/api/artisan/{created_artisan.artisan_id}/products").data)
+        assert sorted(item['name'] for item in listing) == sorted(product['name'] for product in products[:3])
+
+    def test_import_ndjson_and_duplicates(self, client, created_artisan, created_category):
+        url = f"/api/artisan/{created_artisan.artisan_id}/products/import"
+        first = self._products(created_category.category_id, 2)
+        client.post(url, data=json.dumps(first), content_type='application/json')
+
+        lines = [json.dumps(product) for product in self._products(created_category.category_id, 3)]
+        response = client.post(url, data="\n".join(lines), content_type='application/x-ndjson')
+        data = json.loads(response.data)
+
+        assert data['created'] == 1
+        assert [error['row'] for error in data['errors']] == [1, 2]
+        assert data['errors'][0]['errors'] == ["Product with this name already exists for this artisan"]
+
+    def test_import_reports_invalid_utf8_rows(self, client, created_artisan, created_category):
+        # Lotes anteriores já gravados: a resposta continua sendo o relatório por linha
+        lines = [json.dumps(product).encode('utf-8')
+                 for product in self._products(created_category.category_id, 600, prefix="Cesto")]
+        body = b"\n".join(lines) + b'\n{"name": "\xff"}\n' + lines[0]
+        response = client.post(f"/api/artisan/{created_artisan.artisan_id}/products/import",
+                               data=body, content_type='application/x-ndjson')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert (data['total_rows'], data['created']) == (602, 600)
+        assert [(error['row'], error['errors']) for error in data['errors']] == [
+            (601, ["Invalid UTF-8 text"]),
+            (602, ["Product with this name already exists for this artisan"]),
+        ]
+
+    def test_import_csv(self, client, created_artisan, created_category):
+        category_id = created_category.category_id
+        body = (
+            "name,description,price,stock,category_id,image_url\n"
+            f"Vaso,Barro,30.00,2,{category_id},\n"
+            f"Prato,Barro,abc,2,{category_id},\n"
+            f"Colar,Sementes,15,,{category_id},http://example.com/colar.png\n"
+        )
+        response = client.post(f"/api/artisan/{created_artisan.artisan_id}/products/import",
+                               data=body.encode('utf-8'), content_type='text/csv')
+        data = json.loads(response.data)
+
+        assert (data['created'], data['failed']) == (2, 1)
+        assert data['errors'][0]['row'] == 2
+
+    def test_import_uses_bulk_statements(self, app, client, created_artisan, created_category):
+        from sqlalchemy import event
+        from app import db
+        products = self._products(created_category.category_id, 1200, prefix="Lote")
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.post(f"/api/artisan/{created_artisan.artisan_id}/products/import",
+                                   data=json.dumps(products), content_type='application/json')
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert json.loads(response.data)['created'] == 1200
+        inserts = [s for s in statements if s.startswith('INSERT INTO products')]
+        name_checks = [s for s in statements if 'products.name IN' in s]
+        # 3 lotes de 500 linhas: uma checagem de nomes e poucos INSERTs por lote, nunca um por produto
+        assert len(name_checks) == 3
+        assert len(inserts) < 20, len(inserts)
+
+    def test_import_unsupported_content_type(self, client, created_artisan):
+        response = client.post(f"/api/artisan/{created_artisan.artisan_id}/products/import",
+                               data="x", content_type='text/plain')
+        assert response.status_code == 415
+
+    def test_import_unknown_artisan(self, client):
+        # O token é de outro artesão: o guard recusa antes de procurar o artesão
+        response = client.post(f"/api/artisan/{uuid.uuid4()}/products/import",
+                               data="[]", content_type='application/json')
+        assert response.status_code == 403
@@ -0,0 +1,194 @@
+import json
+import uuid
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIProductSearch:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture
+    def searchable_products(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        marker = uuid.uuid4().hex[:8]
+        data = [
+            (f"Vaso {marker} de cerâmica", "Vaso pintado à mão", 'active'),
+            (f"Prato {marker}", f"Prato de cerâmica {marker} com acabamento rústico", 'active'),
+            (f"Colar {marker}", "Colar de sementes", 'active'),
+            (f"Vaso {marker} antigo", "Fora de linha", 'inactive'),
+        ]
+        products = []
+        for name, description, status in data:
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=name,
+                description=description,
+                price=Decimal("25.00"),
+                stock=3,
+                status=status,
+                artisan_id=created_artisan.artisan_id,
+                category_id=created_category.category_id,
+            )
+            session.add(product)
+            products.append(product)
+        session.commit()
+        return marker, products
+
+    def test_search_ranks_and_filters(self, client, searchable_products):
+        marker, products = searchable_products
+        response = client.get(f"/api/products/search?q=ceramica {marker}")
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        ids = [item['product_id'] for item in data['items']]
+
+        # Acentos são ignorados e produtos inativos nunca aparecem
+        assert set(ids) == {products[0].product_id, products[1].product_id, products[2].product_id}
+        assert products[3].product_id not in ids
+        # Produtos que casam com os dois termos vêm antes do que casa só com o marcador
+        assert ids[-1] == products[2].product_id
+        assert data['items'][0]['category']['category_id'] == products[0].category_id
+
+    def test_search_paginates(self, client, searchable_products):
+        marker, _ = searchable_products
+        first = json.loads(client.get(f"/api/products/search?q={marker}&page_size=2").data)
+        second = json.loads(client.get(f"/api/products/search?q={marker}&page_size=2&page=2").data)
+
+        assert first['has_next'] is True
+        assert second['has_next'] is False
+        first_ids = {item['product_id'] for item in first['items']}
+        second_ids = {item['product_id'] for item in second['items']}
+        assert len(first_ids) == 2 and len(second_ids) == 1
+        assert not first_ids & second_ids
+
+    def test_search_sees_updated_names(self, client, session, searchable_products):
+        marker, products = searchable_products
+        new_word = f"luminaria{uuid.uuid4().hex[:6]}"
+        products[2].name = f"{new_word} {marker}"
+        session.commit()
+
+        data = json.loads(client.get(f"/api/products/search?q={new_word}").data)
+        assert [item['product_id'] for item in data['items']] == [products[2].product_id]
+
+    def test_search_without_query(self, client):
+        response = client.get("/api/products/search?q=%20")
+        assert response.status_code == 400
+
+    @pytest.fixture
+    def memory_search_repository(self, monkeypatch):
+        from app.infrastructure.search.inverted_index import InvertedIndex
+        from app.infrastructure.search.in_memory_product_search_repository import InMemoryProductSearchRepository
+        from app.presentation.controllers import product_controller
+
+        index = InvertedIndex()
+        index.enabled = True
+        repository = InMemoryProductSearchRepository(index=index)
+        monkeypatch.setattr(product_controller.product_search_service_instance, 'search_repository', repository)
+        return repository
+
+    def test_search_with_memory_index(self, client, searchable_products, memory_search_repository):
+        marker, products = searchable_products
+        assert memory_search_repository.rebuild() >= 3
+
+        # "vasos" e "ceramicas" casam com "Vaso" e "cerâmica" pelo stemming
+        data = json.loads(client.get(f"/api/products/search?q=vasos ceramicas {marker}").data)
+        ids = [item['product_id'] for item in data['items']]
+        # Outros testes também criam vasos de cerâmica; olha só os produtos deste
+        own_ids = [product_id for product_id in ids if product_id in {product.product_id for product in products}]
+
+        assert own_ids[0] == products[0].product_id
+        assert set(own_ids) == {products[0].product_id, products[1].product_id, products[2].product_id}
+        assert ids[0] == products[0].product_id
+
+    def test_memory_index_pages_skip_products_gone_inactive(self, client, session, searchable_products,
+                                                             memory_search_repository):
+        marker, products = searchable_products
+        memory_search_repository.rebuild()
+        # O índice ainda tem os dois primeiros, mas no banco eles saíram do catálogo
+        products[0].status = 'inactive'
+        products[1].status = 'INACTIVE'
+        session.commit()
+
+        first = json.loads(client.get(f"/api/products/search?q={marker}&page_size=1").data)
+        second = json.loads(client.get(f"/api/products/search?q={marker}&page_size=1&page=2").data)
+
+        assert [item['product_id'] for item in first['items']] == [products[2].product_id]
+        assert first['has_next'] is False
+        assert second['items'] == []
+        assert products[0].product_id not in memory_search_repository.index
+        assert products[1].product_id not in memory_search_repository.index
+
+    def test_created_product_is_added_to_memory_index(self, session, created_artisan, created_category, monkeypatch):
+        from app.domain.models.product import ProductEntity
+        from app.infrastructure.persistence import product_repository
+        from app.infrastructure.search.inverted_index import InvertedIndex
+
+        index = InvertedIndex()
+        index.enabled = True
+        monkeypatch.setattr(product_repository, 'product_search_index', index)
+        word = f"tapete{uuid.uuid4().hex[:6]}"
+
+        product = product_repository.ProductRepository().create(ProductEntity(
+            product_id=str(uuid.uuid4()),
+            name=f"{word} de tear",
+            description="Tapete de algodão",
+            price=Decimal("80.00"),
+            stock=1,
+            artisan_id=created_artisan.artisan_id,
+            category_id=created_category.category_id,
+        ))
+
+        assert [product_id for product_id, _ in index.search(word, k=5)] == [product.product_id]
+        assert index.search(created_category.name, k=5)[0][0] == product.product_id
@@ -0,0 +1,166 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestStockReservationRepository:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture
+    def stocked_products(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        marker = uuid.uuid4().hex[:8]
+        products = []
+        for index, stock in enumerate((5, 2, 1)):
+            product = ProductDBModel(
+                product_id=str(uuid.uuid4()),
+                name=f"Produto {marker} {index}",
+                description="Produto com estoque",
+                price=Decimal("10.00"),
+                stock=stock,
+                artisan_id=created_artisan.artisan_id,
+                category_id=created_category.category_id,
+            )
+            session.add(product)
+            products.append(product)
+        session.commit()
+        return [product.product_id for product in products]
+
+    @pytest.fixture
+    def repository(self):
+        from app.infrastructure.persistence.stock_reservation_repository import StockReservationRepository
+        return StockReservationRepository()
+
+    @staticmethod
+    def _stock(product_ids):
+        from app import db
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        db.session.expire_all()
+        return {product_id: (ProductDBModel.query.get(product_id).stock, ProductDBModel.query.get(product_id).status)
+                for product_id in product_ids}
+
+    @staticmethod
+    def _reservation(items, expires_in=timedelta(minutes=15)):
+        from app.domain.models.stock_reservation import StockReservationEntity
+        return StockReservationEntity(items=items, expires_at=datetime.utcnow() + expires_in)
+
+    def test_reserve_decrements_every_item_with_one_update(self, app, repository, stocked_products):
+        from sqlalchemy import event
+        from app import db
+        first, second, third = stocked_products
+        updates = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('UPDATE products'):
+                updates.append(executemany)
+
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            reservation = repository.reserve(self._reservation({first: 2, second: 2, third: 1}))
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert updates == [True]
+        assert reservation.reservation_id is not None
+        assert self._stock(stocked_products) == {
+            first: (3, 'active'),
+            second: (0, 'out_of_stock'),
+            third: (0, 'out_of_stock'),
+        }
+        assert repository.get_by_id(reservation.reservation_id).items == {first: 2, second: 2, third: 1}
+
+    def test_reserve_is_all_or_none(self, repository, stocked_products):
+        from app.common.exceptions import InsufficientStockError
+        first, second, third = stocked_products
+        before = self._stock(stocked_products)
+
+        with pytest.raises(InsufficientStockError) as error:
+            repository.reserve(self._reservation({first: 1, second: 3, third: 1}))
+
+        assert error.value.product_ids == [second]
+        assert self._stock(stocked_products) == before
+
+    def test_release_gives_the_stock_back_once(self, repository, stocked_products):
+        first, second, _ = stocked_products
+        reservation = repository.reserve(self._reservation({first: 1, second: 2}))
+
+        assert repository.release(reservation.reservation_id) is True
+        assert repository.release(reservation.reservation_id) is False
+
+        stock = self._stock([first, second])
+        assert stock == {first: (5, 'active'), second: (2, 'active')}
+        assert repository.get_by_id(reservation.reservation_id).status == 'released'
+
+    def test_expired_reservations_are_not_confirmed_and_are_released(self, repository, stocked_products):
+        from app.application.services.stock_reservation_service import StockReservationService
+        first, _, third = stocked_products
+        expired = repository.reserve(self._reservation({third: 1}, expires_in=timedelta(seconds=-1)))
+        pending = repository.reserve(self._reservation({first: 1}))
+
+        assert repository.confirm(expired.reservation_id, datetime.utcnow()) is False
+        assert expired.reservation_id in repository.find_expired_ids(datetime.utcnow(), 100, product_ids=[third])
+        assert pending.reservation_id not in repository.find_expired_ids(datetime.utcnow(), 100)
+
+        # Um novo pedido do mesmo produto libera a reserva expirada e reserva de novo
+        reservation = StockReservationService(repository).reserve({third: 1})
+
+        assert repository.get_by_id(expired.reservation_id).status == 'expired'
+        assert self._stock([third]) == {third: (0, 'out_of_stock')}
+        assert repository.confirm(reservation.reservation_id, datetime.utcnow()) is True
+        assert repository.get_by_id(reservation.reservation_id).status == 'confirmed'
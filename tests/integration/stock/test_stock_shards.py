@@ -0,0 +1,184 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestStockShards:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+    @pytest.fixture
+    def hot_product_id(self, session, created_artisan, created_category):
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        product = ProductDBModel(
+            product_id=str(uuid.uuid4()),
+            name=f"Produto disputado {uuid.uuid4().hex[:8]}",
+            description="Lançamento da semana",
+            price=Decimal("99.90"),
+            stock=10,
+            artisan_id=created_artisan.artisan_id,
+            category_id=created_category.category_id,
+        )
+        session.add(product)
+        session.commit()
+        return product.product_id
+
+    @pytest.fixture
+    def shard_repository(self):
+        from app.infrastructure.persistence.stock_shard_repository import StockShardRepository
+        return StockShardRepository()
+
+    @pytest.fixture
+    def reservation_repository(self):
+        from app.infrastructure.persistence.stock_reservation_repository import StockReservationRepository
+        return StockReservationRepository()
+
+    @staticmethod
+    def _reservation(items):
+        from app.domain.models.stock_reservation import StockReservationEntity
+        return StockReservationEntity(items=items, expires_at=datetime.utcnow() + timedelta(minutes=15))
+
+    @staticmethod
+    def _shards(product_id):
+        from app import db
+        from app.infrastructure.persistence.models_db.product_stock_shard_db_model import ProductStockShardDBModel
+        db.session.expire_all()
+        return [shard.stock for shard in ProductStockShardDBModel.query
+                .filter_by(product_id=product_id).order_by(ProductStockShardDBModel.shard_index)]
+
+    @staticmethod
+    def _product(product_id):
+        from app import db
+        from app.infrastructure.persistence.models_db.product_db_model import ProductDBModel
+        db.session.expire_all()
+        return db.session.get(ProductDBModel, product_id)
+
+    def test_enable_splits_the_stock_evenly(self, shard_repository, hot_product_id):
+        assert shard_repository.enable_sharding(hot_product_id, 4) is True
+        assert shard_repository.enable_sharding(hot_product_id, 4) is False
+
+        assert self._shards(hot_product_id) == [3, 3, 2, 2]
+        assert self._product(hot_product_id).stock_sharded is True
+        assert shard_repository.get_total_stock([hot_product_id]) == {hot_product_id: 10}
+
+    def test_reservations_take_from_the_shards(self, app, shard_repository, reservation_repository, hot_product_id):
+        from sqlalchemy import event
+        from app import db
+        shard_repository.enable_sharding(hot_product_id, 4)
+        product_updates = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('UPDATE products'):
+                product_updates.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            reservation_repository.reserve(self._reservation({hot_product_id: 2}))
+            # Maior que qualquer shard: sai de vários
+            reservation_repository.reserve(self._reservation({hot_product_id: 5}))
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+        assert product_updates == []
+        assert sum(self._shards(hot_product_id)) == 3
+        assert self._product(hot_product_id).stock == 10
+
+    def test_insufficient_sharded_stock_is_reported(self, shard_repository, reservation_repository, hot_product_id):
+        from app.common.exceptions import InsufficientStockError
+        shard_repository.enable_sharding(hot_product_id, 3)
+
+        with pytest.raises(InsufficientStockError) as error:
+            reservation_repository.reserve(self._reservation({hot_product_id: 11}))
+
+        assert error.value.product_ids == [hot_product_id]
+        assert sum(self._shards(hot_product_id)) == 10
+
+    def test_release_sync_and_disable(self, shard_repository, reservation_repository, hot_product_id):
+        shard_repository.enable_sharding(hot_product_id, 2)
+        reservation = reservation_repository.reserve(self._reservation({hot_product_id: 10}))
+
+        assert shard_repository.sync_totals([hot_product_id]) == 1
+        product = self._product(hot_product_id)
+        assert (product.stock, product.status) == (0, 'out_of_stock')
+
+        reservation_repository.release(reservation.reservation_id)
+        assert sum(self._shards(hot_product_id)) == 10
+        shard_repository.sync_totals([hot_product_id])
+        product = self._product(hot_product_id)
+        assert (product.stock, product.status) == (10, 'active')
+
+        reservation_repository.reserve(self._reservation({hot_product_id: 4}))
+        assert shard_repository.disable_sharding(hot_product_id) is True
+        product = self._product(hot_product_id)
+        assert (product.stock, product.stock_sharded) == (6, False)
+        assert self._shards(hot_product_id) == []
+
+    def test_stale_shard_layout_is_reloaded(self, shard_repository, reservation_repository, hot_product_id):
+        from app.infrastructure.cache.stock_shard_cache import stock_shard_cache
+        from app.infrastructure.persistence.stock_shard_repository import sharded_product_layout
+        shard_repository.enable_sharding(hot_product_id, 2)
+        # Simula um processo que ainda não viu o modo sharded do produto
+        stale_layout = {product_id: count for product_id, count in sharded_product_layout().items()
+                        if product_id != hot_product_id}
+        stock_shard_cache.invalidate()
+        stock_shard_cache.get_layout(lambda: stale_layout)
+
+        reservation_repository.reserve(self._reservation({hot_product_id: 3}))
+
+        assert sum(self._shards(hot_product_id)) == 7
+        assert self._product(hot_product_id).stock == 10
+        assert hot_product_id in sharded_product_layout()
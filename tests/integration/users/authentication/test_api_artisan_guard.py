@@ -0,0 +1,127 @@
+import json
+import uuid
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPIArtisanGuard:
+
+    @pytest.fixture
+    def test_ids(self):
+        return {
+            "address_id": str(uuid.uuid4()),
+            "artisan_id": str(uuid.uuid4()),
+            "category_id": str(uuid.uuid4()),
+        }
+
+    @pytest.fixture
+    def valid_address_data(self, test_ids):
+        mock_address = mock_factory.address.create()
+        return {
+            "address_id": test_ids['address_id'],
+            "street": mock_address.street,
+            "number": mock_address.number,
+            "complement": mock_address.complement,
+            "neighborhood": mock_address.neighborhood,
+            "city": mock_address.city,
+            "state": mock_address.state,
+            "zip_code": mock_address.zip_code,
+            "country": mock_address.country
+        }
+
+    @pytest.fixture
+    def valid_user_data(self, test_ids):
+        mock_user = mock_factory.user.create()
+        return {
+            "user_id": test_ids["artisan_id"],
+            "email": mock_user.email,
+            "password_hash": mock_user.password,
+            "address_id": test_ids['address_id']
+        }
+
+    @pytest.fixture
+    def valid_artisan_data(self, test_ids):
+        mock_artisan = mock_factory.artisan.create()
+        return {
+            "artisan_id": test_ids['artisan_id'],
+            "store_name": mock_artisan.store_name,
+            "phone": mock_artisan.phone,
+            "bio": mock_artisan.bio
+        }
+
+    @pytest.fixture
+    def valid_category_data(self, test_ids):
+        mock_category = mock_factory.category.create()
+        return {
+            "category_id": test_ids['category_id'],
+            "name": mock_category.name,
+            "description": mock_category.description
+        }
+
+
+    def _products_url(self, artisan):
+        return f"/api/artisan/{artisan.artisan_id}/products"
+
+    def _import_url(self, artisan):
+        return f"/api/artisan/{artisan.artisan_id}/products/import"
+
+    def _bearer(self, token):
+        return {'Authorization': f"Bearer {token}"}
+
+    def test_requires_a_token(self, client, created_artisan):
+        response = client.post(self._import_url(created_artisan), json=[])
+        assert response.status_code == 401
+
+        response = client.post(self._import_url(created_artisan), json=[], headers=self._bearer("not-a-jwt"))
+        assert response.status_code == 401
+
+    def test_every_write_route_is_guarded(self, client, created_artisan):
+        product_id = str(uuid.uuid4())
+        assert client.post(self._products_url(created_artisan), json={}).status_code == 401
+        assert client.post(self._import_url(created_artisan), json=[]).status_code == 401
+        assert client.post(f"{self._products_url(created_artisan)}/{product_id}/image",
+                           data=b"image", content_type='image/png').status_code == 401
+
+    def test_product_listing_is_public(self, client, created_artisan):
+        # Vitrine: qualquer visitante lista os produtos do artesão, sem token
+        assert client.get(self._products_url(created_artisan)).status_code == 200
+
+    def test_rejects_buyers_and_expired_tokens(self, app, client, created_artisan):
+        import datetime
+        from app.infrastructure.security.jwt_token_service import JwtTokenService
+        artisan_id = created_artisan.artisan_id
+        with app.app_context():
+            buyer_token = JwtTokenService().issue_tokens(artisan_id, 'buyer')['access_token']
+            expired = JwtTokenService(access_ttl=datetime.timedelta(seconds=-1))
+            expired_token = expired.issue_tokens(artisan_id, 'artisan')['access_token']
+
+        url = self._import_url(created_artisan)
+        assert client.post(url, json=[], headers=self._bearer(buyer_token)).status_code == 403
+        assert client.post(url, json=[], headers=self._bearer(expired_token)).status_code == 401
+
+    def test_verified_tokens_skip_the_user_lookup(self, app, client, created_artisan):
+        from sqlalchemy import event
+        from app import db
+        from app.infrastructure.cache.verified_token_cache import verified_token_cache
+        from app.infrastructure.security.jwt_token_service import JwtTokenService
+        url = self._import_url(created_artisan)
+        with app.app_context():
+            headers = self._bearer(JwtTokenService().issue_tokens(created_artisan.artisan_id, 'artisan')['access_token'])
+            engine = db.engine
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            assert client.post(url, json=[], headers=headers).status_code == 200
+            first = len([s for s in statements if 'FROM users' in s])
+            assert client.post(url, json=[], headers=headers).status_code == 200
+            second = len([s for s in statements if 'FROM users' in s]) - first
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert (first, second) == (1, 0)
+        assert verified_token_cache.get(headers['Authorization'].split(' ', 1)[1]) is not None
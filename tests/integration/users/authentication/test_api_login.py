@@ -0,0 +1,76 @@
+import json
+import uuid
+
+import pytest
+
+from tests.integration.conftest import mock_factory
+
+
+class TestAPILogin:
+
+    @pytest.fixture
+    def registered_buyer(self, client, session):
+        mock_buyer = mock_factory.buyer.create()
+        mock_address = mock_factory.address.create()
+        data = {
+            "email": f"login_{uuid.uuid4().hex[:8]}@example.com",
+            "password": "ValidPassword123!",
+            "full_name": mock_buyer.full_name,
+            "address": {
+                "street": mock_address.street,
+                "number": mock_address.number,
+                "neighborhood": mock_address.neighborhood,
+                "city": mock_address.city,
+                "state": mock_address.state,
+                "zip_code": mock_address.zip_code,
+            }
+        }
+        response = client.post('/api/auth/register/buyer', json=data)
+        assert response.status_code == 201
+        return data
+
+    def _stored_hash(self, session, email):
+        from app.infrastructure.persistence.models_db.user_db_model import UserDBModel
+        session.expire_all()
+        return UserDBModel.query.filter_by(email=email).first().password_hash
+
+    def test_registration_stores_a_bcrypt_hash(self, session, registered_buyer):
+        stored = self._stored_hash(session, registered_buyer['email'])
+        assert stored.startswith('$2b$04$')
+        assert registered_buyer['password'] not in stored
+
+    def test_login(self, client, registered_buyer):
+        response = client.post('/api/auth/login', json={"email": registered_buyer['email'],
+                                                        "password": registered_buyer['password']})
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['email'] == registered_buyer['email']
+        assert (data['role'], data['token_type']) == ('buyer', 'Bearer')
+        assert data['access_token'] and data['refresh_token'] and data['expires_in'] > 0
+
+    def test_refresh(self, client, registered_buyer):
+        tokens = json.loads(client.post('/api/auth/login', json={"email": registered_buyer['email'],
+                                                                 "password": registered_buyer['password']}).data)
+
+        response = client.post('/api/auth/refresh', json={"refresh_token": tokens['refresh_token']})
+        assert response.status_code == 200
+        assert json.loads(response.data)['access_token'] != tokens['access_token']
+
+        response = client.post('/api/auth/refresh', json={"refresh_token": tokens['access_token']})
+        assert response.status_code == 401
+
+    def test_login_with_wrong_password(self, client, registered_buyer):
+        response = client.post('/api/auth/login', json={"email": registered_buyer['email'],
+                                                        "password": "WrongPassword123!"})
+        assert response.status_code == 401
+
+    def test_login_rehashes_after_cost_change(self, app, client, session, registered_buyer, monkeypatch):
+        old_hash = self._stored_hash(session, registered_buyer['email'])
+        monkeypatch.setitem(app.config, 'BCRYPT_ROUNDS', 5)
+
+        response = client.post('/api/auth/login', json={"email": registered_buyer['email'],
+                                                        "password": registered_buyer['password']})
+
+        assert response.status_code == 200
+        new_hash = self._stored_hash(session, registered_buyer['email'])
+        assert new_hash != old_hash and new_hash.startswith('$2b$05$')
@@ -98,6 +98,110 @@ class TestBuyerRegistrationIntegration:
         data = json.loads(response.data)
         assert "Email already registered" in data.get('message', '')
 
+    def test_duplicate_email_ignores_case(self, app, client, session, valid_buyer_data):
+        """O índice único no email normalizado recusa o mesmo email com outras maiúsculas, sem SELECT antes do INSERT."""
+        from sqlalchemy import event
+        from app import db
+        assert client.post('/api/auth/register/buyer', json=valid_buyer_data).status_code == 201
+        valid_buyer_data['email'] = valid_buyer_data['email'].upper()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.post('/api/auth/register/buyer', json=valid_buyer_data)
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        assert response.status_code == 400
+        assert json.loads(response.data)['message'] == "Email already registered."
+        users_before_insert = [s for s in statements[:next(i for i, s in enumerate(statements) if s.startswith('INSERT INTO users'))]
+                               if 'FROM users' in s]
+        assert users_before_insert == []
+
+    def test_login_ignores_email_case(self, client, session, valid_buyer_data):
+        assert client.post('/api/auth/register/buyer', json=valid_buyer_data).status_code == 201
+        response = client.post('/api/auth/login', json={"email": f"  {valid_buyer_data['email'].upper()} ",
+                                                        "password": valid_buyer_data['password']})
+        assert response.status_code == 200
+
+    def test_registration_commits_once(self, app, client, session, valid_buyer_data):
+        """Endereço, usuário e comprador são gravados num único commit."""
+        from sqlalchemy import event
+        from app import db
+        commits = []
+
+        def record(conn):
+            commits.append(conn)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'commit', record)
+        try:
+            response = client.post('/api/auth/register/buyer', json=valid_buyer_data)
+        finally:
+            event.remove(engine, 'commit', record)
+
+        assert response.status_code == 201
+        assert len(commits) == 1
+
+    def test_failed_registration_leaves_nothing_behind(self, client, session, valid_buyer_data, monkeypatch):
+        """Se o comprador não pode ser gravado, o endereço e o usuário também não ficam."""
+        from app.infrastructure.persistence.buyer_repository import BuyerRepository
+        from app.infrastructure.persistence.models_db.address_db_model import AddressDBModel
+        from app.infrastructure.persistence.models_db.user_db_model import UserDBModel
+
+        def fail(self, buyer_entity):
+            raise RuntimeError("insert failed")
+
+        monkeypatch.setattr(BuyerRepository, 'create', fail)
+        valid_buyer_data['address']['street'] = f"Rua Atômica {uuid.uuid4().hex[:8]}"
+
+        response = client.post('/api/auth/register/buyer', json=valid_buyer_data)
+
+        assert response.status_code == 500
+        session.expire_all()
+        assert UserDBModel.query.filter_by(email=valid_buyer_data['email']).first() is None
+        assert AddressDBModel.query.filter_by(street=valid_buyer_data['address']['street']).first() is None
+
+    def test_address_reuse_ignores_formatting(self, app, client, session, valid_buyer_data):
+        """O mesmo endereço escrito de outro jeito é encontrado pelo fingerprint, numa consulta ao índice."""
+        from sqlalchemy import event
+        from app import db
+        from app.infrastructure.persistence.models_db.user_db_model import UserDBModel
+        address = valid_buyer_data['address']
+        address['street'] = f"Rua São Jorge {uuid.uuid4().hex[:8]}"
+        assert client.post('/api/auth/register/buyer', json=valid_buyer_data).status_code == 201
+
+        first_email = valid_buyer_data['email']
+        valid_buyer_data['email'] = f"test_{uuid.uuid4().hex[:8]}@example.com"
+        address['street'] = f"  {address['street'].upper().replace('SÃO', 'SAO')} "
+        address['city'] = address['city'].lower()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            assert client.post('/api/auth/register/buyer', json=valid_buyer_data).status_code == 201
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+        session.expire_all()
+        first = UserDBModel.query.filter_by(email=first_email).first()
+        second = UserDBModel.query.filter_by(email=valid_buyer_data['email']).first()
+        assert first.address_id == second.address_id
+        lookups = [s for s in statements if s.startswith('SELECT') and 'FROM addresses' in s]
+        assert len(lookups) == 1 and 'addresses.fingerprint = ' in lookups[0]
+        assert not any(s.startswith('INSERT INTO addresses') for s in statements)
+
     def test_weak_password_validation(self, client, session, valid_buyer_data):
         """Verifica se a API valida senhas fracas."""
         # Arrange
@@ -6,6 +6,8 @@ from app.infrastructure.persistence.user_repository import UserRepository
 from app.infrastructure.persistence.buyer_repository import BuyerRepository
 from app.infrastructure.persistence.address_repository import AddressRepository
 from app.infrastructure.persistence.artisan_repository import ArtisanRepository
+from app.infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
+from app.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from app.presentation.dtos.user_dtos import RegisterBuyerRequest, RegisterAddressRequest
 import sqlalchemy
 from sqlalchemy import exc
@@ -30,7 +32,9 @@ def service(repositories):
         user_repository=repositories['user_repo'],
         buyer_repository=repositories['buyer_repo'],
         address_repository=repositories['address_repo'],
-        artisan_repository=repositories['artisan_repo']
+        artisan_repository=repositories['artisan_repo'],
+        password_hasher=BcryptPasswordHasher(rounds=4),
+        unit_of_work=SqlAlchemyUnitOfWork()
     )
 
 @pytest.fixture
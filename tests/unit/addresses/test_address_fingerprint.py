@@ -0,0 +1,30 @@
+import pytest
+
+from app.domain.models.address import AddressEntity
+
+
+def _address(**overrides):
+    fields = dict(street="Rua São Jorge", number="12", neighborhood="Rio Vermelho", city="Salvador",
+                  state="BA", zip_code="41940-000", country="Brasil", complement="Apto 1")
+    fields.update(overrides)
+    return AddressEntity(**fields)
+
+
+class TestAddressFingerprint:
+
+    def test_ignores_case_accents_spacing_and_zip_punctuation(self):
+        same = _address(street="  rua sao   JORGE ", neighborhood="rio vermelho", city="SALVADOR", state="ba",
+                        zip_code="41940000")
+        assert same.fingerprint() == _address().fingerprint()
+
+    def test_ignores_complement_and_country(self):
+        assert _address(complement=None, country="Brazil").fingerprint() == _address().fingerprint()
+
+    @pytest.mark.parametrize("field, value", [("street", "Rua São Bento"), ("number", "13"), ("number", None),
+                                              ("neighborhood", "Centro"), ("city", "Lauro de Freitas"),
+                                              ("state", "SE"), ("zip_code", "41940-001")])
+    def test_identifying_fields_change_it(self, field, value):
+        assert _address(**{field: value}).fingerprint() != _address().fingerprint()
+
+    def test_fields_do_not_run_into_each_other(self):
+        assert _address(street="Rua 1", number="2").fingerprint() != _address(street="Rua", number="1 2").fingerprint()
@@ -0,0 +1,143 @@
+import pytest
+from unittest.mock import Mock
+
+from app.infrastructure.cache.cart_change_buffer import CartChange, CartChangeBuffer, apply_change, combine_changes
+from app.infrastructure.persistence.cart_repository import CartRepository
+from app.infrastructure.persistence.write_behind_cart_repository import WriteBehindCartRepository
+
+
+def ADD(quantity):
+    return CartChange(replace=False, quantity=quantity)
+
+
+def SET(quantity):
+    return CartChange(replace=True, quantity=quantity)
+
+
+class TestCartChangeBuffer:
+
+    @pytest.mark.parametrize("older, newer, expected", [
+        (None, ADD(2), ADD(2)),
+        (ADD(2), ADD(3), ADD(5)),
+        (SET(4), ADD(1), SET(5)),
+        (ADD(4), SET(1), SET(1)),
+        (SET(0), ADD(2), SET(2)),
+        (ADD(2), SET(0), SET(0)),
+        (ADD(60), ADD(60), ADD(99)),
+        (SET(98), ADD(5), SET(99)),
+    ])
+    def test_changes_are_combined(self, older, newer, expected):
+        assert combine_changes(older, newer) == expected
+
+    def test_apply_change(self):
+        assert apply_change(None, ADD(2)) == 2
+        assert apply_change(3, ADD(2)) == 5
+        assert apply_change(3, SET(1)) == 1
+        assert apply_change(3, SET(0)) == 0
+        assert apply_change(98, ADD(5)) == 99
+
+    def test_changes_of_a_line_are_coalesced(self):
+        buffer = CartChangeBuffer()
+        for _ in range(5):
+            buffer.record("b1", "p1", ADD(1))
+        buffer.record("b1", "p2", SET(3))
+
+        assert buffer.changes_for("b1") == {"p1": ADD(5), "p2": SET(3)}
+        assert buffer.changes_for("b2") == {}
+        assert buffer.pending_buyers() == 1
+
+    def test_full_buffer_requests_a_flush(self):
+        buffer = CartChangeBuffer(max_pending_buyers=2)
+        buffer.record("b1", "p1", ADD(1))
+        assert not buffer.flush_requested.is_set()
+        buffer.record("b2", "p1", ADD(1))
+        assert buffer.flush_requested.is_set()
+
+    def test_changes_stay_visible_while_flushing(self):
+        buffer = CartChangeBuffer()
+        buffer.record("b1", "p1", ADD(2))
+
+        with buffer.flushing() as changes:
+            assert changes == {"b1": {"p1": ADD(2)}}
+            buffer.record("b1", "p1", ADD(1))
+            assert buffer.changes_for("b1") == {"p1": ADD(3)}
+
+        assert buffer.changes_for("b1") == {"p1": ADD(1)}
+
+    def test_failed_flush_puts_back_what_was_not_written(self):
+        buffer = CartChangeBuffer()
+        buffer.record("b1", "p1", ADD(2))
+        buffer.record("b2", "p1", SET(4))
+
+        with pytest.raises(RuntimeError):
+            with buffer.flushing():
+                buffer.mark_flushed(["b1"])
+                buffer.record("b2", "p1", ADD(1))
+                raise RuntimeError("database down")
+
+        assert buffer.changes_for("b1") == {}
+        assert buffer.changes_for("b2") == {"p1": SET(5)}
+
+    def test_flushing_one_buyer_keeps_the_others(self):
+        buffer = CartChangeBuffer()
+        buffer.record("b1", "p1", ADD(1))
+        buffer.record("b2", "p1", ADD(1))
+
+        with buffer.flushing("b1") as changes:
+            assert list(changes) == ["b1"]
+
+        assert buffer.changes_for("b1") == {}
+        assert buffer.changes_for("b2") == {"p1": ADD(1)}
+
+
+class TestWriteBehindCartRepository:
+
+    @pytest.fixture
+    def database_repository(self):
+        return Mock(spec=CartRepository)
+
+    @pytest.fixture
+    def buffer(self):
+        buffer = CartChangeBuffer()
+        buffer.configure(enabled=True)
+        return buffer
+
+    def test_disabled_buffer_writes_straight_to_the_database(self, database_repository):
+        repository = WriteBehindCartRepository(database_repository, buffer=CartChangeBuffer())
+
+        repository.add_item("b1", "p1", 2)
+
+        database_repository.add_item.assert_called_once_with("b1", "p1", 2)
+
+    def test_changes_are_buffered_and_flushed_in_batches(self, database_repository, buffer):
+        repository = WriteBehindCartRepository(database_repository, buffer=buffer, batch_size=2)
+        for buyer_id in ("b1", "b2", "b3"):
+            repository.add_item(buyer_id, "p1", 1)
+            repository.add_item(buyer_id, "p1", 1)
+        database_repository.add_item.assert_not_called()
+
+        assert repository.flush() == 3
+        assert database_repository.apply_changes.call_count == 2
+        database_repository.apply_changes.assert_any_call({"b1": {"p1": ADD(2)}, "b2": {"p1": ADD(2)}})
+        assert buffer.pending_buyers() == 0
+
+    def test_update_of_a_line_not_in_the_cart_is_refused(self, database_repository, buffer):
+        database_repository.has_item.return_value = False
+        repository = WriteBehindCartRepository(database_repository, buffer=buffer)
+
+        assert repository.set_item_quantity("b1", "p1", 3) is False
+        repository.add_item("b1", "p1", 1)
+        assert repository.set_item_quantity("b1", "p1", 3) is True
+        assert repository.remove_item("b1", "p1") is True
+        assert repository.remove_item("b1", "p1") is False
+        assert buffer.changes_for("b1") == {"p1": SET(0)}
+
+    def test_failed_flush_keeps_the_changes(self, database_repository, buffer):
+        database_repository.apply_changes.side_effect = RuntimeError("database down")
+        repository = WriteBehindCartRepository(database_repository, buffer=buffer)
+        repository.add_item("b1", "p1", 2)
+
+        with pytest.raises(RuntimeError):
+            repository.flush()
+
+        assert buffer.changes_for("b1") == {"p1": ADD(2)}
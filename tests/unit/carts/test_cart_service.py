@@ -0,0 +1,91 @@
+from decimal import Decimal
+import pytest
+from unittest.mock import Mock
+
+from app.application.services.cart_service import CartService
+from app.common.exceptions import CartItemNotFoundError, ProductNotFoundError
+from app.domain.models.cart import CartEntity, CartItemEntity
+from app.domain.models.category import CategoryEntity
+from app.domain.models.product import ProductEntity
+from app.domain.repositories.cart_repository_interface import ICartRepository
+from app.domain.repositories.product_repository_interface import IProductRepository
+from app.presentation.dtos.cart_dtos import AddCartItemRequest, UpdateCartItemRequest
+
+
+class TestCartService:
+
+    @pytest.fixture
+    def cart_repository(self):
+        return Mock(spec=ICartRepository)
+
+    @pytest.fixture
+    def product_repository(self):
+        return Mock(spec=IProductRepository)
+
+    @pytest.fixture
+    def service(self, cart_repository, product_repository):
+        return CartService(cart_repository, product_repository)
+
+    @pytest.fixture
+    def product(self):
+        return ProductEntity(product_id="p1", name="Vaso", price=Decimal("20.00"), stock=5,
+                             category_id="c1", status="active", artisan_id="a1")
+
+    def test_buyer_without_cart_gets_an_empty_cart(self, service, cart_repository):
+        cart_repository.get_by_buyer_id.return_value = None
+
+        cart = service.get_cart("b1")
+
+        assert cart.buyer_id == "b1"
+        assert cart.cart_id is None
+        assert cart.items == []
+        assert cart.total_value == 0
+
+    def test_cart_uses_the_totals_of_the_repository(self, service, cart_repository, product):
+        item = CartItemEntity(product_id="p1", quantity=2, cart_item_id="i1", product=product,
+                              category=CategoryEntity(category_id="c1", name="Cerâmica"), line_total=Decimal("40.00"))
+        cart_repository.get_by_buyer_id.return_value = CartEntity(
+            buyer_id="b1", cart_id="cart1", items=[item], total_quantity=2, total_value=Decimal("40.00"))
+
+        cart = service.get_cart("b1")
+
+        assert cart.total_quantity == 2
+        assert cart.total_value == 40.0
+        assert cart.items[0].unit_price == 20.0
+        assert cart.items[0].line_total == 40.0
+        assert cart.items[0].category.name == "Cerâmica"
+
+    def test_add_item_adds_the_quantity_and_reloads_the_cart(self, service, cart_repository, product_repository, product):
+        product_repository.get_product_by_id.return_value = product
+        cart_repository.get_by_buyer_id.return_value = None
+
+        service.add_item("b1", AddCartItemRequest(product_id="p1", quantity=3))
+
+        cart_repository.add_item.assert_called_once_with("b1", "p1", 3)
+        cart_repository.get_by_buyer_id.assert_called_once_with("b1")
+
+    @pytest.mark.parametrize("status", ["inactive", "INACTIVE"])
+    def test_inactive_products_cannot_be_added(self, service, cart_repository, product_repository, product, status):
+        product.status = status
+        product_repository.get_product_by_id.return_value = product
+
+        with pytest.raises(ProductNotFoundError):
+            service.add_item("b1", AddCartItemRequest(product_id="p1"))
+        cart_repository.add_item.assert_not_called()
+
+    def test_unknown_products_cannot_be_added(self, service, cart_repository, product_repository):
+        product_repository.get_product_by_id.return_value = None
+
+        with pytest.raises(ProductNotFoundError):
+            service.add_item("b1", AddCartItemRequest(product_id="missing"))
+        cart_repository.add_item.assert_not_called()
+
+    def test_update_and_remove_report_missing_items(self, service, cart_repository):
+        cart_repository.set_item_quantity.return_value = False
+        cart_repository.remove_item.return_value = False
+
+        with pytest.raises(CartItemNotFoundError):
+            service.update_item("b1", "p1", UpdateCartItemRequest(quantity=2))
+        with pytest.raises(CartItemNotFoundError):
+            service.remove_item("b1", "p1")
+        cart_repository.get_by_buyer_id.assert_not_called()
@@ -0,0 +1,87 @@
+import uuid
+from app.domain.models.category import CategoryEntity
+from app.infrastructure.cache.category_cache import CategoryCache
+from app.infrastructure.persistence.category_repository import CategoryRepository
+
+
+def make_category(name='Cerâmica'):
+    return CategoryEntity(category_id=str(uuid.uuid4()), name=name, description=None)
+
+
+class TestCategoryCache:
+    """Testes para o cache de categorias em memória."""
+
+    def test_warm_and_hit(self):
+        cache = CategoryCache()
+        category = make_category()
+        cache.warm([category])
+
+        assert cache.is_warm
+        assert cache.get(category.category_id) is category
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 0
+
+    def test_miss_is_counted(self):
+        cache = CategoryCache()
+        cache.warm([])
+
+        assert cache.get(str(uuid.uuid4())) is None
+        assert cache.stats()['misses'] == 1
+
+    def test_get_many_splits_found_and_missing(self):
+        cache = CategoryCache()
+        cached = make_category()
+        missing_id = str(uuid.uuid4())
+        cache.warm([cached])
+
+        found, missing = cache.get_many([cached.category_id, missing_id])
+
+        assert found == [cached]
+        assert missing == [missing_id]
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_put_with_stale_version_is_ignored(self):
+        """Um leitor que consultou o banco antes de uma invalidação não repopula o cache."""
+        cache = CategoryCache()
+        version_seen = cache.version
+        cache.invalidate()
+
+        assert cache.put(make_category(), expected_version=version_seen) is False
+        assert cache.stats()['size'] == 0
+
+    def test_every_write_bumps_version(self):
+        cache = CategoryCache()
+        versions = [cache.version]
+        cache.warm([])
+        versions.append(cache.version)
+        cache.put(make_category())
+        versions.append(cache.version)
+        cache.invalidate()
+        versions.append(cache.version)
+
+        assert versions == sorted(set(versions))
+
+
+class TestCategoryRepositoryCacheHit:
+    """Leituras servidas pelo cache não precisam de banco de dados."""
+
+    def test_get_by_id_served_from_cache(self):
+        cache = CategoryCache()
+        category = make_category()
+        cache.warm([category])
+        repository = CategoryRepository(cache=cache)
+
+        assert repository.get_by_id(category.category_id) is category
+        assert cache.stats()['hits'] == 1
+
+    def test_get_many_by_ids_served_from_cache(self):
+        cache = CategoryCache()
+        categories = [make_category('Madeira'), make_category('Têxtil')]
+        cache.warm(categories)
+        repository = CategoryRepository(cache=cache)
+
+        result = repository.get_many_by_ids([c.category_id for c in categories])
+
+        assert sorted(c.category_id for c in result) == sorted(c.category_id for c in categories)
+        assert cache.stats()['misses'] == 0
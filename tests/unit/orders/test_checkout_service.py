@@ -0,0 +1,73 @@
+from decimal import Decimal
+import pytest
+from unittest.mock import Mock
+
+from app.application.services.checkout_service import CheckoutService
+from app.application.services.stock_reservation_service import StockReservationService
+from app.common.exceptions import EmptyCartError, InsufficientStockError
+from app.domain.models.order import OrderEntity, OrderItemEntity
+from app.domain.repositories.cart_repository_interface import ICartRepository
+from app.domain.repositories.order_repository_interface import IOrderRepository
+from app.presentation.dtos.order_dtos import CheckoutRequest
+
+
+class TestCheckoutService:
+
+    @pytest.fixture
+    def cart_repository(self):
+        return Mock(spec=ICartRepository)
+
+    @pytest.fixture
+    def order_repository(self):
+        return Mock(spec=IOrderRepository)
+
+    @pytest.fixture
+    def reservation_service(self):
+        return Mock(spec=StockReservationService)
+
+    @pytest.fixture
+    def service(self, cart_repository, order_repository, reservation_service):
+        return CheckoutService(cart_repository, order_repository, reservation_service)
+
+    @pytest.fixture
+    def order(self):
+        item = OrderItemEntity(product_id="p1", quantity=3, unit_price=Decimal("12.50"), order_item_id="i1")
+        return OrderEntity(buyer_id="b1", payment_method="pix", total_value=Decimal("37.50"),
+                           order_id="o1", items=[item])
+
+    def test_checkout_flushes_the_cart_before_creating_the_order(self, service, cart_repository,
+                                                                   order_repository, order):
+        calls = []
+        cart_repository.flush.side_effect = lambda buyer_id: calls.append('flush')
+        order_repository.create_from_cart.side_effect = lambda buyer_id, method: calls.append('order') or order
+
+        response = service.checkout("b1", CheckoutRequest(payment_method="pix"))
+
+        assert calls == ['flush', 'order']
+        cart_repository.flush.assert_called_once_with("b1")
+        order_repository.create_from_cart.assert_called_once_with("b1", "pix")
+        assert response.total_value == 37.5
+        assert response.items[0].line_total == 37.5
+
+    def test_checkout_retries_after_releasing_expired_reservations(self, service, order_repository,
+                                                                  reservation_service, order):
+        order_repository.create_from_cart.side_effect = [InsufficientStockError(["p1"]), order]
+        reservation_service.release_expired.return_value = 1
+
+        assert service.checkout("b1", CheckoutRequest(payment_method="pix")).order_id == "o1"
+        reservation_service.release_expired.assert_called_once_with(product_ids=["p1"])
+
+    def test_checkout_without_stock_and_nothing_expired(self, service, order_repository, reservation_service):
+        order_repository.create_from_cart.side_effect = InsufficientStockError(["p1"])
+        reservation_service.release_expired.return_value = 0
+
+        with pytest.raises(InsufficientStockError):
+            service.checkout("b1", CheckoutRequest(payment_method="pix"))
+        assert order_repository.create_from_cart.call_count == 1
+
+    def test_empty_cart_is_not_retried(self, service, order_repository, reservation_service):
+        order_repository.create_from_cart.side_effect = EmptyCartError()
+
+        with pytest.raises(EmptyCartError):
+            service.checkout("b1", CheckoutRequest(payment_method="boleto"))
+        reservation_service.release_expired.assert_not_called()
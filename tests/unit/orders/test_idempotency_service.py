@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.application.services.idempotency_service import IdempotencyService
+from app.common.exceptions import IdempotencyKeyInProgressError, IdempotencyKeyReusedError
+from app.domain.models.idempotency_record import IdempotencyRecordEntity
+from app.domain.repositories.idempotency_key_repository_interface import IIdempotencyKeyRepository
+from app.infrastructure.cache.idempotency_cache import IdempotencyResponseCache
+
+BODY = {'payment_method': 'pix'}
+
+
+def completed_record(request_hash, expires_at=None):
+    return IdempotencyRecordEntity("checkout:b1", "k1", request_hash,
+                                   expires_at=expires_at or datetime.utcnow() + timedelta(hours=1),
+                                   status=IdempotencyRecordEntity.COMPLETED,
+                                   response_status=201, response_body={'order_id': 'o1'})
+
+
+class TestIdempotencyService:
+
+    @pytest.fixture
+    def repository(self):
+        repository = Mock(spec=IIdempotencyKeyRepository)
+        repository.claim.return_value = None
+        return repository
+
+    @pytest.fixture
+    def service(self, repository):
+        return IdempotencyService(repository, key_ttl=timedelta(hours=2))
+
+    def test_first_request_runs_the_action_and_stores_the_response(self, service, repository):
+        action = Mock(return_value=({'order_id': 'o1'}, 201))
+
+        record, replayed = service.execute("checkout:b1", "k1", BODY, action)
+
+        assert replayed is False
+        action.assert_called_once()
+        repository.complete.assert_called_once_with(record)
+        assert (record.response_status, record.response_body) == (201, {'order_id': 'o1'})
+        assert timedelta(hours=1, minutes=59) < record.expires_at - datetime.utcnow() <= timedelta(hours=2)
+
+    def test_repeated_request_gets_the_stored_response(self, service, repository):
+        repository.claim.return_value = completed_record(IdempotencyService.request_hash(BODY))
+        action = Mock()
+
+        record, replayed = service.execute("checkout:b1", "k1", {'payment_method': 'pix'}, action)
+
+        assert replayed is True
+        assert record.response_body == {'order_id': 'o1'}
+        action.assert_not_called()
+        repository.complete.assert_not_called()
+
+    def test_key_with_another_body_is_rejected(self, service, repository):
+        repository.claim.return_value = completed_record(IdempotencyService.request_hash({'payment_method': 'boleto'}))
+
+        with pytest.raises(IdempotencyKeyReusedError):
+            service.execute("checkout:b1", "k1", BODY, Mock())
+
+    def test_key_of_a_running_request_is_rejected(self, service, repository):
+        repository.claim.return_value = IdempotencyRecordEntity(
+            "checkout:b1", "k1", IdempotencyService.request_hash(BODY), expires_at=datetime.utcnow())
+
+        with pytest.raises(IdempotencyKeyInProgressError):
+            service.execute("checkout:b1", "k1", BODY, Mock())
+
+    def test_failed_action_releases_the_key(self, service, repository):
+        action = Mock(side_effect=ValueError("The cart is empty"))
+
+        with pytest.raises(ValueError):
+            service.execute("checkout:b1", "k1", BODY, action)
+
+        repository.release.assert_called_once_with("checkout:b1", "k1")
+        repository.complete.assert_not_called()
+
+    def test_response_that_cannot_be_stored_is_still_returned(self, service, repository):
+        repository.complete.side_effect = RuntimeError("database unavailable")
+        action = Mock(return_value=({'order_id': 'o1'}, 201))
+
+        record, replayed = service.execute("checkout:b1", "k1", BODY, action)
+
+        assert (record.response_body, replayed) == ({'order_id': 'o1'}, False)
+        assert repository.complete.call_count == 2
+        # A ação já rodou: a chave não é liberada para ela rodar de novo
+        repository.release.assert_not_called()
+
+    @pytest.mark.parametrize("key", ["", "k" * 256, "chave-com-acentuação", "tab\tkey"])
+    def test_invalid_keys_are_rejected(self, service, repository, key):
+        with pytest.raises(ValueError):
+            service.execute("checkout:b1", key, BODY, Mock())
+        repository.claim.assert_not_called()
+
+    def test_request_hash_ignores_the_key_order(self):
+        assert IdempotencyService.request_hash({'a': 1, 'b': 2}) == IdempotencyService.request_hash({'b': 2, 'a': 1})
+        assert IdempotencyService.request_hash({'a': 1}) != IdempotencyService.request_hash({'a': 2})
+
+    def test_purge_deletes_in_batches(self, service, repository):
+        repository.delete_expired.side_effect = [2, 2, 1]
+
+        assert service.purge_expired(batch_size=2) == 5
+        assert repository.delete_expired.call_count == 3
+
+
+class TestIdempotencyResponseCache:
+
+    def test_only_completed_records_are_cached(self):
+        cache = IdempotencyResponseCache()
+        cache.put(IdempotencyRecordEntity("s", "k1", "h", expires_at=datetime.utcnow() + timedelta(hours=1)))
+        cache.put(completed_record("h"))
+
+        assert cache.get("s", "k1") is None
+        assert cache.get("checkout:b1", "k1").response_body == {'order_id': 'o1'}
+
+    def test_expired_records_are_dropped(self):
+        now = datetime(2026, 1, 1, 12, 0)
+        cache = IdempotencyResponseCache(clock=lambda: now)
+        cache.put(completed_record("h", expires_at=now))
+
+        assert cache.get("checkout:b1", "k1") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = IdempotencyResponseCache(max_size=2)
+        for key in ("k1", "k2"):
+            record = completed_record("h")
+            record.idempotency_key = key
+            cache.put(record)
+        cache.get("checkout:b1", "k1")
+        record = completed_record("h")
+        record.idempotency_key = "k3"
+        cache.put(record)
+
+        assert cache.get("checkout:b1", "k2") is None
+        assert cache.get("checkout:b1", "k1") is not None
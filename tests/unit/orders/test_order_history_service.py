@@ -0,0 +1,51 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+from app.application.services.order_history_service import MAX_PAGE_SIZE, OrderHistoryService
+from app.common.utils import decode_keyset_cursor, encode_keyset_cursor
+from app.domain.models.order import OrderEntity
+from app.domain.repositories.order_repository_interface import IOrderRepository
+
+
+def make_order(index):
+    return OrderEntity(buyer_id="b1", payment_method="pix", total_value=Decimal("10.00"),
+                       order_id=f"o{index}", order_date=datetime(2026, 1, 1, 12, index))
+
+
+class TestOrderHistoryService:
+
+    @pytest.fixture
+    def repository(self):
+        return Mock(spec=IOrderRepository)
+
+    @pytest.fixture
+    def service(self, repository):
+        return OrderHistoryService(repository)
+
+    def test_full_page_returns_the_cursor_of_its_last_order(self, service, repository):
+        repository.find_page_by_buyer_id.return_value = [make_order(3), make_order(2), make_order(1)]
+
+        orders, next_cursor = service.get_orders_page("b1", limit=2)
+
+        repository.find_page_by_buyer_id.assert_called_once_with("b1", limit=3, before=None)
+        assert [order.order_id for order in orders] == ["o3", "o2"]
+        assert decode_keyset_cursor(next_cursor) == (datetime(2026, 1, 1, 12, 2), "o2")
+
+    def test_last_page_has_no_cursor(self, service, repository):
+        repository.find_page_by_buyer_id.return_value = [make_order(1)]
+        cursor = encode_keyset_cursor(datetime(2026, 1, 1, 12, 2), "o2")
+
+        orders, next_cursor = service.get_orders_page("b1", limit=2, cursor=cursor)
+
+        repository.find_page_by_buyer_id.assert_called_once_with(
+            "b1", limit=3, before=(datetime(2026, 1, 1, 12, 2), "o2"))
+        assert len(orders) == 1
+        assert next_cursor is None
+
+    @pytest.mark.parametrize("limit, cursor", [(0, None), (MAX_PAGE_SIZE + 1, None), (10, "%%%")])
+    def test_invalid_page_parameters(self, service, repository, limit, cursor):
+        with pytest.raises(ValueError):
+            service.get_orders_page("b1", limit=limit, cursor=cursor)
+        repository.find_page_by_buyer_id.assert_not_called()
@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import Mock
+from app.application.services.product_browse_service import (
+    ProductBrowseService, PRICE_BUCKET_BOUNDS, MAX_BROWSE_PAGE_SIZE
+)
+from app.domain.models.product_filter import ProductFilter
+from app.domain.repositories.product_repository_interface import IProductRepository
+from app.domain.repositories.category_repository_interface import ICategoryRepository
+from tests.unit.products.base_product_test import mock_factory
+
+
+class TestProductBrowse:
+    """Testes para o browse de produtos usando o ProductBrowseService."""
+
+    @pytest.fixture
+    def product_repo(self):
+        return Mock(spec=IProductRepository)
+
+    @pytest.fixture
+    def category_repo(self):
+        return Mock(spec=ICategoryRepository)
+
+    @pytest.fixture
+    def service(self, product_repo, category_repo):
+        return ProductBrowseService(product_repository=product_repo, category_repository=category_repo)
+
+    @pytest.fixture
+    def categories(self):
+        return [mock_factory.category.create(), mock_factory.category.create()]
+
+    def test_browse_returns_page_and_facets(self, service, product_repo, category_repo, categories):
+        first, second = categories
+        product_repo.count_facets.return_value = {
+            'categories': {first.category_id: 2, second.category_id: 3},
+            'price_buckets': {0: 4, len(PRICE_BUCKET_BOUNDS): 1},
+        }
+        product_repo.find_with_categories_by_filter.return_value = [
+            (mock_factory.product.create(category_id=second.category_id), second) for _ in range(2)
+        ]
+        category_repo.get_many_by_ids.return_value = categories
+        product_filter = ProductFilter(min_price=10)
+
+        result = service.browse_products(product_filter, page=2, page_size=2, sort='price_asc')
+
+        assert result.total == 5
+        assert result.has_next is True
+        assert len(result.items) == 2
+        assert [(facet.category_id, facet.name, facet.count) for facet in result.facets.categories] == [
+            (second.category_id, second.name, 3), (first.category_id, first.name, 2)
+        ]
+        assert len(result.facets.price_ranges) == len(PRICE_BUCKET_BOUNDS) + 1
+        assert result.facets.price_ranges[0].count == 4
+        assert result.facets.price_ranges[-1].max_price is None
+        assert result.facets.price_ranges[-1].count == 1
+        product_repo.count_facets.assert_called_once_with(product_filter, PRICE_BUCKET_BOUNDS)
+        product_repo.find_with_categories_by_filter.assert_called_once_with(
+            product_filter, limit=2, offset=2, sort='price_asc'
+        )
+
+    def test_page_past_the_end_skips_items_query(self, service, product_repo, category_repo, categories):
+        product_repo.count_facets.return_value = {'categories': {categories[0].category_id: 1}, 'price_buckets': {0: 1}}
+        category_repo.get_many_by_ids.return_value = categories[:1]
+
+        result = service.browse_products(ProductFilter(), page=3, page_size=10)
+
+        assert result.items == []
+        assert result.has_next is False
+        product_repo.find_with_categories_by_filter.assert_not_called()
+
+    @pytest.mark.parametrize("product_filter, page, page_size, sort", [
+        (ProductFilter(min_price=-1), 1, 10, 'newest'),
+        (ProductFilter(min_price=50, max_price=10), 1, 10, 'newest'),
+        (ProductFilter(status='inactive'), 1, 10, 'newest'),
+        (ProductFilter(), 0, 10, 'newest'),
+        (ProductFilter(), 1, MAX_BROWSE_PAGE_SIZE + 1, 'newest'),
+        (ProductFilter(), 1, 10, 'name'),
+    ])
+    def test_invalid_parameters(self, service, product_repo, product_filter, page, page_size, sort):
+        with pytest.raises(ValueError):
+            service.browse_products(product_filter, page=page, page_size=page_size, sort=sort)
+        product_repo.count_facets.assert_not_called()
@@ -1,5 +1,6 @@
 import pytest
 # Importar apenas a classe BaseProductTest
+from app.common.exceptions import ArtisanNotFoundError, DuplicateProductError
 from app.presentation.dtos.product_dtos import RegisterProductRequest
 from tests.unit.products.base_product_test import BaseProductTest
 
@@ -64,8 +65,6 @@ class TestProductCreation(BaseProductTest):
                 **request
             )
         )
-        # Mock get_artisan_product_by_name to simulate no existing product with the same name
-        mock_repositories['product_repo'].get_artisan_product_by_name.return_value = None
         request = RegisterProductRequest(**data)
         # Act
         result = service.create_artisan_product(artisan_id, request)
@@ -75,10 +74,11 @@ class TestProductCreation(BaseProductTest):
         assert result.product_id == test_ids['product_id']
         assert result.name == valid_product_request[1]['name']
         
-        # Verify repository calls
-        mock_repositories['artisan_repo'].get_artisan_by_id.assert_called_once_with(valid_product_request[0])
+        # Verify repository calls: artesão e nome duplicado ficam a cargo das constraints do banco
         mock_repositories['category_repo'].get_by_id.assert_called_once_with(test_ids['category_id'])
         mock_repositories['product_repo'].create.assert_called_once()
+        mock_repositories['artisan_repo'].get_artisan_by_id.assert_not_called()
+        mock_repositories['product_repo'].get_artisan_product_by_name.assert_not_called()
     
     def test_create_product_with_invalid_price(self, service, mock_repositories, valid_product_request):
         """Testa a criação de um produto com preço inválido."""
@@ -113,9 +113,23 @@ class TestProductCreation(BaseProductTest):
     def test_create_product_with_nonexistent_artisan(self, service, mock_repositories, valid_product_request):
         """Testa a criação de um produto para um artesão que não existe."""
         # Arrange
-        mock_repositories['category_repo'].get_by_id.return_value = None
+        from tests.unit.products.base_product_test import mock_factory
+        mock_repositories['category_repo'].get_by_id.return_value = mock_factory.category.create()
+        mock_repositories['product_repo'].create.side_effect = ArtisanNotFoundError()
         artisan_id, product_data = valid_product_request
         
         request = RegisterProductRequest(**product_data)
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Artisan not found"):
+            service.create_artisan_product(artisan_id, request)
+
+    def test_create_product_with_duplicated_name(self, service, mock_repositories, valid_product_request):
+        """Testa a criação de um produto com nome já usado pelo artesão (violação da constraint única)."""
+        # Arrange
+        from tests.unit.products.base_product_test import mock_factory
+        mock_repositories['category_repo'].get_by_id.return_value = mock_factory.category.create()
+        mock_repositories['product_repo'].create.side_effect = DuplicateProductError()
+        artisan_id, product_data = valid_product_request
+
+        request = RegisterProductRequest(**product_data)
+        with pytest.raises(DuplicateProductError, match="already exists"):
             service.create_artisan_product(artisan_id, request)
\ No newline at end of file
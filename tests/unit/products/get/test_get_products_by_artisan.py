@@ -1,5 +1,7 @@
 import pytest
 import uuid
+from datetime import datetime
+from app.common.utils import encode_keyset_cursor, decode_keyset_cursor
 from app.presentation.dtos.product_dtos import CategoryDTO
 from tests.unit.products.base_product_test import mock_factory, BaseProductTest
 
@@ -19,7 +21,7 @@ class TestGetProductsByArtisan(BaseProductTest):
         
         # Configure o mock do product_repo para retornar esta lista
         mock_repositories['product_repo'].find_by_artisan_id.return_value = [product1]
-        mock_repositories['category_repo'].get_by_id.return_value = mock_entities['category']
+        mock_repositories['category_repo'].get_many_by_ids.return_value = [mock_entities['category']]
         # ACT
         # Chame o método correto no serviço: get_all_products_by_artisan
         products = service.get_all_products_by_artisan(artisan_id_to_find)
@@ -47,7 +49,25 @@ class TestGetProductsByArtisan(BaseProductTest):
         
         # Verifica se o método find_by_artisan_id do repositório foi chamado corretamente
         mock_repositories['product_repo'].find_by_artisan_id.assert_called_once_with(artisan_id_to_find)
-        mock_repositories['category_repo'].get_by_id.assert_called_once_with(category_id_for_product) # Passa o ID real
+        mock_repositories['category_repo'].get_many_by_ids.assert_called_once_with([category_id_for_product]) # Uma única consulta para todas as categorias
+
+    def test_get_all_products_fetches_categories_in_one_call(self, service, mock_repositories, test_ids):
+        """Produtos de categorias diferentes resolvem todas as categorias em uma única chamada."""
+        categories = mock_factory.category.create_many(3)
+        products = [
+            mock_factory.product.create(artisan_id=test_ids['artisan_id'], category_id=category.category_id)
+            for category in categories
+        ]
+        mock_repositories['product_repo'].find_by_artisan_id.return_value = products
+        mock_repositories['category_repo'].get_many_by_ids.return_value = categories
+
+        responses = service.get_all_products_by_artisan(test_ids['artisan_id'])
+
+        assert [r.category.category_id for r in responses] == [c.category_id for c in categories]
+        mock_repositories['category_repo'].get_many_by_ids.assert_called_once()
+        args, _ = mock_repositories['category_repo'].get_many_by_ids.call_args
+        assert sorted(args[0]) == sorted(c.category_id for c in categories)
+        mock_repositories['category_repo'].get_by_id.assert_not_called()
 
     def test_get_all_products_by_artisan_no_products(self, service, mock_repositories, test_ids):
         """Testa a obtenção de produtos quando não há produtos para o artesão."""
@@ -73,7 +93,7 @@ class TestGetProductsByArtisan(BaseProductTest):
         mock_repositories['product_repo'].find_by_artisan_id.assert_called_once_with(artisan_id_to_find)
         mock_repositories['artisan_repo'].get_artisan_by_id.assert_called_once_with(artisan_id_to_find)
         # O repositório de categoria NÃO deve ser chamado se não há produtos
-        mock_repositories['category_repo'].get_by_id.assert_not_called()
+        mock_repositories['category_repo'].get_many_by_ids.assert_not_called()
         
     def test_get_all_products_by_artisan_invalid_artisan(self, service, mock_repositories):
         """Testa a obtenção de produtos quando o ID do artesão é inválido."""
@@ -91,4 +111,94 @@ class TestGetProductsByArtisan(BaseProductTest):
         mock_repositories['artisan_repo'].get_artisan_by_id.assert_called_once_with(invalid_artisan_id)
         # O repositório de produtos e categorias NÃO deve ser chamado se o artesão não existe
         mock_repositories['product_repo'].find_by_artisan_id.assert_not_called()
-        mock_repositories['category_repo'].get_by_id.assert_not_called()
\ No newline at end of file
+        mock_repositories['category_repo'].get_many_by_ids.assert_not_called()
+
+class TestGetProductsPageByArtisan(BaseProductTest):
+    """Testes para a listagem paginada (keyset) de produtos do artesão."""
+
+    def test_first_page_returns_next_cursor(self, service, mock_repositories, mock_entities, test_ids):
+        """Quando há mais produtos que o limite, retorna o cursor da próxima página."""
+        products = mock_factory.product.create_many(3, artisan_id=test_ids['artisan_id'], category_id=test_ids['category_id'])
+        mock_repositories['product_repo'].find_with_categories_by_artisan_id.return_value = [
+            (product, mock_entities['category']) for product in products
+        ]
+
+        page, next_cursor = service.get_products_page_by_artisan(test_ids['artisan_id'], limit=2)
+
+        assert [p['product_id'] for p in page] == [p.product_id for p in products[:2]]
+        assert next_cursor is not None
+        assert decode_keyset_cursor(next_cursor) == (products[1].registration_date, products[1].product_id)
+        assert page[0]['category']['name'] == mock_entities['category'].name
+        # Pede um item a mais para saber se existe próxima página
+        mock_repositories['product_repo'].find_with_categories_by_artisan_id.assert_called_once_with(test_ids['artisan_id'], limit=3, after=None)
+        # A categoria vem na mesma consulta dos produtos
+        mock_repositories['category_repo'].get_many_by_ids.assert_not_called()
+        mock_repositories['product_repo'].find_by_artisan_id.assert_not_called()
+
+    def test_last_page_has_no_cursor(self, service, mock_repositories, mock_entities, test_ids):
+        """A última página não retorna cursor."""
+        products = mock_factory.product.create_many(2, artisan_id=test_ids['artisan_id'], category_id=test_ids['category_id'])
+        mock_repositories['product_repo'].find_with_categories_by_artisan_id.return_value = [
+            (product, mock_entities['category']) for product in products
+        ]
+        cursor = encode_keyset_cursor(datetime(2025, 1, 1, 12, 0, 0), 'last-product-id')
+
+        page, next_cursor = service.get_products_page_by_artisan(test_ids['artisan_id'], limit=2, cursor=cursor)
+
+        assert len(page) == 2
+        assert next_cursor is None
+        mock_repositories['product_repo'].find_with_categories_by_artisan_id.assert_called_once_with(
+            test_ids['artisan_id'], limit=3, after=(datetime(2025, 1, 1, 12, 0, 0), 'last-product-id'))
+
+    @pytest.mark.parametrize("limit", [0, -1, 101])
+    def test_invalid_limit(self, service, mock_repositories, test_ids, limit):
+        """Limites fora do intervalo permitido são rejeitados."""
+        with pytest.raises(ValueError, match="limit must be between"):
+            service.get_products_page_by_artisan(test_ids['artisan_id'], limit=limit)
+        mock_repositories['product_repo'].find_with_categories_by_artisan_id.assert_not_called()
+
+    def test_invalid_cursor(self, service, mock_repositories, test_ids):
+        """Cursores malformados são rejeitados antes de consultar o banco."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_products_page_by_artisan(test_ids['artisan_id'], limit=10, cursor='not-a-cursor')
+        mock_repositories['product_repo'].find_with_categories_by_artisan_id.assert_not_called()
+
+
+class TestGetProductsPageEtag(BaseProductTest):
+    """Testes para o ETag da listagem de produtos do artesão."""
+
+    def test_etag_changes_with_catalogue_version(self, service, mock_repositories, test_ids):
+        """O ETag muda quando a contagem ou o último updated_at mudam, e nunca carrega produtos."""
+        product_repo = mock_repositories['product_repo']
+        product_repo.get_artisan_catalogue_version.return_value = (3, datetime(2025, 1, 1, 12, 0, 0))
+        etag = service.get_products_page_etag(test_ids['artisan_id'], limit=10)
+
+        assert service.get_products_page_etag(test_ids['artisan_id'], limit=10) == etag
+        product_repo.get_artisan_catalogue_version.return_value = (3, datetime(2025, 1, 1, 12, 0, 1))
+        assert service.get_products_page_etag(test_ids['artisan_id'], limit=10) != etag
+        product_repo.get_artisan_catalogue_version.return_value = (2, datetime(2025, 1, 1, 12, 0, 0))
+        assert service.get_products_page_etag(test_ids['artisan_id'], limit=10) != etag
+
+        product_repo.get_artisan_catalogue_version.assert_called_with(test_ids['artisan_id'])
+        product_repo.find_with_categories_by_artisan_id.assert_not_called()
+        mock_repositories['artisan_repo'].get_artisan_by_id.assert_not_called()
+
+    def test_etag_depends_on_page(self, service, mock_repositories, test_ids):
+        """Páginas diferentes do mesmo catálogo têm ETags diferentes."""
+        mock_repositories['product_repo'].get_artisan_catalogue_version.return_value = (0, None)
+        cursor = encode_keyset_cursor(datetime(2025, 1, 1, 12, 0, 0), 'last-product-id')
+
+        etags = {
+            service.get_products_page_etag(test_ids['artisan_id'], limit=10),
+            service.get_products_page_etag(test_ids['artisan_id'], limit=20),
+            service.get_products_page_etag(test_ids['artisan_id'], limit=10, cursor=cursor),
+        }
+        assert len(etags) == 3
+
+    def test_etag_validates_page(self, service, mock_repositories, test_ids):
+        """Parâmetros inválidos são rejeitados antes da consulta de versão."""
+        with pytest.raises(ValueError):
+            service.get_products_page_etag(test_ids['artisan_id'], limit=0)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_products_page_etag(test_ids['artisan_id'], limit=10, cursor='not-a-cursor')
+        mock_repositories['product_repo'].get_artisan_catalogue_version.assert_not_called()
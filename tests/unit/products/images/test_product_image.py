@@ -0,0 +1,136 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.product_image_service import ProductImageService
+from app.common.exceptions import WorkerPoolBusyError
+from app.domain.repositories.file_storage_interface import IFileStorage
+from app.infrastructure.images.image_variants import ImageVariant, detect_image_extension, render_variants
+from app.infrastructure.workers.bounded_executor import BoundedExecutor
+from tests.unit.products.base_product_test import BaseProductTest
+
+
+def _image(format, size=(640, 480), mode='RGB'):
+    from PIL import Image
+    output = io.BytesIO()
+    Image.new(mode, size).save(output, format=format)
+    return output.getvalue()
+
+
+class TestBoundedExecutor:
+
+    def test_rejects_tasks_beyond_the_limit(self):
+        release = threading.Event()
+        executor = BoundedExecutor(lambda workers: ThreadPoolExecutor(workers), max_workers=1, max_pending=2)
+        try:
+            executor.submit(release.wait)
+            executor.submit(release.wait)
+            with pytest.raises(WorkerPoolBusyError):
+                executor.submit(release.wait)
+            assert executor.pending == 2
+        finally:
+            release.set()
+            assert executor.wait(timeout=5)
+            executor.shutdown()
+        assert executor.pending == 0
+
+    def test_wait_includes_the_callbacks(self):
+        done = []
+        executor = BoundedExecutor(lambda workers: ThreadPoolExecutor(workers), max_workers=2, max_pending=4)
+        executor.submit(sum, [1, 2], on_done=lambda future: done.append(future.result()))
+        assert executor.wait(timeout=5)
+        executor.shutdown()
+        assert done == [3]
+
+
+class TestImageVariants:
+
+    @pytest.mark.parametrize("format, extension", [('JPEG', 'jpg'), ('PNG', 'png'), ('WEBP', 'webp')])
+    def test_detects_supported_formats(self, format, extension):
+        assert detect_image_extension(_image(format)[:12]) == extension
+
+    @pytest.mark.parametrize("head", [b'GIF89a......', b'<svg xmlns=', b'', b'RIFF....WAVE'])
+    def test_rejects_anything_else(self, head):
+        assert detect_image_extension(head) is None
+
+    def test_renders_variants_without_upscaling(self):
+        from PIL import Image
+        variants = (ImageVariant('small', 100, 'JPEG', 'jpg'), ImageVariant('large', 2000, 'WEBP', 'webp'))
+
+        rendered = render_variants(_image('PNG', (400, 200), mode='RGBA'), variants)
+
+        assert Image.open(io.BytesIO(rendered['small'])).size == (100, 50)
+        assert Image.open(io.BytesIO(rendered['large'])).size == (400, 200)
+
+
+class TestProductImageService(BaseProductTest):
+
+    @pytest.fixture
+    def storage(self):
+        storage = Mock(spec=IFileStorage)
+        storage.url.side_effect = lambda key: f"/media/{key}"
+        storage.read.return_value = b'original'
+        return storage
+
+    @pytest.fixture
+    def processor(self):
+        processor = Mock()
+        processor.sniff_bytes = 12
+        processor.detect_extension = detect_image_extension
+        processor.is_busy = False
+        processor.variants = (ImageVariant('thumbnail', 320, 'WEBP', 'webp'), ImageVariant('medium', 960, 'WEBP', 'webp'))
+        processor.display_variant = 'medium'
+        return processor
+
+    @pytest.fixture
+    def image_service(self, mock_repositories, storage, processor, mock_entities):
+        mock_repositories['product_repo'].get_product_by_id.return_value = mock_entities['product']
+        return ProductImageService(mock_repositories['product_repo'], storage, processor)
+
+    def test_stores_original_and_switches_to_display_variant(self, image_service, mock_repositories, storage,
+                                                             processor, test_ids):
+        product_repo = mock_repositories['product_repo']
+        result = image_service.upload_product_image(test_ids['artisan_id'], test_ids['product_id'],
+                                                    io.BytesIO(_image('JPEG')))
+
+        assert result.status == 'processing'
+        assert result.original_url.endswith('/original.jpg')
+        product_repo.update_image_url.assert_called_once_with(test_ids['product_id'], result.original_url)
+
+        data, on_done = processor.submit.call_args.args
+        assert data == b'original'
+        on_done({'thumbnail': b't', 'medium': b'm'}, None)
+        assert storage.save.call_count == 3
+        product_repo.update_image_url.assert_called_with(test_ids['product_id'], result.variants['medium'],
+                                                         expected_image_url=result.original_url)
+
+    def test_keeps_original_when_rendering_fails(self, image_service, mock_repositories, processor, test_ids):
+        image_service.upload_product_image(test_ids['artisan_id'], test_ids['product_id'], io.BytesIO(_image('PNG')))
+
+        processor.submit.call_args.args[1](None, OSError("broken image"))
+        assert mock_repositories['product_repo'].update_image_url.call_count == 1
+
+    def test_busy_pool_is_rejected_before_storing(self, image_service, storage, processor, test_ids):
+        processor.is_busy = True
+        with pytest.raises(WorkerPoolBusyError):
+            image_service.upload_product_image(test_ids['artisan_id'], test_ids['product_id'],
+                                               io.BytesIO(_image('PNG')))
+        storage.save.assert_not_called()
+
+    def test_pool_filling_up_after_the_check_keeps_the_original(self, image_service, processor, test_ids):
+        processor.submit.side_effect = WorkerPoolBusyError()
+        result = image_service.upload_product_image(test_ids['artisan_id'], test_ids['product_id'],
+                                                    io.BytesIO(_image('PNG')))
+        assert (result.status, result.variants) == ('original_only', {})
+
+    def test_rejects_unsupported_files(self, image_service, storage, test_ids):
+        with pytest.raises(ValueError, match="Unsupported image"):
+            image_service.upload_product_image(test_ids['artisan_id'], test_ids['product_id'], io.BytesIO(b'GIF89a...'))
+        storage.save.assert_not_called()
+
+    def test_rejects_products_of_other_artisans(self, image_service, storage, test_ids):
+        with pytest.raises(ValueError, match="Product not found"):
+            image_service.upload_product_image('other-artisan', test_ids['product_id'], io.BytesIO(_image('PNG')))
@@ -0,0 +1,142 @@
+import pytest
+
+from app.application.services.product_import_service import ProductImportService
+from app.common.exceptions import DuplicateProductError, ProductBatchRejectedError
+from tests.unit.products.base_product_test import BaseProductTest
+
+
+class TestProductImport(BaseProductTest):
+    """Testes para a importação em lote de produtos usando o ProductImportService."""
+
+    @pytest.fixture
+    def import_service(self, mock_repositories):
+        return ProductImportService(
+            product_repository=mock_repositories['product_repo'],
+            category_repository=mock_repositories['category_repo'],
+            artisan_repository=mock_repositories['artisan_repo'],
+        )
+
+    @pytest.fixture
+    def ready_repositories(self, mock_repositories, mock_entities):
+        mock_repositories['artisan_repo'].get_artisan_by_id.return_value = mock_entities['artisan']
+        mock_repositories['category_repo'].get_many_by_ids.return_value = [mock_entities['category']]
+        mock_repositories['product_repo'].find_existing_names.return_value = set()
+        mock_repositories['product_repo'].bulk_create.side_effect = lambda entities: len(entities)
+        return mock_repositories
+
+    @staticmethod
+    def _record(row, name, category_id, **overrides):
+        record = {"name": name, "description": "Feito à mão", "price": 10.0, "stock": 2, "category_id": category_id}
+        record.update(overrides)
+        return row, record, None
+
+    def test_import_saves_valid_rows_and_reports_errors(self, import_service, ready_repositories, test_ids):
+        category_id = test_ids['category_id']
+        ready_repositories['product_repo'].find_existing_names.return_value = {"Existente"}
+        records = [
+            self._record(1, "Vaso", category_id),
+            self._record(2, "Prato", category_id, price="caro"),
+            self._record(3, "Existente", category_id),
+            self._record(4, "Colar", "categoria-inexistente"),
+            self._record(5, "Vaso", category_id),
+            (6, None, "Invalid JSON: Expecting value"),
+            self._record(7, "Tigela", category_id, stock=-1),
+            self._record(8, "Copo", category_id, stock=None),
+        ]
+
+        result = import_service.import_products(test_ids['artisan_id'], records)
+
+        assert (result.total_rows, result.created, result.failed) == (8, 2, 6)
+        assert [error.row for error in result.errors] == [2, 3, 4, 5, 6, 7]
+        assert result.errors[0].errors[0].startswith("price:")
+        saved = ready_repositories['product_repo'].bulk_create.call_args.args[0]
+        assert [(entity.name, entity.stock, entity.artisan_id) for entity in saved] == [
+            ("Vaso", 2, test_ids['artisan_id']), ("Copo", 0, test_ids['artisan_id'])
+        ]
+        # Uma única consulta de nomes para o lote inteiro
+        ready_repositories['product_repo'].find_existing_names.assert_called_once()
+        ready_repositories['product_repo'].get_artisan_product_by_name.assert_not_called()
+
+    def test_import_runs_in_batches(self, import_service, ready_repositories, test_ids):
+        records = [self._record(row, f"Produto {row}", test_ids['category_id']) for row in range(1, 6)]
+
+        result = import_service.import_products(test_ids['artisan_id'], records, batch_size=2)
+
+        assert result.created == 5
+        assert ready_repositories['product_repo'].bulk_create.call_count == 3
+        assert ready_repositories['product_repo'].find_existing_names.call_count == 3
+
+    def test_failed_batch_is_reported(self, import_service, ready_repositories, test_ids):
+        ready_repositories['product_repo'].bulk_create.side_effect = Exception("deadlock")
+        records = [self._record(row, f"Produto {row}", test_ids['category_id']) for row in range(1, 3)]
+
+        result = import_service.import_products(test_ids['artisan_id'], records)
+
+        assert result.created == 0
+        assert [error.row for error in result.errors] == [1, 2]
+
+    def test_names_are_compared_ignoring_case_and_accents(self, import_service, ready_repositories, test_ids):
+        category_id = test_ids['category_id']
+        # O banco devolve o nome como está gravado
+        ready_repositories['product_repo'].find_existing_names.return_value = {"vaso"}
+        records = [
+            self._record(1, "Vaso", category_id),
+            self._record(2, "Café", category_id),
+            self._record(3, "CAFE ", category_id),
+        ]
+
+        result = import_service.import_products(test_ids['artisan_id'], records)
+
+        assert result.created == 1
+        assert [(error.row, error.errors) for error in result.errors] == [
+            (1, ["Product with this name already exists for this artisan"]),
+            (3, ["Duplicated product name in the import"]),
+        ]
+
+    def test_rejected_batch_falls_back_to_row_by_row(self, import_service, ready_repositories, test_ids):
+        category_id = test_ids['category_id']
+        product_repo = ready_repositories['product_repo']
+        product_repo.bulk_create.side_effect = [ProductBatchRejectedError(), 1]
+
+        def create(entity):
+            # Outra requisição gravou "Prato" depois da consulta de nomes
+            if entity.name == "Prato":
+                raise DuplicateProductError()
+            return entity
+
+        product_repo.create.side_effect = create
+        records = [
+            self._record(1, "Vaso", category_id),
+            self._record(2, "Prato", category_id),
+            self._record(3, "Colar", category_id),
+            # Lote seguinte: "Prato" não foi gravado e ainda pode entrar; "Vaso" já foi
+            self._record(4, "prato", category_id),
+            self._record(5, "VASO", category_id),
+        ]
+
+        result = import_service.import_products(test_ids['artisan_id'], records, batch_size=3)
+
+        assert result.created == 3
+        assert [(error.row, error.errors) for error in result.errors] == [
+            (2, ["Product with this name already exists for this artisan"]),
+            (5, ["Duplicated product name in the import"]),
+        ]
+        assert [call.args[0].name for call in product_repo.create.call_args_list] == ["Vaso", "Prato", "Colar"]
+        assert [entity.name for entity in product_repo.bulk_create.call_args.args[0]] == ["prato"]
+
+    def test_import_stops_at_row_limit(self, import_service, ready_repositories, test_ids, monkeypatch):
+        monkeypatch.setattr('app.application.services.product_import_service.MAX_IMPORT_ROWS', 3)
+        records = [self._record(row, f"Produto {row}", test_ids['category_id']) for row in range(1, 6)]
+
+        result = import_service.import_products(test_ids['artisan_id'], records, batch_size=2)
+
+        assert result.total_rows == 3
+        assert result.created == 3
+        assert result.truncated is True
+
+    def test_import_for_unknown_artisan(self, import_service, mock_repositories, test_ids):
+        mock_repositories['artisan_repo'].get_artisan_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="Artisan not found"):
+            import_service.import_products(test_ids['artisan_id'], [])
+        mock_repositories['product_repo'].bulk_create.assert_not_called()
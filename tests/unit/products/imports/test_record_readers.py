@@ -0,0 +1,76 @@
+import io
+import json
+
+import pytest
+
+from app.common.record_readers import iter_csv, iter_json_array, iter_ndjson
+
+
+class TestRecordReaders:
+    """Testes para os leitores em streaming da importação em lote."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_json_array_across_chunks(self, chunk_size):
+        items = [{"name": f"Vaso {index}", "price": 10.5 + index, "description": "Cerâmica ✓"} for index in range(20)]
+        stream = io.BytesIO(json.dumps(items, ensure_ascii=False).encode('utf-8'))
+
+        records = list(iter_json_array(stream, chunk_size=chunk_size))
+
+        assert [record for _, record, _ in records] == items
+        assert [row for row, _, _ in records] == list(range(1, 21))
+        assert all(error is None for _, _, error in records)
+
+    def test_json_array_reports_non_objects(self):
+        records = list(iter_json_array(io.BytesIO(b'[{"name": "a"}, 42]')))
+        assert records == [(1, {"name": "a"}, None), (2, None, "Each row must be a JSON object")]
+
+    @pytest.mark.parametrize("body", [b'{"name": "a"}', b'[{"name": "a"}', b'[{"name": "a"} {"name": "b"}]', b'[{"name": '])
+    def test_json_array_stops_on_malformed_json(self, body):
+        records = list(iter_json_array(io.BytesIO(body), chunk_size=4))
+        row, record, error = records[-1]
+        assert record is None
+        assert error.startswith("Invalid JSON")
+
+    def test_empty_json_array(self):
+        assert list(iter_json_array(io.BytesIO(b' [ ] '))) == []
+
+    def test_ndjson_fails_only_the_bad_line(self):
+        body = b'{"name": "a"}\n\nnot json\n{"name": "b"}\n'
+        records = list(iter_ndjson(io.BytesIO(body)))
+
+        assert records[0] == (1, {"name": "a"}, None)
+        assert records[1][0] == 2 and records[1][2].startswith("Invalid JSON")
+        assert records[2] == (3, {"name": "b"}, None)
+
+    def test_ndjson_invalid_utf8_fails_only_its_line(self):
+        body = b'\xef\xbb\xbf{"name": "a"}\n{"name": "\xff"}\n{"name": "b"}\n'
+        records = list(iter_ndjson(io.BytesIO(body)))
+
+        assert records == [(1, {"name": "a"}, None), (2, None, "Invalid UTF-8 text"), (3, {"name": "b"}, None)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 64 * 1024])
+    def test_json_array_stops_on_invalid_utf8(self, chunk_size):
+        body = b'[{"name": "a"},\n' + b'{"name": "x"},' * 2000 + b'{"name": "\xff"}]'
+        records = list(iter_json_array(io.BytesIO(body), chunk_size=chunk_size))
+
+        # As linhas do bloco com o byte inválido entram no "rest of the file"
+        row, record, error = records[-1]
+        assert all(error is None for _, _, error in records[:-1])
+        assert (row, record) == (len(records), None)
+        assert error == "Invalid UTF-8 text; the rest of the file was not read"
+
+    def test_csv_stops_on_invalid_utf8(self):
+        body = b"name,price\n" + b"Vaso,10\n" * 5000 + b"Prato,\xff\nColar,5\n"
+        records = list(iter_csv(io.BytesIO(body)))
+
+        row, record, error = records[-1]
+        assert all(error is None for _, _, error in records[:-1])
+        assert (row, record) == (len(records), None)
+        assert error == "Invalid UTF-8 text; the rest of the file was not read"
+
+    def test_csv_reads_blank_cells_as_none(self):
+        body = "name,price,image_url\nVaso,10.50,\nColar,5,http://x/img.png,extra\n".encode('utf-8')
+        records = list(iter_csv(io.BytesIO(body)))
+
+        assert records[0] == (1, {"name": "Vaso", "price": "10.50", "image_url": None}, None)
+        assert records[1] == (2, None, "Row has more cells than the header")
@@ -0,0 +1,85 @@
+import pytest
+
+from app.infrastructure.search.inverted_index import InvertedIndex
+from app.infrastructure.search.text_analyzer import analyze, fold_accents, stem
+
+
+class TestTextAnalyzer:
+
+    def test_fold_accents(self):
+        assert fold_accents("Cerâmica Artesanal São João") == "ceramica artesanal sao joao"
+
+    @pytest.mark.parametrize("variations", [
+        ("vaso", "vasos", "vasinho"),
+        ("cerâmica", "ceramicas", "cerâmico"),
+        ("colar", "colares"),
+        ("cordão", "cordões"),
+        ("anel", "anéis"),
+    ])
+    def test_variations_share_the_same_stem(self, variations):
+        stems = {stem(fold_accents(word)) for word in variations}
+        assert len(stems) == 1
+
+    def test_analyze_drops_stopwords_and_keeps_repetitions(self):
+        assert analyze("Vaso de barro com vaso") == [stem("vaso"), stem("barro"), stem("vaso")]
+        assert analyze(None) == []
+
+
+class TestInvertedIndex:
+
+    @pytest.fixture
+    def index(self):
+        index = InvertedIndex()
+        index.add("p1", "Vaso de cerâmica", "Pintado à mão", "Decoração")
+        index.add("p2", "Prato raso", "Cerâmica esmaltada", "Cozinha")
+        index.add("p3", "Colar de sementes", "Sementes de açaí", "Acessórios")
+        return index
+
+    def test_search_ranks_name_matches_first(self, index):
+        results = index.search("ceramicas", k=10)
+        assert [product_id for product_id, _ in results] == ["p1", "p2"]
+        assert results[0][1] > results[1][1]
+
+    def test_search_matches_category_name(self, index):
+        assert [product_id for product_id, _ in index.search("cozinha", k=10)] == ["p2"]
+
+    def test_search_returns_top_k(self, index):
+        assert len(index.search("vaso prato colar", k=2)) == 2
+        assert index.search("inexistente", k=10) == []
+        assert index.search("de", k=10) == []
+
+    def test_add_replaces_previous_version(self, index):
+        index.add("p1", "Luminária de papel", None, "Decoração")
+
+        assert index.search("vaso", k=10) == []
+        assert [product_id for product_id, _ in index.search("luminaria", k=10)] == ["p1"]
+        assert len(index) == 3
+
+    def test_remove_and_compact(self, index):
+        assert index.remove("p2") is True
+        assert index.remove("p2") is False
+        assert [product_id for product_id, _ in index.search("ceramica", k=10)] == ["p1"]
+
+        index.compact()
+        footprint = index.memory_footprint()
+        assert footprint['documents'] == 2
+        assert footprint['tombstones'] == 0
+        assert [product_id for product_id, _ in index.search("ceramica", k=10)] == ["p1"]
+        assert [product_id for product_id, _ in index.search("sementes", k=10)] == ["p3"]
+
+    def test_common_terms_only_rescore_candidates(self):
+        index = InvertedIndex(max_scored_postings=2)
+        for number in range(5):
+            index.add(f"p{number}", f"Vaso {number}", None, None)
+        index.add("rare", "Vaso azul", None, None)
+
+        # "vaso" passa do limite e só reordena o candidato encontrado por "azul"
+        assert [product_id for product_id, _ in index.search("vaso azul", k=10)] == ["rare"]
+
+    def test_memory_footprint(self, index):
+        footprint = index.memory_footprint()
+        assert footprint['documents'] == 3
+        assert footprint['postings'] > footprint['terms'] > 0
+        assert footprint['total_bytes'] == (
+            footprint['postings_bytes'] + footprint['vocabulary_bytes'] + footprint['documents_bytes']
+        )
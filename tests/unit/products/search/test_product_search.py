@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import Mock
+from app.application.services.product_search_service import ProductSearchService, MAX_SEARCH_PAGE_SIZE
+from app.domain.repositories.product_search_repository_interface import IProductSearchRepository
+from tests.unit.products.base_product_test import mock_factory
+
+
+class TestProductSearch:
+    """Testes para a busca de produtos usando o ProductSearchService."""
+
+    @pytest.fixture
+    def search_repo(self):
+        return Mock(spec=IProductSearchRepository)
+
+    @pytest.fixture
+    def service(self, search_repo):
+        return ProductSearchService(search_repository=search_repo)
+
+    @staticmethod
+    def _rows(count):
+        category = mock_factory.category.create()
+        return [
+            (mock_factory.product.create(category_id=category.category_id), category)
+            for _ in range(count)
+        ]
+
+    def test_extract_terms(self):
+        assert ProductSearchService.extract_terms("Vaso de  CERÂMICA, vaso!") == ['vaso', 'de', 'cerâmica']
+
+    def test_search_returns_page_and_has_next(self, service, search_repo):
+        rows = self._rows(3)
+        search_repo.search.return_value = rows
+
+        result = service.search_products("vaso cerâmica", page=2, page_size=2)
+
+        assert result.has_next is True
+        assert [item.product_id for item in result.items] == [p.product_id for p, _ in rows[:2]]
+        search_repo.search.assert_called_once_with(['vaso', 'cerâmica'], limit=3, offset=2)
+
+    def test_last_page(self, service, search_repo):
+        search_repo.search.return_value = self._rows(1)
+
+        result = service.search_products("vaso", page=1, page_size=2)
+
+        assert result.has_next is False
+        assert len(result.items) == 1
+
+    @pytest.mark.parametrize("query", ["", "   ", "a", "!!", "x" * 101])
+    def test_invalid_query(self, service, search_repo, query):
+        with pytest.raises(ValueError):
+            service.search_products(query)
+        search_repo.search.assert_not_called()
+
+    @pytest.mark.parametrize("page, page_size", [(0, 10), (1, 0), (1, MAX_SEARCH_PAGE_SIZE + 1), (1000, 50)])
+    def test_invalid_pagination(self, service, search_repo, page, page_size):
+        with pytest.raises(ValueError):
+            service.search_products("vaso", page=page, page_size=page_size)
+        search_repo.search.assert_not_called()
@@ -0,0 +1,44 @@
+import json
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from app.presentation.dtos.product_dtos import ResponseRegisterProduct, product_listing_dict
+from app.presentation.json_representation import RawJSON, dumps, output_json
+from tests.unit.products.base_product_test import mock_factory
+
+
+class TestProductSerialization:
+    """Testes para o caminho rápido de serialização de produtos."""
+
+    @pytest.fixture
+    def rows(self):
+        category = mock_factory.category.create()
+        return [
+            (mock_factory.product.create(category_id=category.category_id, price=Decimal("19.90")), category)
+            for _ in range(3)
+        ]
+
+    def test_listing_dict_matches_validated_dto(self, rows):
+        validated = [ResponseRegisterProduct.from_domain_entities(product, category) for product, category in rows]
+        listing = [product_listing_dict(product, category) for product, category in rows]
+
+        assert listing == [item.model_dump() for item in validated]
+        with Flask(__name__).app_context():
+            assert json.loads(dumps(listing))[0]['price'] == 19.9
+
+    def test_output_json_sends_raw_json_as_is(self):
+        with Flask(__name__).app_context():
+            response = output_json(RawJSON(b'[{"a":1}]'), 200, {'X-Test': '1'})
+
+        assert response.status_code == 200
+        assert response.get_data() == b'[{"a":1}]\n'
+        assert response.headers['X-Test'] == '1'
+
+    def test_output_json_encodes_decimals_and_unicode(self):
+        with Flask(__name__).app_context():
+            response = output_json({'name': 'Cerâmica', 'price': Decimal("10.50")}, 201)
+
+        assert response.status_code == 201
+        assert json.loads(response.get_data()) == {'name': 'Cerâmica', 'price': 10.5}
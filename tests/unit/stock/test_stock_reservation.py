@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.application.services.stock_reservation_service import StockReservationService
+from app.common.exceptions import InsufficientStockError, ReservationNotFoundError
+from app.domain.models.stock_reservation import StockReservationEntity
+from app.domain.repositories.stock_reservation_repository_interface import IStockReservationRepository
+
+
+class TestStockReservationService:
+
+    @pytest.fixture
+    def repository(self):
+        repository = Mock(spec=IStockReservationRepository)
+        repository.reserve.side_effect = lambda reservation: reservation
+        repository.find_expired_ids.return_value = []
+        return repository
+
+    @pytest.fixture
+    def service(self, repository):
+        return StockReservationService(repository, reservation_ttl=timedelta(minutes=10))
+
+    def test_reserve_merges_repeated_products(self, service, repository):
+        reservation = service.reserve([("p1", 2), ("p2", 1), ("p1", 3)])
+
+        assert reservation.items == {"p1": 5, "p2": 1}
+        assert reservation.status == StockReservationEntity.PENDING
+        assert timedelta(minutes=9) < reservation.expires_at - datetime.utcnow() <= timedelta(minutes=10)
+        repository.reserve.assert_called_once()
+
+    @pytest.mark.parametrize("items", [
+        [],
+        [("p1", 0)],
+        [("p1", -1)],
+        [("p1", 1.5)],
+        [("", 1)],
+    ])
+    def test_reserve_rejects_invalid_items(self, service, repository, items):
+        with pytest.raises(ValueError):
+            service.reserve(items)
+        repository.reserve.assert_not_called()
+
+    def test_reserve_without_stock_and_nothing_expired(self, service, repository):
+        repository.reserve.side_effect = InsufficientStockError(["p1"])
+
+        with pytest.raises(InsufficientStockError) as error:
+            service.reserve({"p1": 1})
+
+        assert error.value.product_ids == ["p1"]
+        repository.find_expired_ids.assert_called_once()
+        assert repository.find_expired_ids.call_args.kwargs['product_ids'] == ["p1"]
+        assert repository.reserve.call_count == 1
+
+    def test_reserve_retries_after_releasing_expired_reservations(self, service, repository):
+        repository.reserve.side_effect = [InsufficientStockError(["p1"]), "reserved"]
+        repository.find_expired_ids.return_value = ["r1"]
+        repository.release.return_value = True
+
+        assert service.reserve({"p1": 1}) == "reserved"
+        repository.release.assert_called_once_with("r1", status=StockReservationEntity.EXPIRED)
+        assert repository.reserve.call_count == 2
+
+    def test_confirm_and_release_raise_when_not_pending(self, service, repository):
+        repository.confirm.return_value = False
+        repository.release.return_value = False
+
+        with pytest.raises(ReservationNotFoundError):
+            service.confirm("r1")
+        with pytest.raises(ReservationNotFoundError):
+            service.release("r1")
+
+    def test_release_expired_walks_every_batch(self, service, repository):
+        repository.find_expired_ids.side_effect = [["r1", "r2"], ["r3"]]
+        repository.release.side_effect = [True, False, True]
+
+        assert service.release_expired(batch_size=2) == 2
+        assert repository.find_expired_ids.call_count == 2
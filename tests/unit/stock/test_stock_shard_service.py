@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import Mock
+
+from app.application.services.stock_shard_service import StockShardService
+from app.domain.repositories.stock_shard_repository_interface import IStockShardRepository
+from app.infrastructure.cache.stock_shard_cache import StockShardCache
+
+
+class TestStockShardCache:
+
+    def test_layout_is_reloaded_after_the_ttl(self):
+        now = [0.0]
+        cache = StockShardCache(ttl=30, clock=lambda: now[0])
+        loader = Mock(side_effect=[{"p1": 4}, {"p1": 4, "p2": 8}])
+
+        assert cache.get_layout(loader) == {"p1": 4}
+        now[0] = 29
+        assert cache.get_layout(loader) == {"p1": 4}
+        now[0] = 30
+        assert cache.get_layout(loader) == {"p1": 4, "p2": 8}
+        assert loader.call_count == 2
+
+    def test_invalidate_forces_a_reload(self):
+        cache = StockShardCache()
+        loader = Mock(side_effect=[{}, {"p1": 2}])
+
+        assert cache.get_layout(loader) == {}
+        cache.invalidate()
+        assert cache.get_layout(loader) == {"p1": 2}
+
+
+class TestStockShardService:
+
+    @pytest.fixture
+    def repository(self):
+        return Mock(spec=IStockShardRepository)
+
+    @pytest.mark.parametrize("shard_count", [0, 1, 65])
+    def test_enable_rejects_shard_counts_out_of_range(self, repository, shard_count):
+        with pytest.raises(ValueError):
+            StockShardService(repository).enable_sharding("p1", shard_count)
+        repository.enable_sharding.assert_not_called()
+
+    def test_enable_and_disable_report_products_in_the_wrong_mode(self, repository):
+        repository.enable_sharding.return_value = False
+        repository.disable_sharding.return_value = False
+        service = StockShardService(repository)
+
+        with pytest.raises(ValueError, match="already sharded"):
+            service.enable_sharding("p1", 8)
+        with pytest.raises(ValueError, match="not sharded"):
+            service.disable_sharding("p1")
@@ -0,0 +1,233 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.user_authentication_service import UserAuthenticationService
+from app.common.config import DEFAULT_SECRET_KEY, Config, validate_jwt_secret
+from app.common.exceptions import InvalidCredentialsError, InvalidTokenError, WorkerPoolBusyError
+from app.domain.models.user import UserEntity
+from app.domain.repositories.artisan_repository_interface import IArtisanRepository
+from app.domain.repositories.user_repository_interface import IUserRepository
+from app.infrastructure.cache.verified_token_cache import VerifiedTokenCache
+from app.infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
+from app.infrastructure.security.jwt_token_service import JwtTokenService
+from app.infrastructure.workers.bounded_executor import BoundedExecutor
+from tests.unit.users.base_test import BaseUserTest
+
+PASSWORD = "ValidPassword123!"
+
+
+def _pool(max_workers=2, max_pending=8):
+    return BoundedExecutor(lambda workers: ThreadPoolExecutor(workers), max_workers, max_pending)
+
+
+class TestBcryptPasswordHasher:
+
+    def test_hash_and_verify(self):
+        hasher = BcryptPasswordHasher(_pool(), rounds=4)
+        password_hash = hasher.hash(PASSWORD)
+
+        assert password_hash.startswith('$2b$04$')
+        assert hasher.verify(PASSWORD, password_hash)
+        assert not hasher.verify("WrongPassword123!", password_hash)
+        assert not hasher.needs_rehash(password_hash)
+
+    def test_cost_change_needs_rehash(self):
+        password_hash = BcryptPasswordHasher(_pool(), rounds=4).hash(PASSWORD)
+        assert BcryptPasswordHasher(_pool(), rounds=5).needs_rehash(password_hash)
+
+    def test_legacy_plain_password(self):
+        hasher = BcryptPasswordHasher(_pool(), rounds=4)
+        assert hasher.verify(PASSWORD, PASSWORD)
+        assert not hasher.verify("other", PASSWORD)
+        assert hasher.needs_rehash(PASSWORD)
+
+    def test_long_passwords_use_the_first_72_bytes(self):
+        hasher = BcryptPasswordHasher(_pool(), rounds=4)
+        password = "á" * 64  # 128 bytes em UTF-8
+        assert hasher.verify(password, hasher.hash(password))
+
+    def test_full_pool_is_rejected(self):
+        release = threading.Event()
+        pool = _pool(max_workers=1, max_pending=1)
+        pool.submit(release.wait)
+        try:
+            with pytest.raises(WorkerPoolBusyError):
+                BcryptPasswordHasher(pool, rounds=4).hash(PASSWORD)
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_default_limit_is_reachable_by_the_server_threads(self):
+        # Cada thread do gunicorn espera o próprio hash: com o limite padrão,
+        # todas hashing ao mesmo tempo já enchem o pool
+        dockerfile = (Path(__file__).parents[4] / 'dockerfile').read_text()
+        server_threads = int(re.search(r'"--threads",\s*"(\d+)"', dockerfile).group(1))
+        release = threading.Event()
+        pool = _pool(Config.PASSWORD_HASHING_WORKERS, Config.PASSWORD_HASHING_QUEUE_LIMIT)
+        hasher = BcryptPasswordHasher(pool, rounds=4)
+        pool.submit(release.wait)
+        try:
+            for _ in range(Config.PASSWORD_HASHING_QUEUE_LIMIT - 1):
+                pool.submit(release.wait)
+            with pytest.raises(WorkerPoolBusyError):
+                hasher.hash(PASSWORD)
+        finally:
+            release.set()
+            pool.shutdown()
+        assert Config.PASSWORD_HASHING_QUEUE_LIMIT < server_threads
+
+
+class TestUserAuthentication(BaseUserTest):
+
+    @pytest.fixture
+    def user_repository(self):
+        return Mock(spec=IUserRepository)
+
+    @pytest.fixture
+    def hasher(self):
+        return BcryptPasswordHasher(_pool(), rounds=4)
+
+    @pytest.fixture
+    def artisan_repository(self):
+        return Mock(spec=IArtisanRepository)
+
+    @pytest.fixture
+    def token_service(self):
+        return JwtTokenService(secret="test-secret-with-at-least-32-bytes")
+
+    @pytest.fixture
+    def auth_service(self, user_repository, artisan_repository, hasher, token_service):
+        return UserAuthenticationService(user_repository, artisan_repository, hasher, token_service)
+
+    def _user(self, test_ids, password_hash, status='active'):
+        return UserEntity(email="user@example.com", password=password_hash, status=status, user_id=test_ids['user_id'])
+
+    def test_authenticates_with_current_hash(self, auth_service, user_repository, hasher, test_ids):
+        user_repository.get_by_email.return_value = self._user(test_ids, hasher.hash(PASSWORD))
+
+        user = auth_service.authenticate("user@example.com", PASSWORD)
+
+        assert user.user_id == test_ids['user_id']
+        user_repository.update_password_hash.assert_not_called()
+
+    def test_rehashes_when_cost_changed(self, auth_service, user_repository, hasher, test_ids):
+        old_hash = BcryptPasswordHasher(_pool(), rounds=5).hash(PASSWORD)
+        user_repository.get_by_email.return_value = self._user(test_ids, old_hash)
+        user_repository.update_password_hash.return_value = True
+
+        user = auth_service.authenticate("user@example.com", PASSWORD)
+
+        user_id, new_hash, expected = user_repository.update_password_hash.call_args.args
+        assert (user_id, expected) == (test_ids['user_id'], old_hash)
+        assert new_hash.startswith('$2b$04$') and hasher.verify(PASSWORD, new_hash)
+        assert user.password == new_hash
+
+    def test_failed_rehash_does_not_block_login(self, auth_service, user_repository, test_ids):
+        user_repository.get_by_email.return_value = self._user(test_ids, PASSWORD)
+        user_repository.update_password_hash.side_effect = RuntimeError("database down")
+
+        assert auth_service.authenticate("user@example.com", PASSWORD).user_id == test_ids['user_id']
+
+    @pytest.mark.parametrize("password, status", [("WrongPassword123!", 'active'), (PASSWORD, 'inactive')])
+    def test_rejects_invalid_credentials(self, auth_service, user_repository, hasher, test_ids, password, status):
+        user_repository.get_by_email.return_value = self._user(test_ids, hasher.hash(PASSWORD), status)
+        with pytest.raises(InvalidCredentialsError):
+            auth_service.authenticate("user@example.com", password)
+        user_repository.update_password_hash.assert_not_called()
+
+    def test_rejects_unknown_email(self, auth_service, user_repository):
+        user_repository.get_by_email.return_value = None
+        with pytest.raises(InvalidCredentialsError):
+            auth_service.authenticate("nobody@example.com", PASSWORD)
+
+    @pytest.mark.parametrize("is_artisan, role", [(True, 'artisan'), (False, 'buyer')])
+    def test_login_issues_tokens_with_role(self, auth_service, user_repository, artisan_repository, hasher,
+                                           token_service, test_ids, is_artisan, role):
+        user_repository.get_by_email.return_value = self._user(test_ids, hasher.hash(PASSWORD))
+        artisan_repository.get_artisan_by_id.return_value = object() if is_artisan else None
+
+        response = auth_service.login("user@example.com", PASSWORD)
+
+        assert response.role == role
+        claims = token_service.decode(response.access_token)
+        assert (claims['sub'], claims['role']) == (test_ids['user_id'], role)
+        assert token_service.decode(response.refresh_token, 'refresh')['sub'] == test_ids['user_id']
+
+    def test_refresh_issues_new_tokens(self, auth_service, user_repository, token_service, test_ids):
+        tokens = token_service.issue_tokens(test_ids['user_id'], 'artisan')
+        user_repository.get_by_id.return_value = self._user(test_ids, "hash")
+
+        response = auth_service.refresh(tokens['refresh_token'])
+
+        assert response.access_token != tokens['access_token']
+        assert token_service.decode(response.access_token)['role'] == 'artisan'
+
+    def test_refresh_rejects_access_tokens_and_inactive_users(self, auth_service, user_repository, token_service, test_ids):
+        tokens = token_service.issue_tokens(test_ids['user_id'], 'artisan')
+        with pytest.raises(InvalidTokenError):
+            auth_service.refresh(tokens['access_token'])
+
+        user_repository.get_by_id.return_value = self._user(test_ids, "hash", status='inactive')
+        with pytest.raises(InvalidTokenError):
+            auth_service.refresh(tokens['refresh_token'])
+
+
+class TestJwtTokenService:
+
+    def test_rejects_tampered_and_expired_tokens(self):
+        import datetime
+        service = JwtTokenService(secret="test-secret-with-at-least-32-bytes")
+        token = service.issue_tokens("user-1", 'buyer')['access_token']
+
+        with pytest.raises(InvalidTokenError):
+            JwtTokenService(secret="other-secret-with-at-least-32-bytes").decode(token)
+        expired = JwtTokenService(secret="test-secret-with-at-least-32-bytes", access_ttl=datetime.timedelta(seconds=-1))
+        with pytest.raises(InvalidTokenError):
+            service.decode(expired.issue_tokens("user-1", 'buyer')['access_token'])
+
+
+class TestJwtSecretConfig:
+
+    @pytest.mark.parametrize("secret", [None, "", DEFAULT_SECRET_KEY])
+    def test_production_refuses_missing_or_default_secret(self, secret):
+        with pytest.raises(RuntimeError):
+            validate_jwt_secret('production', {'JWT_SECRET_KEY': secret})
+
+    def test_production_accepts_a_private_secret(self):
+        validate_jwt_secret('production', {'JWT_SECRET_KEY': "private-secret-with-at-least-32-bytes"})
+
+    @pytest.mark.parametrize("config_name", ['development', 'testing'])
+    def test_local_environments_do_not_need_the_secret(self, config_name):
+        validate_jwt_secret(config_name, {})
+
+
+class TestVerifiedTokenCache:
+
+    def test_entries_expire_at_exp_or_max_age(self):
+        now = [1000.0]
+        cache = VerifiedTokenCache(max_size=10, max_age=60, clock=lambda: now[0])
+        cache.put("short", {'sub': 'a', 'exp': 1010})
+        cache.put("long", {'sub': 'b', 'exp': 5000})
+
+        assert cache.get("short")['sub'] == 'a'
+        now[0] = 1010
+        assert cache.get("short") is None
+        assert cache.get("long")['sub'] == 'b'
+        now[0] = 1060
+        assert cache.get("long") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = VerifiedTokenCache(max_size=2, clock=lambda: 0.0)
+        cache.put("a", {'exp': 100})
+        cache.put("b", {'exp': 100})
+        cache.get("a")
+        cache.put("c", {'exp': 100})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
@@ -1,12 +1,15 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 from tests.unit.users.base_test import BaseUserTest
 from app.application.services.user_registration_service import UserRegistrationService
 from app.domain.repositories.user_repository_interface import IUserRepository
 from app.domain.repositories.buyer_repository_interface import IBuyerRepository
 from app.domain.repositories.address_repository_interface import IAddressRepository
 from app.domain.repositories.artisan_repository_interface import IArtisanRepository
+from app.domain.repositories.unit_of_work_interface import IUnitOfWork
+from app.domain.services.password_hasher_interface import IPasswordHasher
 from app.presentation.dtos.user_dtos import RegisterAddressRequest
+from app.common.exceptions import EmailAlreadyRegisteredError
 from tests.mocks.factories import MockFactory
 
 mock_factory = MockFactory()
@@ -24,13 +27,27 @@ class BaseRegistrationTest(BaseUserTest):
         }
     
     @pytest.fixture
-    def service(self, mock_repositories):
+    def password_hasher(self):
+        """Hasher mock: o hash é a senha com um prefixo, fácil de verificar."""
+        hasher = Mock(spec=IPasswordHasher)
+        hasher.hash.side_effect = lambda password: f"hashed:{password}"
+        return hasher
+
+    @pytest.fixture
+    def unit_of_work(self):
+        """Unit of work mock (suporta o bloco with)."""
+        return MagicMock(spec=IUnitOfWork)
+
+    @pytest.fixture
+    def service(self, mock_repositories, password_hasher, unit_of_work):
         """Cria o serviço com repositórios mockados."""
         return UserRegistrationService(
             user_repository=mock_repositories['user_repo'],
             artisan_repository=mock_repositories['artisan_repo'],
             address_repository=mock_repositories['address_repo'],
-            buyer_repository=mock_repositories['buyer_repo']
+            buyer_repository=mock_repositories['buyer_repo'],
+            password_hasher=password_hasher,
+            unit_of_work=unit_of_work
         )
     
     @pytest.fixture
@@ -93,7 +110,8 @@ class BaseRegistrationTest(BaseUserTest):
         assert result.email == request.email
         
         # Verifica chamadas aos repositórios
-        mock_repositories['user_repo'].get_by_email.assert_called_once_with(request.email)
+        # A unicidade do email fica com o índice do banco: nenhuma consulta antes do INSERT
+        mock_repositories['user_repo'].get_by_email.assert_not_called()
         mock_repositories['address_repo'].create.assert_called_once()
         mock_repositories['user_repo'].create.assert_called_once()
         
@@ -115,13 +133,15 @@ class BaseRegistrationTest(BaseUserTest):
     def _test_duplicate_email(self, service, mock_repositories, request, mock_entities):
         """Testa validação de email duplicado."""
         # Arrange
-        mock_repositories['user_repo'].get_by_email.return_value = mock_entities['user']
+        mock_repositories['address_repo'].get_by_attributes.return_value = mock_entities['address']
+        mock_repositories['user_repo'].create.side_effect = EmailAlreadyRegisteredError()
         
         # Act & Assert
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Email already registered."):
             self._registration_method(service, request)
         
         # Verify
-        mock_repositories['user_repo'].get_by_email.assert_called_once()
-        mock_repositories['address_repo'].create.assert_not_called()
-        mock_repositories['user_repo'].create.assert_not_called()
\ No newline at end of file
+        mock_repositories['user_repo'].get_by_email.assert_not_called()
+        mock_repositories['user_repo'].create.assert_called_once()
+        mock_repositories['artisan_repo'].create.assert_not_called()
+        mock_repositories['buyer_repo'].create.assert_not_called()
\ No newline at end of file
@@ -34,3 +34,38 @@ class TestArtisanRegistration(BaseRegistrationTest):
         
         # Assert
         self._assert_successful_registration(result, request, mock_repositories, test_ids, 'artisan')
+
+    def test_password_is_hashed_before_saving(self, service, mock_repositories, password_hasher,
+                                              valid_artisan_request, valid_user_request, mock_entities):
+        """A senha nunca chega ao repositório em texto puro."""
+        request = RegisterArtisanRequest(**valid_artisan_request, **valid_user_request)
+        self._setup_successful_registration(mock_repositories, mock_entities, 'artisan', request)
+
+        self._registration_method(service, request)
+
+        password_hasher.hash.assert_called_once_with(request.password)
+        saved_user = mock_repositories['user_repo'].create.call_args.args[0]
+        assert saved_user.password == f"hashed:{request.password}"
+
+    def test_registration_commits_once(self, service, mock_repositories, unit_of_work,
+                                       valid_artisan_request, valid_user_request, mock_entities):
+        """Endereço, usuário e artesão vão numa única transação."""
+        request = RegisterArtisanRequest(**valid_artisan_request, **valid_user_request)
+        self._setup_successful_registration(mock_repositories, mock_entities, 'artisan', request)
+
+        self._registration_method(service, request)
+
+        unit_of_work.commit.assert_called_once()
+        unit_of_work.__exit__.assert_called_once_with(None, None, None)
+
+    def test_failed_registration_is_not_committed(self, service, mock_repositories, unit_of_work,
+                                                  valid_artisan_request, valid_user_request, mock_entities):
+        request = RegisterArtisanRequest(**valid_artisan_request, **valid_user_request)
+        self._setup_successful_registration(mock_repositories, mock_entities, 'artisan', request)
+        mock_repositories['artisan_repo'].create.side_effect = RuntimeError("insert failed")
+
+        with pytest.raises(RuntimeError):
+            self._registration_method(service, request)
+
+        unit_of_work.commit.assert_not_called()
+        assert unit_of_work.__exit__.call_args.args[0] is RuntimeError